@@ -45,6 +45,7 @@ _utils = None
 _intake_tools = None
 _hooks = None
 _shared = None
+_agent_pool = None
 
 
 def _ensure_lazy_imports() -> None:
@@ -133,6 +134,24 @@ def _ensure_lazy_imports() -> None:
     logger.info("[InventoryHub] Lazy imports loaded successfully")
 
 
+def _get_agent_pool():
+    """Lazy-load the pool of pre-built Inventory Hub agents (singleton)."""
+    global _agent_pool
+    if _agent_pool is None:
+        from shared.agent_pool import AgentPool
+        _agent_pool = AgentPool(
+            "inventory_hub",
+            factory=_build_inventory_hub_shell,
+            inject=_inject_runtime_context,
+        )
+    return _agent_pool
+
+
+def _inject_runtime_context(agent: Any, user_id: str, session_id: str, **_: Any) -> None:
+    """Swap the runtime session variables into a pooled agent's system prompt."""
+    agent.system_prompt = _prompts.prepare_system_prompt(user_id, session_id)
+
+
 def create_inventory_hub(
     user_id: str = "anonymous",
     session_id: str = "default-session",
@@ -157,7 +176,21 @@ def create_inventory_hub(
     Returns:
         Strands Agent configured for inventory file ingestion with injected context.
     """
+    return _build_inventory_hub_shell(user_id, session_id).agent
+
+
+def _build_inventory_hub_shell(
+    user_id: str = "anonymous",
+    session_id: str = "default-session",
+) -> Any:
+    """
+    Build an Inventory Hub agent plus its hook instances.
+
+    Returns:
+        AgentShell (reusable via the agent pool).
+    """
     _ensure_lazy_imports()
+    from shared.agent_pool import AgentShell
 
     hooks = [
         _hooks["LoggingHook"](log_level=logging.DEBUG, include_payloads=True),
@@ -188,7 +221,7 @@ def create_inventory_hub(
         f"[InventoryHub] Created {_config.AGENT_NAME} with {len(hooks)} hooks, "
         f"{len(all_agent_tools)} tools, user={user_id}, session={session_id}"
     )
-    return agent
+    return AgentShell(agent=agent, hooks=hooks)
 
 
 def invoke(payload: dict, context=None) -> dict:
@@ -272,15 +305,15 @@ def invoke(payload: dict, context=None) -> dict:
                 "agent_id": _config.AGENT_ID,
             }
 
-        # Create fresh agent instance with injected runtime context (concurrency fix)
-        agent = create_inventory_hub(user_id=user_id, session_id=session_id)
-
-        # Invoke agent with prompt
-        result = agent(
-            prompt,
-            user_id=user_id,
-            session_id=session_id,
-        )
+        # Check out a pooled agent with injected runtime context. Each shell is
+        # exclusive to one request and reset on checkout/return (concurrency fix)
+        with _get_agent_pool().checkout(user_id=user_id, session_id=session_id) as agent:
+            # Invoke agent with prompt
+            result = agent(
+                prompt,
+                user_id=user_id,
+                session_id=session_id,
+            )
 
         # Extract response
         if hasattr(result, "message"):
@@ -508,6 +541,48 @@ __all__ = [
 # =============================================================================
 
 
+def _create_prewarm(agent: Any) -> Any:
+    """
+    Build the background prewarm plan for this container.
+
+    Steps: file analysis imports (pandas/openpyxl) → SSM secret → Gemini
+    model (A2A agent) → S3/AgentCore clients → schema cache (Phase 3 fast
+    path) → one pooled shell for the legacy invoke() path.
+
+    Args:
+        agent: The Strands Agent served by the A2AServer
+
+    Returns:
+        PrewarmManager (started by the FastAPI startup event)
+    """
+    from shared.prewarm import PrewarmManager, import_modules, warm_model
+
+    def _warm_clients() -> None:
+        from core_tools.library.file_processing import get_file_inspector
+        from shared.strands_a2a_client import get_agentcore_client
+
+        # The s3_client property lazily builds the SigV4 client; build it now
+        _s3_client = get_file_inspector().s3_client
+        get_agentcore_client(os.environ.get("AWS_REGION", "us-east-2"))
+
+    def _warm_schema() -> None:
+        from core_tools.schema_provider import get_schema_provider
+
+        get_schema_provider().get_table_schema("pending_entry_items")
+
+    return PrewarmManager(_config.AGENT_ID, steps=[
+        ("imports", import_modules(
+            "pandas", "openpyxl", "core_tools.library.file_processing",
+            "core_tools.schema_column_matcher", "shared.memory_manager",
+        )),
+        ("secrets", _utils.load_google_api_key),
+        ("model", lambda: warm_model(agent.model)),
+        ("clients", _warm_clients),
+        ("schema", _warm_schema),
+        ("agent_pool", lambda: _get_agent_pool().prewarm(1, warm=lambda shell: warm_model(shell.agent.model))),
+    ])
+
+
 def create_app():
     """
     Factory function to create FastAPI app with A2AServer.
@@ -519,14 +594,17 @@ def create_app():
     1. Loads lazy imports (first call triggers heavy imports)
     2. Creates the Strands Agent with tools and hooks
     3. Wraps agent in A2AServer for JSON-RPC protocol
-    4. Returns FastAPI app with health check endpoint
+    4. Returns FastAPI app with health check endpoint (reports prewarm
+       readiness; see shared/prewarm.py)
 
     Returns:
         FastAPI application ready for uvicorn.
     """
     _ensure_lazy_imports()
 
-    from fastapi import FastAPI
+    from fastapi import FastAPI, Response
+
+    from shared.prewarm import attach_prewarm
 
     # Get AGENT_ID for logging
     agent_id = _config.AGENT_ID if _config else "inventory_hub"
@@ -552,15 +630,20 @@ def create_app():
         description="Central intelligence for SGA file ingestion",
     )
 
+    # Warm file analysis stack, secrets and clients in the background once serving
+    prewarm = _create_prewarm(agent)
+    attach_prewarm(app, prewarm)
+
     @app.get("/ping")
-    def ping():
-        """Health check endpoint for AgentCore."""
-        return {
-            "status": "healthy",
+    def ping(response: Response):
+        """Health check endpoint for AgentCore (503 while prewarming)."""
+        status_code, body = prewarm.ping_response({
             "agent_id": agent_id,
             "protocol": "A2A",
             "port": 9000,
-        }
+        })
+        response.status_code = status_code
+        return body
 
     # Mount A2AServer at root (AgentCore expects A2A at /)
     app.mount("/", a2a_server.to_fastapi_app())
@@ -586,8 +669,11 @@ def _start_server():
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
+    from shared.startup_profiler import profile_create_app
+
     logger.info("[InventoryHub] Starting A2A Server on port 9000...")
-    app = create_app()
+    # Startup milestones recorded when STARTUP_PROFILE=true
+    app = profile_create_app("inventory_hub", create_app)
     uvicorn.run(app, host="0.0.0.0", port=9000)
 
 
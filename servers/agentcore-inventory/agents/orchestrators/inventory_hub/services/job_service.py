@@ -30,6 +30,7 @@ from typing import Any
 from shared.cognitive_error_handler import cognitive_sync_handler
 from shared.flow_logger import flow_log
 from shared.strands_a2a_client import A2AClient
+from shared.timing_ledger import merge_ledger
 
 logger = logging.getLogger(__name__)
 
@@ -297,9 +298,15 @@ def check_import_job_status(job_id: str, user_id: str) -> dict[str, Any]:
                 "rows_rejected": 20,
                 "percentage": 100
             },
-            "human_message": "Importacao finalizada! 1480 itens inseridos, 20 rejeitados."
+            "human_message": "Importacao finalizada! 1480 itens inseridos, 20 rejeitados.",
+            "timing": {"spans": [...], "phases": {"4": {...}}, "totals": {...}}
         }
 
+        "timing" is the import's timing ledger (shared/timing_ledger.py):
+        this orchestrator's own spans for the same session_id, with the
+        DataTransformer's phases/totals rollup merged in (its spans stay
+        with the job record).
+
         On error:
         {
             "success": False,
@@ -388,6 +395,9 @@ def check_import_job_status(job_id: str, user_id: str) -> dict[str, Any]:
                 "status": status,
                 "progress": progress,
                 "human_message": human_message,
+                "timing": merge_ledger(
+                    response_data.get("session_id"), response_data.get("timing")
+                ),
             }
 
         # Fallback
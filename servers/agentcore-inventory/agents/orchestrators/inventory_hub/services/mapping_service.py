@@ -6,9 +6,12 @@ and the generation of Human-in-the-Loop (HIL) questions for column mapping.
 
 Phase 3 Flow:
 1. InventoryHub calls invoke_schema_mapper_phase3() after Phase 2 analysis
-2. SchemaMapper agent performs semantic column matching
-3. If missing required fields: generate_hil_questions() creates frontend-compatible questions
-4. Frontend presents questions to user for column selection
+2. Mode 2.5 fast path: SchemaColumnMatcher (+ learned aliases) maps every
+   column deterministically → SchemaMappingResponse without any LLM call
+3. Otherwise (partial/ambiguous layout): SchemaMapper agent performs semantic
+   column matching via A2A
+4. If missing required fields: generate_hil_questions() creates frontend-compatible questions
+5. Frontend presents questions to user for column selection
 
 Architecture:
 - A2A via Strands Framework (IMMUTABLE rule: CLAUDE.md lines 31-36)
@@ -23,8 +26,10 @@ Reference:
 import asyncio
 import json
 import logging
+import os
+import re
 import uuid
-from typing import Any
+from typing import Any, Optional
 
 from shared.flow_logger import flow_log
 from shared.strands_a2a_client import A2AClient
@@ -33,11 +38,244 @@ logger = logging.getLogger(__name__)
 
 __all__ = [
     "invoke_schema_mapper_phase3",
+    "try_deterministic_mapping",
     "generate_hil_questions",
     "_merge_phase3_results",
     "_convert_missing_fields_to_questions",
 ]
 
+# =============================================================================
+# Deterministic Fast Path (Mode 2.5 for Phase 3)
+# =============================================================================
+# When every required column is matched at alias/learned level or better and
+# no column is ambiguous, the matcher alone produces the mapping proposal.
+# HIL confirmation is still required (requires_confirmation=True).
+
+SCHEMA_FAST_PATH_ENABLED = os.environ.get("SCHEMA_FAST_PATH_ENABLED", "true").lower() == "true"
+SCHEMA_FAST_PATH_MIN_CONFIDENCE = float(os.environ.get("SCHEMA_FAST_PATH_MIN_CONFIDENCE", "0.85"))
+
+TARGET_TABLE = "pending_entry_items"
+
+# NOT NULL columns filled by the DataTransformer, never by the source file
+_SYSTEM_POPULATED_COLUMNS = frozenset({"entry_id", "line_number"})
+
+# Business-critical columns (see generate_hil_questions CRITICAL_FIELDS)
+_ALWAYS_REQUIRED_COLUMNS = ("part_number", "quantity")
+
+# Content written by mapping_tools.save_training_example
+_LEARNED_ALIAS_PATTERN = re.compile(r"Column '([^']+)' maps to '([^']+)'")
+
+# Same detection rules as SchemaMapper TRANSFORM_PATTERNS
+_VALUE_TRANSFORMS = (
+    ("DATE_PARSE_PTBR", re.compile(r"^\d{2}/\d{2}/\d{4}$")),
+    ("CURRENCY_CLEAN_PTBR", re.compile(r"^R\$\s*\d")),
+    ("NUMBER_PARSE_PTBR", re.compile(r"^\d{1,3}(\.\d{3})*(,\d{2})?$")),
+)
+_CODE_COLUMNS = frozenset({"part_number", "serial_number", "serial_numbers"})
+
+
+def _match_type(confidence: float) -> str:
+    """Confidence band → match type (same bands as suggest_mappings)."""
+    if confidence >= 0.98:
+        return "exact"
+    if confidence >= 0.90:
+        return "learned"
+    if confidence >= 0.85:
+        return "alias"
+    return "fuzzy"
+
+
+def _infer_transform(target_column: str, values: list[str]) -> Optional[str]:
+    """Infer a DataTransformer pipeline from sample values."""
+    if values:
+        for name, pattern in _VALUE_TRANSFORMS:
+            if name == "NUMBER_PARSE_PTBR" and not any("," in v or "." in v for v in values):
+                continue
+            if all(pattern.match(v) for v in values):
+                return name
+    if target_column in _CODE_COLUMNS:
+        return "TRIM|UPPERCASE"
+    return None
+
+
+def _parse_learned_aliases(records: list[dict[str, Any]]) -> dict[str, str]:
+    """Extract source → target aliases from training-example memory records."""
+    aliases: dict[str, str] = {}
+    for record in records:
+        metadata = record.get("metadata") or {}
+        if isinstance(metadata, dict) and metadata.get("source_column") and metadata.get("target_column"):
+            aliases[metadata["source_column"]] = metadata["target_column"]
+            continue
+        content = record.get("content", "")
+        if isinstance(content, dict):
+            content = content.get("text", "")
+        for source, target in _LEARNED_ALIAS_PATTERN.findall(str(content)):
+            aliases[source] = target
+    return aliases
+
+
+async def _observe_learned_aliases(import_session_id: str) -> dict[str, str]:
+    """Load user-taught column aliases from the global memory namespace."""
+    from shared.memory_manager import AgentMemoryManager
+
+    memory = AgentMemoryManager(agent_id="inventory_hub", actor_id=import_session_id or "system")
+    records = await memory.observe_global(
+        query="column mapping training example",
+        limit=50,
+    )
+    return _parse_learned_aliases(records)
+
+
+def try_deterministic_mapping(
+    columns: list[str],
+    sample_data: list[dict[str, Any]],
+    import_session_id: str,
+    learned_aliases: Optional[dict[str, str]] = None,
+    schema_provider=None,
+    min_confidence: float = SCHEMA_FAST_PATH_MIN_CONFIDENCE,
+) -> tuple[Optional[dict[str, Any]], str]:
+    """
+    Map columns without the LLM when the layout is unambiguous.
+
+    The layout is accepted only if every required target column is matched
+    at or above min_confidence, every matched source column clears the
+    threshold (no fuzzy matches) and no two source columns claim the same
+    target. Columns with no match at all are reported as unmapped.
+
+    Args:
+        columns: Source column names from Phase 2 analysis
+        sample_data: Sample rows (used for transform inference)
+        import_session_id: Import session identifier
+        learned_aliases: Optional source → target aliases from memory
+        schema_provider: Optional SchemaProvider (defaults to singleton)
+        min_confidence: Minimum per-column confidence
+
+    Returns:
+        Tuple of (SchemaMappingResponse dict or None, reason). None means the
+        layout must be escalated to the SchemaMapper agent.
+    """
+    from core_tools.schema_column_matcher import get_column_matcher
+    from shared.agent_schemas import ColumnMapping, MappingStatus, SchemaMappingResponse
+
+    if not columns:
+        return None, "no_columns"
+
+    if schema_provider is None:
+        from core_tools.schema_provider import get_schema_provider
+        schema_provider = get_schema_provider()
+
+    schema = schema_provider.get_table_schema(TARGET_TABLE)
+    if not schema or not schema.columns:
+        return None, "schema_unavailable"
+
+    schema_columns = schema.get_column_names()
+    required = [c for c in schema.required_columns if c not in _SYSTEM_POPULATED_COLUMNS]
+    required += [c for c in _ALWAYS_REQUIRED_COLUMNS if c in schema_columns and c not in required]
+
+    matcher = get_column_matcher(schema_provider)
+    if learned_aliases:
+        matcher.load_learned_aliases(learned_aliases)
+
+    sources_by_target: dict[str, list[str]] = {}
+    confidences: dict[str, float] = {}
+    unmapped: list[str] = []
+    ambiguous: list[str] = []
+
+    for source, (target, confidence) in matcher.match_all_columns(columns, TARGET_TABLE).items():
+        if target is None:
+            unmapped.append(source)
+        elif confidence < min_confidence:
+            ambiguous.append(source)
+        else:
+            sources_by_target.setdefault(target, []).append(source)
+            confidences[source] = confidence
+
+    collisions = [t for t, sources in sources_by_target.items() if len(sources) > 1]
+    missing = [t for t in required if t not in sources_by_target]
+
+    if ambiguous:
+        return None, f"ambiguous_columns={len(ambiguous)}"
+    if collisions:
+        return None, f"target_collisions={len(collisions)}"
+    if missing:
+        return None, f"missing_required={len(missing)}"
+
+    mappings: list[ColumnMapping] = []
+    patterns_used: list[str] = []
+    for target, (source,) in sources_by_target.items():
+        confidence = confidences[source]
+        match_type = _match_type(confidence)
+        values = [
+            str(row[source]).strip()
+            for row in (sample_data or [])[:3]
+            if isinstance(row, dict) and row.get(source) not in (None, "")
+        ]
+        mappings.append(ColumnMapping(
+            source_column=source,
+            target_column=target,
+            transform=_infer_transform(target, values),
+            confidence=round(confidence, 3),
+            reason=f"Deterministic {match_type} match",
+        ))
+        if match_type == "learned":
+            patterns_used.append(f"{source} -> {target}")
+
+    response = SchemaMappingResponse(
+        success=True,
+        status=MappingStatus.SUCCESS,
+        session_id=import_session_id,
+        target_table=TARGET_TABLE,
+        mappings=mappings,
+        unmapped_source_columns=unmapped,
+        overall_confidence=round(sum(m.confidence for m in mappings) / len(mappings), 3),
+        requires_confirmation=True,
+        patterns_used=patterns_used,
+        mapping_mode="deterministic",
+    )
+    return response.model_dump(mode="json"), "all_required_matched"
+
+
+def _run_sync(coro):
+    """Sync-to-async bridge (reuses the current event loop when possible)."""
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop.run_until_complete(coro)
+
+
+def _invoke_fast_path(
+    columns: list[str],
+    sample_data: list[dict[str, Any]],
+    import_session_id: str,
+) -> Optional[dict[str, Any]]:
+    """
+    Run the deterministic mapper, loading learned aliases only if needed.
+
+    Built-in aliases are tried first; AgentCore Memory is queried only when
+    they are not enough to settle the layout.
+    """
+    try:
+        result, reason = try_deterministic_mapping(columns, sample_data, import_session_id)
+        if result is None and reason not in ("no_columns", "schema_unavailable"):
+            learned = _run_sync(_observe_learned_aliases(import_session_id))
+            if learned:
+                result, reason = try_deterministic_mapping(
+                    columns, sample_data, import_session_id, learned_aliases=learned
+                )
+    except Exception as e:
+        logger.warning(f"[Phase3] Deterministic mapping failed, escalating to SchemaMapper: {e}")
+        return None
+
+    flow_log.decision(
+        "Deterministic mapping" if result else "Escalating to SchemaMapper",
+        session_id=import_session_id,
+        reason=reason,
+        mappings_count=len(result["mappings"]) if result else 0,
+    )
+    return result
+
 
 def invoke_schema_mapper_phase3(
     columns: list[str],
@@ -49,7 +287,9 @@ def invoke_schema_mapper_phase3(
     Invoke SchemaMapper via A2A to get column mappings and/or HIL questions.
 
     Called automatically after Phase 2 (file analysis) to trigger Phase 3
-    (semantic column mapping). The SchemaMapper uses Gemini 2.5 Pro with
+    (semantic column mapping). Unambiguous layouts are mapped
+    deterministically (see try_deterministic_mapping); only partial or
+    ambiguous layouts reach the SchemaMapper, which uses Gemini 2.5 Pro with
     thinking enabled for high-quality mapping decisions.
 
     Args:
@@ -99,6 +339,22 @@ def invoke_schema_mapper_phase3(
         3, "SchemaMapper", import_session_id, source_columns_count=len(columns)
     )
 
+    if SCHEMA_FAST_PATH_ENABLED:
+        fast_result = _invoke_fast_path(columns, sample_data, import_session_id)
+        if fast_result is not None:
+            flow_log.phase_end(
+                3,
+                "SchemaMapper",
+                import_session_id,
+                "SUCCESS",
+                0,
+                questions_count=0,
+                mappings_count=len(fast_result["mappings"]),
+                mapping_status=fast_result["status"],
+                mode="deterministic",
+            )
+            return fast_result
+
     async def _invoke() -> dict[str, Any]:
         """Async wrapper for A2A invocation."""
         a2a_client = A2AClient()
@@ -119,13 +375,7 @@ def invoke_schema_mapper_phase3(
 
     try:
         # Sync-to-async bridge pattern
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        result = loop.run_until_complete(_invoke())
+        result = _run_sync(_invoke())
 
         # Extract response from A2AResponse
         if hasattr(result, "success") and not result.success:
@@ -189,7 +439,7 @@ def invoke_schema_mapper_phase3(
                 0,  # Duration tracked separately
                 questions_count=questions_count,
                 mappings_count=len(response_data.get("mappings", [])),
-                status=response_data.get("status", "unknown"),
+                mapping_status=response_data.get("status", "unknown"),
             )
         else:
             logger.error(
@@ -389,28 +389,15 @@ def create_a2a_server(agent: Agent) -> A2AServer:
 # =============================================================================
 
 
-def main() -> None:
+def create_app():
     """
-    Start the DataTransformer A2A server.
-
-    For local development:
-        cd server/agentcore-inventory
-        python -m agents.specialists.data_transformer.main
+    Create the FastAPI app: /ping, /health and the A2A server mounted at root.
 
-    For AgentCore deployment:
-        agentcore deploy --profile faiston-aio
+    Returns:
+        FastAPI application ready for uvicorn.
     """
-    # Import FastAPI and uvicorn here to avoid circular imports
+    # Import FastAPI here to avoid circular imports
     from fastapi import FastAPI
-    import uvicorn
-
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
-
-    logger.info(f"[DataTransformer] Starting A2A server on port {AGENT_PORT}...")
 
     # Create FastAPI app
     app = FastAPI(title=AGENT_NAME, version=AGENT_VERSION)
@@ -450,6 +437,35 @@ def main() -> None:
     # Mount A2A server at root
     app.mount("/", a2a_server.to_fastapi_app())
 
+    return app
+
+
+def main() -> None:
+    """
+    Start the DataTransformer A2A server.
+
+    For local development:
+        cd server/agentcore-inventory
+        python -m agents.specialists.data_transformer.main
+
+    For AgentCore deployment:
+        agentcore deploy --profile faiston-aio
+    """
+    import uvicorn
+
+    from shared.startup_profiler import profile_create_app
+
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    logger.info(f"[DataTransformer] Starting A2A server on port {AGENT_PORT}...")
+
+    # Build app (startup milestones recorded when STARTUP_PROFILE=true)
+    app = profile_create_app(AGENT_ID, create_app)
+
     # Start server with uvicorn
     logger.info(f"[DataTransformer] Starting uvicorn server on 0.0.0.0:{AGENT_PORT}")
     uvicorn.run(app, host="0.0.0.0", port=AGENT_PORT)
@@ -466,6 +482,7 @@ __all__ = [
     "RUNTIME_ID",
     "create_agent",
     "create_a2a_server",
+    "create_app",
     "main",
 ]
 
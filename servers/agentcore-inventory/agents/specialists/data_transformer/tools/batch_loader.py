@@ -26,6 +26,7 @@ from core_tools.mcp_gateway_client import MCPGatewayClient, MCPGatewayClientFact
 
 # FAIL-CLOSED environment configuration (no production fallbacks)
 from shared.env_config import get_required_env
+from shared.timing_ledger import record_usage, timed
 
 logger = logging.getLogger(__name__)
 
@@ -156,6 +157,7 @@ def insert_pending_items_batch(
 
 
 @tool
+@timed("batch_loader.insert_all_batches", phase=4)
 def insert_all_batches(
     batches_json: str,
     session_id: str,
@@ -220,6 +222,7 @@ def insert_all_batches(
                 "success": result.get("success", False),
             })
 
+        record_usage(rows_inserted=total_inserted)
         success = total_inserted > 0 or total_errors == 0
 
         logger.info(
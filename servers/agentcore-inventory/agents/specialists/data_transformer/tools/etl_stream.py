@@ -29,6 +29,7 @@ import pandas as pd
 from strands import tool
 
 from shared.env_config import get_required_env
+from shared.timing_ledger import record_call, record_usage, timed
 
 # Cognitive error handling (Nexo Immune System) - enrich_batch_errors for batch error analysis
 from shared.cognitive_error_handler import enrich_batch_errors
@@ -273,6 +274,7 @@ def _transform_row(
 
 
 @tool
+@timed("etl_stream.stream_and_transform", phase=4)
 def stream_and_transform(
     s3_key: str,
     mappings_json: str,
@@ -329,6 +331,7 @@ def stream_and_transform(
         s3 = _get_s3_client()
         response = s3.get_object(Bucket=DOCUMENTS_BUCKET, Key=s3_key)
         file_content = response["Body"].read()
+        record_call("s3", bytes_read=len(file_content))
 
         # Detect file type and read
         file_type = _detect_file_type(s3_key)
@@ -397,6 +400,7 @@ def stream_and_transform(
             if stopped_early:
                 break
 
+        record_usage(rows=rows_processed)
         logger.info(
             f"[ETLStream] Completed: {rows_processed} processed, "
             f"{rows_transformed} transformed, {len(all_errors)} errors"
@@ -32,6 +32,9 @@ from shared.memory_manager import AgentMemoryManager, MemoryOriginType
 # Schemas
 from shared.agent_schemas import TransformationStatus
 
+# Per-import timing ledger (full ledger kept with the job record)
+from shared.timing_ledger import ledger_snapshot, ledger_summary
+
 logger = logging.getLogger(__name__)
 
 # Agent ID for cognitive error routing (matches parent agent)
@@ -78,6 +81,7 @@ async def _trigger_observation_analysis(
                 "job_id": job_id,
                 "actor_id": user_id,
                 "time_window_hours": 24,  # Tactical analysis
+                "incremental": True,  # Only activity since the last trigger
             },
             timeout=5.0,  # Short timeout - fire and forget
         )
@@ -211,6 +215,8 @@ def get_job_status(job_id: str) -> str:
             "success": True,
             **job,
             "progress_percent": progress,
+            # Tool output goes through the LLM: phases/totals only, no spans
+            "timing": ledger_summary(job.get("timing") or ledger_snapshot(job["session_id"])),
         })
 
     except Exception as e:
@@ -297,6 +303,7 @@ def update_job_status(
         # Set completed_at if terminal status
         if status in ["completed", "failed", "partial"]:
             job["completed_at"] = _now_iso()
+            job["timing"] = ledger_snapshot(job["session_id"])
 
             # Fire-and-forget: Trigger ObservationAgent for pattern analysis
             # This is non-blocking and does not affect the job completion flow
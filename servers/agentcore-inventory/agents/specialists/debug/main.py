@@ -716,22 +716,13 @@ def create_agent() -> Agent:
 # A2A Server Entry Point
 # =============================================================================
 
-def main():
+def create_app():
     """
-    Start the Strands A2AServer with FastAPI wrapper.
+    Create the FastAPI app: /ping and the Strands A2AServer mounted at root.
 
-    Port 9000 is the standard for A2A protocol.
-    Includes /ping health endpoint for AWS ALB.
+    Returns:
+        FastAPI application ready for uvicorn.
     """
-    logger.info(f"[{AGENT_NAME}] Starting Strands A2AServer on port 9000...")
-    logger.info(f"[{AGENT_NAME}] Model: {MODEL_ID}")
-    logger.info(f"[{AGENT_NAME}] Version: {AGENT_VERSION}")
-    logger.info(f"[{AGENT_NAME}] Role: SPECIALIST (Error Analysis)")
-    logger.info(f"[{AGENT_NAME}] Memory Namespace: {MEMORY_NAMESPACE}")
-    logger.info(f"[{AGENT_NAME}] Skills: {len(AGENT_SKILLS)} registered")
-    for skill in AGENT_SKILLS:
-        logger.info(f"[{AGENT_NAME}]   - {skill.id}: {skill.name}")
-
     # Create FastAPI app first
     app = FastAPI(title=AGENT_NAME, version=AGENT_VERSION)
 
@@ -760,6 +751,29 @@ def main():
 
     # Mount A2A server at root
     app.mount("/", a2a_server.to_fastapi_app())
+    return app
+
+
+def main():
+    """
+    Start the Strands A2AServer with FastAPI wrapper.
+
+    Port 9000 is the standard for A2A protocol.
+    Includes /ping health endpoint for AWS ALB.
+    """
+    from shared.startup_profiler import profile_create_app
+
+    logger.info(f"[{AGENT_NAME}] Starting Strands A2AServer on port 9000...")
+    logger.info(f"[{AGENT_NAME}] Model: {MODEL_ID}")
+    logger.info(f"[{AGENT_NAME}] Version: {AGENT_VERSION}")
+    logger.info(f"[{AGENT_NAME}] Role: SPECIALIST (Error Analysis)")
+    logger.info(f"[{AGENT_NAME}] Memory Namespace: {MEMORY_NAMESPACE}")
+    logger.info(f"[{AGENT_NAME}] Skills: {len(AGENT_SKILLS)} registered")
+    for skill in AGENT_SKILLS:
+        logger.info(f"[{AGENT_NAME}]   - {skill.id}: {skill.name}")
+
+    # Build app (startup milestones recorded when STARTUP_PROFILE=true)
+    app = profile_create_app(AGENT_ID, create_app)
 
     # Start server with uvicorn
     logger.info(f"[{AGENT_NAME}] Starting uvicorn server on 0.0.0.0:9000")
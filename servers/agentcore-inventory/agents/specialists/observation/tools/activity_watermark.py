@@ -0,0 +1,296 @@
+# =============================================================================
+# ObservationAgent: Activity Watermarks
+# =============================================================================
+# Per-actor scan watermarks for incremental scan_recent_activity.
+#
+# Each (actor, time window) keeps:
+# - last processed timestamp + record fingerprints at that timestamp
+# - running PatternAggregates (see pattern_engine.py)
+# - activity summary counters in SUMMARY_BUCKETS time buckets per window;
+#   buckets that fall out of the window are dropped on every scan, so the
+#   summary covers the window (to a resolution of window / SUMMARY_BUCKETS)
+#
+# Post-import triggers (job_manager._trigger_observation_analysis) then only
+# fetch and fold records newer than the watermark, so cost is proportional
+# to new activity instead of the lookback window.
+#
+# STORAGE:
+# - In-process dict (warm container, no I/O)
+# - DynamoDB item in INVENTORY_TABLE (PK=USER#{actor}, SK=OBSERVATION#WATERMARK#{hours})
+#   so watermarks survive cold starts. Missing table config degrades to
+#   in-process only.
+#
+# Once the aggregates span two time windows the watermark is discarded and the
+# next scan rebuilds them from the full window (bounded staleness).
+#
+# VERSION: 2026-01-22T00:00:00Z
+# =============================================================================
+
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from shared.debug_utils import debug_error
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+WATERMARK_SK_PREFIX = "OBSERVATION#WATERMARK#"
+MAX_TRACKED_SESSIONS = 500
+SUMMARY_BUCKETS = 24
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_watermarks: Dict[Tuple[str, int], "ActivityWatermark"] = {}
+_watermarks_lock = threading.Lock()
+_table = None
+_table_unavailable = False
+
+
+# =============================================================================
+# Timestamp Helpers
+# =============================================================================
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO-8601 timestamp (naive values are treated as UTC)."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _to_iso(value: datetime) -> str:
+    return value.astimezone(timezone.utc).replace(tzinfo=None).isoformat() + "Z"
+
+
+# =============================================================================
+# Watermark State
+# =============================================================================
+
+
+@dataclass
+class ActivityWatermark:
+    """Incremental scan state for one actor and time window."""
+    actor_id: str
+    time_window_hours: int
+    window_started_at: str
+    last_timestamp: str = ""
+    last_record_ids: List[str] = field(default_factory=list)
+    aggregates: Dict[str, Any] = field(default_factory=dict)
+    summary: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # bucket start -> counters
+    updated_at: str = ""
+
+    @classmethod
+    def start(cls, actor_id: str, time_window_hours: int) -> "ActivityWatermark":
+        """New watermark whose epoch starts at the beginning of the window."""
+        started = _utc_now() - timedelta(hours=time_window_hours)
+        return cls(
+            actor_id=actor_id,
+            time_window_hours=time_window_hours,
+            window_started_at=_to_iso(started),
+        )
+
+    def is_expired(self) -> bool:
+        """True once the aggregates span two full time windows."""
+        started = parse_timestamp(self.window_started_at)
+        if started is None:
+            return True
+        return _utc_now() - started > timedelta(hours=2 * self.time_window_hours)
+
+    def is_new(self, fingerprint: str, timestamp: Optional[str]) -> bool:
+        """True if a record is past the watermark (ties broken by fingerprint)."""
+        last = parse_timestamp(self.last_timestamp)
+        current = parse_timestamp(timestamp)
+        if last is None or current is None:
+            return True
+        if current > last:
+            return True
+        return current == last and fingerprint not in self.last_record_ids
+
+    def window_cutoff(self) -> datetime:
+        """Oldest timestamp inside the time window right now."""
+        return _utc_now() - timedelta(hours=self.time_window_hours)
+
+    def summary_bucket(self, timestamp: Optional[str]) -> str:
+        """Summary bucket key for a record timestamp (now if missing)."""
+        current = parse_timestamp(timestamp) or _utc_now()
+        width = timedelta(hours=self.time_window_hours) / SUMMARY_BUCKETS
+        return _to_iso(_EPOCH + ((current - _EPOCH) // width) * width)
+
+    def prune_summary(self) -> None:
+        """Drop summary buckets that end before the window cutoff."""
+        width = timedelta(hours=self.time_window_hours) / SUMMARY_BUCKETS
+        cutoff = self.window_cutoff()
+        self.summary = {
+            start: counters
+            for start, counters in self.summary.items()
+            if (parse_timestamp(start) or _EPOCH) + width > cutoff
+        }
+
+    def advance(self, records: List[Tuple[str, Optional[str]]]) -> None:
+        """Move the watermark past (fingerprint, timestamp) pairs just folded."""
+        last = parse_timestamp(self.last_timestamp)
+        for fingerprint, timestamp in records:
+            current = parse_timestamp(timestamp)
+            if current is None:
+                continue
+            if last is None or current > last:
+                last = current
+                self.last_timestamp = timestamp
+                self.last_record_ids = [fingerprint]
+            elif current == last and fingerprint not in self.last_record_ids:
+                self.last_record_ids.append(fingerprint)
+        self.updated_at = _to_iso(_utc_now())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "actor_id": self.actor_id,
+            "time_window_hours": self.time_window_hours,
+            "window_started_at": self.window_started_at,
+            "last_timestamp": self.last_timestamp,
+            "last_record_ids": self.last_record_ids,
+            "aggregates": self.aggregates,
+            "summary": self.summary,
+            "updated_at": self.updated_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ActivityWatermark":
+        return cls(
+            actor_id=data["actor_id"],
+            time_window_hours=int(data["time_window_hours"]),
+            window_started_at=data.get("window_started_at", ""),
+            last_timestamp=data.get("last_timestamp", ""),
+            last_record_ids=list(data.get("last_record_ids", [])),
+            aggregates=dict(data.get("aggregates", {})),
+            summary=dict(data.get("summary", {})),
+            updated_at=data.get("updated_at", ""),
+        )
+
+
+# =============================================================================
+# Persistence
+# =============================================================================
+
+
+def _get_table():
+    """Lazy-load the inventory table (None if not configured)."""
+    global _table, _table_unavailable
+    if _table is None and not _table_unavailable:
+        try:
+            from shared.env_config import get_required_env
+            table_name = get_required_env("INVENTORY_TABLE", "observation watermarks")
+            import boto3
+            _table = boto3.resource("dynamodb", region_name="us-east-2").Table(table_name)
+        except Exception as e:
+            logger.warning(f"[ActivityWatermark] Persistence disabled: {e}")
+            _table_unavailable = True
+    return _table
+
+
+def _item_key(actor_id: str, time_window_hours: int) -> Dict[str, str]:
+    return {"PK": f"USER#{actor_id}", "SK": f"{WATERMARK_SK_PREFIX}{time_window_hours}"}
+
+
+def load_watermark(actor_id: str, time_window_hours: int) -> Optional[ActivityWatermark]:
+    """
+    Load the watermark for an actor/window (in-process first, then DynamoDB).
+
+    Expired watermarks are dropped and None is returned, so the caller
+    performs a full-window scan.
+    """
+    key = (actor_id, time_window_hours)
+    with _watermarks_lock:
+        watermark = _watermarks.get(key)
+
+    if watermark is None:
+        table = _get_table()
+        if table is not None:
+            try:
+                item = table.get_item(Key=_item_key(actor_id, time_window_hours)).get("Item")
+                if item and item.get("state"):
+                    watermark = ActivityWatermark.from_dict(json.loads(item["state"]))
+            except Exception as e:
+                debug_error(e, "observation_watermark_load", {"actor_id": actor_id})
+
+    if watermark is None:
+        return None
+    if watermark.is_expired():
+        with _watermarks_lock:
+            _watermarks.pop(key, None)
+        return None
+
+    with _watermarks_lock:
+        _watermarks[key] = watermark
+    return watermark
+
+
+def save_watermark(watermark: ActivityWatermark) -> bool:
+    """
+    Save a watermark (in-process always, DynamoDB when configured).
+
+    Returns:
+        True if the watermark was persisted to DynamoDB
+    """
+    key = (watermark.actor_id, watermark.time_window_hours)
+    with _watermarks_lock:
+        _watermarks[key] = watermark
+
+    table = _get_table()
+    if table is None:
+        return False
+
+    expires_at = int((_utc_now() + timedelta(hours=2 * watermark.time_window_hours)).timestamp())
+    try:
+        table.put_item(Item={
+            **_item_key(watermark.actor_id, watermark.time_window_hours),
+            "state": json.dumps(watermark.to_dict()),
+            "updatedAt": watermark.updated_at,
+            "expiresAt": expires_at,
+        })
+        return True
+    except Exception as e:
+        debug_error(e, "observation_watermark_save", {"actor_id": watermark.actor_id})
+        return False
+
+
+def load_pattern_aggregates(actor_id: str, time_window_hours: int) -> Optional[Dict[str, Any]]:
+    """Saved PatternAggregates dict for an actor/window, if any."""
+    watermark = load_watermark(actor_id, time_window_hours)
+    if watermark is None:
+        return None
+    return watermark.aggregates or None
+
+
+def reset_watermarks() -> None:
+    """Drop in-process watermarks (tests, forced full rescans)."""
+    with _watermarks_lock:
+        _watermarks.clear()
+
+
+__all__ = [
+    "ActivityWatermark",
+    "load_watermark",
+    "save_watermark",
+    "load_pattern_aggregates",
+    "reset_watermarks",
+    "parse_timestamp",
+    "MAX_TRACKED_SESSIONS",
+    "SUMMARY_BUCKETS",
+]
@@ -0,0 +1,472 @@
+# =============================================================================
+# ObservationAgent: Compiled Pattern Analysis Engine
+# =============================================================================
+# Deterministic engine behind the analyze_patterns tool.
+#
+# DESIGN:
+# - Each episode is classified with ONE pass of a precompiled regex that
+#   contains every ERROR_PATTERNS keyword (case-insensitive, no lowercase copy)
+# - Column/mapping extractors are compiled once at import time
+# - Frequencies are accumulated in a single pass; max frequency computed once
+# - Semantic similarity is O(1): a common prefix/suffix of >= 3 chars exists
+#   iff the first/last 3 chars match, and per-column results are memoized
+#
+# INCREMENTAL MODE:
+# PatternAggregates holds everything the detectors need (bucket counts,
+# samples, unmapped column counts, learned mappings, hour/category counts).
+# New facts/episodes are folded into saved aggregates via fold(), so a run
+# only costs time proportional to new activity. Aggregates round-trip through
+# to_dict()/from_dict() for persistence (see scan_recent_activity).
+#
+# VERSION: 2026-01-22T00:00:00Z
+# =============================================================================
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+# =============================================================================
+# Pattern Taxonomy
+# =============================================================================
+
+# Error pattern taxonomy (dict order = classification priority)
+ERROR_PATTERNS = {
+    "SchemaMismatch": {
+        "keywords": ["missing column", "column not found", "unknown column", "schema"],
+        "severity": "critical",
+    },
+    "DataIntegrity": {
+        "keywords": ["type conversion", "null value", "invalid type", "parsing error"],
+        "severity": "warning",
+    },
+    "BusinessLogic": {
+        "keywords": ["duplicate", "negative stock", "constraint violation", "unique"],
+        "severity": "critical",
+    },
+    "Formatting": {
+        "keywords": ["date format", "currency", "number format", "encoding"],
+        "severity": "info",
+    },
+}
+
+# Triangulation weights for mapping detection
+TRIANGULATION_WEIGHTS = {
+    "frequency": 0.3,    # How often the column appears unmapped
+    "semantic": 0.4,     # Semantic similarity to known target columns
+    "history": 0.3,      # Historical success rate of similar mappings
+}
+
+# Known target schema columns (for semantic matching)
+TARGET_SCHEMA_COLUMNS = [
+    "part_number", "serial_number", "description", "quantity",
+    "unit_price", "total_value", "location", "status",
+    "manufacturer", "category", "model", "batch_number",
+]
+
+# Number of sample errors kept per bucket
+MAX_SAMPLES_PER_BUCKET = 3
+
+# Bound on remembered record fingerprints (dedup across incremental folds)
+MAX_SEEN_FINGERPRINTS = 5000
+
+_SEVERITY_ORDER = {"critical": 0, "warning": 1, "info": 2}
+
+
+# =============================================================================
+# Precompiled Matchers
+# =============================================================================
+
+
+def _build_error_classifier() -> Tuple["re.Pattern[str]", Dict[str, int]]:
+    """
+    Compile every ERROR_PATTERNS keyword into one case-insensitive regex.
+
+    The zero-width lookahead lets finditer() report overlapping keywords,
+    so the highest-priority type always wins regardless of match position.
+    Returns (pattern, {group_name: priority}).
+    """
+    alternatives = []
+    priorities: Dict[str, int] = {}
+    for priority, (pattern_type, config) in enumerate(ERROR_PATTERNS.items()):
+        group = f"t{priority}"
+        priorities[group] = priority
+        keywords = sorted(config["keywords"], key=len, reverse=True)
+        alternatives.append(
+            f"(?P<{group}>{'|'.join(re.escape(k) for k in keywords)})"
+        )
+    return re.compile(f"(?=(?:{'|'.join(alternatives)}))", re.IGNORECASE), priorities
+
+
+_ERROR_CLASSIFIER, _ERROR_GROUP_PRIORITY = _build_error_classifier()
+_ERROR_TYPES = list(ERROR_PATTERNS.keys())
+
+_FAILURE_OUTCOME_RE = re.compile(r"error|fail", re.IGNORECASE)
+
+_UNMAPPED_COLUMN_RE = re.compile(
+    r"(?:unmapped column|unknown column|missing mapping for)[:\s]+['\"]?(\w+)['\"]?",
+    re.IGNORECASE,
+)
+
+_LEARNED_MAPPING_RE = re.compile(
+    r"['\"]?(\w+)['\"]?\s+maps?\s+to\s+['\"]?(\w+)['\"]?",
+    re.IGNORECASE,
+)
+
+_NORMALIZE_TABLE = str.maketrans("", "", "_-")
+_NORMALIZED_TARGETS = [
+    (target, target.lower().translate(_NORMALIZE_TABLE))
+    for target in TARGET_SCHEMA_COLUMNS
+]
+
+
+def classify_error(content: str) -> str:
+    """
+    Classify error content into an ERROR_PATTERNS type in one regex pass.
+
+    Args:
+        content: Episode content (any case)
+
+    Returns:
+        Pattern type name, or "Unknown" if no keyword matches
+    """
+    best = len(_ERROR_TYPES)
+    for match in _ERROR_CLASSIFIER.finditer(content):
+        priority = _ERROR_GROUP_PRIORITY[match.lastgroup]
+        if priority < best:
+            best = priority
+            if best == 0:
+                break
+    return _ERROR_TYPES[best] if best < len(_ERROR_TYPES) else "Unknown"
+
+
+def calculate_semantic_similarity(source: str, target: str) -> float:
+    """
+    Calculate semantic similarity between source and target column names.
+
+    Uses simple heuristics:
+    - Exact match: 1.0
+    - Substring match: 0.7
+    - Common prefix (>= 3 chars): 0.5
+    - Common suffix (>= 3 chars): 0.4
+    - No match: 0.0
+    """
+    source = source.lower().translate(_NORMALIZE_TABLE)
+    target = target.lower().translate(_NORMALIZE_TABLE)
+    return _similarity_normalized(source, target)
+
+
+def _similarity_normalized(source: str, target: str) -> float:
+    """Similarity for already-normalized names (see calculate_semantic_similarity)."""
+    if source == target:
+        return 1.0
+
+    if source in target or target in source:
+        return 0.7
+
+    if len(source) >= 3 and len(target) >= 3:
+        if source[:3] == target[:3]:
+            return 0.5
+        if source[-3:] == target[-3:]:
+            return 0.4
+
+    return 0.0
+
+
+@lru_cache(maxsize=1024)
+def best_target_for(column: str) -> Tuple[Optional[str], float]:
+    """
+    Best TARGET_SCHEMA_COLUMNS match for a source column (memoized).
+
+    Returns:
+        Tuple (target or None, similarity score)
+    """
+    normalized = column.lower().translate(_NORMALIZE_TABLE)
+    best_target = None
+    best_score = 0.0
+    for target, normalized_target in _NORMALIZED_TARGETS:
+        score = _similarity_normalized(normalized, normalized_target)
+        if score > best_score:
+            best_score = score
+            best_target = target
+            if score == 1.0:
+                break
+    return best_target, best_score
+
+
+def record_fingerprint(record: Dict[str, Any]) -> str:
+    """Stable fingerprint for a memory record (dedup across folds)."""
+    record_id = record.get("memory_record_id") or record.get("record_id")
+    if record_id:
+        return str(record_id)
+    raw = "|".join(
+        str(record.get(k, "")) for k in ("content", "timestamp", "session_id", "category")
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+# =============================================================================
+# Incremental Aggregates
+# =============================================================================
+
+
+@dataclass
+class PatternAggregates:
+    """
+    Running aggregates for pattern detection.
+
+    Everything the detectors need is kept as counters and bounded samples,
+    so folding new records never requires the full memory history.
+    """
+    error_counts: Dict[str, int] = field(default_factory=dict)
+    error_samples: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    unmapped_columns: Dict[str, int] = field(default_factory=dict)
+    learned_mappings: Dict[str, str] = field(default_factory=dict)
+    hour_counts: Dict[str, int] = field(default_factory=dict)
+    category_counts: Dict[str, int] = field(default_factory=dict)
+    seen: List[str] = field(default_factory=list)
+    facts_folded: int = 0
+    episodes_folded: int = 0
+
+    # -------------------------------------------------------------------------
+    # Folding
+    # -------------------------------------------------------------------------
+
+    def fold(
+        self,
+        facts: Iterable[Dict[str, Any]] = (),
+        episodes: Iterable[Dict[str, Any]] = (),
+        dedupe: bool = True,
+    ) -> int:
+        """
+        Fold new facts and episodes into the aggregates.
+
+        Args:
+            facts: New fact records
+            episodes: New episode records
+            dedupe: Skip records already folded (same fingerprint). Use
+                False for a one-shot analysis of a single activity window,
+                where repeated identical records are real occurrences.
+
+        Returns:
+            Number of records folded
+        """
+        seen = set(self.seen)
+        folded = 0
+
+        for fact in facts:
+            fingerprint = record_fingerprint(fact)
+            if dedupe and fingerprint in seen:
+                continue
+            if fingerprint not in seen:
+                seen.add(fingerprint)
+                self.seen.append(fingerprint)
+            self._fold_fact(fact)
+            folded += 1
+
+        for episode in episodes:
+            fingerprint = record_fingerprint(episode)
+            if dedupe and fingerprint in seen:
+                continue
+            if fingerprint not in seen:
+                seen.add(fingerprint)
+                self.seen.append(fingerprint)
+            self._fold_episode(episode)
+            folded += 1
+
+        if len(self.seen) > MAX_SEEN_FINGERPRINTS:
+            self.seen = self.seen[-MAX_SEEN_FINGERPRINTS:]
+
+        return folded
+
+    def _fold_fact(self, fact: Dict[str, Any]) -> None:
+        """Fold a single fact (learned mappings + category counts)."""
+        self.facts_folded += 1
+        category = fact.get("category", "unknown")
+        self.category_counts[category] = self.category_counts.get(category, 0) + 1
+
+        if "mapping" in (category or "").lower():
+            match = _LEARNED_MAPPING_RE.search(fact.get("content", ""))
+            if match:
+                self.learned_mappings[match.group(1).lower()] = match.group(2).lower()
+
+    def _fold_episode(self, episode: Dict[str, Any]) -> None:
+        """Fold a single episode (errors, unmapped columns, activity hours)."""
+        self.episodes_folded += 1
+        content = episode.get("content", "")
+
+        if _FAILURE_OUTCOME_RE.search(episode.get("outcome", "")):
+            error_type = classify_error(content)
+            self.error_counts[error_type] = self.error_counts.get(error_type, 0) + 1
+            samples = self.error_samples.setdefault(error_type, [])
+            if len(samples) < MAX_SAMPLES_PER_BUCKET:
+                samples.append({
+                    "content": content,
+                    "session_id": episode.get("session_id", ""),
+                    "timestamp": episode.get("timestamp", ""),
+                })
+
+        for column in _UNMAPPED_COLUMN_RE.findall(content):
+            self.unmapped_columns[column] = self.unmapped_columns.get(column, 0) + 1
+
+        timestamp = episode.get("timestamp", "")
+        if timestamp:
+            try:
+                hour = str(datetime.fromisoformat(timestamp.replace("Z", "+00:00")).hour)
+                self.hour_counts[hour] = self.hour_counts.get(hour, 0) + 1
+            except ValueError:
+                pass
+
+    # -------------------------------------------------------------------------
+    # Detection
+    # -------------------------------------------------------------------------
+
+    def error_patterns(self, min_occurrences: int = 2) -> List[Dict[str, Any]]:
+        """Error patterns sorted by severity, then frequency."""
+        patterns = []
+        for pattern_type, count in self.error_counts.items():
+            if count < min_occurrences:
+                continue
+
+            severity = ERROR_PATTERNS.get(pattern_type, {}).get("severity", "info")
+            patterns.append({
+                "type": "error",
+                "subtype": pattern_type,
+                "frequency": count,
+                "severity": severity,
+                "samples": list(self.error_samples.get(pattern_type, [])),
+                "confidence": min(0.95, 0.5 + (count * 0.1)),
+                "description": f"Detected {count} occurrences of {pattern_type} errors",
+            })
+
+        patterns.sort(key=lambda x: (_SEVERITY_ORDER.get(x["severity"], 3), -x["frequency"]))
+        return patterns
+
+    def mapping_patterns(self) -> List[Dict[str, Any]]:
+        """Mapping opportunities (Triangulation method) sorted by confidence."""
+        if not self.unmapped_columns:
+            return []
+
+        max_freq = max(self.unmapped_columns.values())
+        patterns = []
+
+        for column, frequency in self.unmapped_columns.items():
+            if frequency < 2:  # Minimum occurrences
+                continue
+
+            freq_score = frequency / max_freq
+            best_target, best_semantic_score = best_target_for(column)
+            history_score = 0.9 if column.lower() in self.learned_mappings else 0.0
+
+            confidence = (
+                (freq_score * TRIANGULATION_WEIGHTS["frequency"]) +
+                (best_semantic_score * TRIANGULATION_WEIGHTS["semantic"]) +
+                (history_score * TRIANGULATION_WEIGHTS["history"])
+            )
+
+            if confidence < 0.3:  # Minimum threshold
+                continue
+
+            patterns.append({
+                "type": "mapping",
+                "source_column": column,
+                "suggested_target": best_target,
+                "frequency": frequency,
+                "confidence": round(confidence, 2),
+                "severity": "warning" if confidence > 0.6 else "info",
+                "triangulation": {
+                    "frequency_score": round(freq_score, 2),
+                    "semantic_score": round(best_semantic_score, 2),
+                    "history_score": round(history_score, 2),
+                },
+                "description": f"Column '{column}' appears unmapped {frequency} times. "
+                              f"Suggested mapping: '{best_target}' (confidence: {round(confidence * 100)}%)",
+            })
+
+        patterns.sort(key=lambda x: -x["confidence"])
+        return patterns
+
+    def behavior_patterns(self) -> List[Dict[str, Any]]:
+        """Peak-activity and automation-opportunity patterns."""
+        patterns = []
+
+        if self.hour_counts:
+            peak_key = max(self.hour_counts, key=self.hour_counts.get)
+            peak_count = self.hour_counts[peak_key]
+            if peak_count >= 3:  # Minimum for pattern
+                peak_hour = int(peak_key)
+                patterns.append({
+                    "type": "behavior",
+                    "subtype": "peak_activity",
+                    "peak_hour": peak_hour,
+                    "frequency": peak_count,
+                    "confidence": min(0.9, 0.5 + (peak_count * 0.1)),
+                    "severity": "info",
+                    "description": f"Peak import activity at {peak_hour}:00. "
+                                  f"Consider scheduling background tasks outside this window.",
+                })
+
+        for category, count in self.category_counts.items():
+            if "confirm" in category.lower() and count >= 5:
+                patterns.append({
+                    "type": "behavior",
+                    "subtype": "automation_opportunity",
+                    "category": category,
+                    "frequency": count,
+                    "confidence": min(0.85, 0.4 + (count * 0.05)),
+                    "severity": "info",
+                    "description": f"Pattern '{category}' confirmed {count} times. "
+                                  f"Consider auto-approval for high-confidence matches.",
+                })
+
+        return patterns
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for persistence (JSON-safe)."""
+        return {
+            "error_counts": self.error_counts,
+            "error_samples": self.error_samples,
+            "unmapped_columns": self.unmapped_columns,
+            "learned_mappings": self.learned_mappings,
+            "hour_counts": self.hour_counts,
+            "category_counts": self.category_counts,
+            "seen": self.seen,
+            "facts_folded": self.facts_folded,
+            "episodes_folded": self.episodes_folded,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "PatternAggregates":
+        """Restore aggregates saved with to_dict() (empty if data is falsy)."""
+        if not data:
+            return cls()
+        return cls(
+            error_counts=dict(data.get("error_counts", {})),
+            error_samples={k: list(v) for k, v in data.get("error_samples", {}).items()},
+            unmapped_columns=dict(data.get("unmapped_columns", {})),
+            learned_mappings=dict(data.get("learned_mappings", {})),
+            hour_counts={str(k): v for k, v in data.get("hour_counts", {}).items()},
+            category_counts=dict(data.get("category_counts", {})),
+            seen=list(data.get("seen", [])),
+            facts_folded=data.get("facts_folded", 0),
+            episodes_folded=data.get("episodes_folded", 0),
+        )
+
+
+__all__ = [
+    "ERROR_PATTERNS",
+    "TRIANGULATION_WEIGHTS",
+    "TARGET_SCHEMA_COLUMNS",
+    "PatternAggregates",
+    "classify_error",
+    "calculate_semantic_similarity",
+    "best_target_for",
+    "record_fingerprint",
+]
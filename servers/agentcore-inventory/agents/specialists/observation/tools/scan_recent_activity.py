@@ -9,19 +9,39 @@
 # - NO RAW DATA IN CONTEXT: Returns summaries, not full datasets
 # - ACTOR-SCOPED: ALL data is scoped to requesting user
 #
+# Memory retrieval is semantic (top-N by relevance) with no time filter, so
+# records older than the window are dropped here before anything is counted.
+#
+# INCREMENTAL MODE (incremental=True):
+# - Only records newer than the actor's watermark are folded into the saved
+#   pattern aggregates (see activity_watermark.py)
+# - activity_summary covers the window (time-bucketed); facts/episodes are
+#   new only
+#
 # VERSION: 2026-01-22T00:00:00Z
 # =============================================================================
 
 import json
 import logging
 import asyncio
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List, Tuple
 
 from strands import tool
 
 from shared.memory_manager import AgentMemoryManager
 from shared.cognitive_error_handler import cognitive_error_handler
+from agents.specialists.observation.tools.activity_watermark import (
+    MAX_TRACKED_SESSIONS,
+    ActivityWatermark,
+    load_watermark,
+    parse_timestamp,
+    save_watermark,
+)
+from agents.specialists.observation.tools.pattern_engine import (
+    PatternAggregates,
+    record_fingerprint,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +58,124 @@ TIME_WINDOWS = {
 }
 
 
+# =============================================================================
+# Summary Helpers
+# =============================================================================
+
+
+def _merge_summary(
+    summary: Dict[str, Any],
+    facts: List[Dict[str, Any]],
+    episodes: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Fold facts/episodes into running activity counters.
+
+    Args:
+        summary: Counters from a previous scan ({} for a fresh window)
+        facts: New fact records
+        episodes: New episode records
+
+    Returns:
+        Updated counters (new dict)
+    """
+    session_counts: Dict[str, int] = {}
+    categories: Dict[str, int] = {}
+    error_count = 0
+    success_count = 0
+
+    for fact in facts:
+        cat = fact.get("category", "unknown")
+        categories[cat] = categories.get(cat, 0) + 1
+
+    for episode in episodes:
+        session_id = episode.get("session_id", "unknown")
+        session_counts[session_id] = session_counts.get(session_id, 0) + 1
+        cat = episode.get("category", "unknown")
+        categories[cat] = categories.get(cat, 0) + 1
+        outcome = episode.get("outcome", "").lower()
+        if "error" in outcome or "fail" in outcome:
+            error_count += 1
+        elif "success" in outcome or "complet" in outcome:
+            success_count += 1
+
+    return _add_counters(summary, {
+        "total_facts": len(facts),
+        "total_episodes": len(episodes),
+        "session_counts": session_counts,
+        "categories": categories,
+        "error_count": error_count,
+        "success_count": success_count,
+    })
+
+
+def _add_counters(left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+    """Sum two activity counter dicts (new dict, session list capped)."""
+    session_counts: Dict[str, int] = dict(left.get("session_counts", {}))
+    categories: Dict[str, int] = dict(left.get("categories", {}))
+    for session_id, count in right.get("session_counts", {}).items():
+        session_counts[session_id] = session_counts.get(session_id, 0) + count
+    for cat, count in right.get("categories", {}).items():
+        categories[cat] = categories.get(cat, 0) + count
+
+    if len(session_counts) > MAX_TRACKED_SESSIONS:
+        session_counts = dict(
+            sorted(session_counts.items(), key=lambda x: x[1], reverse=True)[:MAX_TRACKED_SESSIONS]
+        )
+
+    return {
+        "total_facts": left.get("total_facts", 0) + right.get("total_facts", 0),
+        "total_episodes": left.get("total_episodes", 0) + right.get("total_episodes", 0),
+        "session_counts": session_counts,
+        "categories": categories,
+        "error_count": left.get("error_count", 0) + right.get("error_count", 0),
+        "success_count": left.get("success_count", 0) + right.get("success_count", 0),
+    }
+
+
+def _fold_summary_buckets(
+    watermark: ActivityWatermark,
+    facts: List[Dict[str, Any]],
+    episodes: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Fold new records into the watermark's time-bucketed summary.
+
+    Buckets older than the window are pruned first, so the returned
+    counters only cover the window.
+
+    Returns:
+        Counters summed over the remaining buckets
+    """
+    watermark.prune_summary()
+
+    grouped: Dict[str, Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]] = {}
+    for fact in facts:
+        grouped.setdefault(watermark.summary_bucket(fact.get("timestamp")), ([], []))[0].append(fact)
+    for episode in episodes:
+        grouped.setdefault(watermark.summary_bucket(episode.get("timestamp")), ([], []))[1].append(episode)
+    for bucket, (bucket_facts, bucket_episodes) in grouped.items():
+        watermark.summary[bucket] = _merge_summary(
+            watermark.summary.get(bucket, {}), bucket_facts, bucket_episodes
+        )
+
+    counters: Dict[str, Any] = _merge_summary({}, [], [])
+    for bucket_counters in watermark.summary.values():
+        counters = _add_counters(counters, bucket_counters)
+    return counters
+
+
+def _is_within(record: Dict[str, Any], cutoff: datetime) -> bool:
+    """True unless the record has a timestamp older than cutoff."""
+    timestamp = parse_timestamp(record.get("timestamp"))
+    return timestamp is None or timestamp >= cutoff
+
+
+def _record_id(record: Dict[str, Any]) -> str:
+    """AgentCore Memory record id (empty if the SDK did not return one)."""
+    return record.get("memoryRecordId") or record.get("memory_record_id") or ""
+
+
 # =============================================================================
 # Tool Implementation
 # =============================================================================
@@ -51,6 +189,7 @@ def scan_recent_activity(
     include_facts: bool = True,
     include_episodes: bool = True,
     include_global: bool = False,
+    incremental: bool = False,
 ) -> str:
     """
     Scan recent Memory activity for patterns and anomalies.
@@ -66,12 +205,18 @@ def scan_recent_activity(
     The activity is actor-scoped: ALL data belongs to the requesting user only.
     No cross-tenant data mixing is allowed.
 
+    Records with a timestamp older than the window are ignored. With
+    incremental=True, only records newer than the actor's watermark are
+    merged into the saved pattern aggregates, so frequent post-import scans
+    do work proportional to new activity.
+
     Args:
         actor_id: User identifier for scoping queries.
         time_window_hours: Analysis window in hours (default 24 = tactical).
         include_facts: Include confirmed facts from SemanticStrategy.
         include_episodes: Include episodes from EpisodicStrategy.
         include_global: Include global patterns (company-wide, optional).
+        incremental: Scan only activity since the last scan (watermark).
 
     Returns:
         JSON string with activity summary:
@@ -108,12 +253,15 @@ def scan_recent_activity(
                 time_window_type = name
                 break
 
-        # Calculate cutoff time
-        cutoff_time = datetime.utcnow() - timedelta(hours=time_window_hours)
-        cutoff_iso = cutoff_time.isoformat() + "Z"
+        # Resume from the actor's watermark when scanning incrementally
+        watermark = load_watermark(actor_id, time_window_hours) if incremental else None
+        is_delta = watermark is not None
+        if incremental and watermark is None:
+            watermark = ActivityWatermark.start(actor_id, time_window_hours)
 
-        # Build search query (time-based)
-        query = f"activity after {cutoff_iso}"
+        # Retrieval cannot filter by time; the cutoff is applied to results
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=time_window_hours)
+        query = "recent activity"
 
         facts: List[Dict[str, Any]] = []
         episodes: List[Dict[str, Any]] = []
@@ -124,6 +272,7 @@ def scan_recent_activity(
                 raw_facts = await memory.observe_facts(query=query, limit=50)
                 for record in raw_facts:
                     facts.append({
+                        "record_id": _record_id(record),
                         "content": record.get("content", ""),
                         "category": record.get("category", "unknown"),
                         "confidence": record.get("confidence_level", 0.7),
@@ -139,6 +288,7 @@ def scan_recent_activity(
                 raw_episodes = await memory.observe_episodes(query=query, limit=30)
                 for record in raw_episodes:
                     episodes.append({
+                        "record_id": _record_id(record),
                         "content": record.get("content", ""),
                         "outcome": record.get("outcome", "unknown"),
                         "session_id": record.get("session_id", ""),
@@ -161,44 +311,52 @@ def scan_recent_activity(
             except Exception as e:
                 logger.warning(f"[scan_recent_activity] Error fetching global: {e}")
 
-        # Analyze session history from episodes
-        session_counts: Dict[str, int] = {}
-        for episode in episodes:
-            session_id = episode.get("session_id", "unknown")
-            session_counts[session_id] = session_counts.get(session_id, 0) + 1
-
+        facts = [f for f in facts if _is_within(f, cutoff)]
+        episodes = [e for e in episodes if _is_within(e, cutoff)]
+
+        # Merge only unseen records into the saved aggregates and counters
+        if incremental:
+            aggregates = PatternAggregates.from_dict(watermark.aggregates)
+            seen = set(aggregates.seen)
+
+            def _is_new(record: Dict[str, Any]) -> bool:
+                fingerprint = record_fingerprint(record)
+                return fingerprint not in seen and watermark.is_new(
+                    fingerprint, record.get("timestamp")
+                )
+
+            facts = [f for f in facts if _is_new(f)]
+            episodes = [e for e in episodes if _is_new(e)]
+
+            aggregates.fold(facts=facts, episodes=episodes)
+            watermark.aggregates = aggregates.to_dict()
+            counters = _fold_summary_buckets(watermark, facts, episodes)
+            watermark.advance([
+                (record_fingerprint(r), r.get("timestamp")) for r in facts + episodes
+            ])
+            save_watermark(watermark)
+        else:
+            counters = _merge_summary({}, facts, episodes)
+
+        session_counts: Dict[str, int] = counters["session_counts"]
         session_history = [
             {"session_id": sid, "event_count": count}
             for sid, count in sorted(session_counts.items(), key=lambda x: x[1], reverse=True)
         ]
 
         # Compute activity summary
-        categories: Dict[str, int] = {}
-        error_count = 0
-        success_count = 0
-
-        for fact in facts:
-            cat = fact.get("category", "unknown")
-            categories[cat] = categories.get(cat, 0) + 1
-
-        for episode in episodes:
-            cat = episode.get("category", "unknown")
-            categories[cat] = categories.get(cat, 0) + 1
-            outcome = episode.get("outcome", "").lower()
-            if "error" in outcome or "fail" in outcome:
-                error_count += 1
-            elif "success" in outcome or "complet" in outcome:
-                success_count += 1
+        error_count = counters["error_count"]
+        success_count = counters["success_count"]
 
         total_outcomes = error_count + success_count
         success_rate = success_count / total_outcomes if total_outcomes > 0 else 1.0
 
-        top_categories = sorted(categories.items(), key=lambda x: x[1], reverse=True)[:5]
+        top_categories = sorted(counters["categories"].items(), key=lambda x: x[1], reverse=True)[:5]
         top_categories = [cat for cat, _ in top_categories]
 
         activity_summary = {
-            "total_facts": len(facts),
-            "total_episodes": len(episodes),
+            "total_facts": counters["total_facts"],
+            "total_episodes": counters["total_episodes"],
             "total_global_patterns": len(global_patterns),
             "unique_sessions": len(session_counts),
             "top_categories": top_categories,
@@ -216,7 +374,7 @@ def scan_recent_activity(
         }[time_window_type]
 
         human_message = (
-            f"Encontrei {len(facts)} fato(s) e {len(episodes)} episódio(s) "
+            f"Encontrei {counters['total_facts']} fato(s) e {counters['total_episodes']} episódio(s) "
             f"nas {window_name}. "
             f"Taxa de sucesso: {round(success_rate * 100)}%."
         )
@@ -224,6 +382,11 @@ def scan_recent_activity(
         if error_count > 0:
             human_message += f" ⚠️ {error_count} erro(s) detectado(s)."
 
+        if is_delta:
+            human_message += (
+                f" {len(facts) + len(episodes)} novo(s) registro(s) desde a última análise."
+            )
+
         return {
             "success": True,
             "actor_id": actor_id,
@@ -234,6 +397,9 @@ def scan_recent_activity(
             "global_patterns": global_patterns[:10],
             "session_history": session_history[:10],
             "activity_summary": activity_summary,
+            "incremental": incremental,
+            "new_records": len(facts) + len(episodes),
+            "watermark": watermark.last_timestamp if incremental else None,
             "human_message": human_message,
         }
 
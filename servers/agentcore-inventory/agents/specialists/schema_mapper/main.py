@@ -733,6 +733,18 @@ def _create_agent_skills() -> list:
 # =============================================================================
 
 
+_agent_pool = None
+
+
+def _get_agent_pool():
+    """Lazy-load the pool of pre-built SchemaMapper agents (singleton)."""
+    global _agent_pool
+    if _agent_pool is None:
+        from shared.agent_pool import AgentPool
+        _agent_pool = AgentPool(AGENT_ID, factory=_build_agent_shell)
+    return _agent_pool
+
+
 def create_agent():
     """
     Create the SchemaMapper as a full Strands Agent.
@@ -749,7 +761,18 @@ def create_agent():
     Returns:
         Strands Agent configured for semantic column mapping.
     """
+    return _build_agent_shell().agent
+
+
+def _build_agent_shell():
+    """
+    Build a SchemaMapper agent plus its hook instances.
+
+    Returns:
+        AgentShell (reusable via the agent pool).
+    """
     _ensure_lazy_imports()
+    from shared.agent_pool import AgentShell
 
     # Create tools dynamically (they use @_tool decorator)
     tools = _create_tools()
@@ -771,7 +794,8 @@ def create_agent():
     agent = _Agent(
         name=AGENT_NAME,
         description=AGENT_DESCRIPTION,
-        model=_create_gemini_model(AGENT_ID),  # Gemini 2.5 Pro + Thinking
+        # Gemini 2.5 Pro + Thinking; repeat layouts replayed from the response cache
+        model=_create_gemini_model(AGENT_ID, cache_responses=True),
         tools=tools,
         system_prompt=SYSTEM_PROMPT,
         hooks=hooks,
@@ -780,7 +804,7 @@ def create_agent():
     )
 
     logger.info(f"[SchemaMapper] Created {AGENT_NAME} with {len(hooks)} hooks")
-    return agent
+    return AgentShell(agent=agent, hooks=hooks)
 
 
 def create_a2a_server(agent):
@@ -869,12 +893,11 @@ def invoke(payload: dict, context=None) -> dict:
         # Lazy imports are loaded here on first LLM call
         _ensure_lazy_imports()
 
-        # Initialize Strands Agent (uses lazy-loaded classes)
-        agent = create_agent()
-
-        # Invoke agent with the full payload (Mode 2: LLM reasoning)
-        # The agent will use get_target_schema, observe_prior_patterns, etc.
-        response = agent(payload)
+        # Check out a pre-built agent (state reset, session context injected)
+        with _get_agent_pool().checkout(session_id=session_id) as agent:
+            # Invoke agent with the full payload (Mode 2: LLM reasoning)
+            # The agent will use get_target_schema, observe_prior_patterns, etc.
+            response = agent(payload)
 
         # Extract response from Strands Agent result
         if hasattr(response, "message"):
@@ -899,6 +922,31 @@ def invoke(payload: dict, context=None) -> dict:
 # =============================================================================
 
 
+def _create_prewarm(agent):
+    """
+    Build the background prewarm plan for this container.
+
+    Steps: SSM secret → Gemini model (A2A agent) → schema cache →
+    memory client → one pooled shell for the legacy invoke() path.
+
+    Args:
+        agent: The Strands Agent served by the A2AServer
+
+    Returns:
+        PrewarmManager (started by the FastAPI startup event)
+    """
+    from agents.utils import load_google_api_key
+    from shared.prewarm import PrewarmManager, warm_model
+
+    return PrewarmManager(AGENT_ID, steps=[
+        ("secrets", load_google_api_key),
+        ("model", lambda: warm_model(agent.model)),
+        ("schema", lambda: _get_schema_provider().get_table_schema("pending_entry_items")),
+        ("memory_client", lambda: _AgentMemoryManager(agent_id=AGENT_ID, actor_id="system").client),
+        ("agent_pool", lambda: _get_agent_pool().prewarm(1, warm=lambda shell: warm_model(shell.agent.model))),
+    ])
+
+
 def create_app():
     """
     Factory function to create FastAPI app with A2AServer.
@@ -910,14 +958,17 @@ def create_app():
     1. Loads lazy imports (first call triggers heavy imports)
     2. Creates the Strands Agent with tools and hooks
     3. Wraps agent in A2AServer for JSON-RPC protocol
-    4. Returns FastAPI app with health check endpoint
+    4. Returns FastAPI app with health check endpoint (reports prewarm
+       readiness; see shared/prewarm.py)
 
     Returns:
         FastAPI application ready for uvicorn.
     """
     _ensure_lazy_imports()
 
-    from fastapi import FastAPI
+    from fastapi import FastAPI, Response
+
+    from shared.prewarm import attach_prewarm
 
     # Create Strands Agent with tools
     agent = create_agent()
@@ -931,15 +982,20 @@ def create_app():
         description="Senior Data Architect for semantic column mapping",
     )
 
+    # Warm model, secrets and clients in the background once serving
+    prewarm = _create_prewarm(agent)
+    attach_prewarm(app, prewarm)
+
     @app.get("/ping")
-    def ping():
-        """Health check endpoint for AgentCore."""
-        return {
-            "status": "healthy",
+    def ping(response: Response):
+        """Health check endpoint for AgentCore (503 while prewarming)."""
+        status_code, body = prewarm.ping_response({
             "agent_id": AGENT_ID,
             "protocol": "A2A",
             "port": 9000,
-        }
+        })
+        response.status_code = status_code
+        return body
 
     # Mount A2AServer at root (AgentCore expects A2A at /)
     app.mount("/", a2a_server.to_fastapi_app())
@@ -965,8 +1021,11 @@ def _start_server():
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
+    from shared.startup_profiler import profile_create_app
+
     logger.info("[SchemaMapper] Starting A2A Server on port 9000...")
-    app = create_app()
+    # Startup milestones recorded when STARTUP_PROFILE=true
+    app = profile_create_app(AGENT_ID, create_app)
     uvicorn.run(app, host="0.0.0.0", port=9000)
 
 
@@ -14,9 +14,11 @@
 
 import json
 import re
+import threading
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import os
+from types import SimpleNamespace
 
 # Strands Model Provider for Gemini (per CLAUDE.md - Gemini 2.5 Family ONLY)
 from strands.models.gemini import GeminiModel
@@ -30,6 +32,7 @@ from a2a.types import AgentSkill
 
 # FAIL-CLOSED environment configuration (no production fallbacks)
 from shared.env_config import get_required_env
+from shared.timing_ledger import record_call
 
 # =============================================================================
 # Constants
@@ -204,6 +207,51 @@ def requires_thinking(agent_type: str) -> bool:
     return agent_type in PRO_THINKING_AGENTS
 
 
+_api_key_lock = threading.Lock()
+
+
+def load_google_api_key() -> str:
+    """
+    Resolve GOOGLE_API_KEY, loading it from SSM Parameter Store if needed.
+
+    SSM Parameter: /faiston-one/academy/google-api-key. The value is cached
+    in os.environ, so the lookup runs once per container (first request or
+    prewarm, whichever comes first).
+
+    Returns:
+        The API key
+
+    Raises:
+        RuntimeError: If the key is not in the environment and SSM lookup fails
+    """
+    import logging
+    logger = logging.getLogger(__name__)
+
+    with _api_key_lock:
+        api_key = os.environ.get("GOOGLE_API_KEY")
+        if api_key:
+            return api_key
+
+        logger.info("[LazyGeminiModel] GOOGLE_API_KEY not in env, loading from SSM...")
+        try:
+            import boto3
+            ssm = boto3.client("ssm", region_name="us-east-2")
+            response = ssm.get_parameter(
+                Name="/faiston-one/academy/google-api-key",
+                WithDecryption=True
+            )
+            api_key = response["Parameter"]["Value"]
+            os.environ["GOOGLE_API_KEY"] = api_key
+            logger.info("[LazyGeminiModel] GOOGLE_API_KEY loaded from SSM successfully")
+            return api_key
+        except Exception as e:
+            logger.error(f"[LazyGeminiModel] Failed to load GOOGLE_API_KEY from SSM: {e}")
+            raise RuntimeError(
+                "GOOGLE_API_KEY not found in environment and SSM lookup failed. "
+                f"SSM path: /faiston-one/academy/google-api-key. Error: {e}"
+            )
+
+
 class LazyGeminiModel:
     """
     Lazy-loading wrapper for GeminiModel to enable fast A2A server startup.
@@ -223,19 +271,30 @@ class LazyGeminiModel:
         agent = Agent(model=model, ...)  # Server starts immediately
         # First actual request triggers GeminiModel initialization
 
+    Opt-in response cache: with cache_responses=True (and
+    LLM_RESPONSE_CACHE_ENABLED=true), stream() goes through
+    shared.llm_response_cache, so identical turns are replayed without a
+    Gemini call (and without initializing GeminiModel at all).
+
     Reference: https://strandsagents.com/latest/documentation/docs/user-guide/concepts/model-providers/gemini/
     """
 
-    def __init__(self, agent_type: str = "default"):
+    def __init__(self, agent_type: str = "default", cache_responses: bool = False):
         """
         Initialize lazy wrapper without connecting to Google API.
 
         Args:
             agent_type: Agent identifier for model selection (Pro vs Flash)
+            cache_responses: Route stream() through the LLM response cache
         """
         self._agent_type = agent_type
         self._model: GeminiModel | None = None
         self._model_id = get_model(agent_type)
+        self._init_lock = threading.Lock()
+        self._response_cache = None
+        if cache_responses:
+            from shared.llm_response_cache import get_llm_response_cache
+            self._response_cache = get_llm_response_cache(AGENT_VERSION)
         # Log immediately so CloudWatch shows server started
         import logging
         logging.getLogger(__name__).info(
@@ -251,104 +310,130 @@ class LazyGeminiModel:
             Initialized GeminiModel instance
         """
         if self._model is None:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.info("[LazyGeminiModel] First request - initializing GeminiModel...")
-
-            # Load API key from SSM at runtime for secure credential management
-            # SSM Parameter: /faiston-one/academy/google-api-key
-            if not os.environ.get("GOOGLE_API_KEY"):
-                logger.info("[LazyGeminiModel] GOOGLE_API_KEY not in env, loading from SSM...")
-                try:
-                    import boto3
-                    ssm = boto3.client("ssm", region_name="us-east-2")
-                    response = ssm.get_parameter(
-                        Name="/faiston-one/academy/google-api-key",
-                        WithDecryption=True
-                    )
-                    api_key = response["Parameter"]["Value"]
-                    os.environ["GOOGLE_API_KEY"] = api_key
-                    logger.info("[LazyGeminiModel] GOOGLE_API_KEY loaded from SSM successfully")
-                except Exception as e:
-                    logger.error(f"[LazyGeminiModel] Failed to load GOOGLE_API_KEY from SSM: {e}")
-                    raise RuntimeError(
-                        "GOOGLE_API_KEY not found in environment and SSM lookup failed. "
-                        f"SSM path: /faiston-one/academy/google-api-key. Error: {e}"
-                    )
-
-            # Build params
-            # Large output buffer for file analysis responses: Increased max_output_tokens
-            # from 4096 to 16384. The file analysis response includes: structure, mappings,
-            # confidence scores, HIL questions, unmapped columns, and full JSON output.
-            # Responses can easily exceed 4096 tokens, causing MaxTokensReachedException
-            # in Strands A2A. Gemini 2.5 Pro supports up to 65,536 output tokens.
-            # Reference: https://ai.google.dev/gemini-api/docs/models/gemini#gemini-2.5-pro
-            #
-            # Disable response_mime_type when tools enabled: REMOVED response_mime_type:
-            # "application/json" because Gemini API does NOT support response_mime_type
-            # when tools (function calling) are enabled. The error was: "Function calling
-            # with a response mime type: 'application/json' is unsupported"
-            # Reference: https://ai.google.dev/gemini-api/docs/function-calling
-            # JSON output is enforced via system prompt instead.
-            #
-            # FIX-424 v2: Safety settings using google-genai SDK (Strands Native)
-            # Uses list of SafetySetting objects instead of dict with enum keys.
-            # Without explicit safety settings, Gemini uses moderate blocking that can
-            # incorrectly flag legitimate business content (part numbers, quantities, prices)
-            # as harmful, causing empty responses and A2A 424 Dependency Failed errors.
-            # Reference: https://github.com/googleapis/python-genai
-            safety_settings = [
-                genai_types.SafetySetting(
-                    category='HARM_CATEGORY_HATE_SPEECH',
-                    threshold='BLOCK_NONE',
-                ),
-                genai_types.SafetySetting(
-                    category='HARM_CATEGORY_DANGEROUS_CONTENT',
-                    threshold='BLOCK_NONE',
-                ),
-                genai_types.SafetySetting(
-                    category='HARM_CATEGORY_SEXUALLY_EXPLICIT',
-                    threshold='BLOCK_NONE',
-                ),
-                genai_types.SafetySetting(
-                    category='HARM_CATEGORY_HARASSMENT',
-                    threshold='BLOCK_NONE',
-                ),
-            ]
-            logger.info("[LazyGeminiModel] Safety settings configured with BLOCK_NONE (FIX-424 v2)")
-
-            params = {
-                "temperature": 0.7,
-                "max_output_tokens": 16384,  # 4x increase to handle detailed analysis
-                "safety_settings": safety_settings,  # FIX-424: Prevent response blocking
-            }
+            # Locked: prewarm thread and first request may race
+            with self._init_lock:
+                if self._model is None:
+                    self._model = self._create_model()
+        return self._model
 
-            # Gemini 2.5 uses thinking_budget parameter (different from Gemini 3):
-            # - Gemini 2.5: Uses "thinking_budget" (integer: 128-32768, or -1 for dynamic)
-            # - Gemini 3: Uses "thinking_level" (string: "high", "medium", "low")
-            # Reference: https://ai.google.dev/gemini-api/docs/thinking
-            is_gemini_3 = "gemini-3" in self._model_id
-            if requires_thinking(self._agent_type):
-                if is_gemini_3:
-                    params["thinking_config"] = {
-                        "thinking_level": "high"  # Max reasoning for Gemini 3
-                    }
-                    logger.info("[LazyGeminiModel] Thinking mode enabled (Gemini 3 - thinking_level: high)")
-                else:
-                    # Gemini 2.5 uses thinking_budget instead of thinking_level
-                    params["thinking_config"] = {
-                        "thinking_budget": -1  # Dynamic allocation for Gemini 2.5
-                    }
-                    logger.info("[LazyGeminiModel] Thinking mode enabled (Gemini 2.5 - thinking_budget: dynamic)")
-
-            # NOW make the actual connection to Google
-            self._model = GeminiModel(
-                model_id=self._model_id,
-                params=params,
-            )
-            logger.info("[LazyGeminiModel] GeminiModel initialized successfully")
+    def _create_model(self) -> GeminiModel:
+        """Build the GeminiModel (API key, safety settings, thinking config)."""
+        import logging
+        logger = logging.getLogger(__name__)
+        logger.info("[LazyGeminiModel] Initializing GeminiModel...")
+
+        # Load API key from SSM at runtime for secure credential management
+        load_google_api_key()
+
+        # Build params
+        # Large output buffer for file analysis responses: Increased max_output_tokens
+        # from 4096 to 16384. The file analysis response includes: structure, mappings,
+        # confidence scores, HIL questions, unmapped columns, and full JSON output.
+        # Responses can easily exceed 4096 tokens, causing MaxTokensReachedException
+        # in Strands A2A. Gemini 2.5 Pro supports up to 65,536 output tokens.
+        # Reference: https://ai.google.dev/gemini-api/docs/models/gemini#gemini-2.5-pro
+        #
+        # Disable response_mime_type when tools enabled: REMOVED response_mime_type:
+        # "application/json" because Gemini API does NOT support response_mime_type
+        # when tools (function calling) are enabled. The error was: "Function calling
+        # with a response mime type: 'application/json' is unsupported"
+        # Reference: https://ai.google.dev/gemini-api/docs/function-calling
+        # JSON output is enforced via system prompt instead.
+        #
+        # FIX-424 v2: Safety settings using google-genai SDK (Strands Native)
+        # Uses list of SafetySetting objects instead of dict with enum keys.
+        # Without explicit safety settings, Gemini uses moderate blocking that can
+        # incorrectly flag legitimate business content (part numbers, quantities, prices)
+        # as harmful, causing empty responses and A2A 424 Dependency Failed errors.
+        # Reference: https://github.com/googleapis/python-genai
+        safety_settings = [
+            genai_types.SafetySetting(
+                category='HARM_CATEGORY_HATE_SPEECH',
+                threshold='BLOCK_NONE',
+            ),
+            genai_types.SafetySetting(
+                category='HARM_CATEGORY_DANGEROUS_CONTENT',
+                threshold='BLOCK_NONE',
+            ),
+            genai_types.SafetySetting(
+                category='HARM_CATEGORY_SEXUALLY_EXPLICIT',
+                threshold='BLOCK_NONE',
+            ),
+            genai_types.SafetySetting(
+                category='HARM_CATEGORY_HARASSMENT',
+                threshold='BLOCK_NONE',
+            ),
+        ]
+        logger.info("[LazyGeminiModel] Safety settings configured with BLOCK_NONE (FIX-424 v2)")
+
+        params = {
+            "temperature": 0.7,
+            "max_output_tokens": 16384,  # 4x increase to handle detailed analysis
+            "safety_settings": safety_settings,  # FIX-424: Prevent response blocking
+        }
 
-        return self._model
+        # Gemini 2.5 uses thinking_budget parameter (different from Gemini 3):
+        # - Gemini 2.5: Uses "thinking_budget" (integer: 128-32768, or -1 for dynamic)
+        # - Gemini 3: Uses "thinking_level" (string: "high", "medium", "low")
+        # Reference: https://ai.google.dev/gemini-api/docs/thinking
+        is_gemini_3 = "gemini-3" in self._model_id
+        if requires_thinking(self._agent_type):
+            if is_gemini_3:
+                params["thinking_config"] = {
+                    "thinking_level": "high"  # Max reasoning for Gemini 3
+                }
+                logger.info("[LazyGeminiModel] Thinking mode enabled (Gemini 3 - thinking_level: high)")
+            else:
+                # Gemini 2.5 uses thinking_budget instead of thinking_level
+                params["thinking_config"] = {
+                    "thinking_budget": -1  # Dynamic allocation for Gemini 2.5
+                }
+                logger.info("[LazyGeminiModel] Thinking mode enabled (Gemini 2.5 - thinking_budget: dynamic)")
+
+        # NOW make the actual connection to Google
+        model = GeminiModel(
+            model_id=self._model_id,
+            params=params,
+        )
+        logger.info("[LazyGeminiModel] GeminiModel initialized successfully")
+        return model
+
+    def warm(self, probe: bool = False) -> None:
+        """
+        Initialize GeminiModel ahead of the first request (see shared/prewarm.py).
+
+        Args:
+            probe: Also run a token count to validate key and connection
+        """
+        model = self._ensure_model()
+        if probe:
+            model._get_client().models.count_tokens(model=self._model_id, contents="ping")
+
+    def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        """
+        Stream a model turn, through the response cache when enabled.
+
+        Returns:
+            Async iterable of Strands stream events
+        """
+        if self._response_cache is None:
+            return self._metered_stream(messages, tool_specs, system_prompt, **kwargs)
+        return self._response_cache.stream(
+            lambda: SimpleNamespace(stream=self._metered_stream),
+            self._model_id, messages, tool_specs, system_prompt, **kwargs
+        )
+
+    async def _metered_stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        """Real model stream; attributes Gemini token usage to the import timing ledger."""
+        async for event in self._ensure_model().stream(messages, tool_specs, system_prompt, **kwargs):
+            usage = (event.get("metadata") or {}).get("usage") if isinstance(event, dict) else None
+            if usage:
+                record_call(
+                    "gemini",
+                    input_tokens=usage.get("inputTokens", 0),
+                    output_tokens=usage.get("outputTokens", 0),
+                )
+            yield event
 
     def __getattr__(self, name: str):
         """
@@ -366,7 +451,10 @@ class LazyGeminiModel:
         return self._model_id
 
 
-def create_gemini_model(agent_type: str = "default") -> LazyGeminiModel:
+def create_gemini_model(
+    agent_type: str = "default",
+    cache_responses: bool = False,
+) -> LazyGeminiModel:
     """
     Create lazy-loading GeminiModel wrapper for Strands Agent.
 
@@ -388,11 +476,13 @@ def create_gemini_model(agent_type: str = "default") -> LazyGeminiModel:
 
     Args:
         agent_type: Agent identifier for model selection
+        cache_responses: Opt in to the LLM response cache (deterministic,
+            repeatable agents only; see shared/llm_response_cache.py)
 
     Returns:
         LazyGeminiModel wrapper that initializes on first use
     """
-    return LazyGeminiModel(agent_type=agent_type)
+    return LazyGeminiModel(agent_type=agent_type, cache_responses=cache_responses)
 
 
 # =============================================================================
@@ -17,6 +17,7 @@
 # - Automatic token caching with expiry handling
 # - Thread-safe token refresh
 # - MCP protocol compliance (JSON-RPC 2.0)
+# - Pooled keep-alive HTTP session with retries (shared/http_session.py)
 #
 # Reference:
 # - https://docs.aws.amazon.com/bedrock-agentcore/latest/devguide/gateway-inbound-auth.html
@@ -38,6 +39,7 @@ import boto3
 import requests
 
 from shared.debug_utils import debug_error
+from shared.http_session import create_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -109,6 +111,7 @@ class CognitoMCPClient:
         _client_secret: Cognito app client secret
         _token_cache: Cached access token
         _lock: Thread lock for token refresh
+        _http: requests Session (keep-alive pool, retries) for token and Gateway calls
     """
 
     def __init__(
@@ -117,6 +120,7 @@ class CognitoMCPClient:
         token_url: str,
         client_id: str,
         client_secret: str,
+        pool_maxsize: Optional[int] = None,
     ):
         """
         Initialize Cognito OAuth2 MCP Client.
@@ -126,6 +130,8 @@ class CognitoMCPClient:
             token_url: Cognito token endpoint URL
             client_id: Cognito app client ID
             client_secret: Cognito app client secret
+            pool_maxsize: Keep-alive connections per host; size it to the
+                number of threads sharing this client (default HTTP_POOL_MAXSIZE)
         """
         self._gateway_url = gateway_url
         self._token_url = token_url
@@ -134,6 +140,7 @@ class CognitoMCPClient:
         self._token_cache: Optional[TokenCache] = None
         self._lock = threading.Lock()
         self._tools_cache: Optional[List[Dict]] = None
+        self._http = create_http_session(pool_maxsize=pool_maxsize)
 
         logger.info(
             f"[CognitoMCPClient] Initialized with OAuth2 auth "
@@ -162,7 +169,7 @@ class CognitoMCPClient:
         """
         logger.debug("[CognitoMCPClient] Fetching new access token from Cognito")
 
-        response = requests.post(
+        response = self._http.post(
             self._token_url,
             data={
                 "grant_type": "client_credentials",
@@ -236,6 +243,15 @@ class CognitoMCPClient:
             "Authorization": f"Bearer {access_token}",
         }
 
+    def _post(self, body: str, timeout: int) -> requests.Response:
+        """POST a pre-serialized JSON-RPC body to the Gateway on the pooled session."""
+        return self._http.post(
+            self._gateway_url,
+            headers=self._get_auth_headers(),
+            data=body,
+            timeout=timeout,
+        )
+
     def call_tool(
         self,
         tool_name: str,
@@ -268,14 +284,10 @@ class CognitoMCPClient:
         }
 
         logger.debug(f"[CognitoMCPClient] Calling tool: {tool_name}")
+        body = json.dumps(payload)
 
         try:
-            response = requests.post(
-                self._gateway_url,
-                headers=self._get_auth_headers(),
-                json=payload,
-                timeout=timeout,
-            )
+            response = self._post(body, timeout)
             response.raise_for_status()
 
         except requests.exceptions.HTTPError as e:
@@ -284,12 +296,7 @@ class CognitoMCPClient:
             if e.response.status_code == 401:
                 logger.info("[CognitoMCPClient] Token expired, refreshing...")
                 self._token_cache = None
-                response = requests.post(
-                    self._gateway_url,
-                    headers=self._get_auth_headers(),
-                    json=payload,
-                    timeout=timeout,
-                )
+                response = self._post(body, timeout)
                 response.raise_for_status()
             else:
                 raise
@@ -352,12 +359,7 @@ class CognitoMCPClient:
                 "params": {"cursor": cursor} if cursor else {},
             }
 
-            response = requests.post(
-                self._gateway_url,
-                headers=self._get_auth_headers(),
-                json=payload,
-                timeout=30,
-            )
+            response = self._post(json.dumps(payload), timeout=30)
             response.raise_for_status()
 
             result = response.json()
@@ -383,6 +385,10 @@ class CognitoMCPClient:
         self._tools_cache = None
         logger.debug("[CognitoMCPClient] Cache cleared")
 
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self._http.close()
+
 
 # =============================================================================
 # Factory
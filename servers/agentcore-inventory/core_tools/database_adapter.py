@@ -50,6 +50,10 @@ class InventoryFilters:
     status: Optional[AssetStatus] = None
     limit: int = 100
     offset: int = 0
+    # Keyset pagination: pass next_cursor from the previous page
+    pagination: Optional[str] = None  # "offset" | "keyset"
+    cursor: Optional[str] = None
+    count: Optional[str] = None  # "none" | "estimated" | "exact"
 
 
 @dataclass
@@ -100,9 +104,11 @@ class DatabaseAdapter(ABC):
 
         Args:
             filters: Optional filters for location, project, part number, status
+                and pagination (offset or keyset cursor, count mode)
 
         Returns:
-            Dict with 'items' list and 'total_count'
+            Dict with 'items' list, 'has_more', optional 'total' and,
+            in keyset mode, 'next_cursor'
         """
         pass
 
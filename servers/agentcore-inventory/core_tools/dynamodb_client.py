@@ -9,6 +9,7 @@
 # - Atomic balance updates
 # - Batch operations for efficiency
 # - Audit trail integration
+# - Write-sharded date/type partition keys (shared.write_sharding)
 #
 # CRITICAL: Lazy imports for cold start optimization (<30s limit)
 # =============================================================================
@@ -17,9 +18,11 @@ from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
 import os
+import time
 
 from shared.debug_utils import debug_error
 from shared.env_config import get_required_env
+from shared.write_sharding import get_shard_count, scatter_gather, sharded_key
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +85,128 @@ def _get_sessions_table() -> str:
     return get_required_env("SESSIONS_TABLE", "DynamoDB sessions")
 
 
+# =============================================================================
+# Write Sharding for Date/Type Partition Keys
+# =============================================================================
+
+# GSI5PK = DATE#YYYY-MM[#n] on movements
+MOVEMENT_DATE_SHARDS = get_shard_count("MOVEMENT_DATE_SHARDS")
+# PK = LOG#YYYY-MM-DD[#n] and GSI3PK = TYPE#<event_type>[#n] on audit events
+AUDIT_LOG_SHARDS = get_shard_count("AUDIT_LOG_SHARDS")
+AUDIT_TYPE_INDEX = os.environ.get("AUDIT_LOG_TYPE_INDEX", "GSI3-TypeQuery")
+
+
+# =============================================================================
+# Movement / Balance Item Builders
+# =============================================================================
+
+# DynamoDB TransactWriteItems limit (actions per transaction)
+TRANSACT_MAX_ACTIONS = 100
+# Attempts per transaction chunk on conflicts/throttling (same request token)
+TRANSACT_MAX_ATTEMPTS = int(os.environ.get("DYNAMODB_TRANSACT_MAX_ATTEMPTS", "3"))
+_TRANSACT_RETRYABLE = ("TransactionConflict", "ThrottlingError", "ProvisionedThroughputExceeded")
+
+
+def _balance_key(location_id: str, pn_id: str, project_id: Optional[str] = None) -> Dict[str, str]:
+    """Primary key of a balance projection item."""
+    return {
+        "PK": f"BALANCE#{location_id}#{pn_id}",
+        "SK": f"PROJ#{project_id}" if project_id else "METADATA",
+    }
+
+
+def _balance_delta_params(
+    location_id: str,
+    pn_id: str,
+    project_id: Optional[str],
+    total_delta: int,
+    reserved_delta: int,
+    now: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Key/UpdateExpression/values applying total and reserved deltas at once.
+
+    available moves by total_delta - reserved_delta. A single Update per
+    balance item is required inside TransactWriteItems, which rejects two
+    actions on the same item.
+    """
+    assignments = []
+    values: Dict[str, Any] = {":zero": 0, ":now": now or datetime.utcnow().isoformat() + "Z"}
+    if total_delta:
+        assignments.append("total = if_not_exists(total, :zero) + :total_delta")
+        values[":total_delta"] = total_delta
+    if reserved_delta:
+        assignments.append("reserved = if_not_exists(reserved, :zero) + :reserved_delta")
+        values[":reserved_delta"] = reserved_delta
+    assignments.append("available = if_not_exists(available, :zero) + :available_delta")
+    values[":available_delta"] = total_delta - reserved_delta
+    assignments.append("updated_at = :now")
+
+    return {
+        "Key": _balance_key(location_id, pn_id, project_id),
+        "UpdateExpression": "SET " + ", ".join(assignments),
+        "ExpressionAttributeValues": values,
+    }
+
+
+def _balance_update_params(
+    location_id: str,
+    pn_id: str,
+    delta: int,
+    project_id: Optional[str] = None,
+    is_reservation: bool = False,
+) -> Dict[str, Any]:
+    """Key/UpdateExpression/values for an atomic balance increment."""
+    if is_reservation:
+        # Update reserved quantity (available moves the other way)
+        return _balance_delta_params(location_id, pn_id, project_id, 0, delta)
+    # Update total and available
+    return _balance_delta_params(location_id, pn_id, project_id, delta, 0)
+
+
+def _movement_item(
+    movement_id: str,
+    movement_type: str,
+    location_id: str,
+    pn_id: str,
+    quantity: int,
+    created_at: str,
+    project_id: Optional[str] = None,
+    asset_ids: Optional[List[str]] = None,
+    reference_id: Optional[str] = None,
+    notes: Optional[str] = None,
+    user_id: str = "system",
+) -> Dict[str, Any]:
+    """Movement record (event log item) with its GSI keys."""
+    item = {
+        "PK": f"MOVE#{movement_id}",
+        "SK": "METADATA",
+        "movement_id": movement_id,
+        "movement_type": movement_type,
+        "location_id": location_id,
+        "pn_id": pn_id,
+        "quantity": quantity,
+        "created_at": created_at,
+        "created_by": user_id,
+        # GSI keys
+        "GSI3PK": f"PROJ#{project_id}" if project_id else "PROJ#_NONE",
+        "GSI3SK": f"MOVE#{created_at}#{movement_id}",
+        "GSI5PK": sharded_key(f"DATE#{created_at[:7]}", movement_id, MOVEMENT_DATE_SHARDS),
+        "GSI5SK": f"{created_at}#{movement_id}",
+    }
+
+    if project_id:
+        item["project_id"] = project_id
+    if asset_ids:
+        item["asset_ids"] = asset_ids
+    if reference_id:
+        item["reference_id"] = reference_id
+    if notes:
+        item["notes"] = notes
+
+    return item
+
+
 # =============================================================================
 # Decimal Conversion for JSON Serialization (LOW-001 FIX)
 # =============================================================================
@@ -366,6 +491,50 @@ class SGADynamoDBClient:
             debug_error(e, "dynamodb_query_gsi", {"gsi_name": gsi_name, "pk_value": pk_value})
             return []
 
+    def query_partition(
+        self,
+        pk_value: str,
+        gsi_name: Optional[str] = None,
+        limit: int = 100,
+        scan_forward: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Query one partition with the table's client (thread-safe).
+
+        Used by scatter-gather readers that query all write shards of a key
+        in parallel; boto3 resources must not be shared across threads, but
+        their meta client can (and it still speaks native Python types).
+
+        Args:
+            pk_value: Partition key value (table PK or GSI PK)
+            gsi_name: Optional GSI name; None queries the table PK
+            limit: Maximum items to return
+            scan_forward: True for ascending, False for descending
+
+        Returns:
+            List of items
+        """
+        pk_name = "PK"
+        params = {"TableName": self._table_name}
+        if gsi_name:
+            pk_name = f"GSI{gsi_name.split('-')[0].replace('GSI', '')}PK"
+            params["IndexName"] = gsi_name
+
+        try:
+            response = self.table.meta.client.query(
+                KeyConditionExpression=f"{pk_name} = :pk",
+                ExpressionAttributeValues={":pk": pk_value},
+                Limit=limit,
+                ScanIndexForward=scan_forward,
+                **params,
+            )
+            items = response.get("Items", [])
+            # LOW-001 FIX: Convert Decimal to int/float for JSON serialization
+            return [_convert_decimals_to_numbers(item) for item in items]
+        except Exception as e:
+            debug_error(e, "dynamodb_query_partition", {"gsi_name": gsi_name, "pk_value": pk_value})
+            return []
+
     # =========================================================================
     # Batch Operations
     # =========================================================================
@@ -609,40 +778,10 @@ class SGADynamoDBClient:
         Returns:
             True if successful
         """
-        pk = f"BALANCE#{location_id}#{pn_id}"
-        sk = f"PROJ#{project_id}" if project_id else "METADATA"
-
         try:
-            if is_reservation:
-                # Update reserved quantity
-                self.table.update_item(
-                    Key={"PK": pk, "SK": sk},
-                    UpdateExpression="""
-                        SET reserved = if_not_exists(reserved, :zero) + :delta,
-                            available = if_not_exists(available, :zero) - :delta,
-                            updated_at = :now
-                    """,
-                    ExpressionAttributeValues={
-                        ":delta": delta,
-                        ":zero": 0,
-                        ":now": datetime.utcnow().isoformat() + "Z",
-                    },
-                )
-            else:
-                # Update total and available
-                self.table.update_item(
-                    Key={"PK": pk, "SK": sk},
-                    UpdateExpression="""
-                        SET total = if_not_exists(total, :zero) + :delta,
-                            available = if_not_exists(available, :zero) + :delta,
-                            updated_at = :now
-                    """,
-                    ExpressionAttributeValues={
-                        ":delta": delta,
-                        ":zero": 0,
-                        ":now": datetime.utcnow().isoformat() + "Z",
-                    },
-                )
+            self.table.update_item(
+                **_balance_update_params(location_id, pn_id, delta, project_id, is_reservation)
+            )
             return True
         except Exception as e:
             debug_error(e, "dynamodb_update_balance", {"location_id": location_id, "pn_id": pn_id, "delta": delta})
@@ -685,37 +824,201 @@ class SGADynamoDBClient:
         Returns:
             True if successful
         """
-        now = datetime.utcnow()
-        iso_now = now.isoformat() + "Z"
-        month = now.strftime("%Y-%m")
+        item = _movement_item(
+            movement_id=movement_id,
+            movement_type=movement_type,
+            location_id=location_id,
+            pn_id=pn_id,
+            quantity=quantity,
+            created_at=datetime.utcnow().isoformat() + "Z",
+            project_id=project_id,
+            asset_ids=asset_ids,
+            reference_id=reference_id,
+            notes=notes,
+            user_id=user_id,
+        )
 
-        item = {
-            "PK": f"MOVE#{movement_id}",
-            "SK": "METADATA",
-            "movement_id": movement_id,
-            "movement_type": movement_type,
-            "location_id": location_id,
-            "pn_id": pn_id,
-            "quantity": quantity,
-            "created_at": iso_now,
-            "created_by": user_id,
-            # GSI keys
-            "GSI3PK": f"PROJ#{project_id}" if project_id else "PROJ#_NONE",
-            "GSI3SK": f"MOVE#{iso_now}#{movement_id}",
-            "GSI5PK": f"DATE#{month}",
-            "GSI5SK": f"{iso_now}#{movement_id}",
+        return self.put_item(item)
+
+    def record_movements(
+        self,
+        movements: List[Dict[str, Any]],
+        user_id: str = "system",
+        request_token: Optional[str] = None,
+        created_at: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Write movements and their balance increments in DynamoDB transactions.
+
+        Each movement dict takes the create_movement() arguments plus an
+        optional signed "balance_delta" (applied at location_id/pn_id/
+        project_id) and "is_reservation". Deltas are coalesced per balance
+        item into one Update carrying both the total and reserved changes,
+        and movements are grouped into TransactWriteItems chunks of up to 100
+        actions such that every chunk carries the balance updates of its own
+        movements - a failed chunk never leaves balances out of step with the
+        movement log.
+
+        Idempotency: the ClientRequestToken of each chunk is derived from
+        request_token (or the movement ids) together with the batch
+        timestamp, and every timestamp written (created_at, updated_at) is
+        that same value, so a retry with the same token and created_at sends
+        an identical request. Movement puts are conditional
+        (attribute_not_exists); a chunk whose movements all exist already was
+        applied by an earlier attempt and is reported as already applied,
+        not as a failure.
+
+        Args:
+            movements: Movement dicts (movement_id, movement_type,
+                location_id, pn_id, quantity required)
+            user_id: User who created the movements
+            request_token: Optional caller idempotency token for the batch
+            created_at: Batch timestamp (ISO 8601); pass the original value
+                when retrying so the retry is byte-identical (default: now)
+
+        Returns:
+            {"success": bool, "movements_written": int, "already_applied": int,
+             "balance_updates": int, "transactions": int, "error"?: str,
+             "failed_movement_ids"?: [...]}
+        """
+        import hashlib
+
+        result = {
+            "success": True, "movements_written": 0, "already_applied": 0,
+            "balance_updates": 0, "transactions": 0,
         }
+        if not movements:
+            return result
+
+        created_at = created_at or datetime.utcnow().isoformat() + "Z"
+        token_seed = request_token or hashlib.sha256(
+            "|".join(m["movement_id"] for m in movements).encode("utf-8")
+        ).hexdigest()
+        processed = 0
+        for index, (chunk, deltas) in enumerate(self._group_movement_transactions(movements)):
+            actions = []
+            for movement in chunk:
+                item = _movement_item(
+                    created_at=movement.get("created_at") or created_at,
+                    user_id=user_id,
+                    **{
+                        k: movement.get(k)
+                        for k in (
+                            "movement_id", "movement_type", "location_id", "pn_id", "quantity",
+                            "project_id", "asset_ids", "reference_id", "notes",
+                        )
+                    },
+                )
+                item["updated_at"] = item["created_at"]
+                actions.append({"Put": {
+                    "TableName": self._table_name,
+                    "Item": item,
+                    "ConditionExpression": "attribute_not_exists(PK)",
+                }})
+            for (location_id, pn_id, project_id), (total_delta, reserved_delta) in deltas.items():
+                params = _balance_delta_params(
+                    location_id, pn_id, project_id, total_delta, reserved_delta, now=created_at
+                )
+                actions.append({"Update": {
+                    "TableName": self._table_name,
+                    **params,
+                }})
+
+            token = hashlib.sha256(
+                f"{token_seed}:{created_at}:{index}".encode("utf-8")
+            ).hexdigest()[:36]
+            error = self._transact_write(actions, token)
+            if error and self._chunk_already_applied(error, len(chunk)):
+                logger.info(f"[record_movements] Chunk {index} already applied ({len(chunk)} movements)")
+                result["already_applied"] += len(chunk)
+            elif error:
+                debug_error(
+                    error, "dynamodb_record_movements",
+                    {"chunk": index, "actions": len(actions), "written": result["movements_written"]},
+                )
+                result.update({
+                    "success": False,
+                    "error": str(error),
+                    "failed_movement_ids": [m["movement_id"] for m in movements[processed:]],
+                })
+                return result
+            else:
+                result["movements_written"] += len(chunk)
+                result["balance_updates"] += len(deltas)
+                result["transactions"] += 1
+            processed += len(chunk)
+
+        logger.info(
+            f"[record_movements] {result['movements_written']} movements, "
+            f"{result['balance_updates']} balance updates in {result['transactions']} transactions"
+            f" ({result['already_applied']} already applied)"
+        )
+        return result
+
+    @staticmethod
+    def _chunk_already_applied(error: Exception, put_count: int) -> bool:
+        """True if every movement Put of a cancelled chunk hit an existing item."""
+        reasons = getattr(error, "response", {}).get("CancellationReasons", [])
+        put_reasons = [r.get("Code") for r in reasons[:put_count]]
+        return len(put_reasons) == put_count and all(
+            code == "ConditionalCheckFailed" for code in put_reasons
+        )
 
-        if project_id:
-            item["project_id"] = project_id
-        if asset_ids:
-            item["asset_ids"] = asset_ids
-        if reference_id:
-            item["reference_id"] = reference_id
-        if notes:
-            item["notes"] = notes
+    @staticmethod
+    def _group_movement_transactions(
+        movements: List[Dict[str, Any]],
+    ) -> List[Tuple[List[Dict[str, Any]], Dict[Tuple, Tuple[int, int]]]]:
+        """
+        Split movements into transaction-sized groups with coalesced deltas.
 
-        return self.put_item(item)
+        Deltas are keyed by balance item (the _balance_key() fields), so a
+        receipt and a reservation on the same item become one Update.
+
+        Returns:
+            [(movements, {(location_id, pn_id, project_id): (total_delta, reserved_delta)})]
+            where len(movements) + len(deltas) <= TRANSACT_MAX_ACTIONS
+        """
+        groups: List[Tuple[List[Dict[str, Any]], Dict[Tuple, List[int]]]] = []
+        chunk: List[Dict[str, Any]] = []
+        deltas: Dict[Tuple, List[int]] = {}
+
+        for movement in movements:
+            delta = movement.get("balance_delta") or 0
+            key = (movement["location_id"], movement["pn_id"], movement.get("project_id"))
+            new_actions = 1 + (1 if delta and key not in deltas else 0)
+            if chunk and len(chunk) + len(deltas) + new_actions > TRANSACT_MAX_ACTIONS:
+                groups.append((chunk, deltas))
+                chunk, deltas = [], {}
+            chunk.append(movement)
+            if delta:
+                totals = deltas.setdefault(key, [0, 0])
+                totals[1 if movement.get("is_reservation") else 0] += delta
+
+        groups.append((chunk, deltas))
+        # Net-zero deltas (e.g., receive + issue in one batch) need no write
+        return [(c, {k: tuple(d) for k, d in ds.items() if any(d)}) for c, ds in groups]
+
+    def _transact_write(self, actions: List[Dict[str, Any]], token: str) -> Optional[Exception]:
+        """Run one TransactWriteItems call, retrying conflicts with the same token."""
+        for attempt in range(1, TRANSACT_MAX_ATTEMPTS + 1):
+            try:
+                # Table meta client: thread-safe and accepts native Python values
+                self.table.meta.client.transact_write_items(
+                    TransactItems=actions, ClientRequestToken=token
+                )
+                return None
+            except Exception as e:
+                reasons = [
+                    r.get("Code", "") for r in getattr(e, "response", {}).get("CancellationReasons", [])
+                ]
+                code = getattr(e, "response", {}).get("Error", {}).get("Code", "")
+                retryable = any(r in _TRANSACT_RETRYABLE for r in reasons) or any(
+                    c in code for c in _TRANSACT_RETRYABLE
+                )
+                if not retryable or attempt == TRANSACT_MAX_ATTEMPTS:
+                    return e
+                time.sleep(0.05 * 2 ** (attempt - 1))
+        return None
 
     def get_movements_by_date(
         self,
@@ -725,18 +1028,22 @@ class SGADynamoDBClient:
         """
         Get movements for a specific month using GSI5.
 
+        With MOVEMENT_DATE_SHARDS > 1 the month is spread over several
+        partitions; all of them are queried in parallel and merged.
+
         Args:
             year_month: Month in YYYY-MM format
             limit: Maximum items
 
         Returns:
-            List of movements
+            List of movements (newest first)
         """
-        return self.query_gsi(
-            gsi_name="GSI5-DateQuery",
-            pk_value=f"DATE#{year_month}",
+        return scatter_gather(
+            f"DATE#{year_month}",
+            MOVEMENT_DATE_SHARDS,
+            lambda pk: self.query_partition(pk, gsi_name="GSI5-DateQuery", limit=limit, scan_forward=False),
+            sort_key="GSI5SK",
             limit=limit,
-            scan_forward=False  # Newest first
         )
 
     # =========================================================================
@@ -1070,7 +1377,7 @@ class SGAAuditLogger:
         event_id = str(uuid.uuid4())[:12]
 
         item = {
-            "PK": f"LOG#{date_key}",
+            "PK": sharded_key(f"LOG#{date_key}", event_id, AUDIT_LOG_SHARDS),
             "SK": f"{iso_now}#{event_id}",
             "event_id": event_id,
             "event_type": event_type,
@@ -1085,7 +1392,7 @@ class SGAAuditLogger:
             "GSI1SK": f"{iso_now}#{event_id}",
             "GSI2PK": f"ENTITY#{entity_type}#{entity_id}",
             "GSI2SK": f"{iso_now}#{event_id}",
-            "GSI3PK": f"TYPE#{event_type}",
+            "GSI3PK": sharded_key(f"TYPE#{event_type}", event_id, AUDIT_LOG_SHARDS),
             "GSI3SK": f"{iso_now}#{event_id}",
         }
 
@@ -1141,6 +1448,46 @@ class SGAAuditLogger:
             session_id=session_id,
         )
 
+    def get_events_by_date(self, date_key: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Get audit events for a day (all write shards, newest first).
+
+        Args:
+            date_key: Day in YYYY-MM-DD format
+            limit: Maximum events
+
+        Returns:
+            List of audit events
+        """
+        return scatter_gather(
+            f"LOG#{date_key}",
+            AUDIT_LOG_SHARDS,
+            lambda pk: self._client.query_partition(pk, limit=limit, scan_forward=False),
+            sort_key="SK",
+            limit=limit,
+        )
+
+    def get_events_by_type(self, event_type: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Get audit events of a type, e.g. AGENT_ACTIVITY (all write shards, newest first).
+
+        Args:
+            event_type: Event type (GSI3PK = TYPE#<event_type>)
+            limit: Maximum events
+
+        Returns:
+            List of audit events
+        """
+        return scatter_gather(
+            f"TYPE#{event_type}",
+            AUDIT_LOG_SHARDS,
+            lambda pk: self._client.query_partition(
+                pk, gsi_name=AUDIT_TYPE_INDEX, limit=limit, scan_forward=False
+            ),
+            sort_key="GSI3SK",
+            limit=limit,
+        )
+
 
 # =============================================================================
 # Session Manager
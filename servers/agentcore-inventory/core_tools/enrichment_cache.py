@@ -0,0 +1,446 @@
+# =============================================================================
+# Equipment Enrichment Cache
+# =============================================================================
+# Read-through cache for Tavily enrichment results.
+#
+# Imports repeat the same Cisco/HP/Dell SKUs constantly, and every
+# enrich_equipment() call used to go back to Tavily search/extract even when
+# the result was already stored in the S3 Knowledge Repository by
+# _store_enrichment_result(). This cache answers those repeats locally.
+#
+# Architecture:
+#     enrichment_tools -> EnrichmentCache -> in-memory LRU (per container)
+#                                         -> S3 index entries (shared)
+#                                         -> enrichment_result.json (S3 KB)
+#
+# Layers:
+#     1. In-memory LRU keyed by normalized (part_number, manufacturer)
+#     2. One small index entry per key under enrichment-cache/entries/
+#        (outside equipment-docs/ so Bedrock KB does not index it). Writes
+#        are a single PUT per key - no shared object to read-modify-write,
+#        so concurrent containers cannot drop each other's entries
+#     3. The enrichment_result.json already written by the enrichment flow
+#
+# Freshness:
+#     - Positive results (SUCCESS/PARTIAL) expire after ENRICHMENT_CACHE_TTL_HOURS
+#     - NOT_FOUND results are cached for ENRICHMENT_CACHE_NEGATIVE_TTL_HOURS
+#       (shorter, vendors publish datasheets for new SKUs over time)
+#     - ERROR results are never cached
+#
+# CRITICAL: Lazy imports for cold start optimization (<30s limit)
+#
+# Author: Faiston NEXO Team
+# Date: January 2026
+# =============================================================================
+
+import json
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import quote
+
+from shared.debug_utils import debug_error
+from shared.env_config import get_optional_env_int
+
+logger = logging.getLogger(__name__)
+
+# Cache configuration (override via environment)
+ENRICHMENT_CACHE_TTL_HOURS = get_optional_env_int("ENRICHMENT_CACHE_TTL_HOURS", 720)
+ENRICHMENT_CACHE_NEGATIVE_TTL_HOURS = get_optional_env_int(
+    "ENRICHMENT_CACHE_NEGATIVE_TTL_HOURS", 24
+)
+ENRICHMENT_CACHE_MAX_ENTRIES = get_optional_env_int("ENRICHMENT_CACHE_MAX_ENTRIES", 2000)
+
+# Index entries live outside equipment-docs/ so the Knowledge Base never ingests them
+ENTRY_PREFIX = "enrichment-cache/entries/"
+
+# Statuses that can be served from cache (ERROR is always retried)
+_POSITIVE_STATUSES = ("success", "partial")
+_NEGATIVE_STATUSES = ("not_found",)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_cache_key(
+    part_number: str,
+    manufacturer: Optional[str] = None,
+) -> Tuple[str, str]:
+    """
+    Normalize (part_number, manufacturer) into a stable cache key.
+
+    Only case and whitespace noise is removed - hyphens and other
+    separators are significant in vendor part numbers. Manufacturer is
+    lower-cased; missing or "Unknown" becomes "".
+
+    Args:
+        part_number: Raw part number from the import row
+        manufacturer: Optional manufacturer hint
+
+    Returns:
+        Tuple (normalized_part_number, normalized_manufacturer)
+    """
+    pn = _WHITESPACE_RE.sub("", (part_number or "").strip()).upper()
+    mfr = _WHITESPACE_RE.sub(" ", (manufacturer or "").strip()).lower()
+    if mfr == "unknown":
+        mfr = ""
+    return pn, mfr
+
+
+def _entry_id(key: Tuple[str, str]) -> str:
+    """Serialize a cache key (e.g. "C9200-24P|cisco")."""
+    return f"{key[0]}|{key[1]}"
+
+
+def _entry_key(entry_id: str) -> str:
+    """S3 key of the index entry for a serialized cache key."""
+    return f"{ENTRY_PREFIX}{quote(entry_id, safe='')}.json"
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[float]:
+    """Parse an ISO-8601 'Z' timestamp into epoch seconds."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.rstrip("Z")).replace(tzinfo=timezone.utc).timestamp()
+    except ValueError:
+        return None
+
+
+class EnrichmentCache:
+    """
+    Read-through enrichment cache backed by the S3 Knowledge Repository.
+
+    Thread-safe. One instance per container (see get_enrichment_cache()).
+    Lookups never raise - any S3 failure degrades to a cache miss so the
+    caller falls back to a live Tavily enrichment.
+
+    Example:
+        cache = get_enrichment_cache()
+        cached = cache.get("C9200-24P", "Cisco")
+        if cached is None:
+            result = enrich_equipment(...)
+            cache.put(result.to_dict(), manufacturer_hint="Cisco")
+            cache.flush()  # one PUT per new index entry
+    """
+
+    def __init__(
+        self,
+        s3_client=None,
+        ttl_hours: int = ENRICHMENT_CACHE_TTL_HOURS,
+        negative_ttl_hours: int = ENRICHMENT_CACHE_NEGATIVE_TTL_HOURS,
+        max_entries: int = ENRICHMENT_CACHE_MAX_ENTRIES,
+    ):
+        """
+        Initialize the enrichment cache.
+
+        Args:
+            s3_client: EquipmentDocsS3Client (lazy-created if None)
+            ttl_hours: Freshness window for SUCCESS/PARTIAL results
+            negative_ttl_hours: Freshness window for NOT_FOUND results
+            max_entries: In-memory LRU bound
+        """
+        self._s3_client = s3_client
+        self._ttl_seconds = ttl_hours * 3600
+        self._negative_ttl_seconds = negative_ttl_hours * 3600
+        self._max_entries = max_entries
+
+        self._lru: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        # Index entries read from / written to S3 by this container
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._dirty: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    # =========================================================================
+    # S3 Access
+    # =========================================================================
+
+    @property
+    def s3_client(self):
+        """Get EquipmentDocsS3Client with lazy loading."""
+        if self._s3_client is None:
+            from core_tools.s3_client import EquipmentDocsS3Client
+            self._s3_client = EquipmentDocsS3Client()
+        return self._s3_client
+
+    def _read_json(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read a JSON object from the equipment docs bucket (None if absent)."""
+        try:
+            response = self.s3_client.client.get_object(
+                Bucket=self.s3_client.bucket,
+                Key=key,
+            )
+            return json.loads(response["Body"].read().decode("utf-8"))
+        except Exception as e:
+            # NoSuchKey is the normal case for a fresh bucket
+            if "NoSuchKey" not in str(e):
+                debug_error(e, "enrichment_cache_read", {"key": key})
+            return None
+
+    def _result_key(self, part_number: str) -> str:
+        """S3 key where _store_enrichment_result() writes the full result."""
+        return self.s3_client.get_doc_path(
+            part_number, "enrichment_metadata", "enrichment_result.json"
+        )
+
+    def _load_entry(self, entry_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Index entry for a key.
+
+        A fresh entry already seen by this container is reused; otherwise S3
+        is read again, so entries written (or refreshed) by other containers
+        are picked up. Absent entries are not remembered - a miss is followed
+        by a live enrichment anyway, which dwarfs one GET.
+        """
+        with self._lock:
+            entry = self._entries.get(entry_id)
+            if entry is not None and self._is_fresh(
+                entry.get("status", ""), entry.get("enrichment_timestamp")
+            ):
+                self._entries.move_to_end(entry_id)
+                return entry
+
+        entry = self._read_json(_entry_key(entry_id))
+
+        with self._lock:
+            if entry is None:
+                self._entries.pop(entry_id, None)
+            else:
+                self._remember_entry(entry_id, entry)
+        return entry
+
+    def _remember_entry(self, entry_id: str, entry: Dict[str, Any]) -> None:
+        """Insert into the entry map, bounded like the LRU (caller holds lock)."""
+        self._entries[entry_id] = entry
+        self._entries.move_to_end(entry_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    # =========================================================================
+    # Freshness
+    # =========================================================================
+
+    def _is_fresh(self, status: str, timestamp: Optional[str]) -> bool:
+        """Check whether a cached status/timestamp is still within its TTL."""
+        if status in _POSITIVE_STATUSES:
+            ttl = self._ttl_seconds
+        elif status in _NEGATIVE_STATUSES:
+            ttl = self._negative_ttl_seconds
+        else:
+            return False
+
+        ts = _parse_timestamp(timestamp)
+        if ts is None:
+            return False
+        return (time.time() - ts) < ttl
+
+    def _remember(self, key: Tuple[str, str], result: Dict[str, Any]) -> None:
+        """Insert into the LRU, evicting the oldest entry (caller holds lock)."""
+        self._lru[key] = result
+        self._lru.move_to_end(key)
+        while len(self._lru) > self._max_entries:
+            self._lru.popitem(last=False)
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    def get(
+        self,
+        part_number: str,
+        manufacturer: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a fresh enrichment result.
+
+        Args:
+            part_number: Equipment part number
+            manufacturer: Optional manufacturer hint
+
+        Returns:
+            EnrichmentResult dict (see EnrichmentResult.to_dict()) or None
+        """
+        key = normalize_cache_key(part_number, manufacturer)
+        if not key[0]:
+            return None
+
+        with self._lock:
+            cached = self._lru.get(key)
+            if cached and self._is_fresh(
+                cached.get("status", ""), cached.get("enrichment_timestamp")
+            ):
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return dict(cached)
+
+        entry = self._load_entry(_entry_id(key))
+
+        if not entry or not self._is_fresh(
+            entry.get("status", ""), entry.get("enrichment_timestamp")
+        ):
+            with self._lock:
+                self._lru.pop(key, None)
+                self.misses += 1
+            return None
+
+        if entry["status"] in _NEGATIVE_STATUSES:
+            # Negative results are never written to S3 - rebuild from the entry
+            result = {
+                "part_number": part_number,
+                "serial_number": None,
+                "status": entry["status"],
+                "manufacturer": entry.get("manufacturer"),
+                "description": None,
+                "specifications": {},
+                "documents": [],
+                "sources": [],
+                "confidence_score": 0.0,
+                "error_message": None,
+                "enrichment_timestamp": entry["enrichment_timestamp"],
+            }
+        else:
+            result = self._read_json(entry.get("result_key") or self._result_key(part_number))
+            if not result:
+                with self._lock:
+                    self.misses += 1
+                return None
+
+        with self._lock:
+            self._remember(key, result)
+            self.hits += 1
+        return dict(result)
+
+    def put(
+        self,
+        result: Dict[str, Any],
+        manufacturer_hint: Optional[str] = None,
+    ) -> None:
+        """
+        Record an enrichment result (LRU + pending index entry).
+
+        Stored under both the requested (part_number, manufacturer_hint) key
+        and the detected manufacturer key so later lookups with or without
+        a hint hit. Call flush() to persist the index entries.
+
+        Args:
+            result: EnrichmentResult dict
+            manufacturer_hint: Manufacturer the caller asked for (may be None)
+        """
+        status = result.get("status", "")
+        if status not in _POSITIVE_STATUSES and status not in _NEGATIVE_STATUSES:
+            return
+
+        part_number = result.get("part_number", "")
+        keys = {normalize_cache_key(part_number, manufacturer_hint)}
+        keys.add(normalize_cache_key(part_number, result.get("manufacturer")))
+
+        entry = {
+            "status": status,
+            "manufacturer": result.get("manufacturer"),
+            "enrichment_timestamp": result.get("enrichment_timestamp"),
+            "confidence_score": result.get("confidence_score", 0.0),
+        }
+        if status in _POSITIVE_STATUSES:
+            entry["result_key"] = self._result_key(part_number)
+
+        with self._lock:
+            for key in keys:
+                if not key[0]:
+                    continue
+                self._remember(key, dict(result))
+                self._remember_entry(_entry_id(key), entry)
+                self._dirty[_entry_id(key)] = entry
+
+    def flush(self) -> bool:
+        """
+        Persist pending index entries to S3 (one PUT per entry, no reads).
+
+        Each key has its own object, so there is no shared index to merge
+        and concurrent containers never overwrite each other's keys.
+
+        Returns:
+            True if every pending entry was written (or nothing was pending)
+        """
+        with self._lock:
+            if not self._dirty:
+                return True
+            pending = dict(self._dirty)
+            self._dirty.clear()
+
+        failed: Dict[str, Dict[str, Any]] = {}
+        for entry_id, entry in pending.items():
+            try:
+                self.s3_client.client.put_object(
+                    Bucket=self.s3_client.bucket,
+                    Key=_entry_key(entry_id),
+                    Body=json.dumps(entry, ensure_ascii=False).encode("utf-8"),
+                    ContentType="application/json",
+                )
+            except Exception as e:
+                debug_error(e, "enrichment_cache_flush", {"entry": entry_id})
+                failed[entry_id] = entry
+
+        if failed:
+            with self._lock:
+                # Keep entries pending for the next flush
+                for entry_id, entry in failed.items():
+                    self._dirty.setdefault(entry_id, entry)
+            return False
+
+        logger.info("[EnrichmentCache] Index entries flushed: %d", len(pending))
+        return True
+
+    def invalidate(self, part_number: str, manufacturer: Optional[str] = None) -> None:
+        """Drop a key from the LRU and the index (next lookup re-enriches)."""
+        key = normalize_cache_key(part_number, manufacturer)
+        tombstone = {
+            "status": "invalidated",
+            "enrichment_timestamp": datetime.utcnow().isoformat() + "Z",
+        }
+        with self._lock:
+            self._lru.pop(key, None)
+            self._remember_entry(_entry_id(key), tombstone)
+            self._dirty[_entry_id(key)] = tombstone
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters for logging/metrics."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "lru_size": len(self._lru),
+                "entries_loaded": len(self._entries),
+                "pending_writes": len(self._dirty),
+            }
+
+
+# =============================================================================
+# Singleton Access
+# =============================================================================
+
+_enrichment_cache: Optional[EnrichmentCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_enrichment_cache() -> EnrichmentCache:
+    """Get the per-container EnrichmentCache (lazy initialization)."""
+    global _enrichment_cache
+    if _enrichment_cache is None:
+        with _cache_lock:
+            if _enrichment_cache is None:
+                _enrichment_cache = EnrichmentCache()
+    return _enrichment_cache
+
+
+__all__ = [
+    "EnrichmentCache",
+    "get_enrichment_cache",
+    "normalize_cache_key",
+    "ENTRY_PREFIX",
+]
@@ -10,6 +10,7 @@
 #
 # Tools:
 #     - enrich_equipment(): Full enrichment workflow for single equipment
+#       (read-through EnrichmentCache - see core_tools/enrichment_cache.py)
 #     - enrich_batch(): Batch enrichment for multiple items
 #     - validate_part_number(): Validate PN via web search
 #     - trigger_kb_sync(): Trigger Bedrock Knowledge Base sync
@@ -99,6 +100,24 @@ class EnrichmentResult:
             "enrichment_timestamp": self.enrichment_timestamp,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EnrichmentResult":
+        """Rebuild from to_dict() output (e.g., a cached S3 result)."""
+        return cls(
+            part_number=data.get("part_number", ""),
+            serial_number=data.get("serial_number"),
+            status=EnrichmentStatus(data.get("status", EnrichmentStatus.ERROR.value)),
+            manufacturer=data.get("manufacturer"),
+            description=data.get("description"),
+            specifications=data.get("specifications") or {},
+            documents=data.get("documents") or [],
+            sources=data.get("sources") or [],
+            confidence_score=data.get("confidence_score", 0.0),
+            error_message=data.get("error_message"),
+            enrichment_timestamp=data.get("enrichment_timestamp")
+            or datetime.utcnow().isoformat() + "Z",
+        )
+
 
 @dataclass
 class BatchEnrichmentResult:
@@ -112,6 +131,7 @@ class BatchEnrichmentResult:
     results: List[EnrichmentResult] = field(default_factory=list)
     duration_seconds: float = 0.0
     kb_sync_triggered: bool = False
+    cache_hits: int = 0
 
 
 # =============================================================================
@@ -125,6 +145,7 @@ def enrich_equipment(
     manufacturer_hint: Optional[str] = None,
     store_to_s3: bool = True,
     download_documents: bool = False,
+    use_cache: bool = True,
 ) -> EnrichmentResult:
     """
     Enrich a single equipment item with documentation and specifications.
@@ -135,12 +156,16 @@ def enrich_equipment(
     3. Optionally downloads datasheets/manuals
     4. Stores results in S3 Knowledge Repository
 
+    Results already in the EnrichmentCache (fresh SUCCESS/PARTIAL, or a
+    recent NOT_FOUND) are returned without any Tavily call.
+
     Args:
         part_number: Equipment part number (e.g., "C9200-24P")
         serial_number: Optional serial number for tracking
         manufacturer_hint: Optional manufacturer name to improve search
         store_to_s3: Store enrichment results to S3 (default True)
         download_documents: Download PDF documents (default False)
+        use_cache: Serve/record results via EnrichmentCache (default True)
 
     Returns:
         EnrichmentResult with found data and sources
@@ -160,6 +185,11 @@ def enrich_equipment(
         f"part_number={part_number}, manufacturer={manufacturer_hint}"
     )
 
+    if use_cache and not download_documents:
+        cached = _get_cached_result(part_number, serial_number, manufacturer_hint)
+        if cached:
+            return cached
+
     try:
         # Lazy imports
         from core_tools.tavily_gateway import (
@@ -250,8 +280,13 @@ def enrich_equipment(
             )
 
         # Step 5: Store to S3 Knowledge Repository
+        stored = False
         if store_to_s3 and result.status != EnrichmentStatus.NOT_FOUND:
-            _store_enrichment_result(s3_client, result)
+            stored = _store_enrichment_result(s3_client, result)
+
+        if use_cache:
+            _record_cached_result(result, manufacturer_hint, stored)
+            _flush_enrichment_cache()
 
         # Step 6: Download documents if requested
         if download_documents and result.documents:
@@ -330,19 +365,48 @@ def enrich_batch(
         errors=0,
     )
 
-    # Process each item
+    # Process each item (cache first, one live enrichment per unique SKU)
+    from core_tools.enrichment_cache import normalize_cache_key
+
+    enriched: Dict[Any, EnrichmentResult] = {}
+    s3_client = None
+
     for item in items:
         part_number = item.get("part_number", "")
         if not part_number:
             continue
 
-        result = enrich_equipment(
-            part_number=part_number,
-            serial_number=item.get("serial_number"),
-            manufacturer_hint=item.get("manufacturer"),
-            store_to_s3=store_to_s3,
-            download_documents=False,  # Batch mode doesn't download docs
-        )
+        manufacturer_hint = item.get("manufacturer")
+        serial_number = item.get("serial_number")
+        key = normalize_cache_key(part_number, manufacturer_hint)
+
+        result = None
+        if key in enriched:
+            result = _with_serial(enriched[key], serial_number)
+            batch_result.cache_hits += 1
+        else:
+            result = _get_cached_result(part_number, serial_number, manufacturer_hint)
+            if result:
+                batch_result.cache_hits += 1
+            else:
+                result = enrich_equipment(
+                    part_number=part_number,
+                    serial_number=serial_number,
+                    manufacturer_hint=manufacturer_hint,
+                    store_to_s3=False,  # Stored below so the outcome is known
+                    download_documents=False,  # Batch mode doesn't download docs
+                    use_cache=False,  # Recorded below, index flushed once
+                )
+                stored = False
+                if store_to_s3 and result.status in (
+                    EnrichmentStatus.SUCCESS, EnrichmentStatus.PARTIAL
+                ):
+                    if s3_client is None:
+                        from core_tools.s3_client import EquipmentDocsS3Client
+                        s3_client = EquipmentDocsS3Client()
+                    stored = _store_enrichment_result(s3_client, result)
+                _record_cached_result(result, manufacturer_hint, stored=stored)
+            enriched[key] = result
 
         batch_result.results.append(result)
 
@@ -356,6 +420,8 @@ def enrich_batch(
         else:
             batch_result.errors += 1
 
+    _flush_enrichment_cache()
+
     # Calculate duration
     end_time = datetime.utcnow()
     batch_result.duration_seconds = (end_time - start_time).total_seconds()
@@ -373,6 +439,7 @@ def enrich_batch(
         f"[EnrichmentTools] enrich_batch completed: "
         f"success={batch_result.successful}, partial={batch_result.partial}, "
         f"not_found={batch_result.not_found}, errors={batch_result.errors}, "
+        f"cache_hits={batch_result.cache_hits}, "
         f"duration={batch_result.duration_seconds:.1f}s"
     )
 
@@ -387,6 +454,8 @@ def validate_part_number(
     Validate a part number by searching for its existence online.
 
     Useful for detecting typos or invalid part numbers before import.
+    Part numbers with a fresh SUCCESS/PARTIAL enrichment in the
+    EnrichmentCache are confirmed without a Tavily search.
 
     Args:
         part_number: Part number to validate
@@ -408,6 +477,20 @@ def validate_part_number(
     """
     logger.info(f"[EnrichmentTools] validate_part_number: {part_number}")
 
+    cached = _get_cached_result(part_number, None, manufacturer_hint)
+    if cached and cached.status in (EnrichmentStatus.SUCCESS, EnrichmentStatus.PARTIAL):
+        return {
+            "valid": True,
+            "confidence": cached.confidence_score,
+            "manufacturer": cached.manufacturer or manufacturer_hint,
+            "suggestions": [],
+            "top_result": {
+                "url": cached.documents[0].get("url"),
+                "title": cached.documents[0].get("title"),
+            } if cached.documents else None,
+            "cached": True,
+        }
+
     try:
         from core_tools.tavily_gateway import TavilyGatewayAdapterFactory, SearchDepth
 
@@ -682,6 +765,75 @@ def _detect_manufacturer_from_url(url: str) -> Optional[str]:
     return None
 
 
+def _with_serial(
+    result: EnrichmentResult,
+    serial_number: Optional[str],
+) -> EnrichmentResult:
+    """Copy a (cached) result for another physical unit of the same SKU."""
+    data = result.to_dict()
+    data["serial_number"] = serial_number
+    return EnrichmentResult.from_dict(data)
+
+
+def _get_cached_result(
+    part_number: str,
+    serial_number: Optional[str],
+    manufacturer_hint: Optional[str],
+) -> Optional[EnrichmentResult]:
+    """Look up a fresh enrichment in the EnrichmentCache (None on miss/error)."""
+    try:
+        from core_tools.enrichment_cache import get_enrichment_cache
+
+        cached = get_enrichment_cache().get(part_number, manufacturer_hint)
+        if not cached:
+            return None
+
+        cached["serial_number"] = serial_number
+        logger.info(
+            f"[EnrichmentTools] Cache hit: part_number={part_number}, "
+            f"status={cached.get('status')}"
+        )
+        return EnrichmentResult.from_dict(cached)
+
+    except Exception as e:
+        debug_error(e, "enrichment_cache_get", {"part_number": part_number})
+        return None
+
+
+def _record_cached_result(
+    result: EnrichmentResult,
+    manufacturer_hint: Optional[str],
+    stored: bool,
+) -> None:
+    """
+    Record a live enrichment in the EnrichmentCache.
+
+    SUCCESS/PARTIAL results are only cached once their enrichment_result.json
+    is in S3 (the cache reads it back); NOT_FOUND lives in the index entry only.
+    """
+    if result.status == EnrichmentStatus.ERROR:
+        return
+    if result.status != EnrichmentStatus.NOT_FOUND and not stored:
+        return
+
+    try:
+        from core_tools.enrichment_cache import get_enrichment_cache
+
+        get_enrichment_cache().put(result.to_dict(), manufacturer_hint=manufacturer_hint)
+    except Exception as e:
+        debug_error(e, "enrichment_cache_put", {"part_number": result.part_number})
+
+
+def _flush_enrichment_cache() -> None:
+    """Persist pending EnrichmentCache index entries (best effort)."""
+    try:
+        from core_tools.enrichment_cache import get_enrichment_cache
+
+        get_enrichment_cache().flush()
+    except Exception as e:
+        debug_error(e, "enrichment_cache_flush", {})
+
+
 def _store_enrichment_result(
     s3_client,
     result: EnrichmentResult,
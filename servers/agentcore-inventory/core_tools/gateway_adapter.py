@@ -133,6 +133,10 @@ class GatewayPostgresAdapter(DatabaseAdapter):
         """
         List assets and balances with optional filters.
 
+        For constant-time paging through large warehouses use keyset mode:
+        InventoryFilters(pagination="keyset") for the first page, then
+        InventoryFilters(cursor=response["next_cursor"]) with the same filters.
+
         Calls: SGAPostgresTools___sga_list_inventory
         """
         arguments = {}
@@ -143,7 +147,10 @@ class GatewayPostgresAdapter(DatabaseAdapter):
                 "part_number": filters.part_number,
                 "status": filters.status.value if filters.status else None,
                 "limit": filters.limit,
-                "offset": filters.offset,
+                "offset": filters.offset if not filters.cursor else None,
+                "pagination": filters.pagination,
+                "cursor": filters.cursor,
+                "count": filters.count,
             })
 
         logger.debug(f"list_inventory with filters: {arguments}")
@@ -319,6 +326,40 @@ class GatewayPostgresAdapter(DatabaseAdapter):
             arguments=arguments
         )
 
+    def create_movements_bulk(
+        self,
+        movements: List[MovementData]
+    ) -> Dict[str, Any]:
+        """
+        Create many inventory movements in a single transaction.
+
+        Calls: SGAPostgresTools___sga_create_movements_bulk
+        """
+        arguments = {
+            "movements": [
+                self._clean_none_values({
+                    "movement_type": m.movement_type.value,
+                    "part_number": m.part_number,
+                    "quantity": m.quantity,
+                    "source_location_id": m.source_location_id,
+                    "destination_location_id": m.destination_location_id,
+                    "project_id": m.project_id,
+                    "serial_numbers": m.serial_numbers,
+                    "nf_number": m.nf_number,
+                    "nf_date": m.nf_date,
+                    "reason": m.reason,
+                })
+                for m in movements
+            ]
+        }
+
+        logger.info(f"create_movements_bulk: {len(movements)} movements")
+
+        return self._client.call_tool(
+            tool_name=self._tool_name("sga_create_movements_bulk"),
+            arguments=arguments
+        )
+
     def reconcile_with_sap(
         self,
         sap_data: List[Dict[str, Any]],
@@ -7,8 +7,10 @@ LLM for reasoning tasks.
 
 Modules:
     file_processing: FileInspector class for S3 file structure analysis
+    file_structure_cache: ETag-keyed cache of FileInspector results
 """
 
 from core_tools.library.file_processing import FileInspector, FileStructure
+from core_tools.library.file_structure_cache import FileStructureCache
 
-__all__ = ["FileInspector", "FileStructure"]
+__all__ = ["FileInspector", "FileStructure", "FileStructureCache"]
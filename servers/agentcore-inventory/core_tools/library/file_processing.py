@@ -8,7 +8,7 @@ Principle - deterministic Python code for I/O operations.
 CRITICAL CONSTRAINTS:
     - pandas nrows=5 limit (NEVER load full file)
     - MAX_FILE_SIZE = 500 MB
-    - STATELESS design (only s3_client stored)
+    - STATELESS design (only s3_client and the ETag-keyed result cache stored)
     - UTF-8 → Latin-1 encoding fallback
 
 Example:
@@ -34,6 +34,12 @@ from botocore.config import Config
 # Do NOT add `import pandas as pd` at module level - avoid pandas import at module level for cold start optimization
 from botocore.exceptions import ClientError
 
+from core_tools.library.file_structure_cache import (
+    FileStructureCache,
+    get_file_structure_cache,
+)
+from shared.timing_ledger import record_call
+
 
 @dataclass
 class FileStructure:
@@ -82,21 +88,28 @@ class FileStructure:
             "error_type": self.error_type,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FileStructure":
+        """Rebuild a FileStructure from to_dict() output (e.g. a cache entry)."""
+        return cls(**{name: data[name] for name in cls.__dataclass_fields__ if name in data})
+
 
 class FileInspector:
     """
     Efficient S3 file structure inspector (nrows constraint).
 
     CRITICAL: This class is STATELESS.
-        - Only `self._s3_client` and `self._bucket` are stored
+        - Only `self._s3_client`, `self._bucket` and `self._cache` are stored
         - All processing uses local variables
-        - No file content/names stored in self
+        - No file content/names stored in self (the optional cache holds
+          results keyed by S3 ETag, which are immutable per object version)
 
     Constants:
         SAMPLE_ROWS: pandas nrows limit (5)
         MAX_SAMPLE_ROWS: Rows returned to caller (3)
         HEAD_BYTES: Initial bytes for format detection (8KB)
         MAX_FILE_SIZE: Maximum allowed file size (500 MB)
+        INSPECTOR_VERSION: Part of the result cache key (bump on parser changes)
 
     Example:
         >>> inspector = FileInspector()
@@ -110,6 +123,7 @@ class FileInspector:
     MAX_SAMPLE_ROWS: int = 3  # Return exactly 3 samples
     HEAD_BYTES: int = 8192  # 8KB for format/separator detection
     MAX_FILE_SIZE: int = 524_288_000  # 500 MB
+    INSPECTOR_VERSION: str = "2026-01-22.1"  # Bump to invalidate cached results
 
     # Extended inventory column patterns for header detection
     # These patterns help identify if first row is a header
@@ -191,15 +205,21 @@ class FileInspector:
     XLSX_MAGIC: bytes = b"PK\x03\x04"  # ZIP signature (XLSX is ZIP-based)
     XLS_MAGIC: bytes = b"\xd0\xcf\x11\xe0"  # OLE2 compound document
 
-    def __init__(self, bucket: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        bucket: Optional[str] = None,
+        cache: Optional[FileStructureCache] = None,
+    ) -> None:
         """
         Initialize FileInspector.
 
         Args:
             bucket: Default S3 bucket. Falls back to DOCUMENTS_BUCKET env var.
+            cache: Optional result cache keyed by (bucket, key, ETag, version).
         """
         self._bucket = bucket or os.environ.get("DOCUMENTS_BUCKET")
         self._s3_client: Optional[Any] = None  # Lazy loaded
+        self._cache = cache
 
     @property
     def s3_client(self) -> Any:
@@ -220,7 +240,8 @@ class FileInspector:
         Analyze file structure without loading full content.
 
         Algorithm:
-            1. HEAD object → get content-length, type
+            1. HEAD object → get content-length, type, ETag
+               (cached result for this ETag → return it, no further S3 reads)
             2. GET Range=0-8191 → detect format via magic bytes
             3. Auto-detect CSV separator (, ; \\t)
             4. Detect header using heuristics (type variance + patterns)
@@ -261,6 +282,7 @@ class FileInspector:
         try:
             # Step 1: HEAD object for metadata
             head_response = self.s3_client.head_object(Bucket=bucket, Key=key)
+            record_call("s3")
             file_size = head_response.get("ContentLength", 0)
             content_type = head_response.get("ContentType", "")
 
@@ -273,35 +295,21 @@ class FileInspector:
                     error_type="FILE_TOO_LARGE",
                 )
 
-            # Step 2: GET Range for format detection
-            range_end = min(self.HEAD_BYTES - 1, file_size - 1)
-            range_response = self.s3_client.get_object(
-                Bucket=bucket, Key=key, Range=f"bytes=0-{range_end}"
-            )
-            head_bytes = range_response["Body"].read()
-
-            # Step 3: Detect format
-            detected_format = self._detect_format(head_bytes, key, content_type)
-
-            if detected_format == "unknown":
-                return FileStructure(
-                    success=False,
-                    file_size_bytes=file_size,
-                    error=f"Unsupported file format. Key: {key}, ContentType: {content_type}",
-                    error_type="UNSUPPORTED_FORMAT",
+            # Unchanged object already inspected → serve from cache (HEAD only)
+            cache_key = None
+            if self._cache is not None:
+                cache_key = self._cache.make_key(
+                    bucket, key, head_response.get("ETag"), self.INSPECTOR_VERSION
                 )
+            if cache_key is not None:
+                cached = self._cache.get(cache_key, self.s3_client)
+                if cached is not None:
+                    return FileStructure.from_dict(cached)
 
-            # Step 4 & 5: Parse based on format
-            if detected_format in ("xlsx", "xls"):
-                return self._parse_excel_structure(
-                    bucket, key, file_size, detected_format
-                )
-            else:
-                # CSV variants
-                separator = self._detect_csv_separator(head_bytes)
-                return self._parse_csv_structure(
-                    bucket, key, file_size, detected_format, separator, head_bytes
-                )
+            result = self._inspect_object(bucket, key, file_size, content_type)
+            if cache_key is not None and result.success:
+                self._cache.put(cache_key, result.to_dict(), self.s3_client)
+            return result
 
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "")
@@ -323,6 +331,55 @@ class FileInspector:
                 error_type="INSPECTION_ERROR",
             )
 
+    def _inspect_object(
+        self, bucket: str, key: str, file_size: int, content_type: str
+    ) -> FileStructure:
+        """
+        Inspect object content after HEAD (steps 2-6 of inspect_s3_file).
+
+        Args:
+            bucket: S3 bucket name.
+            key: NFC-normalized S3 object key.
+            file_size: ContentLength from HEAD.
+            content_type: ContentType from HEAD.
+
+        Returns:
+            FileStructure with analysis results.
+
+        Raises:
+            ClientError: Propagated to inspect_s3_file for classification.
+        """
+        # Step 2: GET Range for format detection
+        range_end = min(self.HEAD_BYTES - 1, file_size - 1)
+        range_response = self.s3_client.get_object(
+            Bucket=bucket, Key=key, Range=f"bytes=0-{range_end}"
+        )
+        head_bytes = range_response["Body"].read()
+        record_call("s3", bytes_read=len(head_bytes))
+
+        # Step 3: Detect format
+        detected_format = self._detect_format(head_bytes, key, content_type)
+
+        if detected_format == "unknown":
+            return FileStructure(
+                success=False,
+                file_size_bytes=file_size,
+                error=f"Unsupported file format. Key: {key}, ContentType: {content_type}",
+                error_type="UNSUPPORTED_FORMAT",
+            )
+
+        # Step 4 & 5: Parse based on format
+        if detected_format in ("xlsx", "xls"):
+            return self._parse_excel_structure(
+                bucket, key, file_size, detected_format
+            )
+        else:
+            # CSV variants
+            separator = self._detect_csv_separator(head_bytes)
+            return self._parse_csv_structure(
+                bucket, key, file_size, detected_format, separator, head_bytes
+            )
+
     def _detect_format(
         self, head_bytes: bytes, key: str, content_type: str
     ) -> str:
@@ -568,6 +625,7 @@ class FileInspector:
                 Bucket=bucket, Key=key, Range=f"bytes=0-{download_bytes - 1}"
             )
             content = response["Body"].read()
+            record_call("s3", bytes_read=len(content))
         except Exception as e:
             return FileStructure(
                 success=False,
@@ -686,6 +744,7 @@ class FileInspector:
         try:
             response = self.s3_client.get_object(Bucket=bucket, Key=key)
             content = response["Body"].read()
+            record_call("s3", bytes_read=len(content))
         except Exception as e:
             return FileStructure(
                 success=False,
@@ -816,7 +875,8 @@ def get_file_inspector(bucket: Optional[str] = None) -> FileInspector:
     Get singleton FileInspector instance.
 
     Thread-safe lazy initialization of the FileInspector.
-    The singleton is stateless (only s3_client), so reuse is safe.
+    The singleton is stateless (only s3_client and the ETag-keyed result
+    cache), so reuse is safe.
 
     Args:
         bucket: Optional default bucket override.
@@ -826,5 +886,7 @@ def get_file_inspector(bucket: Optional[str] = None) -> FileInspector:
     """
     global _inspector_instance
     if _inspector_instance is None:
-        _inspector_instance = FileInspector(bucket=bucket)
+        _inspector_instance = FileInspector(
+            bucket=bucket, cache=get_file_structure_cache()
+        )
     return _inspector_instance
@@ -0,0 +1,222 @@
+"""
+ETag-keyed cache for FileInspector results.
+
+The frontend polls nexo_analyze_file and users retry uploads, so the same
+unchanged S3 object is inspected many times. Each inspection costs a HEAD,
+one or more range GETs (a full GET for Excel) and a pandas parse. S3 ETags
+change whenever the object content changes, so a FileStructure computed for
+(bucket, key, ETag) stays valid until the object is overwritten.
+
+Cache key:
+    (bucket, key, ETag, FileInspector.INSPECTOR_VERSION)
+    Bumping INSPECTOR_VERSION invalidates every entry after parser changes.
+
+Tiers:
+    1. In-process LRU (warm container) - a hit costs only the HEAD
+    2. S3 sidecar object (shared across containers):
+       s3://{bucket}/file-structure-cache/{inspector_version}/{sha256}.json
+
+Only successful inspections are cached; failures are always re-inspected.
+
+Environment:
+    FILE_STRUCTURE_CACHE_ENABLED      - "false" disables the cache (default: true)
+    FILE_STRUCTURE_CACHE_MAX_ENTRIES  - LRU size (default: 128)
+    FILE_STRUCTURE_CACHE_SIDECAR      - "false" keeps the cache in-process only
+    FILE_STRUCTURE_CACHE_BUCKET       - Sidecar bucket (default: inspected bucket)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FILE_STRUCTURE_CACHE_ENABLED = (
+    os.environ.get("FILE_STRUCTURE_CACHE_ENABLED", "true").lower() == "true"
+)
+FILE_STRUCTURE_CACHE_MAX_ENTRIES = int(
+    os.environ.get("FILE_STRUCTURE_CACHE_MAX_ENTRIES", "128")
+)
+FILE_STRUCTURE_CACHE_SIDECAR = (
+    os.environ.get("FILE_STRUCTURE_CACHE_SIDECAR", "true").lower() == "true"
+)
+FILE_STRUCTURE_CACHE_BUCKET = os.environ.get("FILE_STRUCTURE_CACHE_BUCKET", "")
+
+SIDECAR_PREFIX = "file-structure-cache"
+
+CacheKey = Tuple[str, str, str, str]
+
+
+def normalize_etag(etag: Optional[str]) -> str:
+    """Strip the quotes S3 wraps around ETag values."""
+    return (etag or "").strip().strip('"')
+
+
+class FileStructureCache:
+    """
+    Two-tier cache of FileStructure dicts keyed by S3 object version.
+
+    Attributes:
+        max_entries: Maximum entries kept in the in-process LRU.
+        sidecar_enabled: Whether entries are shared through S3.
+        sidecar_bucket: Sidecar bucket override (None = inspected bucket).
+
+    Example:
+        >>> cache = FileStructureCache()
+        >>> key = cache.make_key("bucket", "uploads/a.csv", '"abc"', "1")
+        >>> cache.get(key, s3_client) is None
+        True
+    """
+
+    def __init__(
+        self,
+        max_entries: int = FILE_STRUCTURE_CACHE_MAX_ENTRIES,
+        sidecar_enabled: bool = FILE_STRUCTURE_CACHE_SIDECAR,
+        sidecar_bucket: Optional[str] = FILE_STRUCTURE_CACHE_BUCKET or None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.sidecar_enabled = sidecar_enabled
+        self.sidecar_bucket = sidecar_bucket
+        self._lru: "OrderedDict[CacheKey, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "sidecar_hits": 0, "misses": 0, "stores": 0}
+
+    @staticmethod
+    def make_key(bucket: str, key: str, etag: Optional[str], inspector_version: str) -> Optional[CacheKey]:
+        """
+        Build the cache key for one object version.
+
+        Returns:
+            Cache key tuple, or None when the object has no ETag.
+        """
+        etag = normalize_etag(etag)
+        if not etag:
+            return None
+        return (bucket, key, etag, inspector_version)
+
+    def sidecar_location(self, cache_key: CacheKey) -> Tuple[str, str]:
+        """S3 (bucket, key) of the sidecar object for a cache key."""
+        bucket, _, _, inspector_version = cache_key
+        digest = hashlib.sha256("\n".join(cache_key).encode("utf-8")).hexdigest()
+        return (
+            self.sidecar_bucket or bucket,
+            f"{SIDECAR_PREFIX}/{inspector_version}/{digest}.json",
+        )
+
+    def get(self, cache_key: CacheKey, s3_client: Any = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached structure (LRU first, then the S3 sidecar).
+
+        Args:
+            cache_key: Key from make_key().
+            s3_client: S3 client for the sidecar tier (None = LRU only).
+
+        Returns:
+            FileStructure dict, or None on a miss.
+        """
+        with self._lock:
+            entry = self._lru.get(cache_key)
+            if entry is not None:
+                self._lru.move_to_end(cache_key)
+                self._stats["hits"] += 1
+                return dict(entry)
+
+        entry = self._read_sidecar(cache_key, s3_client)
+        with self._lock:
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["sidecar_hits"] += 1
+        self._remember(cache_key, entry)
+        return dict(entry)
+
+    def put(self, cache_key: CacheKey, structure: Dict[str, Any], s3_client: Any = None) -> None:
+        """
+        Store a successful FileStructure dict in both tiers (sidecar best-effort).
+
+        Args:
+            cache_key: Key from make_key().
+            structure: FileStructure.to_dict() output.
+            s3_client: S3 client for the sidecar tier (None = LRU only).
+        """
+        if not structure.get("success"):
+            return
+        self._remember(cache_key, structure)
+        with self._lock:
+            self._stats["stores"] += 1
+
+        if not (self.sidecar_enabled and s3_client is not None):
+            return
+        sidecar_bucket, sidecar_key = self.sidecar_location(cache_key)
+        try:
+            s3_client.put_object(
+                Bucket=sidecar_bucket,
+                Key=sidecar_key,
+                Body=json.dumps(
+                    {"source": list(cache_key), "structure": structure},
+                    default=str,
+                ).encode("utf-8"),
+                ContentType="application/json",
+            )
+        except Exception as e:
+            logger.warning(f"[FileStructureCache] Sidecar write failed: {e}")
+
+    def _read_sidecar(self, cache_key: CacheKey, s3_client: Any) -> Optional[Dict[str, Any]]:
+        if not (self.sidecar_enabled and s3_client is not None):
+            return None
+        sidecar_bucket, sidecar_key = self.sidecar_location(cache_key)
+        try:
+            response = s3_client.get_object(Bucket=sidecar_bucket, Key=sidecar_key)
+            payload = json.loads(response["Body"].read())
+        except Exception as e:
+            if "NoSuchKey" not in str(e) and "404" not in str(e):
+                logger.warning(f"[FileStructureCache] Sidecar read failed: {e}")
+            return None
+
+        # Guard against digest collisions and hand-edited sidecars
+        if tuple(payload.get("source") or ()) != cache_key:
+            return None
+        structure = payload.get("structure")
+        return structure if isinstance(structure, dict) and structure.get("success") else None
+
+    def _remember(self, cache_key: CacheKey, structure: Dict[str, Any]) -> None:
+        with self._lock:
+            self._lru[cache_key] = dict(structure)
+            self._lru.move_to_end(cache_key)
+            while len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all in-process entries (sidecars are left in S3)."""
+        with self._lock:
+            self._lru.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current LRU size."""
+        with self._lock:
+            return {**self._stats, "lru_size": len(self._lru)}
+
+
+# Singleton instance for module-level access
+_cache_instance: Optional[FileStructureCache] = None
+
+
+def get_file_structure_cache() -> Optional[FileStructureCache]:
+    """
+    Get the shared FileStructureCache.
+
+    Returns:
+        Cache singleton, or None when FILE_STRUCTURE_CACHE_ENABLED is off.
+    """
+    global _cache_instance
+    if not FILE_STRUCTURE_CACHE_ENABLED:
+        return None
+    if _cache_instance is None:
+        _cache_instance = FileStructureCache()
+    return _cache_instance
@@ -15,7 +15,10 @@ Key Features:
 - Uses SigV4 signing with IAM credentials (auto-refreshed)
 - Supports tool discovery via list_tools()
 - Supports tool invocation via call_tool()
+- Batches independent calls via call_tools_batch() (JSON-RPC 2.0 batch)
 - Caches tool list for performance
+- Pooled keep-alive HTTP session with retries (shared/http_session.py)
+- Resolves multi-part results spilled to S3 (iter_tool_items() streams them)
 - Sync-first design for simplicity (avoids async complexity)
 
 Reference:
@@ -30,7 +33,8 @@ Updated: January 2026 - SigV4 auth (AWS Best Practice)
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import boto3
 import requests
@@ -38,9 +42,19 @@ from botocore.auth import SigV4Auth
 from botocore.awsrequest import AWSRequest
 
 from shared.debug_utils import debug_error
+from shared.http_session import HTTP_POOL_MAXSIZE, create_http_session
+from shared.timing_ledger import record_call
 
 logger = logging.getLogger(__name__)
 
+# Manifest key for oversized results (see postgres_tools_lambda._spill_result)
+RESULT_PAGES_KEY = "result_pages"
+
+# call_tools_batch() sends one JSON-RPC batch array; set to "false" to always
+# use concurrent single calls (also the automatic fallback when the Gateway
+# rejects batch arrays)
+MCP_JSONRPC_BATCH = os.environ.get("MCP_JSONRPC_BATCH", "true").lower() == "true"
+
 
 class MCPGatewayClient:
     """
@@ -67,6 +81,7 @@ class MCPGatewayClient:
         _gateway_url: Full MCP endpoint URL for AgentCore Gateway
         _region: AWS region for SigV4 signing
         _session: boto3 Session for credential management
+        _http: requests Session (keep-alive pool, retries) for Gateway calls
         _tools_cache: Cached list of available tools
     """
 
@@ -76,7 +91,8 @@ class MCPGatewayClient:
     def __init__(
         self,
         gateway_url: str,
-        region: Optional[str] = None
+        region: Optional[str] = None,
+        pool_maxsize: Optional[int] = None
     ):
         """
         Initialize MCP Gateway Client with IAM auth.
@@ -85,11 +101,17 @@ class MCPGatewayClient:
             gateway_url: Gateway MCP endpoint URL
                 Format: https://{gateway_id}.gateway.bedrock-agentcore.{region}.amazonaws.com/mcp
             region: AWS region for SigV4 signing (default: from env or us-east-2)
+            pool_maxsize: Keep-alive connections to the Gateway; size it to the
+                number of threads sharing this client (default HTTP_POOL_MAXSIZE)
         """
         self._gateway_url = gateway_url
         self._region = region or os.environ.get("AWS_REGION", "us-east-2")
         self._session = boto3.Session()
+        self._pool_maxsize = pool_maxsize or HTTP_POOL_MAXSIZE
+        self._http = create_http_session(pool_maxsize=self._pool_maxsize)
+        self._batch_supported: Optional[bool] = None if MCP_JSONRPC_BATCH else False
         self._tools_cache: Optional[List[Dict]] = None
+        self._s3 = None
 
         logger.info(
             f"[MCPGatewayClient] Initialized with IAM auth (SigV4) "
@@ -123,21 +145,22 @@ class MCPGatewayClient:
         self,
         method: str,
         url: str,
-        payload: Dict[str, Any]
+        body: str
     ) -> Dict[str, str]:
         """
         Sign HTTP request with AWS SigV4 for AgentCore Gateway.
 
+        The signature covers the exact body bytes, so the caller must send
+        this same string (data=body) rather than letting requests re-encode.
+
         Args:
             method: HTTP method (POST, GET, etc.)
             url: Full request URL
-            payload: Request body as dictionary
+            body: Serialized request body
 
         Returns:
             Dictionary of signed headers to include in request
         """
-        body = json.dumps(payload)
-
         # Create AWS request object
         request = AWSRequest(
             method=method,
@@ -157,11 +180,18 @@ class MCPGatewayClient:
 
         return dict(request.headers)
 
+    def _post(self, payload: Any, timeout: int) -> requests.Response:
+        """Serialize a JSON-RPC payload once, sign it and POST it on the pooled session."""
+        body = json.dumps(payload)
+        headers = self._sign_request("POST", self._gateway_url, body)
+        return self._http.post(self._gateway_url, headers=headers, data=body, timeout=timeout)
+
     def call_tool(
         self,
         tool_name: str,
         arguments: Dict[str, Any],
-        timeout: int = 30
+        timeout: int = 30,
+        resolve_pages: bool = True
     ) -> Dict[str, Any]:
         """
         Invoke a tool via Gateway using MCP protocol (JSON-RPC 2.0).
@@ -175,6 +205,9 @@ class MCPGatewayClient:
             tool_name: Full tool name (e.g., "SGAPostgresTools___sga_get_balance")
             arguments: Tool arguments as dictionary
             timeout: Request timeout in seconds (default 30)
+            resolve_pages: If True (default), a multi-part result is fetched
+                from S3 and returned whole; if False, the manifest is returned
+                as-is (use iter_tool_items() to stream it instead)
 
         Returns:
             Tool execution result parsed from response content
@@ -196,16 +229,9 @@ class MCPGatewayClient:
 
         logger.debug(f"[MCPGatewayClient] Calling tool: {tool_name}")
 
-        # Sign and execute request
-        headers = self._sign_request("POST", self._gateway_url, payload)
-
         try:
-            response = requests.post(
-                self._gateway_url,
-                headers=headers,
-                json=payload,
-                timeout=timeout
-            )
+            response = self._post(payload, timeout)
+            record_call("mcp", bytes_read=len(response.content or b""))
             response.raise_for_status()
 
         except requests.exceptions.HTTPError as e:
@@ -215,9 +241,20 @@ class MCPGatewayClient:
             debug_error(e, "mcp_gateway_request_failed", {"tool_name": tool_name})
             raise
 
-        # Parse JSON-RPC response
-        result = response.json()
+        return self._parse_tool_response(response.json(), tool_name, resolve_pages)
 
+    def _parse_tool_response(
+        self,
+        result: Dict[str, Any],
+        tool_name: str,
+        resolve_pages: bool = True
+    ) -> Any:
+        """
+        Extract the tool result from one JSON-RPC response object.
+
+        Raises:
+            Exception: If MCP error in response
+        """
         # Check for JSON-RPC error
         if "error" in result:
             error = result["error"]
@@ -234,12 +271,15 @@ class MCPGatewayClient:
                 if content_item.get("type") == "text":
                     text = content_item.get("text", "{}")
                     try:
-                        return json.loads(text)
+                        parsed = json.loads(text)
                     except json.JSONDecodeError:
                         logger.warning(
                             f"[MCPGatewayClient] Could not parse response as JSON: {text[:100]}"
                         )
                         return {"raw_text": text}
+                    if resolve_pages and isinstance(parsed, dict) and RESULT_PAGES_KEY in parsed:
+                        return self._resolve_result_pages(parsed)
+                    return parsed
                 elif "data" in content_item:
                     return content_item["data"]
 
@@ -247,6 +287,224 @@ class MCPGatewayClient:
         logger.debug(f"[MCPGatewayClient] Returning raw result for {tool_name}")
         return result.get("result", {})
 
+    def call_tools_batch(
+        self,
+        calls: Sequence[Tuple[str, Dict[str, Any]]],
+        timeout: int = 30
+    ) -> List[Any]:
+        """
+        Invoke several independent tools in (roughly) one round trip.
+
+        Sends a single JSON-RPC 2.0 batch array. If the Gateway rejects
+        batches, this client remembers it and instead issues the calls
+        concurrently on the pooled session. Responses are matched back by
+        id, so results follow the order of `calls` either way.
+
+        Example:
+            ```python
+            balances = client.call_tools_batch([
+                ("SGAPostgresTools___sga_get_balance", {"part_number": pn})
+                for pn in ("PN-001", "PN-002", "PN-003")
+            ])
+            ```
+
+        Args:
+            calls: (tool_name, arguments) pairs
+            timeout: Request timeout in seconds
+
+        Returns:
+            One result per call, parsed as in call_tool(). A call that fails
+            yields {"error": "..."} instead of raising, so one bad lookup
+            does not discard the others.
+        """
+        if not calls:
+            return []
+
+        if self._batch_supported is not False:
+            results = self._send_batch(calls, timeout)
+            if results is not None:
+                return results
+
+        workers = min(len(calls), self._pool_maxsize)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda call: self._call_tool_or_error(*call, timeout), calls))
+
+    def _call_tool_or_error(self, tool_name: str, arguments: Dict[str, Any], timeout: int) -> Any:
+        """call_tool() for batch fan-out: failures become {"error": ...}."""
+        try:
+            return self.call_tool(tool_name, arguments, timeout=timeout)
+        except Exception as e:
+            return {"error": str(e)}
+
+    def _send_batch(
+        self,
+        calls: Sequence[Tuple[str, Dict[str, Any]]],
+        timeout: int
+    ) -> Optional[List[Any]]:
+        """
+        Send calls as one JSON-RPC batch array.
+
+        Returns:
+            Results in call order, or None if the caller should fall back to
+            concurrent requests (batches unsupported, or this one too large)
+
+        Raises:
+            requests.HTTPError: For other error statuses (401/403/429/5xx);
+                these do not change whether batches are considered supported
+        """
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": f"batch-{n}",
+                "method": "tools/call",
+                "params": {"name": tool_name, "arguments": arguments},
+            }
+            for n, (tool_name, arguments) in enumerate(calls)
+        ]
+
+        try:
+            response = self._post(payload, timeout)
+            record_call("mcp", bytes_read=len(response.content or b""))
+            if response.status_code >= 500:
+                # Some calls may have run; do not replay them one by one
+                response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            debug_error(e, "mcp_gateway_batch_failed", {"calls": len(calls)})
+            raise
+
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+
+        if isinstance(body, list):
+            self._batch_supported = True
+        elif self._is_batch_rejection(response, body):
+            logger.info(
+                f"[MCPGatewayClient] Gateway does not accept JSON-RPC batches "
+                f"(status {response.status_code}); using concurrent requests"
+            )
+            self._batch_supported = False
+            return None
+        elif response.status_code == 413:
+            # Too large for one request, not a capability signal
+            return None
+        else:
+            # Auth, throttling, etc.: surface the error, keep the capability flag
+            try:
+                response.raise_for_status()
+            except requests.exceptions.HTTPError as e:
+                debug_error(e, "mcp_gateway_http_error", {"calls": len(calls), "status_code": response.status_code})
+                raise
+            error = Exception(f"MCP error: unexpected batch response (status {response.status_code})")
+            debug_error(error, "mcp_gateway_batch_failed", {"calls": len(calls)})
+            raise error
+
+        by_id = {item.get("id"): item for item in body if isinstance(item, dict)}
+        results = []
+        for n, (tool_name, _) in enumerate(calls):
+            item = by_id.get(f"batch-{n}")
+            if item is None:
+                results.append({"error": "No response for batched call"})
+                continue
+            try:
+                results.append(self._parse_tool_response(item, tool_name))
+            except Exception as e:
+                results.append({"error": str(e)})
+        return results
+
+    @staticmethod
+    def _is_batch_rejection(response: requests.Response, body: Any) -> bool:
+        """
+        True if a reply to a batch array says batches are unsupported.
+
+        That is a JSON-RPC "Invalid Request" (-32600) error object, or a 400
+        whose body mentions batching.
+        """
+        if isinstance(body, dict) and isinstance(body.get("error"), dict):
+            if body["error"].get("code") == -32600:
+                return True
+        if response.status_code == 400:
+            text = body if body is not None else getattr(response, "text", "")
+            return "batch" in json.dumps(text).lower()
+        return False
+
+    def iter_tool_items(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        items_field: str = "items",
+        timeout: int = 30
+    ) -> Iterator[Any]:
+        """
+        Invoke a tool and yield the items of its main result list lazily.
+
+        Multi-part results are read one S3 page at a time, and keyset
+        paginated tools (next_cursor) are re-invoked with the cursor until
+        exhausted, so only one page is held in memory.
+
+        Args:
+            tool_name: Full tool name (e.g., "SGAPostgresTools___sga_list_inventory")
+            arguments: Tool arguments as dictionary
+            items_field: Result list to stream when the result was not paged
+            timeout: Request timeout in seconds for each Gateway call
+
+        Yields:
+            Items of the result list, in order
+        """
+        arguments = dict(arguments)
+        while True:
+            result = self.call_tool(tool_name, arguments, timeout=timeout, resolve_pages=False)
+            manifest = result.get(RESULT_PAGES_KEY) if isinstance(result, dict) else None
+
+            if manifest and manifest.get("field") is None:
+                result = self._read_result_object(manifest["bucket"], manifest["keys"][0])
+                manifest = None
+
+            if manifest:
+                for page in self._iter_result_pages(manifest):
+                    yield from page
+            elif isinstance(result, dict):
+                yield from result.get(items_field) or []
+
+            cursor = result.get("next_cursor") if isinstance(result, dict) else None
+            if not cursor:
+                return
+            arguments["cursor"] = cursor
+
+    def _get_s3_client(self):
+        """S3 client for multi-part results (lazy, shares the boto3 Session)."""
+        if self._s3 is None:
+            self._s3 = self._session.client("s3", region_name=self._region)
+        return self._s3
+
+    def _read_result_object(self, bucket: str, key: str) -> Any:
+        """Fetch and parse one spilled result object."""
+        response = self._get_s3_client().get_object(Bucket=bucket, Key=key)
+        body = response["Body"].read()
+        record_call("s3", bytes_read=len(body))
+        return json.loads(body)
+
+    def _iter_result_pages(self, manifest: Dict[str, Any]) -> Iterator[List[Any]]:
+        """Yield the pages listed in a result_pages manifest, fetched on demand."""
+        for key in manifest.get("keys", []):
+            yield self._read_result_object(manifest["bucket"], key)
+
+    def _resolve_result_pages(self, result: Dict[str, Any]) -> Any:
+        """Rebuild a multi-part result into the shape the tool returned."""
+        manifest = result[RESULT_PAGES_KEY]
+        field = manifest.get("field")
+        if field is None:
+            return self._read_result_object(manifest["bucket"], manifest["keys"][0])
+
+        resolved = {k: v for k, v in result.items() if k != RESULT_PAGES_KEY}
+        resolved[field] = [item for page in self._iter_result_pages(manifest) for item in page]
+        logger.debug(
+            f"[MCPGatewayClient] Resolved {len(manifest.get('keys', []))} result page(s) "
+            f"into '{field}' ({len(resolved[field])} items)"
+        )
+        return resolved
+
     def list_tools(self, use_cache: bool = True) -> List[Dict]:
         """
         List all available tools from Gateway.
@@ -274,14 +532,7 @@ class MCPGatewayClient:
                 "params": {"cursor": cursor} if cursor else {}
             }
 
-            headers = self._sign_request("POST", self._gateway_url, payload)
-
-            response = requests.post(
-                self._gateway_url,
-                headers=headers,
-                json=payload,
-                timeout=30
-            )
+            response = self._post(payload, timeout=30)
             response.raise_for_status()
 
             result = response.json()
@@ -335,6 +586,10 @@ class MCPGatewayClient:
         self._tools_cache = None
         logger.debug("[MCPGatewayClient] Tool cache cleared")
 
+    def close(self) -> None:
+        """Close pooled Gateway connections."""
+        self._http.close()
+
 
 class MCPGatewayClientFactory:
     """
@@ -14,16 +14,44 @@ Security:
     - TLS encryption required
     - Connection pooling via RDS Proxy
 
+Warm-container reuse (Lambda keeps module state between invocations):
+    - boto3 clients and the Secrets Manager secret are cached at module level;
+      the secret is refetched after RDS_SECRET_TTL_SECONDS and immediately
+      when a login fails (rotated password)
+    - A long-lived client keeps its connection open; it is validated before
+      reuse (SELECT 1 after RDS_CONNECTION_VALIDATE_AFTER_SECONDS idle) and
+      transparently reopened when broken
+    - Fixed read queries are sent as server-side prepared statements
+      (RDS_PREPARED_STATEMENTS=false disables them, e.g. if RDS Proxy
+      session pinning becomes a problem)
+    - Part number / location / project codes resolved for movements are
+      cached per container (positive and negative entries with TTLs)
+
+Balance snapshots (schema/008_balance_snapshots.sql):
+    - With RDS_BALANCE_SNAPSHOTS=true, get_balance and reconcile_with_sap
+      read trigger-maintained snapshot and rollup rows instead of
+      joining/aggregating balances per call. Default false.
+    - Rollout order: apply 008 to the database first, then set the flag.
+      If the tables are missing anyway (UndefinedTable), the container logs
+      a warning and falls back to the join queries for its lifetime.
+    - refresh_materialized_views() refreshes a view CONCURRENTLY once its
+      pending change count reaches RDS_MV_REFRESH_MIN_CHANGES, or when any
+      change is older than RDS_MV_REFRESH_MAX_STALENESS_SECONDS
+
 Author: Faiston NEXO Team
 Date: January 2026
 """
 
+import base64
 import hashlib
 import json
 import logging
 import os
 import re
-from typing import Any, Dict, List, Optional
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 import boto3
 
@@ -33,6 +61,174 @@ logger = logging.getLogger(__name__)
 # Version for tracking deployments (BUG-043 fix)
 __version__ = "2026.01.27.v1"
 
+RDS_SECRET_TTL_SECONDS = float(os.environ.get("RDS_SECRET_TTL_SECONDS", "300"))
+RDS_CONNECTION_VALIDATE_AFTER_SECONDS = float(
+    os.environ.get("RDS_CONNECTION_VALIDATE_AFTER_SECONDS", "30")
+)
+RDS_PREPARED_STATEMENTS = os.environ.get("RDS_PREPARED_STATEMENTS", "true").lower() == "true"
+
+# psycopg.pq.TransactionStatus values (IntEnum; psycopg is imported lazily)
+_TX_INTRANS = 2
+_TX_INERROR = 3
+_TX_UNKNOWN = 4
+
+# PostgreSQL SQLSTATE for invalid_password (login with a rotated secret)
+_INVALID_PASSWORD_SQLSTATE = "28P01"
+
+# Balance reads from sga.balance_snapshots / balance_location_rollups (008);
+# enable only after schema/008_balance_snapshots.sql has been applied
+RDS_BALANCE_SNAPSHOTS = os.environ.get("RDS_BALANCE_SNAPSHOTS", "false").lower() == "true"
+
+# PostgreSQL SQLSTATE for undefined_table (008 not applied yet)
+_UNDEFINED_TABLE_SQLSTATE = "42P01"
+_balance_snapshots_missing = False
+
+# Change-driven REFRESH MATERIALIZED VIEW CONCURRENTLY (refresh_materialized_views)
+RDS_MV_REFRESH_MIN_CHANGES = int(os.environ.get("RDS_MV_REFRESH_MIN_CHANGES", "500"))
+RDS_MV_REFRESH_MAX_STALENESS_SECONDS = float(
+    os.environ.get("RDS_MV_REFRESH_MAX_STALENESS_SECONDS", "900")
+)
+_MV_NAME_PATTERN = re.compile(r"^mv_[a-z0-9_]+$")
+
+# Module-level caches shared by every client in this process/container
+_boto3_clients: Dict[Tuple[str, str], Any] = {}
+_secret_cache: Dict[str, Tuple[Dict[str, str], float]] = {}
+_cache_lock = threading.Lock()
+
+
+# list_inventory pagination
+INVENTORY_PAGINATION_MODES = ("offset", "keyset")
+INVENTORY_COUNT_MODES = ("none", "estimated", "exact")
+
+
+def _encode_inventory_cursor(last_row: Dict[str, Any], filters_digest: str) -> str:
+    """Opaque continuation token for keyset paging on (part_number, location_code)."""
+    payload = json.dumps(
+        {"pn": last_row["part_number"], "loc": last_row["location_code"], "f": filters_digest},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_inventory_cursor(cursor: str, filters_digest: str) -> Tuple[str, str]:
+    """
+    Decode a continuation token from _encode_inventory_cursor().
+
+    Raises:
+        ValueError: Malformed token, or token issued for different filters
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        part_number, location_code, digest = payload["pn"], payload["loc"], payload["f"]
+    except Exception as e:
+        raise ValueError(f"Invalid inventory cursor: {e}") from e
+    if digest != filters_digest:
+        raise ValueError("Inventory cursor was issued for different filters")
+    return part_number, location_code
+
+
+# Movement dimension lookups (code -> surrogate id)
+RDS_DIMENSION_CACHE_TTL_SECONDS = float(os.environ.get("RDS_DIMENSION_CACHE_TTL_SECONDS", "300"))
+RDS_DIMENSION_NEGATIVE_TTL_SECONDS = float(
+    os.environ.get("RDS_DIMENSION_NEGATIVE_TTL_SECONDS", "30")
+)
+RDS_DIMENSION_CACHE_MAX_ENTRIES = int(os.environ.get("RDS_DIMENSION_CACHE_MAX_ENTRIES", "10000"))
+
+# Rows per multi-row INSERT in create_movements_bulk (11 params/row, 65535 max)
+BULK_MOVEMENT_CHUNK_ROWS = 1000
+
+# kind -> (table, code column, id column)
+_DIMENSIONS: Dict[str, Tuple[str, str, str]] = {
+    "part_number": ("sga.part_numbers", "part_number", "part_number_id"),
+    "location": ("sga.locations", "location_code", "location_id"),
+    "project": ("sga.projects", "project_code", "project_id"),
+}
+
+
+class _DimensionCache:
+    """
+    Process-wide TTL cache of dimension code -> id.
+
+    A cached None is a negative entry (code known not to exist) and expires
+    after RDS_DIMENSION_NEGATIVE_TTL_SECONDS so newly registered codes are
+    picked up quickly. Dimension ids never change for a given code, so
+    positive entries only expire to bound staleness after deletes.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Tuple[str, str], Tuple[Optional[str], float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, code: str) -> Tuple[bool, Optional[str]]:
+        """Return (hit, id); id is None for a negative hit."""
+        with self._lock:
+            entry = self._entries.get((kind, code))
+        if entry is None:
+            return False, None
+        value, cached_at = entry
+        ttl = RDS_DIMENSION_CACHE_TTL_SECONDS if value is not None else RDS_DIMENSION_NEGATIVE_TTL_SECONDS
+        if time.monotonic() - cached_at >= ttl:
+            return False, None
+        return True, value
+
+    def put(self, kind: str, code: str, value: Optional[str]) -> None:
+        with self._lock:
+            if len(self._entries) >= RDS_DIMENSION_CACHE_MAX_ENTRIES:
+                self._entries.clear()
+            self._entries[(kind, code)] = (value, time.monotonic())
+
+    def invalidate(self, kind: Optional[str] = None) -> None:
+        with self._lock:
+            if kind is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == kind]:
+                    del self._entries[key]
+
+
+_dimension_cache = _DimensionCache()
+
+
+def _get_boto3_client(service: str, region: str) -> Any:
+    """Get a process-wide boto3 client (creating one costs ~50-100ms)."""
+    with _cache_lock:
+        client = _boto3_clients.get((service, region))
+        if client is None:
+            client = _boto3_clients[(service, region)] = boto3.client(service, region_name=region)
+        return client
+
+
+def _is_auth_failure(exception: Exception) -> bool:
+    """True when a connect failed because the password is no longer valid."""
+    if getattr(exception, "sqlstate", None) == _INVALID_PASSWORD_SQLSTATE:
+        return True
+    return "password authentication failed" in str(exception)
+
+
+def _use_balance_snapshots() -> bool:
+    """True when balance reads should use the 008 snapshot/rollup tables."""
+    return RDS_BALANCE_SNAPSHOTS and not _balance_snapshots_missing
+
+
+def _snapshot_tables_missing(exception: Exception) -> bool:
+    """
+    Check a snapshot read failure for missing 008 tables.
+
+    On UndefinedTable, snapshot reads are switched off for this container
+    (join queries from then on) and True is returned.
+    """
+    global _balance_snapshots_missing
+    if getattr(exception, "sqlstate", None) != _UNDEFINED_TABLE_SQLSTATE:
+        return False
+    if not _balance_snapshots_missing:
+        logger.warning(
+            "RDS_BALANCE_SNAPSHOTS is set but schema/008_balance_snapshots.sql "
+            "is not applied; using join queries for balance reads"
+        )
+    _balance_snapshots_missing = True
+    return True
+
 
 def debug_error(exception: Exception, operation: str, context: dict = None) -> dict:
     """
@@ -77,8 +273,9 @@ class SGAPostgresClient:
         )
 
         # Create boto3 clients WITH explicit region (fixes "You must specify a region" error)
-        self._secrets_client = boto3.client("secretsmanager", region_name=self._region)
-        self._rds_client = boto3.client("rds", region_name=self._region)
+        # Shared across instances so warm invocations skip client construction
+        self._secrets_client = _get_boto3_client("secretsmanager", self._region)
+        self._rds_client = _get_boto3_client("rds", self._region)
 
         # Configuration from environment
         self._proxy_endpoint = os.environ.get("RDS_PROXY_ENDPOINT")
@@ -107,25 +304,96 @@ class SGAPostgresClient:
         # Cache for credentials
         self._credentials = None
 
-    def _get_credentials(self) -> Dict[str, str]:
+        # Connection reuse bookkeeping
+        self._last_used = 0.0
+        self._prepare_reads = True if RDS_PREPARED_STATEMENTS else None
+
+    def _get_credentials(self, force_refresh: bool = False) -> Dict[str, str]:
         """
         Get database credentials from Secrets Manager.
 
+        The secret is cached per process for RDS_SECRET_TTL_SECONDS, so warm
+        invocations skip the Secrets Manager round trip.
+
+        Args:
+            force_refresh: Bypass the cache (after a failed login, e.g. rotation)
+
         Returns:
             Dictionary with host, username, password, dbname, port
         """
-        if self._credentials:
-            return self._credentials
+        if not force_refresh:
+            with _cache_lock:
+                cached = _secret_cache.get(self._secret_arn)
+            if cached and time.monotonic() - cached[1] < RDS_SECRET_TTL_SECONDS:
+                self._credentials = cached[0]
+                return self._credentials
 
         try:
             response = self._secrets_client.get_secret_value(SecretId=self._secret_arn)
             self._credentials = json.loads(response["SecretString"])
+            with _cache_lock:
+                _secret_cache[self._secret_arn] = (self._credentials, time.monotonic())
             logger.info("Retrieved credentials from Secrets Manager")
             return self._credentials
         except Exception as e:
             debug_error(e, "postgres_get_credentials", {"secret_arn": self._secret_arn})
             raise
 
+    def _connection_is_reusable(self) -> bool:
+        """
+        Validate the open connection before reuse.
+
+        Aborted transactions are rolled back; a connection idle for longer
+        than RDS_CONNECTION_VALIDATE_AFTER_SECONDS (RDS Proxy / Aurora may have
+        dropped it while the container was frozen) is probed with SELECT 1.
+        """
+        conn = self._connection
+        if conn is None or conn.closed:
+            return False
+        try:
+            status = conn.info.transaction_status
+            if status == _TX_UNKNOWN:
+                return False
+            if status == _TX_INERROR:
+                conn.rollback()
+            if time.monotonic() - self._last_used > RDS_CONNECTION_VALIDATE_AFTER_SECONDS:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT 1")
+                if status != _TX_INTRANS:
+                    conn.rollback()
+                self._last_used = time.monotonic()
+            return True
+        except Exception as e:
+            logger.warning(f"Discarding broken PostgreSQL connection: {e}")
+            self.close()
+            return False
+
+    def release(self) -> None:
+        """
+        End the implicit read transaction at the end of an invocation.
+
+        Keeps the connection open for the next warm invocation without leaving
+        it "idle in transaction" (writes always commit before returning).
+        """
+        conn = self._connection
+        if conn is None or conn.closed:
+            return
+        try:
+            if conn.info.transaction_status in (_TX_INTRANS, _TX_INERROR):
+                conn.rollback()
+        except Exception as e:
+            logger.warning(f"Failed to release PostgreSQL connection: {e}")
+            self.close()
+
+    def close(self) -> None:
+        """Close the connection (the next query reconnects)."""
+        conn, self._connection = self._connection, None
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
     def _get_connection(self):
         """
         Get or create a database connection.
@@ -138,83 +406,104 @@ class SGAPostgresClient:
         Returns:
             psycopg connection object
         """
-        if self._connection is not None and not self._connection.closed:
+        if self._connection_is_reusable():
             return self._connection
 
         try:
-            import psycopg
-            from psycopg.rows import dict_row
-
-            creds = self._get_credentials()
-
-            if self._direct_connect:
-                # Direct connection to Aurora (bypasses Proxy)
-                # Use for bootstrap when Proxy IAM auth not configured
-                host = creds.get("host")  # Use Aurora cluster endpoint
-                logger.info(f"Connecting directly to Aurora at {host}")
-
-                self._connection = psycopg.connect(
-                    host=host,
-                    port=creds.get("port", self._port),
-                    user=creds.get("username"),
-                    password=creds.get("password"),
-                    dbname=creds.get("dbname", self._database),
-                    sslmode="require",
-                    row_factory=dict_row
-                )
-                logger.info("Connected to PostgreSQL directly (bypass Proxy)")
-
-            elif self._use_iam_auth:
-                # IAM authentication via RDS Proxy
-                user = creds.get("username", "sgaadmin")
-                host = self._proxy_endpoint or creds.get("host")
-
-                # Generate IAM auth token
-                token = self._rds_client.generate_db_auth_token(
-                    DBHostname=host,
-                    Port=self._port,
-                    DBUsername=user,
-                    Region=self._region
-                )
+            self._connection = self._connect(self._get_credentials())
+        except Exception as e:
+            if self._use_iam_auth or not _is_auth_failure(e):
+                debug_error(e, "postgres_connect", {"proxy_endpoint": self._proxy_endpoint, "direct_connect": self._direct_connect})
+                raise
+            # Secret rotated since it was cached: refetch once and retry
+            logger.info("PostgreSQL login failed, refreshing rotated secret")
+            try:
+                self._connection = self._connect(self._get_credentials(force_refresh=True))
+            except Exception as retry_error:
+                debug_error(retry_error, "postgres_connect", {"proxy_endpoint": self._proxy_endpoint, "direct_connect": self._direct_connect, "secret_refreshed": True})
+                raise
 
-                self._connection = psycopg.connect(
-                    host=host,
-                    port=self._port,
-                    user=user,
-                    password=token,
-                    dbname=self._database,
-                    sslmode="require",
-                    row_factory=dict_row
-                )
-                logger.info("Connected to PostgreSQL via IAM auth")
+        self._last_used = time.monotonic()
+        return self._connection
 
-            else:
-                # Password authentication via RDS Proxy
-                # Note: RDS Proxy must be configured to accept password auth
-                host = self._proxy_endpoint or creds.get("host")
-
-                self._connection = psycopg.connect(
-                    host=host,
-                    port=creds.get("port", self._port),
-                    user=creds.get("username"),
-                    password=creds.get("password"),
-                    dbname=creds.get("dbname", self._database),
-                    sslmode="require",
-                    row_factory=dict_row
-                )
-                logger.info("Connected to PostgreSQL via password auth")
+    def _connect(self, creds: Dict[str, str]):
+        """
+        Open a new connection using the configured auth mode.
 
-            return self._connection
+        Args:
+            creds: Secret contents from _get_credentials()
 
-        except Exception as e:
-            debug_error(e, "postgres_connect", {"proxy_endpoint": self._proxy_endpoint, "direct_connect": self._direct_connect})
-            raise
+        Returns:
+            psycopg connection object
+        """
+        import psycopg
+        from psycopg.rows import dict_row
+
+        if self._direct_connect:
+            # Direct connection to Aurora (bypasses Proxy)
+            # Use for bootstrap when Proxy IAM auth not configured
+            host = creds.get("host")  # Use Aurora cluster endpoint
+            logger.info(f"Connecting directly to Aurora at {host}")
+
+            connection = psycopg.connect(
+                host=host,
+                port=creds.get("port", self._port),
+                user=creds.get("username"),
+                password=creds.get("password"),
+                dbname=creds.get("dbname", self._database),
+                sslmode="require",
+                row_factory=dict_row
+            )
+            logger.info("Connected to PostgreSQL directly (bypass Proxy)")
+
+        elif self._use_iam_auth:
+            # IAM authentication via RDS Proxy
+            user = creds.get("username", "sgaadmin")
+            host = self._proxy_endpoint or creds.get("host")
+
+            # Generate IAM auth token
+            token = self._rds_client.generate_db_auth_token(
+                DBHostname=host,
+                Port=self._port,
+                DBUsername=user,
+                Region=self._region
+            )
+
+            connection = psycopg.connect(
+                host=host,
+                port=self._port,
+                user=user,
+                password=token,
+                dbname=self._database,
+                sslmode="require",
+                row_factory=dict_row
+            )
+            logger.info("Connected to PostgreSQL via IAM auth")
+
+        else:
+            # Password authentication via RDS Proxy
+            # Note: RDS Proxy must be configured to accept password auth
+            host = self._proxy_endpoint or creds.get("host")
+
+            connection = psycopg.connect(
+                host=host,
+                port=creds.get("port", self._port),
+                user=creds.get("username"),
+                password=creds.get("password"),
+                dbname=creds.get("dbname", self._database),
+                sslmode="require",
+                row_factory=dict_row
+            )
+            logger.info("Connected to PostgreSQL via password auth")
+
+        return connection
 
     def _execute_query(
         self,
         query: str,
         params: Optional[tuple] = None,
-        fetch_all: bool = True
+        fetch_all: bool = True,
+        prepare: Optional[bool] = None
     ) -> List[Dict]:
         """
         Execute a SQL query and return results.
@@ -223,6 +512,8 @@ class SGAPostgresClient:
             query: SQL query string
             params: Query parameters (optional)
             fetch_all: If True, fetch all results; if False, return cursor
+            prepare: True = server-side prepared statement from the first call
+                (psycopg caches it per connection); None = psycopg default
 
         Returns:
             List of dictionaries representing rows
@@ -230,7 +521,8 @@ class SGAPostgresClient:
         conn = self._get_connection()
         try:
             with conn.cursor() as cur:
-                cur.execute(query, params)
+                cur.execute(query, params, prepare=prepare)
+                self._last_used = time.monotonic()
                 if fetch_all:
                     return cur.fetchall()
                 return []
@@ -255,6 +547,7 @@ class SGAPostgresClient:
             with conn.cursor() as cur:
                 cur.execute(query, params)
                 conn.commit()
+                self._last_used = time.monotonic()
                 return cur.rowcount
         except Exception as e:
             conn.rollback()
@@ -269,20 +562,42 @@ class SGAPostgresClient:
         self,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        pagination: str = "offset",
+        count: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         List inventory with optional filters.
 
+        Two paging modes over sga.mv_inventory_summary:
+        - offset (legacy): LIMIT/OFFSET, exact total by default
+        - keyset: pages on (part_number, location_code) with an opaque
+          next_cursor, so every page costs the same regardless of depth.
+          Used when pagination="keyset" or a cursor is given.
+
         Args:
             filters: Dictionary of filter conditions
             limit: Maximum number of results
-            offset: Pagination offset
+            offset: Pagination offset (offset mode only)
+            cursor: next_cursor from the previous keyset page
+            pagination: "offset" | "keyset"
+            count: "none" | "estimated" | "exact"
+                (default: exact for offset, estimated for keyset)
 
         Returns:
             Dictionary with items and pagination info
+
+        Raises:
+            ValueError: Unknown pagination/count mode or invalid cursor
         """
         filters = filters or {}
+        keyset = cursor is not None or pagination == "keyset"
+        count = count or ("estimated" if keyset else "exact")
+        if pagination not in INVENTORY_PAGINATION_MODES:
+            raise ValueError(f"pagination must be one of {INVENTORY_PAGINATION_MODES}")
+        if count not in INVENTORY_COUNT_MODES:
+            raise ValueError(f"count must be one of {INVENTORY_COUNT_MODES}")
 
         # Build query using materialized view for performance
         query = """
@@ -304,24 +619,95 @@ class SGAPostgresClient:
             query += " AND stock_status = %s"
             params.append(filters["status"])
 
-        # Get total count
-        count_query = f"SELECT COUNT(*) as total FROM ({query}) AS subq"
-        count_result = self._execute_query(count_query, tuple(params))
-        total = count_result[0]["total"] if count_result else 0
+        total, total_is_estimate = self._count_inventory(query, tuple(params), bool(filters), count)
 
-        # Add pagination
-        query += " ORDER BY part_number, location_code LIMIT %s OFFSET %s"
-        params.extend([limit, offset])
+        if not keyset:
+            # Add pagination
+            query += " ORDER BY part_number, location_code LIMIT %s OFFSET %s"
+            params.extend([limit, offset])
 
-        items = self._execute_query(query, tuple(params))
+            items = self._execute_query(query, tuple(params))
 
-        return {
+            exact_total = total is not None and not total_is_estimate
+            result = {
+                "items": items,
+                "total": total,
+                "limit": limit,
+                "offset": offset,
+                "has_more": (offset + len(items)) < total if exact_total else len(items) == limit
+            }
+            if total_is_estimate:
+                result["total_is_estimate"] = True
+            return result
+
+        # Keyset: row-value comparison uses idx_mv_inventory_summary_keyset
+        filters_digest = hashlib.sha256(
+            json.dumps(filters, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()[:16]
+        if cursor:
+            after_part_number, after_location_code = _decode_inventory_cursor(cursor, filters_digest)
+            query += " AND (part_number, location_code) > (%s, %s)"
+            params.extend([after_part_number, after_location_code])
+
+        # Fetch one extra row to know whether another page exists
+        query += " ORDER BY part_number, location_code LIMIT %s"
+        params.append(limit + 1)
+
+        rows = self._execute_query(query, tuple(params), prepare=self._prepare_reads)
+        items = rows[:limit]
+        has_more = len(rows) > limit
+
+        result = {
             "items": items,
-            "total": total,
             "limit": limit,
-            "offset": offset,
-            "has_more": (offset + len(items)) < total
+            "has_more": has_more,
+            "next_cursor": _encode_inventory_cursor(items[-1], filters_digest) if has_more else None,
         }
+        if total is not None:
+            result["total"] = total
+            result["total_is_estimate"] = total_is_estimate
+        return result
+
+    def _count_inventory(
+        self,
+        query: str,
+        params: tuple,
+        filtered: bool,
+        count: str
+    ) -> Tuple[Optional[int], bool]:
+        """
+        Row count for a list_inventory query.
+
+        "estimated" reads planner statistics instead of scanning:
+        pg_class.reltuples for the unfiltered view, EXPLAIN row estimate
+        when filters apply. Falls back to exact when statistics are missing
+        (never analyzed).
+
+        Returns:
+            (total, is_estimate) - total is None when count="none"
+        """
+        if count == "none":
+            return None, False
+
+        if count == "estimated":
+            if not filtered:
+                stats = self._execute_query(
+                    "SELECT reltuples::bigint AS estimate FROM pg_class "
+                    "WHERE oid = 'sga.mv_inventory_summary'::regclass"
+                )
+                estimate = stats[0]["estimate"] if stats else -1
+            else:
+                plan = self._execute_query(f"EXPLAIN (FORMAT JSON) {query}", params)
+                plan_json = next(iter(plan[0].values())) if plan else None
+                if isinstance(plan_json, str):
+                    plan_json = json.loads(plan_json)
+                estimate = int(plan_json[0]["Plan"]["Plan Rows"]) if plan_json else -1
+            if estimate >= 0:
+                return estimate, True
+
+        count_query = f"SELECT COUNT(*) as total FROM ({query}) AS subq"
+        count_result = self._execute_query(count_query, params)
+        return (count_result[0]["total"] if count_result else 0), False
 
     def get_balance(
         self,
@@ -340,37 +726,65 @@ class SGAPostgresClient:
         Returns:
             Balance information
         """
-        query = """
-            SELECT
-                b.balance_id,
-                pn.part_number,
-                pn.description,
-                l.location_code,
-                l.location_name,
-                p.project_code,
-                p.project_name,
-                b.quantity_total,
-                b.quantity_reserved,
-                b.quantity_available,
-                b.last_movement_at,
-                b.last_count_at
-            FROM sga.balances b
-            JOIN sga.part_numbers pn ON b.part_number_id = pn.part_number_id
-            JOIN sga.locations l ON b.location_id = l.location_id
-            LEFT JOIN sga.projects p ON b.project_id = p.project_id
-            WHERE pn.part_number = %s
-        """
+        use_snapshots = _use_balance_snapshots()
+        if use_snapshots:
+            # Precomputed rows (trg_balances_snapshot) - no joins
+            query = """
+                SELECT
+                    balance_id,
+                    part_number,
+                    description,
+                    location_code,
+                    location_name,
+                    project_code,
+                    project_name,
+                    quantity_total,
+                    quantity_reserved,
+                    quantity_available,
+                    last_movement_at,
+                    last_count_at
+                FROM sga.balance_snapshots
+                WHERE part_number = %s
+            """
+            location_column, project_column = "location_code", "project_code"
+        else:
+            query = """
+                SELECT
+                    b.balance_id,
+                    pn.part_number,
+                    pn.description,
+                    l.location_code,
+                    l.location_name,
+                    p.project_code,
+                    p.project_name,
+                    b.quantity_total,
+                    b.quantity_reserved,
+                    b.quantity_available,
+                    b.last_movement_at,
+                    b.last_count_at
+                FROM sga.balances b
+                JOIN sga.part_numbers pn ON b.part_number_id = pn.part_number_id
+                JOIN sga.locations l ON b.location_id = l.location_id
+                LEFT JOIN sga.projects p ON b.project_id = p.project_id
+                WHERE pn.part_number = %s
+            """
+            location_column, project_column = "l.location_code", "p.project_code"
         params = [part_number]
 
         if location_id:
-            query += " AND l.location_code = %s"
+            query += f" AND {location_column} = %s"
             params.append(location_id)
 
         if project_id:
-            query += " AND p.project_code = %s"
+            query += f" AND {project_column} = %s"
             params.append(project_id)
 
-        results = self._execute_query(query, tuple(params))
+        try:
+            results = self._execute_query(query, tuple(params), prepare=self._prepare_reads)
+        except Exception as e:
+            if use_snapshots and _snapshot_tables_missing(e):
+                return self.get_balance(part_number, location_id, project_id)
+            raise
 
         if not results:
             return {
@@ -454,7 +868,7 @@ class SGAPostgresClient:
         base_query += " ORDER BY a.serial_number LIMIT %s"
         params.append(limit)
 
-        results = self._execute_query(base_query, tuple(params))
+        results = self._execute_query(base_query, tuple(params), prepare=self._prepare_reads)
 
         return {
             "query": query,
@@ -526,7 +940,7 @@ class SGAPostgresClient:
                 WHERE a.serial_number = %s
             """
 
-        asset_result = self._execute_query(asset_query, (identifier,))
+        asset_result = self._execute_query(asset_query, (identifier,), prepare=self._prepare_reads)
 
         if not asset_result:
             return {
@@ -562,7 +976,8 @@ class SGAPostgresClient:
 
         timeline = self._execute_query(
             timeline_query,
-            (str(asset["asset_id"]), limit)
+            (str(asset["asset_id"]), limit),
+            prepare=self._prepare_reads,
         )
 
         return {
@@ -637,7 +1052,7 @@ class SGAPostgresClient:
         query += " ORDER BY m.movement_date DESC LIMIT %s"
         params.append(limit)
 
-        results = self._execute_query(query, tuple(params))
+        results = self._execute_query(query, tuple(params), prepare=self._prepare_reads)
 
         return {
             "count": len(results),
@@ -701,6 +1116,61 @@ class SGAPostgresClient:
             "items": results
         }
 
+    def _resolve_dimensions(
+        self,
+        codes: Dict[str, List[Optional[str]]]
+    ) -> Dict[str, Dict[str, Optional[str]]]:
+        """
+        Resolve dimension codes to ids through the container-level cache.
+
+        All cache misses across part numbers, locations and projects are
+        fetched in a single set-based query; codes that do not exist are
+        cached as negative entries.
+
+        Args:
+            codes: {"part_number" | "location" | "project": [code, ...]};
+                empty/None codes are ignored
+
+        Returns:
+            {kind: {code: id or None}}
+        """
+        resolved: Dict[str, Dict[str, Optional[str]]] = {kind: {} for kind in _DIMENSIONS}
+        missing: Dict[str, List[str]] = {}
+        for kind, kind_codes in codes.items():
+            for code in set(filter(None, kind_codes)):
+                hit, value = _dimension_cache.get(kind, code)
+                if hit:
+                    resolved[kind][code] = value
+                else:
+                    missing.setdefault(kind, []).append(code)
+
+        if not missing:
+            return resolved
+
+        branches = []
+        params: List[Any] = []
+        for kind, kind_codes in missing.items():
+            table, code_column, id_column = _DIMENSIONS[kind]
+            branches.append(
+                f"SELECT '{kind}' AS kind, {code_column} AS code, {id_column}::text AS id "
+                f"FROM {table} WHERE {code_column} = ANY(%s)"
+            )
+            params.append(kind_codes)
+
+        rows = self._execute_query(" UNION ALL ".join(branches), tuple(params))
+        found = {(row["kind"], row["code"]): row["id"] for row in rows}
+        for kind, kind_codes in missing.items():
+            for code in kind_codes:
+                value = found.get((kind, code))
+                _dimension_cache.put(kind, code, value)
+                resolved[kind][code] = value
+
+        logger.debug(
+            f"[Dimensions] Resolved {sum(len(c) for c in missing.values())} codes "
+            f"from database ({len(found)} found)"
+        )
+        return resolved
+
     def create_movement(
         self,
         movement_type: str,
@@ -732,10 +1202,14 @@ class SGAPostgresClient:
         Returns:
             Created movement info
         """
-        # Look up IDs from codes
-        pn_query = "SELECT part_number_id FROM sga.part_numbers WHERE part_number = %s"
-        pn_result = self._execute_query(pn_query, (part_number,))
-        if not pn_result:
+        # Look up IDs from codes (cached per container, one query on a miss)
+        dimensions = self._resolve_dimensions({
+            "part_number": [part_number],
+            "location": [source_location_id, destination_location_id],
+            "project": [project_id],
+        })
+        part_number_id = dimensions["part_number"].get(part_number)
+        if part_number_id is None:
             # AUDIT-028: Structured error response with user-friendly message
             return {
                 "error": f"Part number not found: {part_number}",
@@ -743,28 +1217,10 @@ class SGAPostgresClient:
                 "suggested_fix": "Verifique se o código está correto ou cadastre o part number primeiro.",
                 "recoverable": False,
             }
-        part_number_id = pn_result[0]["part_number_id"]
-
-        source_id = None
-        if source_location_id:
-            loc_query = "SELECT location_id FROM sga.locations WHERE location_code = %s"
-            loc_result = self._execute_query(loc_query, (source_location_id,))
-            if loc_result:
-                source_id = loc_result[0]["location_id"]
-
-        dest_id = None
-        if destination_location_id:
-            loc_query = "SELECT location_id FROM sga.locations WHERE location_code = %s"
-            loc_result = self._execute_query(loc_query, (destination_location_id,))
-            if loc_result:
-                dest_id = loc_result[0]["location_id"]
-
-        proj_id = None
-        if project_id:
-            proj_query = "SELECT project_id FROM sga.projects WHERE project_code = %s"
-            proj_result = self._execute_query(proj_query, (project_id,))
-            if proj_result:
-                proj_id = proj_result[0]["project_id"]
+
+        source_id = dimensions["location"].get(source_location_id)
+        dest_id = dimensions["location"].get(destination_location_id)
+        proj_id = dimensions["project"].get(project_id)
 
         # Insert movement
         insert_query = """
@@ -807,6 +1263,168 @@ class SGAPostgresClient:
             "message": f"Movement created: {movement_type} - {quantity} x {part_number}"
         }
 
+    def create_movements_bulk(
+        self,
+        movements: List[Dict[str, Any]],
+        created_by: str = "mcp_lambda"
+    ) -> Dict[str, Any]:
+        """
+        Create many inventory movements in a single transaction.
+
+        Codes for every line are resolved with one set-based lookup (plus one
+        lookup for serial numbers), then all movements and their
+        movement_items are inserted with multi-row INSERTs and committed
+        together. Any invalid line rejects the whole batch.
+
+        Args:
+            movements: List of dicts with the create_movement() arguments
+                (movement_type, part_number, quantity, source_location_id,
+                destination_location_id, project_id, serial_numbers,
+                nf_number, nf_date, reason)
+            created_by: Value for movements.created_by
+
+        Returns:
+            {"success": True, "created_count": int, "movements": [...]} or
+            {"success": False, "created_count": 0, "errors": [{"index", "error"}], ...}
+        """
+        if not movements:
+            return {"success": True, "created_count": 0, "movements": []}
+
+        errors: List[Dict[str, Any]] = []
+        for index, movement in enumerate(movements):
+            missing_fields = [
+                f for f in ("movement_type", "part_number", "quantity") if not movement.get(f)
+            ]
+            if missing_fields:
+                errors.append({"index": index, "error": f"Missing fields: {', '.join(missing_fields)}"})
+
+        dimensions = self._resolve_dimensions({
+            "part_number": [m.get("part_number") for m in movements],
+            "location": [
+                code for m in movements
+                for code in (m.get("source_location_id"), m.get("destination_location_id"))
+            ],
+            "project": [m.get("project_id") for m in movements],
+        })
+
+        serials = {s for m in movements for s in (m.get("serial_numbers") or [])}
+        asset_ids: Dict[str, str] = {}
+        if serials:
+            rows = self._execute_query(
+                "SELECT serial_number, asset_id::text AS asset_id "
+                "FROM sga.assets WHERE serial_number = ANY(%s)",
+                (list(serials),),
+            )
+            asset_ids = {row["serial_number"]: row["asset_id"] for row in rows}
+
+        for index, movement in enumerate(movements):
+            part_number = movement.get("part_number")
+            if part_number and dimensions["part_number"].get(part_number) is None:
+                errors.append({"index": index, "error": f"Part number not found: {part_number}"})
+            unknown_serials = [
+                s for s in (movement.get("serial_numbers") or []) if s not in asset_ids
+            ]
+            if unknown_serials:
+                errors.append({
+                    "index": index,
+                    "error": f"Serial numbers not found: {', '.join(unknown_serials)}",
+                })
+
+        if errors:
+            # AUDIT-028: Structured error response with user-friendly message
+            return {
+                "success": False,
+                "created_count": 0,
+                "errors": errors,
+                "human_explanation": (
+                    f"{len(errors)} problema(s) encontrados no lote; nenhuma movimentação foi criada."
+                ),
+                "suggested_fix": "Corrija as linhas indicadas e reenvie o lote completo.",
+                "recoverable": False,
+            }
+
+        movement_rows = []
+        item_rows = []
+        for movement in movements:
+            movement_id = str(uuid.uuid4())
+            movement_rows.append((
+                movement_id,
+                movement["movement_type"],
+                dimensions["part_number"][movement["part_number"]],
+                movement["quantity"],
+                dimensions["location"].get(movement.get("source_location_id")),
+                dimensions["location"].get(movement.get("destination_location_id")),
+                dimensions["project"].get(movement.get("project_id")),
+                movement.get("nf_number"),
+                movement.get("nf_date"),
+                movement.get("reason"),
+                created_by,
+            ))
+            for serial in movement.get("serial_numbers") or []:
+                item_rows.append((movement_id, asset_ids[serial], serial))
+
+        conn = self._get_connection()
+        movement_dates: Dict[str, str] = {}
+        try:
+            with conn.cursor() as cur:
+                for start in range(0, len(movement_rows), BULK_MOVEMENT_CHUNK_ROWS):
+                    chunk = movement_rows[start:start + BULK_MOVEMENT_CHUNK_ROWS]
+                    cur.execute(
+                        f"""
+                        INSERT INTO sga.movements (
+                            movement_id, movement_type, part_number_id, quantity,
+                            source_location_id, destination_location_id, project_id,
+                            nf_number, nf_date, reason, created_by
+                        ) VALUES {", ".join(["(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"] * len(chunk))}
+                        RETURNING movement_id::text AS movement_id, movement_date
+                        """,
+                        tuple(value for row in chunk for value in row),
+                    )
+                    for row in cur.fetchall():
+                        movement_dates[row["movement_id"]] = row["movement_date"].isoformat()
+
+                for start in range(0, len(item_rows), BULK_MOVEMENT_CHUNK_ROWS):
+                    chunk = item_rows[start:start + BULK_MOVEMENT_CHUNK_ROWS]
+                    cur.execute(
+                        f"""
+                        INSERT INTO sga.movement_items (movement_id, asset_id, serial_number)
+                        VALUES {", ".join(["(%s, %s, %s)"] * len(chunk))}
+                        """,
+                        tuple(value for row in chunk for value in row),
+                    )
+            conn.commit()
+            self._last_used = time.monotonic()
+        except Exception as e:
+            conn.rollback()
+            debug_error(
+                e, "postgres_create_movements_bulk",
+                {"movement_count": len(movement_rows), "item_count": len(item_rows)}
+            )
+            return {
+                "success": False,
+                "created_count": 0,
+                "errors": [{"index": -1, "error": str(e)}],
+                "recoverable": True,
+            }
+
+        logger.info(
+            f"[BulkMovements] Created {len(movement_rows)} movements, "
+            f"{len(item_rows)} movement_items"
+        )
+        return {
+            "success": True,
+            "created_count": len(movement_rows),
+            "item_count": len(item_rows),
+            "movements": [
+                {
+                    "index": index,
+                    "movement_id": row[0],
+                    "movement_date": movement_dates.get(row[0]),
+                }
+                for index, row in enumerate(movement_rows)
+            ],
+        }
+
     def reconcile_with_sap(
         self,
         sap_data: List[Dict[str, Any]],
@@ -830,20 +1448,30 @@ class SGAPostgresClient:
             "sga_only": []
         }
 
-        # Get all SGA balances
-        sga_query = """
-            SELECT
-                pn.part_number,
-                l.location_code,
-                p.project_code,
-                SUM(b.quantity_total) as sga_quantity
-            FROM sga.balances b
-            JOIN sga.part_numbers pn ON b.part_number_id = pn.part_number_id
-            JOIN sga.locations l ON b.location_id = l.location_id
-            LEFT JOIN sga.projects p ON b.project_id = p.project_id
-            GROUP BY pn.part_number, l.location_code, p.project_code
-        """
-        sga_balances = self._execute_query(sga_query)
+        # Get all SGA balances per (part_number, location), across projects
+        use_snapshots = _use_balance_snapshots()
+        if use_snapshots:
+            sga_query = """
+                SELECT part_number, location_code, quantity_total AS sga_quantity
+                FROM sga.balance_location_rollups
+            """
+        else:
+            sga_query = """
+                SELECT
+                    pn.part_number,
+                    l.location_code,
+                    SUM(b.quantity_total) as sga_quantity
+                FROM sga.balances b
+                JOIN sga.part_numbers pn ON b.part_number_id = pn.part_number_id
+                JOIN sga.locations l ON b.location_id = l.location_id
+                GROUP BY pn.part_number, l.location_code
+            """
+        try:
+            sga_balances = self._execute_query(sga_query)
+        except Exception as e:
+            if use_snapshots and _snapshot_tables_missing(e):
+                return self.reconcile_with_sap(sap_data, include_serials)
+            raise
 
         # Create lookup for SGA data
         sga_lookup = {}
@@ -898,6 +1526,112 @@ class SGAPostgresClient:
 
         return results
 
+    def refresh_materialized_views(
+        self,
+        force: bool = False,
+        views: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Refresh materialized views whose pending change volume warrants it.
+
+        Pending changes are recorded per view in sga.mv_change_log by
+        statement triggers (schema/008). A view is refreshed CONCURRENTLY
+        (readers are not blocked) when its pending count reaches
+        RDS_MV_REFRESH_MIN_CHANGES or its oldest pending change is older than
+        RDS_MV_REFRESH_MAX_STALENESS_SECONDS. Each view is refreshed in its own
+        transaction under a transaction-level advisory lock, so overlapping
+        schedulers skip views already being refreshed.
+
+        Intended to be invoked on a short schedule (e.g., EventBridge every
+        minute with {"name": "sga_refresh_materialized_views"}); when nothing
+        is due the call costs one small query.
+
+        Args:
+            force: Refresh every registered view regardless of change volume
+            views: Optional subset of view names (e.g., ["mv_inventory_summary"])
+
+        Returns:
+            {"refreshed": [{view_name, changes, duration_ms}],
+             "skipped": [{view_name, pending_changes, reason}]}
+        """
+        state = self._execute_query("""
+            SELECT
+                s.view_name,
+                COALESCE(SUM(c.changes), 0) AS pending_changes,
+                MAX(c.log_id) AS max_log_id,
+                EXTRACT(EPOCH FROM NOW() - MIN(c.noted_at)) AS oldest_change_age_seconds
+            FROM sga.mv_refresh_state s
+            LEFT JOIN sga.mv_change_log c ON c.view_name = s.view_name
+            GROUP BY s.view_name
+            ORDER BY s.view_name
+        """)
+
+        conn = self._get_connection()
+        conn.commit()  # end the read transaction; each refresh gets its own
+
+        refreshed: List[Dict[str, Any]] = []
+        skipped: List[Dict[str, Any]] = []
+        for row in state:
+            view_name = row["view_name"]
+            pending = int(row["pending_changes"] or 0)
+            age = float(row["oldest_change_age_seconds"] or 0)
+
+            if views and view_name not in views:
+                continue
+            if not _MV_NAME_PATTERN.match(view_name):
+                skipped.append({"view_name": view_name, "pending_changes": pending, "reason": "invalid view name"})
+                continue
+            due = force or pending >= RDS_MV_REFRESH_MIN_CHANGES or (
+                pending > 0 and age >= RDS_MV_REFRESH_MAX_STALENESS_SECONDS
+            )
+            if not due:
+                skipped.append({"view_name": view_name, "pending_changes": pending, "reason": "below threshold"})
+                continue
+
+            started = time.monotonic()
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "SELECT pg_try_advisory_xact_lock(hashtext(%s)) AS locked",
+                        (f"sga.refresh.{view_name}",),
+                    )
+                    if not cur.fetchone()["locked"]:
+                        conn.rollback()
+                        skipped.append({"view_name": view_name, "pending_changes": pending, "reason": "refresh in progress"})
+                        continue
+
+                    cur.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY sga.{view_name}")
+                    duration_ms = int((time.monotonic() - started) * 1000)
+                    if row["max_log_id"] is not None:
+                        cur.execute(
+                            "DELETE FROM sga.mv_change_log WHERE view_name = %s AND log_id <= %s",
+                            (view_name, row["max_log_id"]),
+                        )
+                    cur.execute(
+                        """
+                        UPDATE sga.mv_refresh_state
+                        SET last_refreshed_at = NOW(),
+                            last_refresh_ms = %s,
+                            refresh_count = refresh_count + 1
+                        WHERE view_name = %s
+                        """,
+                        (duration_ms, view_name),
+                    )
+                conn.commit()
+                self._last_used = time.monotonic()
+            except Exception as e:
+                conn.rollback()
+                debug_error(e, "postgres_refresh_materialized_views", {"view_name": view_name})
+                skipped.append({"view_name": view_name, "pending_changes": pending, "reason": str(e)})
+                continue
+
+            refreshed.append({"view_name": view_name, "changes": pending, "duration_ms": duration_ms})
+            logger.info(
+                f"[MVRefresh] {view_name} refreshed after {pending} changes in {duration_ms}ms"
+            )
+
+        return {"refreshed": refreshed, "skipped": skipped}
+
     # =========================================================================
     # Schema Introspection Methods (for Schema-Aware NEXO Import)
     # =========================================================================
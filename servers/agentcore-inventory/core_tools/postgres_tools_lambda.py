@@ -19,10 +19,13 @@ Date: January 2026
 Updated: January 2026 - Fix to read tool name from context, not event (per AWS docs)
 """
 
+import hashlib
 import json
 import logging
 import os
-from typing import Any, Dict
+import random
+import uuid
+from typing import Any, Dict, Optional, Tuple
 from datetime import datetime, date
 
 # Version for tracking deployments (BUG-043 fix)
@@ -37,6 +40,59 @@ logger = logging.getLogger(__name__)
 # Target prefix for tool naming
 TARGET_PREFIX = "SGAPostgresTools"
 
+# Payload-aware request logging: arguments that can carry whole batches are
+# logged as {count, bytes, sha256} instead of being serialized into CloudWatch.
+# Full payloads are still logged for a sampled fraction of invocations.
+BULKY_ARGUMENT_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "sga_insert_pending_items_batch": ("rows",),
+    "sga_create_movements_bulk": ("movements",),
+    "sga_reconcile_sap": ("sap_data",),
+}
+LOG_PAYLOAD_SAMPLE_RATE = float(os.environ.get("LOG_PAYLOAD_SAMPLE_RATE", "0"))
+# Result lists longer than this are logged as a count
+LOG_RESULT_MAX_ITEMS = int(os.environ.get("LOG_RESULT_MAX_ITEMS", "20"))
+
+# Multi-part results: a response larger than MCP_RESULT_MAX_INLINE_BYTES has
+# its largest top-level list (items, movements, discrepancies...) written to
+# MCP_RESULT_BUCKET as pages of MCP_RESULT_PAGE_ITEMS. The inline response
+# keeps the remaining fields plus a "result_pages" manifest that
+# MCPGatewayClient resolves (eagerly in call_tool, lazily in iter_tool_items).
+# Without a bucket, results stay inline exactly as before.
+# The prefix should carry an S3 lifecycle expiration rule.
+MCP_RESULT_MAX_INLINE_BYTES = int(os.environ.get("MCP_RESULT_MAX_INLINE_BYTES", "1000000"))
+MCP_RESULT_PAGE_ITEMS = int(os.environ.get("MCP_RESULT_PAGE_ITEMS", "1000"))
+MCP_RESULT_BUCKET = os.environ.get("MCP_RESULT_BUCKET", "")
+MCP_RESULT_PREFIX = os.environ.get("MCP_RESULT_PREFIX", "mcp-results/")
+RESULT_PAGES_KEY = "result_pages"
+
+# Warm-container reuse: one SGAPostgresClient per execution environment keeps
+# boto3 clients, the cached secret, the open connection and its prepared
+# statements across invocations (see postgres_client.py).
+_pg_client = None
+
+
+def _get_client():
+    """Get the execution environment's SGAPostgresClient (lazy singleton)."""
+    global _pg_client
+    if _pg_client is None:
+        from postgres_client import SGAPostgresClient
+
+        _pg_client = SGAPostgresClient()
+    return _pg_client
+
+
+_s3_client = None
+
+
+def _get_s3_client():
+    """Get the S3 client used for spilled result pages (lazy singleton)."""
+    global _s3_client
+    if _s3_client is None:
+        import boto3
+
+        _s3_client = boto3.client("s3")
+    return _s3_client
+
 
 def debug_error(exception: Exception, operation: str, context: dict = None) -> dict:
     """
@@ -62,6 +118,133 @@ def debug_error(exception: Exception, operation: str, context: dict = None) -> d
     return {"enriched": False, "analysis": {}}
 
 
+def _summarize_payload(value: Any) -> Dict[str, Any]:
+    """Compact stand-in for a bulky value: item count, JSON size and hash."""
+    encoded = json.dumps(value, default=json_serializer, separators=(",", ":")).encode("utf-8")
+    summary = {
+        "bytes": len(encoded),
+        "sha256": hashlib.sha256(encoded).hexdigest()[:16],
+    }
+    if isinstance(value, (list, dict, str)):
+        summary["count"] = len(value)
+    return summary
+
+
+def _loggable_arguments(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Arguments with the tool's bulky fields replaced by _summarize_payload()."""
+    bulky = BULKY_ARGUMENT_FIELDS.get(tool_name, ())
+    return {
+        key: _summarize_payload(value) if key in bulky and value is not None else value
+        for key, value in arguments.items()
+    }
+
+
+def _loggable_result(result: Any) -> Any:
+    """Result with long top-level lists (items, errors, rows) reduced to counts."""
+    if not isinstance(result, dict):
+        return result
+    return {
+        key: {"count": len(value)} if isinstance(value, list) and len(value) > LOG_RESULT_MAX_ITEMS else value
+        for key, value in result.items()
+    }
+
+
+def _log_tool_request(tool_name: str, arguments: Dict[str, Any]) -> None:
+    """Log a tool invocation once, summarizing bulky payloads."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info(
+        f"Executing tool: {tool_name} with args: "
+        f"{json.dumps(_loggable_arguments(tool_name, arguments), default=json_serializer)}"
+    )
+    if (
+        tool_name in BULKY_ARGUMENT_FIELDS
+        and LOG_PAYLOAD_SAMPLE_RATE > 0
+        and random.random() < LOG_PAYLOAD_SAMPLE_RATE
+    ):
+        logger.info(
+            f"Full payload (sampled at {LOG_PAYLOAD_SAMPLE_RATE}) for {tool_name}: "
+            f"{json.dumps(arguments, default=json_serializer)}"
+        )
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a tool result the way the MCP text content carries it."""
+    return json.dumps(value, default=json_serializer)
+
+
+def _largest_list_field(result: Dict[str, Any]) -> Optional[str]:
+    """Name of the longest top-level list in a result, if any."""
+    lists = [(len(v), k) for k, v in result.items() if isinstance(v, list) and v]
+    return max(lists)[1] if lists else None
+
+
+def _put_result_object(key: str, body: str) -> None:
+    """Write one spilled result object to MCP_RESULT_BUCKET."""
+    _get_s3_client().put_object(
+        Bucket=MCP_RESULT_BUCKET,
+        Key=key,
+        Body=body.encode("utf-8"),
+        ContentType="application/json",
+    )
+
+
+def _spill_result(tool_name: str, result: Any) -> Dict[str, Any]:
+    """
+    Write an oversized result to S3 and return the inline manifest.
+
+    The largest top-level list is split into pages (one object per page) so
+    clients can stream it; everything else stays inline. Results without a
+    list, or whose remaining fields are still too large, are written as a
+    single object holding the whole result ("field": None).
+    """
+    prefix = f"{MCP_RESULT_PREFIX}{tool_name}/{uuid.uuid4().hex}/"
+    field = _largest_list_field(result) if isinstance(result, dict) else None
+
+    if field is not None:
+        rows = result[field]
+        envelope = {k: v for k, v in result.items() if k != field}
+        page_count = -(-len(rows) // MCP_RESULT_PAGE_ITEMS)
+        keys = [f"{prefix}page-{n:05d}.json" for n in range(page_count)]
+        envelope[RESULT_PAGES_KEY] = {
+            "field": field,
+            "item_count": len(rows),
+            "page_items": MCP_RESULT_PAGE_ITEMS,
+            "bucket": MCP_RESULT_BUCKET,
+            "keys": keys,
+        }
+        if len(_dumps(envelope)) <= MCP_RESULT_MAX_INLINE_BYTES:
+            for n, key in enumerate(keys):
+                start = n * MCP_RESULT_PAGE_ITEMS
+                _put_result_object(key, _dumps(rows[start:start + MCP_RESULT_PAGE_ITEMS]))
+            return envelope
+
+    key = f"{prefix}result.json"
+    _put_result_object(key, _dumps(result))
+    return {RESULT_PAGES_KEY: {"field": None, "bucket": MCP_RESULT_BUCKET, "keys": [key]}}
+
+
+def _result_text(tool_name: str, result: Any) -> str:
+    """Serialize a tool result once, spilling it to S3 when too large to inline."""
+    text = _dumps(result)
+    if len(text) <= MCP_RESULT_MAX_INLINE_BYTES:
+        return text
+    if not MCP_RESULT_BUCKET:
+        logger.warning(
+            f"Result for {tool_name} is {len(text)} bytes (inline limit "
+            f"{MCP_RESULT_MAX_INLINE_BYTES}) and MCP_RESULT_BUCKET is not set"
+        )
+        return text
+
+    manifest = _spill_result(tool_name, result)
+    pages = manifest[RESULT_PAGES_KEY]
+    logger.info(
+        f"Spilled {len(text)}-byte result for {tool_name} to "
+        f"s3://{MCP_RESULT_BUCKET}/ as {len(pages['keys'])} object(s) (field={pages['field']})"
+    )
+    return _dumps(manifest)
+
+
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Lambda handler for AgentCore Gateway tool invocation.
@@ -77,7 +260,9 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     Returns:
         Tool execution result or error
     """
-    logger.info(f"Received event: {json.dumps(event)}")
+    # The event is logged once, after routing, with bulky fields summarized
+    # (see _log_tool_request); dumping it here would serialize batches twice
+    logger.debug("Received event with keys: %s", list(event))
 
     try:
         # Extract tool name from context (per AWS MCP Gateway documentation)
@@ -113,7 +298,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         else:
             actual_tool = tool_name
 
-        logger.info(f"Executing tool: {actual_tool} with args: {json.dumps(arguments)}")
+        _log_tool_request(actual_tool, arguments)
 
         # Route to appropriate handler
         handlers = {
@@ -125,7 +310,10 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             "sga_get_movements": handle_get_movements,
             "sga_get_pending_tasks": handle_get_pending_tasks,
             "sga_create_movement": handle_create_movement,
+            "sga_create_movements_bulk": handle_create_movements_bulk,
             "sga_reconcile_sap": handle_reconcile_sap,
+            # Maintenance (scheduled: EventBridge rule with {"name": ...})
+            "sga_refresh_materialized_views": handle_refresh_materialized_views,
             # Schema introspection (for NEXO Import schema-aware validation)
             "sga_get_schema_metadata": handle_get_schema_metadata,
             "sga_get_table_columns": handle_get_table_columns,
@@ -150,16 +338,23 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             }
 
         # Execute the tool handler
-        result = handlers[actual_tool](arguments)
+        try:
+            result = handlers[actual_tool](arguments)
+        finally:
+            # Keep the connection for the next warm invocation, but never
+            # leave it idle in transaction while the container is frozen
+            if _pg_client is not None:
+                _pg_client.release()
 
-        logger.info(f"Tool result: {result}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Tool result: {_loggable_result(result)}")
 
         # Return MCP-formatted response
         return {
             "content": [
                 {
                     "type": "text",
-                    "text": json.dumps(result, default=json_serializer)
+                    "text": _result_text(actual_tool, result)
                 }
             ],
             "isError": False
@@ -199,11 +394,13 @@ def handle_list_inventory(arguments: Dict[str, Any]) -> Dict[str, Any]:
         part_number: Filter by part number
         status: Filter by asset status
         limit: Max results (default 100)
-        offset: Pagination offset
+        offset: Pagination offset (offset mode)
+        pagination: "offset" (default) | "keyset"
+        cursor: next_cursor from the previous page (implies keyset)
+        count: "none" | "estimated" | "exact"
+            (default: exact for offset, estimated for keyset)
     """
-    from postgres_client import SGAPostgresClient
-
-    client = SGAPostgresClient()
+    client = _get_client()
 
     filters = {
         "location_id": arguments.get("location_id"),
@@ -217,7 +414,17 @@ def handle_list_inventory(arguments: Dict[str, Any]) -> Dict[str, Any]:
     limit = arguments.get("limit", 100)
     offset = arguments.get("offset", 0)
 
-    return client.list_inventory(filters=filters, limit=limit, offset=offset)
+    try:
+        return client.list_inventory(
+            filters=filters,
+            limit=limit,
+            offset=offset,
+            cursor=arguments.get("cursor"),
+            pagination=arguments.get("pagination", "offset"),
+            count=arguments.get("count"),
+        )
+    except ValueError as e:
+        return {"error": str(e)}
 
 
 def handle_get_balance(arguments: Dict[str, Any]) -> Dict[str, Any]:
@@ -229,9 +436,7 @@ def handle_get_balance(arguments: Dict[str, Any]) -> Dict[str, Any]:
         location_id: Filter by location (optional)
         project_id: Filter by project (optional)
     """
-    from postgres_client import SGAPostgresClient
-
-    client = SGAPostgresClient()
+    client = _get_client()
 
     part_number = arguments.get("part_number")
     if not part_number:
@@ -253,9 +458,7 @@ def handle_search_assets(arguments: Dict[str, Any]) -> Dict[str, Any]:
         search_type: Type of search (serial, part_number, description, all)
         limit: Max results
     """
-    from postgres_client import SGAPostgresClient
-
-    client = SGAPostgresClient()
+    client = _get_client()
 
     query = arguments.get("query")
     if not query:
@@ -277,9 +480,7 @@ def handle_get_asset_timeline(arguments: Dict[str, Any]) -> Dict[str, Any]:
         identifier_type: Type of identifier (asset_id, serial_number)
         limit: Max results
     """
-    from postgres_client import SGAPostgresClient
-
-    client = SGAPostgresClient()
+    client = _get_client()
 
     identifier = arguments.get("identifier")
     if not identifier:
@@ -304,9 +505,7 @@ def handle_get_movements(arguments: Dict[str, Any]) -> Dict[str, Any]:
         location_id: Filter by location
         limit: Max results
     """
-    from postgres_client import SGAPostgresClient
-
-    client = SGAPostgresClient()
+    client = _get_client()
 
     filters = {
         "start_date": arguments.get("start_date"),
@@ -334,9 +533,7 @@ def handle_get_pending_tasks(arguments: Dict[str, Any]) -> Dict[str, Any]:
         assignee_id: Filter by assignee
         limit: Max results
     """
-    from postgres_client import SGAPostgresClient
-
-    client = SGAPostgresClient()
+    client = _get_client()
 
     filters = {
         "task_type": arguments.get("task_type"),
@@ -368,9 +565,7 @@ def handle_create_movement(arguments: Dict[str, Any]) -> Dict[str, Any]:
         nf_date: NF date
         reason: Reason for movement
     """
-    from postgres_client import SGAPostgresClient
-
-    client = SGAPostgresClient()
+    client = _get_client()
 
     # Validate required fields
     required = ["movement_type", "part_number", "quantity"]
@@ -392,6 +587,23 @@ def handle_create_movement(arguments: Dict[str, Any]) -> Dict[str, Any]:
     )
 
 
+def handle_create_movements_bulk(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Create many inventory movements in one transaction (all or nothing).
+
+    Args:
+        movements: List of movement dicts, each with the sga_create_movement
+            arguments (movement_type, part_number and quantity required)
+    """
+    client = _get_client()
+
+    movements = arguments.get("movements")
+    if not isinstance(movements, list):
+        return {"error": "movements is required and must be a list"}
+
+    return client.create_movements_bulk(movements=movements)
+
+
 def handle_reconcile_sap(arguments: Dict[str, Any]) -> Dict[str, Any]:
     """
     Compare SGA inventory with SAP export data.
@@ -400,9 +612,7 @@ def handle_reconcile_sap(arguments: Dict[str, Any]) -> Dict[str, Any]:
         sap_data: List of SAP items to compare (required)
         include_serials: Include serial number comparison
     """
-    from postgres_client import SGAPostgresClient
-
-    client = SGAPostgresClient()
+    client = _get_client()
 
     sap_data = arguments.get("sap_data")
     if not sap_data:
@@ -423,6 +633,22 @@ def handle_reconcile_sap(arguments: Dict[str, Any]) -> Dict[str, Any]:
 # =============================================================================
 
 
+def handle_refresh_materialized_views(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Refresh materialized views whose pending change volume warrants it.
+
+    Args:
+        force: Refresh all registered views regardless of changes (default False)
+        views: Optional list of view names to consider
+    """
+    client = _get_client()
+
+    return client.refresh_materialized_views(
+        force=bool(arguments.get("force", False)),
+        views=arguments.get("views")
+    )
+
+
 def handle_get_schema_metadata(arguments: Dict[str, Any]) -> Dict[str, Any]:
     """
     Get complete schema metadata for all SGA import-related tables.
@@ -439,9 +665,7 @@ def handle_get_schema_metadata(arguments: Dict[str, Any]) -> Dict[str, Any]:
         - table_list: List of available table names
         - timestamp: ISO timestamp of retrieval
     """
-    from postgres_client import SGAPostgresClient
-
-    client = SGAPostgresClient()
+    client = _get_client()
 
     try:
         metadata = client.get_schema_metadata()
@@ -480,9 +704,7 @@ def handle_get_table_columns(arguments: Dict[str, Any]) -> Dict[str, Any]:
         - udt_name: User-defined type name (for ENUMs)
         - is_primary_key: Boolean
     """
-    from postgres_client import SGAPostgresClient
-
-    client = SGAPostgresClient()
+    client = _get_client()
 
     table_name = arguments.get("table_name")
     if not table_name:
@@ -518,9 +740,7 @@ def handle_get_enum_values(arguments: Dict[str, Any]) -> Dict[str, Any]:
         - enum_name: The ENUM type name
         - values: List of valid enum values
     """
-    from postgres_client import SGAPostgresClient
-
-    client = SGAPostgresClient()
+    client = _get_client()
 
     enum_name = arguments.get("enum_name")
     if not enum_name:
@@ -589,9 +809,7 @@ def handle_create_column(arguments: Dict[str, Any]) -> Dict[str, Any]:
         - error: error type string (if failed)
         - message: error message (if failed)
     """
-    from postgres_client import SGAPostgresClient
-
-    client = SGAPostgresClient()
+    client = _get_client()
 
     # Validate required field
     column_name = arguments.get("column_name")
@@ -665,9 +883,7 @@ def handle_insert_pending_items_batch(arguments: Dict[str, Any]) -> Dict[str, An
             "errors": list of row-level errors with row_index, error, row_data
         }
     """
-    from postgres_client import SGAPostgresClient
-
-    client = SGAPostgresClient()
+    client = _get_client()
 
     rows = arguments.get("rows")
     session_id = arguments.get("session_id")  # This is entry_id in DB
@@ -0,0 +1,28 @@
+-- =============================================================================
+-- Migration 007: Keyset Pagination for Inventory Listing
+-- =============================================================================
+-- Purpose: Constant-time paging in sga_list_inventory (pagination="keyset")
+-- Date: January 2026
+--
+-- list_inventory pages on (part_number, location_code) with a row-value
+-- comparison:
+--   WHERE (part_number, location_code) > (%s, %s)
+--   ORDER BY part_number, location_code LIMIT n
+-- This composite index serves both the seek and the ordering, so deep pages
+-- cost the same as the first one (no OFFSET scan).
+--
+-- Safety:
+--   - Uses IF NOT EXISTS for idempotency
+--   - The pair is unique (one balance row per location + part number)
+-- =============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_mv_inventory_summary_keyset
+    ON sga.mv_inventory_summary(part_number, location_code);
+
+-- Location-filtered browsing (location_code = %s ORDER BY part_number, ...)
+CREATE INDEX IF NOT EXISTS idx_mv_inventory_summary_location_keyset
+    ON sga.mv_inventory_summary(location_code, part_number);
+
+-- Keep planner statistics fresh so count="estimated" (pg_class.reltuples)
+-- is available right after deployment
+ANALYZE sga.mv_inventory_summary;
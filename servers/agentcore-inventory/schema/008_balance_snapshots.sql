@@ -0,0 +1,314 @@
+-- =============================================================================
+-- Migration 008: Incremental Balance Snapshots & Change-Driven MV Refresh
+-- =============================================================================
+-- Purpose: Precomputed balance rows for sga_get_balance / sga_reconcile_sap,
+--          and a refresh strategy for the materialized views in 004
+-- Date: January 2026
+--
+-- Features:
+--   1. balance_snapshots: one denormalized row per balances row
+--      (part_number, location, project codes + quantities, no joins on read)
+--   2. balance_location_rollups: totals per (part_number, location) across
+--      projects, maintained by deltas (reconciliation reads these directly)
+--   3. mv_refresh_state / mv_change_log: per-view pending change counts that
+--      drive REFRESH MATERIALIZED VIEW CONCURRENTLY from the application
+--      (SGAPostgresClient.refresh_materialized_views)
+--
+-- Maintenance path:
+--   movements INSERT -> trg_movements_update_balance (003) -> balances
+--   balances INSERT/UPDATE -> trg_balances_snapshot -> snapshots + rollups
+--   balances/assets statements -> mv_change_log (append-only, no hot row)
+--
+-- Safety:
+--   - Uses IF NOT EXISTS / OR REPLACE for idempotency
+--   - Backfill is an upsert, safe to re-run
+-- =============================================================================
+
+SET search_path TO sga, public;
+
+-- -----------------------------------------------------------------------------
+-- 1. balance_snapshots
+-- -----------------------------------------------------------------------------
+
+CREATE TABLE IF NOT EXISTS sga.balance_snapshots (
+    balance_id UUID PRIMARY KEY REFERENCES sga.balances(balance_id) ON DELETE CASCADE,
+    part_number_id UUID NOT NULL,
+    location_id UUID NOT NULL,
+    project_id UUID,
+    part_number VARCHAR(100) NOT NULL,
+    description VARCHAR(500),
+    location_code VARCHAR(50) NOT NULL,
+    location_name VARCHAR(255),
+    project_code VARCHAR(50),
+    project_name VARCHAR(255),
+    quantity_total INTEGER NOT NULL DEFAULT 0,
+    quantity_reserved INTEGER NOT NULL DEFAULT 0,
+    quantity_available INTEGER GENERATED ALWAYS AS (quantity_total - quantity_reserved) STORED,
+    last_movement_at TIMESTAMPTZ,
+    last_count_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_balance_snapshots_pn_location
+    ON sga.balance_snapshots(part_number, location_code);
+
+COMMENT ON TABLE sga.balance_snapshots IS
+'Denormalized balance rows kept in sync by trg_balances_snapshot (read by sga_get_balance)';
+
+-- -----------------------------------------------------------------------------
+-- 2. balance_location_rollups
+-- -----------------------------------------------------------------------------
+
+CREATE TABLE IF NOT EXISTS sga.balance_location_rollups (
+    part_number_id UUID NOT NULL,
+    location_id UUID NOT NULL,
+    part_number VARCHAR(100) NOT NULL,
+    location_code VARCHAR(50) NOT NULL,
+    quantity_total INTEGER NOT NULL DEFAULT 0,
+    quantity_reserved INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (part_number_id, location_id)
+);
+
+COMMENT ON TABLE sga.balance_location_rollups IS
+'Balance totals per part number and location across projects (read by sga_reconcile_sap)';
+
+-- -----------------------------------------------------------------------------
+-- Function: sync_balance_snapshot
+-- -----------------------------------------------------------------------------
+-- Row trigger on balances: upserts the snapshot row and applies the quantity
+-- delta to the (part_number, location) rollup. O(1) per balance change.
+
+CREATE OR REPLACE FUNCTION sga.sync_balance_snapshot()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_total_delta INTEGER;
+    v_reserved_delta INTEGER;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        UPDATE sga.balance_location_rollups
+        SET quantity_total = quantity_total - OLD.quantity_total,
+            quantity_reserved = quantity_reserved - OLD.quantity_reserved,
+            updated_at = NOW()
+        WHERE part_number_id = OLD.part_number_id
+          AND location_id = OLD.location_id;
+        RETURN OLD;
+    END IF;
+
+    INSERT INTO sga.balance_snapshots (
+        balance_id, part_number_id, location_id, project_id,
+        part_number, description, location_code, location_name,
+        project_code, project_name,
+        quantity_total, quantity_reserved, last_movement_at, last_count_at, updated_at
+    )
+    SELECT
+        NEW.balance_id, NEW.part_number_id, NEW.location_id, NEW.project_id,
+        pn.part_number, pn.description, l.location_code, l.location_name,
+        p.project_code, p.project_name,
+        NEW.quantity_total, NEW.quantity_reserved, NEW.last_movement_at, NEW.last_count_at, NOW()
+    FROM sga.part_numbers pn
+    JOIN sga.locations l ON l.location_id = NEW.location_id
+    LEFT JOIN sga.projects p ON p.project_id = NEW.project_id
+    WHERE pn.part_number_id = NEW.part_number_id
+    ON CONFLICT (balance_id) DO UPDATE SET
+        quantity_total = EXCLUDED.quantity_total,
+        quantity_reserved = EXCLUDED.quantity_reserved,
+        last_movement_at = EXCLUDED.last_movement_at,
+        last_count_at = EXCLUDED.last_count_at,
+        updated_at = NOW();
+
+    IF TG_OP = 'INSERT' THEN
+        v_total_delta := NEW.quantity_total;
+        v_reserved_delta := NEW.quantity_reserved;
+    ELSE
+        v_total_delta := NEW.quantity_total - OLD.quantity_total;
+        v_reserved_delta := NEW.quantity_reserved - OLD.quantity_reserved;
+    END IF;
+
+    IF TG_OP = 'INSERT' OR v_total_delta <> 0 OR v_reserved_delta <> 0 THEN
+        INSERT INTO sga.balance_location_rollups (
+            part_number_id, location_id, part_number, location_code,
+            quantity_total, quantity_reserved
+        )
+        SELECT NEW.part_number_id, NEW.location_id, pn.part_number, l.location_code,
+               v_total_delta, v_reserved_delta
+        FROM sga.part_numbers pn
+        JOIN sga.locations l ON l.location_id = NEW.location_id
+        WHERE pn.part_number_id = NEW.part_number_id
+        ON CONFLICT (part_number_id, location_id) DO UPDATE SET
+            quantity_total = sga.balance_location_rollups.quantity_total + EXCLUDED.quantity_total,
+            quantity_reserved = sga.balance_location_rollups.quantity_reserved + EXCLUDED.quantity_reserved,
+            updated_at = NOW();
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_balances_snapshot ON sga.balances;
+CREATE TRIGGER trg_balances_snapshot
+    AFTER INSERT OR UPDATE OR DELETE ON sga.balances
+    FOR EACH ROW
+    EXECUTE FUNCTION sga.sync_balance_snapshot();
+
+-- -----------------------------------------------------------------------------
+-- Function: sync_balance_snapshot_labels
+-- -----------------------------------------------------------------------------
+-- Keeps denormalized codes/names current when a dimension row is renamed.
+
+CREATE OR REPLACE FUNCTION sga.sync_balance_snapshot_labels()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'part_numbers' THEN
+        UPDATE sga.balance_snapshots
+        SET part_number = NEW.part_number, description = NEW.description
+        WHERE part_number_id = NEW.part_number_id;
+        UPDATE sga.balance_location_rollups
+        SET part_number = NEW.part_number
+        WHERE part_number_id = NEW.part_number_id;
+    ELSIF TG_TABLE_NAME = 'locations' THEN
+        UPDATE sga.balance_snapshots
+        SET location_code = NEW.location_code, location_name = NEW.location_name
+        WHERE location_id = NEW.location_id;
+        UPDATE sga.balance_location_rollups
+        SET location_code = NEW.location_code
+        WHERE location_id = NEW.location_id;
+    ELSIF TG_TABLE_NAME = 'projects' THEN
+        UPDATE sga.balance_snapshots
+        SET project_code = NEW.project_code, project_name = NEW.project_name
+        WHERE project_id = NEW.project_id;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_part_numbers_snapshot_labels ON sga.part_numbers;
+CREATE TRIGGER trg_part_numbers_snapshot_labels
+    AFTER UPDATE OF part_number, description ON sga.part_numbers
+    FOR EACH ROW
+    EXECUTE FUNCTION sga.sync_balance_snapshot_labels();
+
+DROP TRIGGER IF EXISTS trg_locations_snapshot_labels ON sga.locations;
+CREATE TRIGGER trg_locations_snapshot_labels
+    AFTER UPDATE OF location_code, location_name ON sga.locations
+    FOR EACH ROW
+    EXECUTE FUNCTION sga.sync_balance_snapshot_labels();
+
+DROP TRIGGER IF EXISTS trg_projects_snapshot_labels ON sga.projects;
+CREATE TRIGGER trg_projects_snapshot_labels
+    AFTER UPDATE OF project_code, project_name ON sga.projects
+    FOR EACH ROW
+    EXECUTE FUNCTION sga.sync_balance_snapshot_labels();
+
+-- -----------------------------------------------------------------------------
+-- 3. Materialized view refresh bookkeeping
+-- -----------------------------------------------------------------------------
+-- mv_change_log is append-only (one row per writing statement) so concurrent
+-- movement transactions never contend on a counter row. The refresher sums
+-- it per view, refreshes, and deletes the entries it has accounted for.
+
+CREATE TABLE IF NOT EXISTS sga.mv_refresh_state (
+    view_name VARCHAR(100) PRIMARY KEY,
+    last_refreshed_at TIMESTAMPTZ,
+    last_refresh_ms INTEGER,
+    refresh_count BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS sga.mv_change_log (
+    log_id BIGSERIAL PRIMARY KEY,
+    view_name VARCHAR(100) NOT NULL,
+    changes BIGINT NOT NULL,
+    noted_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_mv_change_log_view ON sga.mv_change_log(view_name, log_id);
+
+-- Views refreshed CONCURRENTLY (each has a unique index, see 004)
+INSERT INTO sga.mv_refresh_state (view_name) VALUES
+    ('mv_inventory_summary'),
+    ('mv_location_utilization'),
+    ('mv_project_inventory')
+ON CONFLICT (view_name) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION sga.note_mv_changes()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_rows BIGINT;
+BEGIN
+    SELECT COUNT(*) INTO v_rows FROM changed_rows;
+    IF v_rows > 0 THEN
+        INSERT INTO sga.mv_change_log (view_name, changes)
+        SELECT unnest(TG_ARGV), v_rows;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_balances_mv_changes_insert ON sga.balances;
+CREATE TRIGGER trg_balances_mv_changes_insert
+    AFTER INSERT ON sga.balances
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION sga.note_mv_changes('mv_inventory_summary');
+
+DROP TRIGGER IF EXISTS trg_balances_mv_changes_update ON sga.balances;
+CREATE TRIGGER trg_balances_mv_changes_update
+    AFTER UPDATE ON sga.balances
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION sga.note_mv_changes('mv_inventory_summary');
+
+DROP TRIGGER IF EXISTS trg_assets_mv_changes_insert ON sga.assets;
+CREATE TRIGGER trg_assets_mv_changes_insert
+    AFTER INSERT ON sga.assets
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION sga.note_mv_changes('mv_location_utilization', 'mv_project_inventory');
+
+DROP TRIGGER IF EXISTS trg_assets_mv_changes_update ON sga.assets;
+CREATE TRIGGER trg_assets_mv_changes_update
+    AFTER UPDATE ON sga.assets
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION sga.note_mv_changes('mv_location_utilization', 'mv_project_inventory');
+
+-- -----------------------------------------------------------------------------
+-- Backfill
+-- -----------------------------------------------------------------------------
+
+INSERT INTO sga.balance_snapshots (
+    balance_id, part_number_id, location_id, project_id,
+    part_number, description, location_code, location_name,
+    project_code, project_name,
+    quantity_total, quantity_reserved, last_movement_at, last_count_at
+)
+SELECT
+    b.balance_id, b.part_number_id, b.location_id, b.project_id,
+    pn.part_number, pn.description, l.location_code, l.location_name,
+    p.project_code, p.project_name,
+    b.quantity_total, b.quantity_reserved, b.last_movement_at, b.last_count_at
+FROM sga.balances b
+JOIN sga.part_numbers pn ON b.part_number_id = pn.part_number_id
+JOIN sga.locations l ON b.location_id = l.location_id
+LEFT JOIN sga.projects p ON b.project_id = p.project_id
+ON CONFLICT (balance_id) DO UPDATE SET
+    quantity_total = EXCLUDED.quantity_total,
+    quantity_reserved = EXCLUDED.quantity_reserved,
+    last_movement_at = EXCLUDED.last_movement_at,
+    last_count_at = EXCLUDED.last_count_at,
+    updated_at = NOW();
+
+INSERT INTO sga.balance_location_rollups (
+    part_number_id, location_id, part_number, location_code, quantity_total, quantity_reserved
+)
+SELECT part_number_id, location_id, part_number, location_code,
+       SUM(quantity_total), SUM(quantity_reserved)
+FROM sga.balance_snapshots
+GROUP BY part_number_id, location_id, part_number, location_code
+ON CONFLICT (part_number_id, location_id) DO UPDATE SET
+    quantity_total = EXCLUDED.quantity_total,
+    quantity_reserved = EXCLUDED.quantity_reserved,
+    updated_at = NOW();
+
+ANALYZE sga.balance_snapshots;
+ANALYZE sga.balance_location_rollups;
@@ -0,0 +1,525 @@
+#!/usr/bin/env python3
+# =============================================================================
+# Smart Import Pipeline Benchmark - Local AWS + Postgres Stand-ins
+# =============================================================================
+# Reproducible throughput benchmark for the Smart Import stages:
+#
+#   inspect    FileInspector.inspect_s3_file          (Phase 2)
+#   analyze    sheet_analyzer.analyze_workbook        (Phase 2, XLSX only)
+#   match      SchemaColumnMatcher.match_all_columns  (Phase 3)
+#   transform  etl_stream.stream_and_transform        (Phase 4)
+#   insert     SGAPostgresClient.insert_pending_items_batch
+#              (the client method the sga_insert_pending_items_batch MCP tool
+#              runs behind the gateway)
+#
+# Everything runs locally:
+# - S3 / DynamoDB / Secrets Manager: moto (mock_aws)
+# - PostgreSQL: a throwaway postgres container (default, needs docker) or
+#   any existing server (--postgres-dsn / BENCHMARK_POSTGRES_DSN);
+#   schema/*.sql is applied to a fresh "sga" schema
+#
+# Fixtures are generated deterministically (seeded) as semicolon CSV with
+# PT-BR numbers and as XLSX, at 1k/10k/100k/1M rows, and cached on disk.
+#
+# Per stage the report records rows/second, peak RSS (sampled from
+# /proc/self/statm while the stage runs) and p50/p95 latency over the stage's
+# calls (per repeat; per batch for insert). Write the result as a JSON
+# baseline, then compare later runs against it:
+#
+#   cd server/agentcore-inventory
+#   pip install "moto[s3,dynamodb,secretsmanager]" "psycopg[binary]"
+#   python scripts/benchmark_import_pipeline.py --sizes 1k 10k 100k \
+#       --output import_pipeline_baseline.json
+#   python scripts/benchmark_import_pipeline.py --sizes 1k 10k 100k \
+#       --baseline import_pipeline_baseline.json --check
+#
+# NOTE: SGAPostgresClient always connects with sslmode=require, so the
+# postgres container is started with the image's snakeoil certificate.
+# =============================================================================
+
+import argparse
+import contextlib
+import json
+import math
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+SIZES: Dict[str, int] = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+FORMATS = ("csv", "xlsx")
+STAGES = ("inspect", "analyze", "match", "transform", "insert")
+
+BUCKET = "sga-benchmark-documents"
+REGION = "us-east-2"
+POSTGRES_IMAGE = "postgres:16"
+
+# Source columns as exported by a typical PT-BR ERP
+FIXTURE_COLUMNS = [
+    "codigo", "descricao", "quantidade", "valor_unitario", "valor_total",
+    "localizacao", "numero_serie",
+]
+
+# Mappings SchemaMapper produces for FIXTURE_COLUMNS
+FIXTURE_MAPPINGS = [
+    {"source_column": "codigo", "target_column": "part_number", "transform": "TRIM|UPPERCASE"},
+    {"source_column": "descricao", "target_column": "description", "transform": "TRIM"},
+    {"source_column": "quantidade", "target_column": "quantity", "transform": "NUMBER_PARSE_PTBR"},
+    {"source_column": "valor_unitario", "target_column": "unit_value", "transform": "CURRENCY_CLEAN_PTBR"},
+    {"source_column": "valor_total", "target_column": "total_value", "transform": "CURRENCY_CLEAN_PTBR"},
+]
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+def _ptbr_number(value: float) -> str:
+    """1234.5 → '1.234,50'"""
+    return f"{value:,.2f}".replace(",", "_").replace(".", ",").replace("_", ".")
+
+
+def fixture_rows(count: int, seed: int = 42) -> Iterator[List[Any]]:
+    """Deterministic inventory rows (same seed → same file)."""
+    rng = random.Random(seed)
+    for index in range(count):
+        quantity = rng.randint(1, 500)
+        unit_value = rng.randint(100, 500_000) / 100
+        yield [
+            f"PN-{rng.randint(0, 99_999):05d}",
+            f"Item de inventario {index} lote {rng.randint(1, 999)}",
+            str(quantity),
+            f"R$ {_ptbr_number(unit_value)}",
+            f"R$ {_ptbr_number(unit_value * quantity)}",
+            f"LOC-{rng.randint(1, 250):03d}",
+            f"SN{rng.getrandbits(40):012X}",
+        ]
+
+
+def ensure_fixture(fixtures_dir: Path, size: str, fmt: str) -> Path:
+    """Generate (or reuse) the fixture file for a size/format."""
+    path = fixtures_dir / f"inventory_{size}.{fmt}"
+    if path.exists():
+        return path
+    fixtures_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{fmt}.tmp")
+
+    if fmt == "csv":
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            f.write(";".join(FIXTURE_COLUMNS) + "\n")
+            for row in fixture_rows(SIZES[size]):
+                f.write(";".join(row) + "\n")
+    else:
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Inventario")
+        sheet.append(FIXTURE_COLUMNS)
+        for row in fixture_rows(SIZES[size]):
+            sheet.append(row)
+        workbook.save(tmp_path)
+
+    tmp_path.rename(path)
+    return path
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+
+def _current_rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # ru_maxrss is KB on Linux (process-wide high-water mark)
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class PeakRSS:
+    """Samples RSS on a background thread while the block runs."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "PeakRSS":
+        self.peak = _current_rss_bytes()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, _current_rss_bytes())
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, _current_rss_bytes())
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile (samples need not be sorted)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, min(len(ordered), math.ceil(pct / 100 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def summarize(latencies_ms: List[float], rows: int, peak_rss: int, unit: str = "rows") -> Dict[str, Any]:
+    """Stage metrics as stored in the JSON report."""
+    total_s = sum(latencies_ms) / 1000
+    return {
+        "unit": unit,
+        "items": rows,
+        "calls": len(latencies_ms),
+        "p50_ms": round(percentile(latencies_ms, 50), 2),
+        "p95_ms": round(percentile(latencies_ms, 95), 2),
+        "rows_per_second": round(rows / total_s, 1) if total_s > 0 else None,
+        "peak_rss_mb": round(peak_rss / (1024 * 1024), 1),
+    }
+
+
+def timed(fn: Callable[[], Any]) -> Tuple[float, Any]:
+    start = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - start) * 1000, result
+
+
+# =============================================================================
+# Local Environment (moto + Postgres)
+# =============================================================================
+
+
+@contextlib.contextmanager
+def start_postgres_container() -> Iterator[Dict[str, Any]]:
+    """Throwaway postgres with SSL on (snakeoil cert ships with the image)."""
+    password = uuid.uuid4().hex
+    container_id = subprocess.check_output([
+        "docker", "run", "-d", "--rm", "-P",
+        "-e", f"POSTGRES_PASSWORD={password}",
+        "-e", "POSTGRES_DB=sga_inventory",
+        POSTGRES_IMAGE,
+        "-c", "ssl=on",
+        "-c", "ssl_cert_file=/etc/ssl/certs/ssl-cert-snakeoil.pem",
+        "-c", "ssl_key_file=/etc/ssl/private/ssl-cert-snakeoil.key",
+    ], text=True).strip()
+    try:
+        port = subprocess.check_output(
+            ["docker", "port", container_id, "5432/tcp"], text=True
+        ).strip().splitlines()[0].rsplit(":", 1)[1]
+        yield {
+            "host": "127.0.0.1", "port": int(port), "username": "postgres",
+            "password": password, "dbname": "sga_inventory",
+        }
+    finally:
+        subprocess.run(["docker", "stop", container_id], capture_output=True)
+
+
+def _parse_dsn(dsn: str) -> Dict[str, Any]:
+    from urllib.parse import urlparse
+
+    parsed = urlparse(dsn)
+    return {
+        "host": parsed.hostname or "127.0.0.1",
+        "port": parsed.port or 5432,
+        "username": parsed.username or "postgres",
+        "password": parsed.password or "",
+        "dbname": (parsed.path or "/sga_inventory").lstrip("/") or "sga_inventory",
+    }
+
+
+def apply_schema(creds: Dict[str, Any], timeout: float = 60) -> None:
+    """Recreate the sga schema from schema/*.sql (in file order)."""
+    import psycopg
+
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            conn = psycopg.connect(
+                host=creds["host"], port=creds["port"], user=creds["username"],
+                password=creds["password"], dbname=creds["dbname"],
+                sslmode="require", autocommit=True,
+            )
+            break
+        except psycopg.OperationalError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.5)
+
+    with conn:
+        conn.execute("DROP SCHEMA IF EXISTS sga CASCADE")
+        for sql_file in sorted((PROJECT_ROOT / "schema").glob("*.sql")):
+            conn.execute(sql_file.read_text())
+
+
+@contextlib.contextmanager
+def local_environment(args: argparse.Namespace) -> Iterator[Dict[str, Any]]:
+    """moto AWS + Postgres, with the env vars the pipeline modules expect."""
+    from moto import mock_aws
+
+    with contextlib.ExitStack() as stack:
+        if args.postgres_dsn:
+            creds = _parse_dsn(args.postgres_dsn)
+            postgres_label = "dsn"
+        else:
+            creds = stack.enter_context(start_postgres_container())
+            postgres_label = POSTGRES_IMAGE
+        apply_schema(creds)
+
+        os.environ.update({
+            "AWS_ACCESS_KEY_ID": "testing",
+            "AWS_SECRET_ACCESS_KEY": "testing",
+            "AWS_DEFAULT_REGION": REGION,
+            "AWS_REGION": REGION,
+            "DOCUMENTS_BUCKET": BUCKET,
+            "INVENTORY_TABLE": "sga-benchmark-inventory",
+            "HIL_TASKS_TABLE": "sga-benchmark-hil-tasks",
+            "AUDIT_LOG_TABLE": "sga-benchmark-audit-log",
+            "SESSIONS_TABLE": "sga-benchmark-sessions",
+            "USE_POSTGRES_MCP": "false",
+            "DIRECT_CONNECT": "true",
+            "FILE_STRUCTURE_CACHE_ENABLED": "false",
+        })
+        stack.enter_context(mock_aws())
+
+        import boto3
+
+        boto3.client("s3", region_name=REGION).create_bucket(
+            Bucket=BUCKET, CreateBucketConfiguration={"LocationConstraint": REGION},
+        )
+        dynamodb = boto3.client("dynamodb", region_name=REGION)
+        for env_name in ("INVENTORY_TABLE", "HIL_TASKS_TABLE", "AUDIT_LOG_TABLE", "SESSIONS_TABLE"):
+            dynamodb.create_table(
+                TableName=os.environ[env_name],
+                KeySchema=[{"AttributeName": "PK", "KeyType": "HASH"},
+                           {"AttributeName": "SK", "KeyType": "RANGE"}],
+                AttributeDefinitions=[{"AttributeName": "PK", "AttributeType": "S"},
+                                      {"AttributeName": "SK", "AttributeType": "S"}],
+                BillingMode="PAY_PER_REQUEST",
+            )
+        secret = boto3.client("secretsmanager", region_name=REGION).create_secret(
+            Name="sga-benchmark-postgres", SecretString=json.dumps(creds),
+        )
+        os.environ["RDS_SECRET_ARN"] = secret["ARN"]
+
+        yield {"postgres": postgres_label, "aws": "moto"}
+
+
+# =============================================================================
+# Stages
+# =============================================================================
+
+
+def run_case(size: str, fmt: str, path: Path, args: argparse.Namespace) -> Dict[str, Any]:
+    """Run every applicable stage for one fixture file."""
+    import boto3
+
+    from agents.specialists.data_transformer.tools.etl_stream import stream_and_transform
+    from core_tools.library.file_processing import FileInspector
+    from core_tools.postgres_client import SGAPostgresClient
+    from core_tools.schema_column_matcher import SchemaColumnMatcher
+    from core_tools.schema_provider import get_schema_provider
+    from core_tools.sheet_analyzer import analyze_workbook
+
+    s3_key = f"benchmarks/{path.name}"
+    content = path.read_bytes()
+    boto3.client("s3", region_name=REGION).put_object(Bucket=BUCKET, Key=s3_key, Body=content)
+    rows = SIZES[size]
+    repeat = args.repeat if rows <= 100_000 else 1
+    results: Dict[str, Any] = {"rows": rows, "file_size_bytes": len(content)}
+    selected = set(args.stages)
+
+    def repeated(fn: Callable[[], Any], items: int, unit: str = "rows") -> Tuple[Dict[str, Any], Any]:
+        latencies, last = [], None
+        with PeakRSS() as rss:
+            for _ in range(repeat):
+                latency, last = timed(fn)
+                latencies.append(latency)
+        return summarize(latencies, items * repeat, rss.peak, unit), last
+
+    if "inspect" in selected:
+        inspector = FileInspector(bucket=BUCKET)
+        results["inspect"], structure = repeated(
+            lambda: inspector.inspect_s3_file(BUCKET, s3_key), rows
+        )
+        if not structure.success:
+            raise RuntimeError(f"inspect failed: {structure.error}")
+
+    if "analyze" in selected and fmt == "xlsx":
+        results["analyze"], _ = repeated(lambda: analyze_workbook(content, path.name), rows)
+
+    if "match" in selected:
+        matcher = SchemaColumnMatcher(schema_provider=get_schema_provider())
+        results["match"], _ = repeated(
+            lambda: matcher.match_all_columns(FIXTURE_COLUMNS), len(FIXTURE_COLUMNS), unit="columns"
+        )
+
+    batches: List[List[Dict[str, Any]]] = []
+    if "transform" in selected or "insert" in selected:
+        mappings_json = json.dumps(FIXTURE_MAPPINGS)
+        metrics, output = repeated(
+            lambda: stream_and_transform(s3_key, mappings_json, "bench-session", "bench-job"),
+            rows,
+        )
+        output = json.loads(output)
+        if not output.get("success"):
+            raise RuntimeError(f"transform failed: {output.get('error')}")
+        batches = output["batches"]
+        if "transform" in selected:
+            results["transform"] = metrics
+
+    if "insert" in selected:
+        client = SGAPostgresClient()
+        entry_id = client._execute_query(
+            "INSERT INTO sga.pending_entries (source_type, status) "
+            "VALUES ('BULK_IMPORT', 'PROCESSING') RETURNING entry_id"
+        )[0]["entry_id"]
+        client._get_connection().commit()
+
+        latencies, inserted = [], 0
+        with PeakRSS() as rss:
+            line_number = 0
+            for batch in batches:
+                for row in batch:
+                    line_number += 1
+                    row["line_number"] = line_number
+                latency, result = timed(lambda: client.insert_pending_items_batch(batch, str(entry_id)))
+                latencies.append(latency)
+                inserted += result.get("inserted_count", 0)
+        results["insert"] = summarize(latencies, inserted, rss.peak)
+        client._execute_query("DELETE FROM sga.pending_entries WHERE entry_id = %s", (entry_id,), fetch_all=False)
+        client._get_connection().commit()
+
+    return results
+
+
+# =============================================================================
+# Baseline Comparison
+# =============================================================================
+
+
+def compare_to_baseline(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float,
+) -> List[str]:
+    """
+    Regressions beyond tolerance (fraction) versus a baseline report.
+
+    Throughput may drop, and p95/peak RSS may grow, by at most `tolerance`.
+    Cases or stages missing from either report are skipped.
+    """
+    regressions = []
+    for case, stages in current.get("results", {}).items():
+        base_stages = baseline.get("results", {}).get(case, {})
+        for stage, metrics in stages.items():
+            base = base_stages.get(stage)
+            if not isinstance(metrics, dict) or not isinstance(base, dict):
+                continue
+            checks = (
+                ("rows_per_second", -1),
+                ("p95_ms", 1),
+                ("peak_rss_mb", 1),
+            )
+            for metric, direction in checks:
+                new_value, old_value = metrics.get(metric), base.get(metric)
+                if not new_value or not old_value:
+                    continue
+                change = (new_value - old_value) / old_value * direction
+                if change > tolerance:
+                    regressions.append(
+                        f"{case} {stage}.{metric}: {old_value} → {new_value} "
+                        f"({change * 100:+.0f}% worse)"
+                    )
+    return regressions
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT, text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Smart Import pipeline stages locally")
+    parser.add_argument("--sizes", nargs="*", choices=list(SIZES), default=["1k", "10k", "100k"])
+    parser.add_argument("--formats", nargs="*", choices=FORMATS, default=list(FORMATS))
+    parser.add_argument("--stages", nargs="*", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--repeat", type=int, default=5, help="Calls per stage (≤100k rows; 1M runs once)")
+    parser.add_argument("--fixtures-dir", default=str(Path(tempfile.gettempdir()) / "sga_benchmark_fixtures"))
+    parser.add_argument("--postgres-dsn", default=os.environ.get("BENCHMARK_POSTGRES_DSN"),
+                        help="Existing postgres (SSL required); default: start a container")
+    parser.add_argument("--output", default="import_pipeline_benchmark.json", help="JSON report path")
+    parser.add_argument("--baseline", help="Baseline report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed regression (fraction)")
+    parser.add_argument("--check", action="store_true", help="Exit 1 on regressions")
+    args = parser.parse_args()
+
+    fixtures_dir = Path(args.fixtures_dir)
+    report: Dict[str, Any] = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "git_commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "repeat": args.repeat,
+        "results": {},
+    }
+
+    with local_environment(args) as environment:
+        report["environment"] = environment
+        for size in args.sizes:
+            for fmt in args.formats:
+                case = f"{fmt}/{size}"
+                path = ensure_fixture(fixtures_dir, size, fmt)
+                print(f"[bench] {case} ({path.stat().st_size:,} bytes)")
+                results = run_case(size, fmt, path, args)
+                report["results"][case] = results
+                for stage in STAGES:
+                    metrics = results.get(stage)
+                    if metrics:
+                        print(
+                            f"    {stage:<10} {metrics['rows_per_second'] or 0:>12,.0f} {metrics['unit']}/s "
+                            f"p50={metrics['p50_ms']:>9.1f}ms p95={metrics['p95_ms']:>9.1f}ms "
+                            f"rss={metrics['peak_rss_mb']:>7.1f}MB"
+                        )
+
+    regressions: List[str] = []
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare_to_baseline(report, baseline, args.tolerance)
+        report["baseline"] = {"path": args.baseline, "tolerance": args.tolerance, "regressions": regressions}
+
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    print(f"Report written to {args.output}")
+
+    if regressions:
+        print(f"Regressions vs {args.baseline} (tolerance {args.tolerance:.0%}):")
+        for regression in regressions:
+            print(f"  - {regression}")
+        if args.check:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# =============================================================================
+# Startup Profile + Budget Check - All Agent Entry Points
+# =============================================================================
+# Starts every agent main.py in a fresh child process, the same way
+# AgentCore does (import module → create_app() → uvicorn → first /ping), with:
+# - PYTHONPROFILEIMPORTTIME=1 (per-module import cost, CPython -X importtime)
+# - STARTUP_PROFILE=true      (milestones via shared/startup_profiler.py)
+#
+# Writes one machine-readable JSON report and, with --check, exits 1 when any
+# agent misses its startup budget (or fails to start), so cold start
+# regressions are caught before they hit the 30s Firecracker init limit.
+#
+# Usage:
+#   cd server/agentcore-inventory
+#   python scripts/profile_startup.py --output startup_report.json --check
+#   python scripts/profile_startup.py --agents schema_mapper debug --top 10
+#
+# NOTE: Background prewarm (shared/prewarm.py) runs after the listener is up
+# and is disabled in the child by default (--with-prewarm to include it).
+# =============================================================================
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from shared.startup_profiler import parse_importtime  # noqa: E402
+
+# AgentCore Firecracker initialization limit
+FIRECRACKER_INIT_LIMIT_MS = 30_000
+
+# Agent entry points and their time-to-first-/ping budgets (ms).
+# Half the Firecracker limit leaves headroom for slower cold hosts.
+AGENTS: Dict[str, Dict[str, Any]] = {
+    "inventory_hub": {"module": "agents.orchestrators.inventory_hub.main", "budget_ms": 15_000},
+    "schema_mapper": {"module": "agents.specialists.schema_mapper.main", "budget_ms": 15_000},
+    "data_transformer": {"module": "agents.specialists.data_transformer.main", "budget_ms": 15_000},
+    "debug": {"module": "agents.specialists.debug.main", "budget_ms": 15_000},
+    "observation": {"module": "agents.specialists.observation.main", "budget_ms": 15_000},
+    "repair": {"module": "agents.specialists.repair.main", "budget_ms": 15_000},
+}
+
+# Runs inside the child: import → create_app() → uvicorn (ephemeral port) → GET /ping
+_CHILD_BOOTSTRAP = """
+import importlib, sys, threading, time, urllib.error, urllib.request
+module_name, agent_id, report_path = sys.argv[1:4]
+module = importlib.import_module(module_name)
+import uvicorn
+from shared.startup_profiler import profile_create_app
+app = profile_create_app(agent_id, module.create_app, enabled=True, path=report_path)
+server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning"))
+thread = threading.Thread(target=server.run, daemon=True)
+thread.start()
+deadline = time.monotonic() + 60
+while not server.started:
+    if time.monotonic() > deadline or not thread.is_alive():
+        sys.exit(3)
+    time.sleep(0.005)
+port = server.servers[0].sockets[0].getsockname()[1]
+try:
+    urllib.request.urlopen(f"http://127.0.0.1:{port}/ping", timeout=30).read()
+except urllib.error.HTTPError:
+    pass  # 503 while prewarming still counts as the first /ping
+server.should_exit = True
+thread.join(10)
+"""
+
+
+def profile_agent(agent_id: str, spec: Dict[str, Any], args: argparse.Namespace) -> Dict[str, Any]:
+    """Run one agent entry point in a child process and collect its profile."""
+    report_path = Path(tempfile.gettempdir()) / f"startup_profile_{agent_id}_{os.getpid()}.json"
+    env = {
+        **os.environ,
+        "PYTHONPROFILEIMPORTTIME": "1",
+        "STARTUP_PROFILE": "true",
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(PROJECT_ROOT), os.environ.get("PYTHONPATH")])),
+    }
+    if not args.with_prewarm:
+        env["PREWARM_ENABLED"] = "false"
+
+    budget_ms = args.budget_ms or spec["budget_ms"]
+    result: Dict[str, Any] = {"module": spec["module"], "budget_ms": budget_ms}
+
+    started = time.monotonic()
+    try:
+        proc = subprocess.run(
+            [sys.executable, "-c", _CHILD_BOOTSTRAP, spec["module"], agent_id, str(report_path)],
+            cwd=PROJECT_ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=args.timeout,
+        )
+    except subprocess.TimeoutExpired:
+        result.update({"error": f"timeout after {args.timeout}s", "within_budget": False})
+        return result
+
+    result["wall_ms"] = round((time.monotonic() - started) * 1000, 1)
+    result["exit_code"] = proc.returncode
+    result["imports"] = parse_importtime(proc.stderr, top=args.top)
+
+    if report_path.exists():
+        milestones = json.loads(report_path.read_text())
+        report_path.unlink()
+        for key in ("modules_loaded_ms", "create_app_ms", "first_ping_ms"):
+            result[key] = milestones.get(key)
+
+    if proc.returncode != 0 or result.get("first_ping_ms") is None:
+        error_lines = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        result["error"] = "\n".join(error_lines[-15:]) or f"exit code {proc.returncode}"
+        result["within_budget"] = False
+    else:
+        result["within_budget"] = result["first_ping_ms"] <= budget_ms
+    return result
+
+
+def budget_violations(agents: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Human-readable list of agents that failed to start or missed budget."""
+    violations = []
+    for agent_id, result in agents.items():
+        if result.get("error"):
+            lines = result["error"].splitlines() or ["unknown error"]
+            reason = next((line for line in reversed(lines) if "Error" in line), lines[-1])
+            violations.append(f"{agent_id}: failed to start ({reason.strip()})")
+        elif not result.get("within_budget"):
+            violations.append(
+                f"{agent_id}: first /ping at {result['first_ping_ms']:.0f}ms "
+                f"> budget {result['budget_ms']}ms"
+            )
+    return violations
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Profile agent cold start and check startup budgets")
+    parser.add_argument("--agents", nargs="*", choices=sorted(AGENTS), help="Subset of agents (default: all)")
+    parser.add_argument("--output", default="startup_report.json", help="JSON report path")
+    parser.add_argument("--check", action="store_true", help="Exit 1 when any agent misses its budget")
+    parser.add_argument("--budget-ms", type=int, default=None, help="Override every agent's budget")
+    parser.add_argument("--top", type=int, default=25, help="Modules kept per import ranking")
+    parser.add_argument("--timeout", type=int, default=FIRECRACKER_INIT_LIMIT_MS // 1000 * 4,
+                        help="Per-agent child timeout (seconds)")
+    parser.add_argument("--with-prewarm", action="store_true", help="Keep background prewarm enabled")
+    args = parser.parse_args()
+
+    selected = args.agents or list(AGENTS)
+    report: Dict[str, Any] = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": sys.version.split()[0],
+        "firecracker_init_limit_ms": FIRECRACKER_INIT_LIMIT_MS,
+        "agents": {},
+    }
+
+    for agent_id in selected:
+        result = profile_agent(agent_id, AGENTS[agent_id], args)
+        report["agents"][agent_id] = result
+        status = "OK " if result.get("within_budget") else "FAIL"
+        print(
+            f"[{status}] {agent_id:<18} imports={result.get('imports', {}).get('total_ms', 0):>8.0f}ms "
+            f"create_app={result.get('create_app_ms') or 0:>8.0f}ms "
+            f"first_ping={result.get('first_ping_ms') or 0:>8.0f}ms "
+            f"budget={result['budget_ms']}ms"
+        )
+
+    violations = budget_violations(report["agents"])
+    report["violations"] = violations
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    print(f"Report written to {args.output}")
+
+    if violations:
+        for violation in violations:
+            print(f"  - {violation}")
+        if args.check:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
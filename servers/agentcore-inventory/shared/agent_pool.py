@@ -0,0 +1,236 @@
+# =============================================================================
+# Agent Instance Pool
+# =============================================================================
+# Bounded pool of pre-built Strands Agent "shells" for legacy invoke() paths.
+#
+# Building an agent rebuilds tool lists, hook instances (Logging/Metrics/
+# Debug/SecurityAudit/ResultValidation), system prompt and model wrapper on
+# every request. The pool keeps a few shells warm and swaps only the
+# per-request runtime context on checkout.
+#
+# ISOLATION (no state leaks between sessions):
+# - On checkout AND on return: conversation messages, agent.state,
+#   conversation-manager counters, interrupt state and hook state (hooks
+#   exposing a sync reset()) are cleared
+# - Per-request context (user_id, session_id, ...) is injected after reset
+# - A shell whose request raised is discarded, never returned to the pool
+#
+# CONCURRENCY:
+# - Each shell is used by one request at a time (Strands agents reject
+#   concurrent invocations)
+# - When every shell is busy an overflow shell is built (same cost as
+#   before); at most AGENT_POOL_SIZE idle shells are retained
+#
+# Usage:
+#     pool = AgentPool("schema_mapper", factory=_build_agent_shell)
+#     with pool.checkout(session_id=session_id) as agent:
+#         response = agent(payload)
+#
+# VERSION: 2026-01-22T00:00:00Z
+# =============================================================================
+
+import inspect
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+AGENT_POOL_SIZE = int(os.environ.get("AGENT_POOL_SIZE", "4"))
+AGENT_POOL_ENABLED = os.environ.get("AGENT_POOL_ENABLED", "true").lower() == "true"
+
+
+# =============================================================================
+# Agent Shell
+# =============================================================================
+
+
+@dataclass
+class AgentShell:
+    """A pre-built agent plus the hook instances registered on it."""
+    agent: Any
+    hooks: List[Any] = field(default_factory=list)
+    uses: int = 0
+
+
+def reset_agent_shell(shell: AgentShell) -> None:
+    """
+    Clear all per-request state from a shell.
+
+    Args:
+        shell: Shell to reset (modified in place)
+    """
+    agent = shell.agent
+
+    messages = getattr(agent, "messages", None)
+    if isinstance(messages, list):
+        messages.clear()
+
+    state = getattr(agent, "state", None)
+    if state is not None and hasattr(state, "delete"):
+        try:
+            for key in list((state.get() or {}).keys()):
+                state.delete(key)
+        except Exception as e:
+            logger.warning(f"[AgentPool] Could not clear agent state: {e}")
+
+    conversation_manager = getattr(agent, "conversation_manager", None)
+    if conversation_manager is not None and hasattr(conversation_manager, "removed_message_count"):
+        conversation_manager.removed_message_count = 0
+
+    interrupt_state = getattr(agent, "_interrupt_state", None)
+    if interrupt_state is not None and getattr(interrupt_state, "activated", False):
+        interrupt_state.deactivate()
+
+    for hook in shell.hooks:
+        reset = getattr(hook, "reset", None)
+        if callable(reset) and not inspect.iscoroutinefunction(reset):
+            reset()
+
+
+# =============================================================================
+# Pool
+# =============================================================================
+
+
+class AgentPool:
+    """
+    Bounded pool of reusable agent shells.
+
+    Args:
+        name: Pool name (for logs)
+        factory: Builds a new AgentShell
+        inject: Optional callback(agent, **context) applying per-request
+            runtime context (e.g. system prompt with user/session)
+        max_size: Maximum idle shells retained
+    """
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[], AgentShell],
+        inject: Optional[Callable[..., None]] = None,
+        max_size: int = AGENT_POOL_SIZE,
+    ):
+        self.name = name
+        self._factory = factory
+        self._inject = inject
+        self.max_size = max(0, max_size)
+        self._idle: List[AgentShell] = []
+        self._lock = threading.Lock()
+        self._stats = {"created": 0, "reused": 0, "discarded": 0, "overflow": 0}
+
+    def _acquire(self) -> AgentShell:
+        with self._lock:
+            if self._idle:
+                self._stats["reused"] += 1
+                return self._idle.pop()
+            self._stats["created"] += 1
+        return self._factory()
+
+    def _release(self, shell: AgentShell) -> None:
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append(shell)
+                return
+            self._stats["overflow"] += 1
+
+    @contextmanager
+    def checkout(self, **context: Any) -> Iterator[Any]:
+        """
+        Check out an agent with the given runtime context injected.
+
+        Args:
+            **context: Per-request context (user_id, session_id, ...)
+
+        Yields:
+            Strands Agent, exclusive to the caller until the block exits
+        """
+        if not AGENT_POOL_ENABLED or self.max_size == 0:
+            shell = self._factory()
+            self._apply_context(shell, context)
+            yield shell.agent
+            return
+
+        shell = self._acquire()
+        try:
+            reset_agent_shell(shell)
+            self._apply_context(shell, context)
+        except Exception:
+            self._discard(shell)
+            raise
+
+        try:
+            yield shell.agent
+        except BaseException:
+            self._discard(shell)
+            raise
+
+        try:
+            reset_agent_shell(shell)
+        except Exception as e:
+            logger.warning(f"[AgentPool:{self.name}] Reset failed, discarding shell: {e}")
+            self._discard(shell)
+            return
+        shell.uses += 1
+        self._release(shell)
+
+    def _apply_context(self, shell: AgentShell, context: Dict[str, Any]) -> None:
+        state = getattr(shell.agent, "state", None)
+        if state is not None and hasattr(state, "set"):
+            for key, value in context.items():
+                if value is not None:
+                    state.set(key, value)
+        if self._inject is not None:
+            self._inject(shell.agent, **context)
+
+    def _discard(self, shell: AgentShell) -> None:
+        with self._lock:
+            self._stats["discarded"] += 1
+        logger.debug(f"[AgentPool:{self.name}] Discarded shell after {shell.uses} uses")
+
+    def prewarm(self, count: int = 1, warm: Optional[Callable[[AgentShell], None]] = None) -> int:
+        """
+        Build shells ahead of the first request.
+
+        Args:
+            count: Idle shells to have ready (capped at max_size)
+            warm: Optional callback run on each new shell (e.g. model init)
+
+        Returns:
+            Number of idle shells after prewarming
+        """
+        for _ in range(max(0, min(count, self.max_size) - len(self._idle))):
+            shell = self._factory()
+            if warm is not None:
+                warm(shell)
+            with self._lock:
+                self._stats["created"] += 1
+                self._idle.append(shell)
+        return len(self._idle)
+
+    def clear(self) -> None:
+        """Drop all idle shells (e.g. after config/model changes)."""
+        with self._lock:
+            self._idle.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool counters for health checks."""
+        with self._lock:
+            return {**self._stats, "idle": len(self._idle), "max_size": self.max_size}
+
+
+__all__ = [
+    "AGENT_POOL_SIZE",
+    "AgentPool",
+    "AgentShell",
+    "reset_agent_shell",
+]
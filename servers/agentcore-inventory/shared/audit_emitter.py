@@ -22,6 +22,11 @@ from datetime import datetime
 import os
 
 from shared.env_config import get_required_env
+from shared.write_sharding import get_shard_count, sharded_key
+
+# Write shards for PK=LOG#<date> and GSI3PK=TYPE#AGENT_ACTIVITY
+# (readers: SGAAuditLogger.get_events_by_date / get_events_by_type)
+AUDIT_LOG_SHARDS = get_shard_count("AUDIT_LOG_SHARDS")
 
 
 def _convert_floats_to_decimal(obj: Any) -> Any:
@@ -151,14 +156,14 @@ class AgentAuditEmitter:
             event_id = f"{timestamp}#{self.agent_id}"
 
             item = {
-                # Primary Key (date-partitioned for efficient queries)
-                "PK": f"LOG#{date_key}",
+                # Primary Key (date-partitioned, write-sharded under bursts)
+                "PK": sharded_key(f"LOG#{date_key}", event_id, AUDIT_LOG_SHARDS),
                 "SK": event_id,
 
                 # GSI Keys for different query patterns
                 "GSI1PK": f"ACTOR#AGENT#{self.agent_id}",
                 "GSI1SK": event_id,
-                "GSI3PK": "TYPE#AGENT_ACTIVITY",
+                "GSI3PK": sharded_key("TYPE#AGENT_ACTIVITY", event_id, AUDIT_LOG_SHARDS),
                 "GSI3SK": event_id,
 
                 # Event Data
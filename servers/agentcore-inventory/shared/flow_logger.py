@@ -26,6 +26,10 @@ Usage:
         questions_count=2,
         status="NEEDS_INPUT"
     )
+
+Phase start/end also open/close a span in the import's timing ledger
+(shared/timing_ledger.py), so wall/CPU time and external calls are measured
+per phase even when callers pass duration_ms=0.
 """
 
 import structlog
@@ -33,6 +37,8 @@ import time
 from contextlib import contextmanager
 from typing import Optional, Dict, Any
 
+from shared import timing_ledger
+
 logger = structlog.get_logger()
 
 
@@ -55,6 +61,7 @@ class SmartImportLogger:
             session_id: Import session identifier
             **kwargs: Additional PII-safe metrics (counts, flags, etc.)
         """
+        timing_ledger.begin_phase(session_id, phase, name)
         logger.info(
             f"Phase {phase} START: {name}",
             phase=phase,
@@ -84,6 +91,7 @@ class SmartImportLogger:
             duration_ms: Execution time in milliseconds
             **kwargs: Additional PII-safe metrics
         """
+        timing_ledger.end_phase(session_id, phase, name, status)
         logger.info(
             f"Phase {phase} END: {name} {status}",
             phase=phase,
@@ -155,6 +163,7 @@ class SmartImportLogger:
             self.phase_end(phase, name, session_id, "SUCCESS", duration_ms)
         except Exception as e:
             duration_ms = int((time.time() - start) * 1000)
+            timing_ledger.end_phase(session_id, phase, name, "FAILED")
             logger.error(
                 f"Phase {phase} FAILED: {name}",
                 phase=phase,
@@ -3,13 +3,37 @@
 # =============================================================================
 # Implements structured logging for all agent lifecycle events.
 #
+# Low-overhead pipeline (hook callbacks run inline with every tool/model call):
+# - Records go through a bounded QueueHandler; a background QueueListener
+#   does the formatting and handler I/O (stdout -> CloudWatch)
+# - JSON is serialized lazily on the listener thread, only for records that
+#   are actually emitted
+# - Per-event-type policies sample events, sample payloads and truncate them
+# - Per-tool rate limits (token bucket) cap hot tool loops; suppressed counts
+#   are reported on the next emitted event for that tool
+# - Errors and invocation start/end are never sampled or rate limited
+#
+# Environment:
+#   LOGGING_HOOK_ASYNC               - "false" logs synchronously (default: true)
+#   LOGGING_HOOK_QUEUE_SIZE          - Max queued records, extra are dropped (default: 10000)
+#   LOGGING_HOOK_MAX_PAYLOAD_CHARS   - Default payload truncation (default: 2048)
+#   LOGGING_HOOK_TOOL_RATE_PER_SEC   - Default per-tool event rate, 0 = unlimited (default: 20)
+#
 # Reference: https://strandsagents.com/latest/documentation/docs/user-guide/concepts/agents/hooks/
 # =============================================================================
 
-import logging
+import atexit
 import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
 
 from strands.hooks import HookProvider, HookRegistry
 from strands.hooks.events import (
@@ -23,6 +47,184 @@ from strands.hooks.events import (
 
 logger = logging.getLogger(__name__)
 
+# Listener side: propagates to the root handlers configured by the agent.
+# Deliberately NOT a child of `logger`, which forwards into the queue.
+_sink_logger = logging.getLogger("shared.hooks.lifecycle")
+
+LOGGING_HOOK_ASYNC = os.environ.get("LOGGING_HOOK_ASYNC", "true").lower() == "true"
+LOGGING_HOOK_QUEUE_SIZE = int(os.environ.get("LOGGING_HOOK_QUEUE_SIZE", "10000"))
+LOGGING_HOOK_MAX_PAYLOAD_CHARS = int(os.environ.get("LOGGING_HOOK_MAX_PAYLOAD_CHARS", "2048"))
+LOGGING_HOOK_TOOL_RATE_PER_SEC = float(os.environ.get("LOGGING_HOOK_TOOL_RATE_PER_SEC", "20"))
+
+# Payload fields dropped by payload sampling; errors are truncated but always kept
+PAYLOAD_FIELDS = ("tool_input",)
+TRUNCATED_FIELDS = PAYLOAD_FIELDS + ("error",)
+
+
+# =============================================================================
+# Policies
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class LogEventPolicy:
+    """
+    Logging policy for one event type.
+
+    Attributes:
+        sample_rate: Fraction of events emitted (1.0 = all).
+        payload_sample_rate: Fraction of emitted events that keep payloads.
+        max_payload_chars: Serialized payload fields are truncated to this size.
+        rate_limited: Whether per-tool rate limits apply to this event type.
+    """
+
+    sample_rate: float = 1.0
+    payload_sample_rate: float = 1.0
+    max_payload_chars: int = LOGGING_HOOK_MAX_PAYLOAD_CHARS
+    rate_limited: bool = False
+
+
+DEFAULT_EVENT_POLICIES: Dict[str, LogEventPolicy] = {
+    "AGENT_INVOCATION_START": LogEventPolicy(),
+    "AGENT_INVOCATION_END": LogEventPolicy(),
+    "TOOL_CALL_START": LogEventPolicy(rate_limited=True),
+    "TOOL_CALL_END": LogEventPolicy(rate_limited=True),
+    "MODEL_CALL_START": LogEventPolicy(),
+    "MODEL_CALL_END": LogEventPolicy(),
+}
+
+
+class _ToolRateLimiter:
+    """Token bucket per tool name (events per second, burst = 1 second)."""
+
+    def __init__(self, default_rate: float, overrides: Optional[Dict[str, float]] = None):
+        self.default_rate = default_rate
+        self.overrides = dict(overrides or {})
+        self._buckets: Dict[str, list] = {}  # tool -> [tokens, last_refill]
+        self._suppressed: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, tool_name: str) -> bool:
+        rate = self.overrides.get(tool_name, self.default_rate)
+        if rate <= 0:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.setdefault(tool_name, [rate, now])
+            bucket[0] = min(rate, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            if bucket[0] >= 1.0:
+                bucket[0] -= 1.0
+                return True
+            self._suppressed[tool_name] = self._suppressed.get(tool_name, 0) + 1
+            return False
+
+    def take_suppressed(self, tool_name: str) -> int:
+        with self._lock:
+            return self._suppressed.pop(tool_name, 0)
+
+
+# =============================================================================
+# Queue Pipeline
+# =============================================================================
+
+
+class _LazyJSON:
+    """Log message that serializes (and truncates payloads) only when formatted."""
+
+    __slots__ = ("entry", "max_payload_chars")
+
+    def __init__(self, entry: Dict[str, Any], max_payload_chars: int):
+        self.entry = entry
+        self.max_payload_chars = max_payload_chars
+
+    def __str__(self) -> str:
+        entry = dict(self.entry)
+        for field_name in TRUNCATED_FIELDS:
+            if field_name in entry:
+                entry[field_name] = _truncate(entry[field_name], self.max_payload_chars)
+        return json.dumps(entry, default=str)
+
+
+def _truncate(value: Any, max_chars: int) -> Any:
+    """Serialize a payload field and cut it to max_chars (keeps small values as-is)."""
+    text = value if isinstance(value, str) else json.dumps(value, default=str)
+    if len(text) <= max_chars:
+        return value
+    return f"{text[:max_chars]}...<truncated {len(text) - max_chars} chars>"
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler that never blocks or formats on the calling thread.
+
+    prepare() keeps the record untouched so _LazyJSON is formatted by the
+    listener; a full queue drops the record instead of blocking the agent.
+    """
+
+    dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _DroppingQueueHandler.dropped += 1
+
+
+class _SinkHandler(logging.Handler):
+    """Listener-side handler: hands records to the normal logging handlers."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        _sink_logger.handle(record)
+
+
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+def _ensure_pipeline() -> None:
+    """Attach the QueueHandler and start the background listener (once)."""
+    global _listener
+    if _listener is not None:
+        return
+    with _listener_lock:
+        if _listener is not None:
+            return
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(LOGGING_HOOK_QUEUE_SIZE)
+        logger.addHandler(_DroppingQueueHandler(log_queue))
+        logger.propagate = False
+        _listener = QueueListener(log_queue, _SinkHandler())
+        _listener.start()
+
+
+def shutdown_logging_pipeline() -> None:
+    """Flush queued records and stop the listener (also runs at exit)."""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        if _DroppingQueueHandler.dropped:
+            _sink_logger.warning(
+                f"[LoggingHook] Dropped {_DroppingQueueHandler.dropped} records (queue full)"
+            )
+        for handler in list(logger.handlers):
+            if isinstance(handler, _DroppingQueueHandler):
+                logger.removeHandler(handler)
+        logger.propagate = True
+        _listener = None
+
+
+atexit.register(shutdown_logging_pipeline)
+
+
+# =============================================================================
+# Hook
+# =============================================================================
+
 
 class LoggingHook(HookProvider):
     """
@@ -35,18 +237,40 @@ class LoggingHook(HookProvider):
 
     Usage:
         agent = Agent(hooks=[LoggingHook()])
+
+        # Verbose, but cheap in hot tool loops
+        LoggingHook(
+            log_level=logging.DEBUG,
+            include_payloads=True,
+            tool_rate_limits={"insert_pending_items_batch": 2},
+        )
     """
 
-    def __init__(self, log_level: int = logging.INFO, include_payloads: bool = False):
+    def __init__(
+        self,
+        log_level: int = logging.INFO,
+        include_payloads: bool = False,
+        event_policies: Optional[Dict[str, LogEventPolicy]] = None,
+        tool_rate_limits: Optional[Dict[str, float]] = None,
+        default_tool_rate: float = LOGGING_HOOK_TOOL_RATE_PER_SEC,
+        use_queue: bool = LOGGING_HOOK_ASYNC,
+    ):
         """
         Initialize LoggingHook.
 
         Args:
             log_level: Logging level (default: INFO)
             include_payloads: Whether to log full payloads (default: False for security)
+            event_policies: Per-event-type overrides of DEFAULT_EVENT_POLICIES
+            tool_rate_limits: Per-tool max events/second (0 = unlimited)
+            default_tool_rate: Events/second for tools not in tool_rate_limits
+            use_queue: Log through the background QueueListener (default: True)
         """
         self.log_level = log_level
         self.include_payloads = include_payloads
+        self.event_policies = {**DEFAULT_EVENT_POLICIES, **(event_policies or {})}
+        self.use_queue = use_queue
+        self._rate_limiter = _ToolRateLimiter(default_tool_rate, tool_rate_limits)
 
     def register_hooks(self, registry: HookRegistry) -> None:
         """Register callbacks for all lifecycle events."""
@@ -57,17 +281,44 @@ class LoggingHook(HookProvider):
         registry.add_callback(BeforeModelCallEvent, self._on_model_start)
         registry.add_callback(AfterModelCallEvent, self._on_model_end)
 
+    def _should_log(self, event_type: str, tool_name: Optional[str] = None, is_error: bool = False) -> bool:
+        """Level, sampling and rate-limit checks - run before any payload work."""
+        if not logger.isEnabledFor(self.log_level):
+            return False
+        if is_error:
+            return True
+        policy = self.event_policies.get(event_type, LogEventPolicy())
+        if policy.sample_rate < 1.0 and random.random() >= policy.sample_rate:
+            return False
+        if policy.rate_limited and tool_name is not None:
+            return self._rate_limiter.allow(tool_name)
+        return True
+
     def _log(self, event_type: str, data: Dict[str, Any]) -> None:
-        """Emit structured log entry."""
+        """Emit structured log entry (serialized lazily by the listener)."""
+        policy = self.event_policies.get(event_type, LogEventPolicy())
+        if policy.payload_sample_rate < 1.0 and random.random() >= policy.payload_sample_rate:
+            data = {k: v for k, v in data.items() if k not in PAYLOAD_FIELDS}
+
+        tool_name = data.get("tool_name")
+        if tool_name is not None:
+            suppressed = self._rate_limiter.take_suppressed(tool_name)
+            if suppressed:
+                data["suppressed_events"] = suppressed
+
         log_entry = {
             "timestamp": datetime.utcnow().isoformat(),
             "event_type": event_type,
             **data,
         }
-        logger.log(self.log_level, json.dumps(log_entry))
+        if self.use_queue:
+            _ensure_pipeline()
+        logger.log(self.log_level, _LazyJSON(log_entry, policy.max_payload_chars))
 
     def _on_invocation_start(self, event: BeforeInvocationEvent) -> None:
         """Log agent invocation start."""
+        if not self._should_log("AGENT_INVOCATION_START"):
+            return
         self._log("AGENT_INVOCATION_START", {
             "agent_name": getattr(event.agent, "name", "unknown"),
             "message_count": len(getattr(event.agent, "messages", [])),
@@ -75,6 +326,8 @@ class LoggingHook(HookProvider):
 
     def _on_invocation_end(self, event: AfterInvocationEvent) -> None:
         """Log agent invocation end."""
+        if not self._should_log("AGENT_INVOCATION_END"):
+            return
         self._log("AGENT_INVOCATION_END", {
             "agent_name": getattr(event.agent, "name", "unknown"),
             "stop_reason": getattr(event, "stop_reason", "unknown"),
@@ -82,8 +335,11 @@ class LoggingHook(HookProvider):
 
     def _on_tool_start(self, event: BeforeToolCallEvent) -> None:
         """Log tool call start."""
+        tool_name = getattr(event, "tool_name", "unknown")
+        if not self._should_log("TOOL_CALL_START", tool_name):
+            return
         data = {
-            "tool_name": getattr(event, "tool_name", "unknown"),
+            "tool_name": tool_name,
         }
         if self.include_payloads:
             data["tool_input"] = getattr(event, "tool_input", {})
@@ -91,22 +347,30 @@ class LoggingHook(HookProvider):
 
     def _on_tool_end(self, event: AfterToolCallEvent) -> None:
         """Log tool call end."""
+        tool_name = getattr(event, "tool_name", "unknown")
+        error = getattr(event, "error", None)
+        if not self._should_log("TOOL_CALL_END", tool_name, is_error=bool(error)):
+            return
         data = {
-            "tool_name": getattr(event, "tool_name", "unknown"),
-            "success": not getattr(event, "error", None),
+            "tool_name": tool_name,
+            "success": not error,
         }
-        if getattr(event, "error", None):
-            data["error"] = str(event.error)
+        if error:
+            data["error"] = str(error)
         self._log("TOOL_CALL_END", data)
 
     def _on_model_start(self, event: BeforeModelCallEvent) -> None:
         """Log model call start."""
+        if not self._should_log("MODEL_CALL_START"):
+            return
         self._log("MODEL_CALL_START", {
             "message_count": len(getattr(event, "messages", [])),
         })
 
     def _on_model_end(self, event: AfterModelCallEvent) -> None:
         """Log model call end."""
+        if not self._should_log("MODEL_CALL_END"):
+            return
         self._log("MODEL_CALL_END", {
             "stop_reason": getattr(event, "stop_reason", "unknown"),
             "usage": getattr(event, "usage", {}),
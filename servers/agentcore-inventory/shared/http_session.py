@@ -0,0 +1,89 @@
+# =============================================================================
+# HTTP Session - Pooled keep-alive transport for Gateway/MCP clients
+# =============================================================================
+# Module-level requests.post() opens a new TCP+TLS connection per call, so
+# per-row loops (batch inserts, enrichment) pay a handshake every time. A
+# shared requests.Session keeps connections alive in a sized pool and retries
+# throttled/unavailable responses with exponential backoff.
+#
+# Usage:
+#   from shared.http_session import create_http_session
+#   self._http = create_http_session()
+#   response = self._http.post(url, data=body, headers=headers, timeout=30)
+#
+# Retries cover connection errors plus 429/503 (honoring Retry-After), which
+# the Gateway returns before a tool runs. Other 5xx responses are NOT retried:
+# tools/call is a POST and the tool (e.g. sga_create_movement) may already
+# have executed. Exhausted retries return the last response, so callers'
+# raise_for_status() behaves as before.
+# =============================================================================
+
+import logging
+import os
+from typing import Optional, Sequence
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+HTTP_POOL_MAXSIZE = int(os.environ.get("HTTP_POOL_MAXSIZE", "10"))
+HTTP_MAX_RETRIES = int(os.environ.get("HTTP_MAX_RETRIES", "3"))
+HTTP_BACKOFF_SECONDS = float(os.environ.get("HTTP_BACKOFF_SECONDS", "0.5"))
+RETRY_STATUS_CODES = (429, 503)
+
+
+def create_http_session(
+    pool_maxsize: Optional[int] = None,
+    max_retries: Optional[int] = None,
+    backoff_factor: Optional[float] = None,
+    status_forcelist: Sequence[int] = RETRY_STATUS_CODES,
+) -> requests.Session:
+    """
+    Create a requests.Session with a sized keep-alive pool and retries.
+
+    Args:
+        pool_maxsize: Connections kept per host (default HTTP_POOL_MAXSIZE);
+            size it to the number of threads sharing the client
+        max_retries: Retries for connection errors and retryable statuses
+            (default HTTP_MAX_RETRIES)
+        backoff_factor: Exponential backoff base in seconds
+            (default HTTP_BACKOFF_SECONDS)
+        status_forcelist: Response codes that are retried
+
+    Returns:
+        Session with the pooled adapter mounted for http:// and https://
+    """
+    pool_maxsize = pool_maxsize or HTTP_POOL_MAXSIZE
+    max_retries = HTTP_MAX_RETRIES if max_retries is None else max_retries
+
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=0,
+        status=max_retries,
+        status_forcelist=tuple(status_forcelist),
+        allowed_methods=None,  # POST included: only pre-execution statuses are listed
+        backoff_factor=HTTP_BACKOFF_SECONDS if backoff_factor is None else backoff_factor,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    logger.debug(
+        f"[HTTPSession] Created session (pool_maxsize={pool_maxsize}, retries={max_retries})"
+    )
+    return session
+
+
+__all__ = [
+    "HTTP_BACKOFF_SECONDS",
+    "HTTP_MAX_RETRIES",
+    "HTTP_POOL_MAXSIZE",
+    "RETRY_STATUS_CODES",
+    "create_http_session",
+]
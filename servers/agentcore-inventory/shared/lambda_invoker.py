@@ -1,8 +1,8 @@
 # =============================================================================
 # Lambda Invoker - Direct Lambda Invocation with OTEL Tracing
 # =============================================================================
-# Provides synchronous Lambda invocation for deterministic operations
-# that have been extracted from agents (BRAIN/HANDS pattern).
+# Provides Lambda invocation for deterministic operations that have been
+# extracted from agents (BRAIN/HANDS pattern).
 #
 # Architecture:
 #   Orchestrator → LambdaInvoker → Lambda (intake-tools, file-analyzer)
@@ -11,6 +11,32 @@
 #   Emits audit events for observability
 #   Raises CognitiveError for DebugAgent enrichment
 #
+# Modes:
+#   - Sync  (InvocationType=RequestResponse): blocks until the Lambda returns
+#   - Async (InvocationType=Event): returns a LambdaInvocation future at once;
+#     the Lambda writes its response to S3 under a correlation id
+#     (event["async_result"] = {"correlation_id", "bucket", "key"}) and the
+#     caller polls it (result() / await wait()), so several file analyses can
+#     be in flight at once
+#
+# Payload offload:
+#   Events approaching the invoke limits (6 MB sync, 256 KB async) are put in
+#   S3 and replaced by {"payload_ref": {"bucket", "key"}, "action", ...}.
+#   Responses too large to return inline may likewise come back as
+#   {"result_ref": {"bucket", "key"}} and are resolved transparently.
+#
+# OPT-IN (LAMBDA_S3_EXCHANGE_ENABLED=true):
+#   Async mode and payload offload need Lambda handlers that understand
+#   async_result/payload_ref; the deployed intake-tools and file-analyzer do
+#   not yet. Until they do, sync events are sent inline exactly as before and
+#   invoke_async() raises CONFIG_ERROR.
+#
+# Cleanup:
+#   Exchange objects are deleted once read (results, result_refs) or once
+#   the invocation completes (offloaded payloads). Abandoned objects (timed
+#   out invocations, crashed callers) are removed by an S3 lifecycle rule on
+#   the lambda-exchange/ prefix (expire after 1 day).
+#
 # Usage:
 #   from shared.lambda_invoker import LambdaInvoker
 #
@@ -22,6 +48,13 @@
 #       session_id="session-456",
 #   )
 #
+#   invocation = invoker.invoke_file_analyzer_async(
+#       action="analyze_file_structure",
+#       payload={"s3_key": "uploads/.../inventory.csv"},
+#       session_id="session-456",
+#   )
+#   result = await invocation.wait()   # or invocation.result(timeout=60)
+#
 # Related:
 #   - ADR-010: Lambda Migration for Deterministic Operations
 #   - server/lambdas/intake-tools/ - Intake operations Lambda
@@ -31,10 +64,14 @@
 # Date: January 2026
 # =============================================================================
 
+import asyncio
 import json
 import logging
 import os
-from typing import Any
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
 
 from shared.cognitive_error_handler import CognitiveError
 from shared.audit_emitter import AgentAuditEmitter, AgentStatus
@@ -53,8 +90,26 @@ FILE_ANALYZER_FUNCTION = os.environ.get(
 )
 AWS_REGION = os.environ.get("AWS_REGION_NAME", "us-east-2")
 
+# Async results + payload offload (S3)
+LAMBDA_EXCHANGE_BUCKET = os.environ.get(
+    "LAMBDA_EXCHANGE_BUCKET", os.environ.get("DOCUMENTS_BUCKET", "")
+)
+LAMBDA_RESULT_PREFIX = "lambda-exchange/results"
+LAMBDA_PAYLOAD_PREFIX = "lambda-exchange/payloads"
+SYNC_PAYLOAD_LIMIT_BYTES = 6 * 1024 * 1024
+ASYNC_PAYLOAD_LIMIT_BYTES = 256 * 1024
+# Offload before the hard limit (headers, envelope and encoding overhead)
+PAYLOAD_OFFLOAD_RATIO = float(os.environ.get("LAMBDA_PAYLOAD_OFFLOAD_RATIO", "0.9"))
+ASYNC_POLL_INTERVAL_SECONDS = float(os.environ.get("LAMBDA_ASYNC_POLL_INTERVAL", "0.5"))
+ASYNC_TIMEOUT_SECONDS = float(os.environ.get("LAMBDA_ASYNC_TIMEOUT", "300"))
+LAMBDA_S3_EXCHANGE_ENABLED = (
+    os.environ.get("LAMBDA_S3_EXCHANGE_ENABLED", "false").lower() == "true"
+)
+
 # Lazy imports for cold start optimization
 _lambda_client = None
+_s3_client = None
+_audit_executor = None
 
 
 def _get_lambda_client():
@@ -67,12 +122,190 @@ def _get_lambda_client():
     return _lambda_client
 
 
+def _get_s3_client():
+    """Get S3 client (payload offload, async results) with lazy initialization."""
+    global _s3_client
+    if _s3_client is None:
+        import boto3
+        _s3_client = boto3.client("s3", region_name=AWS_REGION)
+    return _s3_client
+
+
+def _emit_in_background(emit: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+    """Run an audit emit off the calling thread (async mode must not block)."""
+    global _audit_executor
+    if _audit_executor is None:
+        _audit_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lambda-audit")
+    _audit_executor.submit(emit, *args, **kwargs)
+
+
+def _is_missing_key(error: Exception) -> bool:
+    code = getattr(error, "response", {}).get("Error", {}).get("Code", "")
+    return code in ("NoSuchKey", "404", "NotFound") or "NoSuchKey" in str(error)
+
+
+def _delete_exchange_object(bucket: str, key: str | None) -> None:
+    """Best-effort delete of a consumed exchange object (lifecycle rule is the backstop)."""
+    if not key:
+        return
+    try:
+        _get_s3_client().delete_object(Bucket=bucket, Key=key)
+    except Exception as e:
+        logger.warning("[LambdaInvoker] Could not delete s3://%s/%s: %s", bucket, key, e)
+
+
+# =============================================================================
+# Async Invocation Future
+# =============================================================================
+
+
+class LambdaInvocation:
+    """
+    Handle for an InvocationType=Event Lambda call.
+
+    The Lambda writes its response JSON to s3://{bucket}/{key}; poll() reads
+    it once available. Application errors in the stored response raise the
+    same CognitiveError as synchronous invocations.
+
+    Example:
+        invocation = invoker.invoke_file_analyzer_async("analyze_file_structure", payload)
+        envelope = await invocation.wait(timeout=120)
+    """
+
+    def __init__(
+        self,
+        invoker: "LambdaInvoker",
+        correlation_id: str,
+        function_name: str,
+        operation_name: str,
+        bucket: str,
+        key: str,
+        session_id: str | None = None,
+        transform: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
+        payload_key: str | None = None,
+    ):
+        self.invoker = invoker
+        self.correlation_id = correlation_id
+        self.function_name = function_name
+        self.operation_name = operation_name
+        self.bucket = bucket
+        self.key = key
+        self.session_id = session_id
+        self.transform = transform
+        self.payload_key = payload_key
+        self.submitted_at = time.monotonic()
+        self._result: dict[str, Any] | None = None
+        self._error: CognitiveError | None = None
+
+    def done(self) -> bool:
+        """True once the result (or an error) has been collected."""
+        return self._result is not None or self._error is not None
+
+    def poll(self) -> dict[str, Any] | None:
+        """
+        Check S3 for the result once (non-blocking).
+
+        Returns:
+            Result (transformed when a transform was given), or None if the
+            Lambda has not finished yet
+
+        Raises:
+            CognitiveError: If the Lambda reported an error
+        """
+        if self._error is not None:
+            raise self._error
+        if self._result is not None:
+            return self._result
+
+        try:
+            response = _get_s3_client().get_object(Bucket=self.bucket, Key=self.key)
+            body = response["Body"].read()
+        except Exception as e:
+            if _is_missing_key(e):
+                return None
+            raise
+
+        # Read once: the result and the offloaded event are no longer needed
+        _delete_exchange_object(self.bucket, self.key)
+        _delete_exchange_object(self.bucket, self.payload_key)
+
+        try:
+            raw = json.loads(body.decode("utf-8"))
+        except json.JSONDecodeError as e:
+            self._error = CognitiveError(
+                technical_message=f"Failed to parse async Lambda result: {e}",
+                human_explanation="Resposta inesperada do servidor.",
+                suggested_fix="Contate o suporte tecnico.",
+                error_type="PARSE_ERROR",
+                recoverable=False,
+                original_exception=e,
+            )
+            raise self._error from e
+
+        try:
+            result = self.invoker._collect_result(
+                raw, self.function_name, self.operation_name, self.session_id,
+            )
+            self._result = self.transform(result) if self.transform else result
+        except CognitiveError as e:
+            self._error = e
+            raise
+        return self._result
+
+    def result(
+        self,
+        timeout: float = ASYNC_TIMEOUT_SECONDS,
+        poll_interval: float = ASYNC_POLL_INTERVAL_SECONDS,
+    ) -> dict[str, Any]:
+        """Block (polling) until the result is available."""
+        deadline = time.monotonic() + timeout
+        while True:
+            result = self.poll()
+            if result is not None:
+                return result
+            if time.monotonic() >= deadline:
+                raise self._timeout_error(timeout)
+            time.sleep(poll_interval)
+
+    async def wait(
+        self,
+        timeout: float = ASYNC_TIMEOUT_SECONDS,
+        poll_interval: float = ASYNC_POLL_INTERVAL_SECONDS,
+    ) -> dict[str, Any]:
+        """Await the result without blocking the event loop."""
+        deadline = time.monotonic() + timeout
+        while True:
+            result = await asyncio.to_thread(self.poll)
+            if result is not None:
+                return result
+            if time.monotonic() >= deadline:
+                raise self._timeout_error(timeout)
+            await asyncio.sleep(poll_interval)
+
+    def _timeout_error(self, timeout: float) -> CognitiveError:
+        return CognitiveError(
+            technical_message=(
+                f"Async Lambda {self.function_name} ({self.operation_name}) produced no "
+                f"result in {timeout:.0f}s (correlation_id={self.correlation_id})"
+            ),
+            human_explanation="A operacao esta demorando mais que o esperado.",
+            suggested_fix=self.invoker._suggest_fix("LAMBDA_ASYNC_TIMEOUT"),
+            error_type="LAMBDA_ASYNC_TIMEOUT",
+            recoverable=True,
+            context={
+                "function": self.function_name,
+                "operation": self.operation_name,
+                "correlation_id": self.correlation_id,
+            },
+        )
+
+
 class LambdaInvoker:
     """
     Lambda invoker with OTEL tracing and audit logging.
 
-    Provides synchronous Lambda invocation for operations extracted from
-    agents following the BRAIN/HANDS pattern. The Orchestrator (BRAIN)
+    Provides synchronous and async (Event + S3 result) Lambda invocation for
+    operations extracted from agents following the BRAIN/HANDS pattern. The Orchestrator (BRAIN)
     coordinates which Lambda (HANDS) to call; the Lambda executes
     deterministic operations.
 
@@ -81,6 +314,8 @@ class LambdaInvoker:
         - Audit logging for observability
         - Response transformation to Orchestrator envelope
         - CognitiveError for DebugAgent enrichment
+        - Async mode with LambdaInvocation futures (invoke_async)
+        - Automatic S3 offload of large events/results
 
     Example:
         invoker = LambdaInvoker()
@@ -206,6 +441,49 @@ class LambdaInvoker:
             session_id=session_id,
         )
 
+        return self._file_analyzer_envelope(result)
+
+    def invoke_file_analyzer_async(
+        self,
+        action: str,
+        payload: dict[str, Any],
+        session_id: str | None = None,
+    ) -> LambdaInvocation:
+        """
+        Start a file-analyzer invocation without blocking (InvocationType=Event).
+
+        Lets the orchestrator keep several file analyses in flight:
+
+            invocations = [invoker.invoke_file_analyzer_async(...) for key in keys]
+            envelopes = await asyncio.gather(*(i.wait() for i in invocations))
+
+        Args:
+            action: Operation to perform
+            payload: Action-specific parameters (s3_key, etc.)
+            session_id: Optional session identifier for audit
+
+        Returns:
+            LambdaInvocation resolving to the same envelope as
+            invoke_file_analyzer()
+
+        Raises:
+            CognitiveError: If the invocation could not be submitted
+        """
+        event = {**payload}
+        if action:
+            event["action"] = action
+
+        return self.invoke_async(
+            function_name=FILE_ANALYZER_FUNCTION,
+            event=event,
+            operation_name=f"file_analyzer.{action}",
+            session_id=session_id,
+            transform=self._file_analyzer_envelope,
+        )
+
+    @staticmethod
+    def _file_analyzer_envelope(result: dict[str, Any]) -> dict[str, Any]:
+        """Transform a file-analyzer response to the Orchestrator envelope."""
         # File analyzer returns MCP format, extract content
         if "content" in result:
             # MCP format: {"content": [{"type": "text", "text": "..."}], "isError": ...}
@@ -265,13 +543,15 @@ class LambdaInvoker:
                 "session_id": session_id or "unknown",
             },
         ) as subsegment:
+            payload_key = None
             try:
                 # Invoke Lambda synchronously
                 client = _get_lambda_client()
+                payload, payload_key = self._encode_event(event, SYNC_PAYLOAD_LIMIT_BYTES)
                 response = client.invoke(
                     FunctionName=function_name,
                     InvocationType="RequestResponse",  # Synchronous
-                    Payload=json.dumps(event).encode("utf-8"),
+                    Payload=payload,
                 )
 
                 # Check for Lambda execution errors
@@ -282,18 +562,7 @@ class LambdaInvoker:
                         function_name, error_payload,
                     )
                     subsegment.put_annotation("success", False)
-                    raise CognitiveError(
-                        technical_message=f"Lambda function error: {error_payload}",
-                        human_explanation="Ocorreu um erro ao processar a operacao no servidor.",
-                        suggested_fix="Verifique os parametros e tente novamente.",
-                        error_type="LAMBDA_FUNCTION_ERROR",
-                        recoverable=True,
-                        context={
-                            "function": function_name,
-                            "operation": operation_name,
-                            "error_payload": error_payload[:500],
-                        },
-                    )
+                    raise self._function_error(function_name, operation_name, error_payload)
 
                 # Parse response
                 payload_bytes = response["Payload"].read()
@@ -304,48 +573,10 @@ class LambdaInvoker:
                     function_name, result.get("success"),
                 )
 
-                # Check for application-level errors
-                if not result.get("success", True):
-                    error = result.get("error", "Unknown error")
-                    error_type = result.get("error_type", "LAMBDA_ERROR")
-
-                    logger.warning(
-                        "[LambdaInvoker] Application error: %s - %s",
-                        error_type, error,
-                    )
-                    subsegment.put_annotation("success", False)
-                    subsegment.put_annotation("error_type", error_type)
-
-                    # For FILE_NOT_FOUND, this is expected behavior, not an error
-                    if error_type == "FILE_NOT_FOUND":
-                        # Return the result as-is, let caller handle
-                        subsegment.put_annotation("success", True)
-                        return result
-
-                    raise CognitiveError(
-                        technical_message=f"Lambda operation failed: {error}",
-                        human_explanation=self._translate_error(error),
-                        suggested_fix=self._suggest_fix(error_type),
-                        error_type=error_type,
-                        recoverable=error_type in ("VALIDATION_ERROR", "FILE_NOT_FOUND"),
-                        context={
-                            "function": function_name,
-                            "operation": operation_name,
-                            "original_error": error,
-                        },
-                    )
-
-                # Success - record in trace
-                subsegment.put_annotation("success", True)
-
-                # Emit completion audit event
-                self.audit.completed(
-                    f"Operacao concluida: {operation_name}",
-                    session_id=session_id,
+                return self._collect_result(
+                    result, function_name, operation_name, session_id, subsegment,
                 )
 
-                return result
-
             except CognitiveError:
                 # Re-raise cognitive errors (already formatted)
                 raise
@@ -360,7 +591,7 @@ class LambdaInvoker:
                     error_type="PARSE_ERROR",
                     recoverable=False,
                     original_exception=e,
-                )
+                ) from e
 
             except Exception as e:
                 logger.exception("[LambdaInvoker] Invocation failed: %s", e)
@@ -374,18 +605,269 @@ class LambdaInvoker:
                     error=str(e),
                 )
 
-                raise CognitiveError(
-                    technical_message=f"Lambda invocation failed: {e}",
-                    human_explanation="Nao foi possivel executar a operacao.",
-                    suggested_fix="Verifique sua conexao e tente novamente.",
-                    error_type="INVOCATION_ERROR",
-                    recoverable=True,
-                    original_exception=e,
-                    context={
-                        "function": function_name,
-                        "operation": operation_name,
-                    },
+                raise self._invocation_error(e, function_name, operation_name) from e
+
+            finally:
+                # The Lambda has returned: its offloaded event is consumed
+                if payload_key:
+                    _delete_exchange_object(LAMBDA_EXCHANGE_BUCKET, payload_key)
+
+    def invoke_async(
+        self,
+        function_name: str,
+        event: dict[str, Any],
+        operation_name: str,
+        session_id: str | None = None,
+        transform: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
+    ) -> LambdaInvocation:
+        """
+        Invoke a Lambda with InvocationType=Event and return a future.
+
+        The event carries async_result = {"correlation_id", "bucket", "key"};
+        the Lambda writes its usual response JSON to that S3 location.
+
+        Args:
+            function_name: Lambda function name or ARN
+            event: Event payload to send to Lambda
+            operation_name: Operation name for tracing/logging
+            session_id: Optional session ID for audit
+            transform: Optional envelope transform applied to the result
+
+        Returns:
+            LambdaInvocation to poll or await
+
+        Raises:
+            CognitiveError: If the invocation could not be submitted
+        """
+        if not LAMBDA_S3_EXCHANGE_ENABLED or not LAMBDA_EXCHANGE_BUCKET:
+            raise CognitiveError(
+                technical_message=(
+                    "Async Lambda invocation requires LAMBDA_S3_EXCHANGE_ENABLED=true and "
+                    "LAMBDA_EXCHANGE_BUCKET or DOCUMENTS_BUCKET"
+                ),
+                human_explanation="Erro de configuracao do sistema.",
+                suggested_fix=self._suggest_fix("CONFIG_ERROR"),
+                error_type="CONFIG_ERROR",
+                recoverable=False,
+                context={"function": function_name, "operation": operation_name},
+            )
+
+        correlation_id = uuid.uuid4().hex
+        result_key = f"{LAMBDA_RESULT_PREFIX}/{correlation_id}.json"
+        event = {
+            **event,
+            "async_result": {
+                "correlation_id": correlation_id,
+                "bucket": LAMBDA_EXCHANGE_BUCKET,
+                "key": result_key,
+            },
+        }
+
+        # Audit off the calling thread: async mode must not block on DynamoDB
+        _emit_in_background(
+            self.audit.working,
+            f"Executando operacao: {operation_name}",
+            session_id=session_id,
+            details={
+                "function": function_name,
+                "action": operation_name,
+                "correlation_id": correlation_id,
+            },
+        )
+
+        with trace_subsegment(
+            f"LambdaAsync-{operation_name}",
+            annotations={
+                "lambda_function": function_name,
+                "operation": operation_name,
+                "session_id": session_id or "unknown",
+                "correlation_id": correlation_id,
+            },
+        ) as subsegment:
+            try:
+                payload, payload_key = self._encode_event(event, ASYNC_PAYLOAD_LIMIT_BYTES)
+                _get_lambda_client().invoke(
+                    FunctionName=function_name,
+                    InvocationType="Event",
+                    Payload=payload,
+                )
+                subsegment.put_annotation("submitted", True)
+            except Exception as e:
+                logger.exception("[LambdaInvoker] Async invocation failed: %s", e)
+                subsegment.put_annotation("submitted", False)
+                subsegment.add_exception(e)
+                _emit_in_background(
+                    self.audit.error,
+                    f"Erro na operacao: {operation_name}",
+                    session_id=session_id,
+                    error=str(e),
                 )
+                raise self._invocation_error(e, function_name, operation_name) from e
+
+        logger.info(
+            "[LambdaInvoker] Async %s submitted: correlation_id=%s",
+            operation_name, correlation_id,
+        )
+        return LambdaInvocation(
+            invoker=self,
+            correlation_id=correlation_id,
+            function_name=function_name,
+            operation_name=operation_name,
+            bucket=LAMBDA_EXCHANGE_BUCKET,
+            key=result_key,
+            session_id=session_id,
+            transform=transform,
+            payload_key=payload_key,
+        )
+
+    def _encode_event(
+        self, event: dict[str, Any], limit_bytes: int
+    ) -> tuple[bytes, str | None]:
+        """
+        Serialize an event once, offloading it to S3 if it nears the limit.
+
+        Offloaded events keep their routing fields (action, session_id,
+        async_result) inline and reference the full event via payload_ref.
+        Offload only happens with LAMBDA_S3_EXCHANGE_ENABLED.
+
+        Returns:
+            Tuple of (invoke payload, offloaded S3 key or None)
+        """
+        body = json.dumps(event).encode("utf-8")
+        if (
+            not LAMBDA_S3_EXCHANGE_ENABLED
+            or not LAMBDA_EXCHANGE_BUCKET
+            or len(body) < limit_bytes * PAYLOAD_OFFLOAD_RATIO
+        ):
+            return body, None
+
+        key = f"{LAMBDA_PAYLOAD_PREFIX}/{uuid.uuid4().hex}.json"
+        _get_s3_client().put_object(
+            Bucket=LAMBDA_EXCHANGE_BUCKET,
+            Key=key,
+            Body=body,
+            ContentType="application/json",
+        )
+        logger.info(
+            "[LambdaInvoker] Offloaded %d byte event to s3://%s/%s",
+            len(body), LAMBDA_EXCHANGE_BUCKET, key,
+        )
+        stub = {
+            field: event[field]
+            for field in ("action", "user_id", "session_id", "async_result")
+            if field in event
+        }
+        stub["payload_ref"] = {"bucket": LAMBDA_EXCHANGE_BUCKET, "key": key}
+        return json.dumps(stub).encode("utf-8"), key
+
+    def _collect_result(
+        self,
+        result: dict[str, Any],
+        function_name: str,
+        operation_name: str,
+        session_id: str | None = None,
+        subsegment: Any = None,
+    ) -> dict[str, Any]:
+        """
+        Resolve offloaded results and apply application-level error handling.
+
+        Shared by the sync path and LambdaInvocation.poll().
+
+        Raises:
+            CognitiveError: On application errors (except FILE_NOT_FOUND)
+        """
+        # Responses too large for the invoke response are stored in S3
+        ref = result.get("result_ref") if isinstance(result, dict) else None
+        if ref:
+            response = _get_s3_client().get_object(Bucket=ref["bucket"], Key=ref["key"])
+            body = response["Body"].read()
+            _delete_exchange_object(ref["bucket"], ref["key"])
+            result = json.loads(body.decode("utf-8"))
+
+        # Unhandled error recorded by an async Lambda (no FunctionError header)
+        if "errorMessage" in result and "success" not in result:
+            if subsegment is not None:
+                subsegment.put_annotation("success", False)
+            raise self._function_error(function_name, operation_name, json.dumps(result))
+
+        # Check for application-level errors
+        if not result.get("success", True):
+            error = result.get("error", "Unknown error")
+            error_type = result.get("error_type", "LAMBDA_ERROR")
+
+            logger.warning(
+                "[LambdaInvoker] Application error: %s - %s",
+                error_type, error,
+            )
+            if subsegment is not None:
+                subsegment.put_annotation("success", False)
+                subsegment.put_annotation("error_type", error_type)
+
+            # For FILE_NOT_FOUND, this is expected behavior, not an error
+            if error_type == "FILE_NOT_FOUND":
+                # Return the result as-is, let caller handle
+                if subsegment is not None:
+                    subsegment.put_annotation("success", True)
+                return result
+
+            raise CognitiveError(
+                technical_message=f"Lambda operation failed: {error}",
+                human_explanation=self._translate_error(error),
+                suggested_fix=self._suggest_fix(error_type),
+                error_type=error_type,
+                recoverable=error_type in ("VALIDATION_ERROR", "FILE_NOT_FOUND"),
+                context={
+                    "function": function_name,
+                    "operation": operation_name,
+                    "original_error": error,
+                },
+            )
+
+        # Success - record in trace
+        if subsegment is not None:
+            subsegment.put_annotation("success", True)
+
+        # Emit completion audit event
+        self.audit.completed(
+            f"Operacao concluida: {operation_name}",
+            session_id=session_id,
+        )
+
+        return result
+
+    def _function_error(
+        self, function_name: str, operation_name: str, error_payload: str
+    ) -> CognitiveError:
+        """CognitiveError for an unhandled exception inside the Lambda."""
+        return CognitiveError(
+            technical_message=f"Lambda function error: {error_payload}",
+            human_explanation="Ocorreu um erro ao processar a operacao no servidor.",
+            suggested_fix="Verifique os parametros e tente novamente.",
+            error_type="LAMBDA_FUNCTION_ERROR",
+            recoverable=True,
+            context={
+                "function": function_name,
+                "operation": operation_name,
+                "error_payload": error_payload[:500],
+            },
+        )
+
+    def _invocation_error(
+        self, error: Exception, function_name: str, operation_name: str
+    ) -> CognitiveError:
+        """CognitiveError for a failed Invoke API call."""
+        return CognitiveError(
+            technical_message=f"Lambda invocation failed: {error}",
+            human_explanation="Nao foi possivel executar a operacao.",
+            suggested_fix="Verifique sua conexao e tente novamente.",
+            error_type="INVOCATION_ERROR",
+            recoverable=True,
+            original_exception=error,
+            context={
+                "function": function_name,
+                "operation": operation_name,
+            },
+        )
 
     def _translate_error(self, error: str) -> str:
         """Translate error message to user-friendly Portuguese."""
@@ -417,6 +899,7 @@ class LambdaInvoker:
             "LAMBDA_FUNCTION_ERROR": "Erro interno. Tente novamente.",
             "PARSE_ERROR": "Resposta inesperada. Contate o suporte.",
             "INVOCATION_ERROR": "Problema de conexao. Tente novamente.",
+            "LAMBDA_ASYNC_TIMEOUT": "A operacao continua em andamento. Consulte novamente em instantes.",
         }
         return suggestions.get(error_type, "Tente novamente ou contate o suporte.")
 
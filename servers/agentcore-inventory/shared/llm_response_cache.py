@@ -0,0 +1,341 @@
+# =============================================================================
+# LLM Response Cache (content-addressed, opt-in)
+# =============================================================================
+# Replays recorded model turns for identical requests, so a repeat import of a
+# known layout (same supplier, same header every week) gets its mapping without
+# a Gemini Pro call.
+#
+# KEY: sha256 of
+#   - model id
+#   - system prompt version (hash of the prompt text)
+#   - normalized tool schema (tool specs, key-sorted)
+#   - normalized input (messages with volatile ids templated out)
+#   - AGENT_VERSION (deploys invalidate every entry)
+#
+# NORMALIZATION:
+# Volatile values (UUIDs, ISO timestamps, session/import/job ids, S3 keys)
+# are replaced by ordered placeholders in the key AND in the stored response;
+# on replay the placeholders are filled with the current request's values.
+#
+# TOOL TURNS ARE CACHEABLE:
+# A turn that *requests* a tool (e.g. SchemaMapper's save_mapping_proposal)
+# is safe to replay: tools run in the agent loop, outside Model.stream(), so
+# the replayed toolUse is executed again exactly as a fresh response would
+# be. Tool results fed back into later turns are part of the key.
+#
+# NOT STORED:
+# - Responses that did not finish cleanly (max_tokens, guardrails, errors)
+#
+# STORAGE (per deployment namespace, TENANT_ID env):
+# - Local LRU (warm container)
+# - S3: s3://{LLM_RESPONSE_CACHE_BUCKET}/llm-response-cache/{namespace}/{AGENT_VERSION}/{key}.json
+#
+# CRITICAL: Lazy imports (boto3 only on S3 access) for cold start compliance.
+#
+# VERSION: 2026-01-22T00:00:00Z
+# =============================================================================
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from shared.debug_utils import debug_error
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+LLM_RESPONSE_CACHE_ENABLED = (
+    os.environ.get("LLM_RESPONSE_CACHE_ENABLED", "false").lower() == "true"
+)
+LLM_RESPONSE_CACHE_TTL_HOURS = float(os.environ.get("LLM_RESPONSE_CACHE_TTL_HOURS", "168"))
+LLM_RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get("LLM_RESPONSE_CACHE_MAX_ENTRIES", "256"))
+# Entries are partitioned per deployment (one tenant per stack)
+CACHE_NAMESPACE = os.environ.get("TENANT_ID", "default")
+
+S3_PREFIX = "llm-response-cache"
+
+CACHEABLE_STOP_REASONS = {"end_turn", "tool_use"}
+
+_VOLATILE_KEY_RE = re.compile(
+    r'(?:\\?")(?:session_id|import_id|job_id|request_id|task_id|s3_key|upload_id)(?:\\?")\s*:\s*(?:\\?")([^"\\]+)(?:\\?")'
+)
+_UUID_RE = re.compile(r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b")
+_ISO_TIMESTAMP_RE = re.compile(r"\b\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})?")
+
+
+# =============================================================================
+# Key Building
+# =============================================================================
+
+
+def _placeholder(index: int) -> str:
+    return f"<<volatile:{index}>>"
+
+
+def extract_volatile_values(text: str) -> List[str]:
+    """Volatile values in order of first appearance (longest match wins)."""
+    found: Dict[int, str] = {}
+    for pattern in (_VOLATILE_KEY_RE, _UUID_RE, _ISO_TIMESTAMP_RE):
+        for match in pattern.finditer(text):
+            value = match.group(1) if match.groups() else match.group(0)
+            start = match.start(1) if match.groups() else match.start()
+            if value and value not in found.values():
+                found[start] = value
+    return [found[position] for position in sorted(found)]
+
+
+def _substitute(text: str, values: List[str]) -> str:
+    """Replace volatile values with placeholders (longest first)."""
+    for index, value in sorted(enumerate(values), key=lambda item: -len(item[1])):
+        text = text.replace(value, _placeholder(index))
+    return text
+
+
+def _restore(text: str, values: List[str]) -> str:
+    """Fill placeholders with the current request's (JSON-escaped) values."""
+    for index, value in enumerate(values):
+        text = text.replace(_placeholder(index), json.dumps(value)[1:-1])
+    return text
+
+
+def build_cache_key(
+    model_id: str,
+    system_prompt: Optional[str],
+    tool_specs: Optional[List[Dict[str, Any]]],
+    messages: List[Dict[str, Any]],
+    agent_version: str,
+) -> Tuple[str, List[str]]:
+    """
+    Content-addressed key for one model turn.
+
+    Returns:
+        Tuple of (sha256 hex key, volatile values found in the messages)
+    """
+    messages_json = json.dumps(messages, sort_keys=True, default=str, ensure_ascii=False)
+    volatile = extract_volatile_values(messages_json)
+    prompt_version = hashlib.sha256((system_prompt or "").encode("utf-8")).hexdigest()
+    tools_json = json.dumps(
+        sorted(tool_specs or [], key=lambda spec: spec.get("name", "")),
+        sort_keys=True,
+        default=str,
+    )
+    material = "\n".join([
+        model_id,
+        agent_version,
+        prompt_version,
+        tools_json,
+        _substitute(messages_json, volatile),
+    ])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest(), volatile
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+
+class LLMResponseCache:
+    """
+    Response cache (local LRU + optional S3), partitioned by namespace.
+
+    Args:
+        agent_version: Deploy version; entries from other versions are ignored
+        bucket: S3 bucket for the shared tier (None = local only)
+        ttl_hours: Entry lifetime
+        max_entries: Local LRU size
+    """
+
+    def __init__(
+        self,
+        agent_version: str,
+        bucket: Optional[str] = None,
+        ttl_hours: float = LLM_RESPONSE_CACHE_TTL_HOURS,
+        max_entries: int = LLM_RESPONSE_CACHE_MAX_ENTRIES,
+        s3_client: Any = None,
+    ):
+        self.agent_version = agent_version
+        self.bucket = bucket
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_entries = max_entries
+        self._s3 = s3_client
+        self._lru: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "bypassed": 0}
+
+    # -------------------------------------------------------------------------
+    # Storage
+    # -------------------------------------------------------------------------
+
+    def _get_s3(self):
+        if self._s3 is None and self.bucket:
+            import boto3
+            self._s3 = boto3.client("s3", region_name="us-east-2")
+        return self._s3
+
+    def _s3_key(self, namespace: str, key: str) -> str:
+        return f"{S3_PREFIX}/{namespace}/{self.agent_version}/{key}.json"
+
+    def _is_valid(self, entry: Dict[str, Any]) -> bool:
+        return (
+            entry.get("agent_version") == self.agent_version
+            and time.time() - entry.get("created_at", 0) < self.ttl_seconds
+        )
+
+    def get(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
+        """Cached entry for a namespace/key, or None."""
+        lru_key = f"{namespace}:{key}"
+        with self._lock:
+            entry = self._lru.get(lru_key)
+            if entry is not None:
+                if self._is_valid(entry):
+                    self._lru.move_to_end(lru_key)
+                    return entry
+                del self._lru[lru_key]
+
+        s3 = self._get_s3()
+        if s3 is None:
+            return None
+        try:
+            response = s3.get_object(Bucket=self.bucket, Key=self._s3_key(namespace, key))
+            entry = json.loads(response["Body"].read())
+        except Exception as e:
+            if "NoSuchKey" not in str(e) and "404" not in str(e):
+                logger.warning(f"[LLMResponseCache] S3 read failed: {e}")
+            return None
+
+        if not self._is_valid(entry):
+            return None
+        self._remember(lru_key, entry)
+        return entry
+
+    def put(self, namespace: str, key: str, entry: Dict[str, Any]) -> None:
+        """Store an entry locally and (best effort) in S3."""
+        entry = {**entry, "agent_version": self.agent_version, "created_at": time.time()}
+        self._remember(f"{namespace}:{key}", entry)
+        with self._lock:
+            self._stats["stores"] += 1
+
+        s3 = self._get_s3()
+        if s3 is None:
+            return
+        try:
+            s3.put_object(
+                Bucket=self.bucket,
+                Key=self._s3_key(namespace, key),
+                Body=json.dumps(entry).encode("utf-8"),
+                ContentType="application/json",
+            )
+        except Exception as e:
+            debug_error(e, "llm_response_cache_put", {"namespace": namespace})
+
+    def _remember(self, lru_key: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._lru[lru_key] = entry
+            self._lru.move_to_end(lru_key)
+            while len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "lru_size": len(self._lru)}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    # -------------------------------------------------------------------------
+    # Model Stream Wrapper
+    # -------------------------------------------------------------------------
+
+    async def stream(
+        self,
+        get_model: Callable[[], Any],
+        model_id: str,
+        messages: List[Dict[str, Any]],
+        tool_specs: Optional[List[Dict[str, Any]]] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Cache-through replacement for Model.stream().
+
+        Args:
+            get_model: Returns the real model (only called on a miss)
+            model_id: Model identifier (part of the key)
+            messages, tool_specs, system_prompt, **kwargs: Model.stream() args
+
+        Yields:
+            Stream events (replayed on a hit, recorded on a miss)
+        """
+        namespace = CACHE_NAMESPACE
+        key, volatile = build_cache_key(
+            model_id, system_prompt, tool_specs, messages, self.agent_version
+        )
+
+        entry = self.get(namespace, key)
+        if entry is not None:
+            self._count("hits")
+            logger.info(f"[LLMResponseCache] Hit: namespace={namespace}, key={key[:12]}")
+            for event in json.loads(_restore(entry["events"], volatile)):
+                yield event
+            return
+
+        self._count("misses")
+        recorded: List[Dict[str, Any]] = []
+        async for event in get_model().stream(messages, tool_specs, system_prompt, **kwargs):
+            recorded.append(event)
+            yield event
+
+        if _finished_cleanly(recorded):
+            try:
+                events_json = json.dumps(recorded)
+            except (TypeError, ValueError):
+                return
+            self.put(namespace, key, {
+                "model_id": model_id,
+                "events": _substitute(events_json, volatile),
+            })
+        else:
+            self._count("bypassed")
+
+
+def _finished_cleanly(events: List[Dict[str, Any]]) -> bool:
+    for event in reversed(events):
+        if "messageStop" in event:
+            return event["messageStop"].get("stopReason") in CACHEABLE_STOP_REASONS
+    return False
+
+
+# =============================================================================
+# Singleton
+# =============================================================================
+
+_response_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_response_cache(agent_version: str) -> Optional[LLMResponseCache]:
+    """Shared cache instance, or None when LLM_RESPONSE_CACHE_ENABLED is off."""
+    global _response_cache
+    if not LLM_RESPONSE_CACHE_ENABLED:
+        return None
+    if _response_cache is None or _response_cache.agent_version != agent_version:
+        bucket = os.environ.get("LLM_RESPONSE_CACHE_BUCKET") or os.environ.get("DOCUMENTS_BUCKET")
+        _response_cache = LLMResponseCache(agent_version=agent_version, bucket=bucket)
+    return _response_cache
+
+
+__all__ = [
+    "LLMResponseCache",
+    "build_cache_key",
+    "get_llm_response_cache",
+]
@@ -35,9 +35,13 @@ Architecture: AWS Bedrock AgentCore Memory + Strands Agents
 """
 
 import os
+import asyncio
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from shared.genesis_kernel import (
     MemoryOriginType,
@@ -68,6 +72,21 @@ NS_FACTS = "/facts/{actorId}"           # SemanticStrategy
 NS_EPISODES = "/episodes/{actorId}"     # EpisodicStrategy
 NS_GLOBAL = "/strategy/import/company"  # Global (all agents)
 
+# OBSERVE performance tuning
+# - Namespaces are queried concurrently, each bounded by its own timeout
+#   (a slow namespace degrades to "no records" instead of stalling the agent)
+# - Identical lookups within one import session are answered from a short
+#   TTL cache; learn*() writes invalidate the namespace they wrote to
+OBSERVE_NAMESPACE_TIMEOUT_SECONDS = float(
+    os.environ.get("MEMORY_OBSERVE_TIMEOUT_SECONDS", "5")
+)
+OBSERVE_CACHE_TTL_SECONDS = float(
+    os.environ.get("MEMORY_OBSERVE_CACHE_TTL_SECONDS", "120")
+)
+OBSERVE_CACHE_MAX_ENTRIES = int(
+    os.environ.get("MEMORY_OBSERVE_CACHE_MAX_ENTRIES", "256")
+)
+
 
 # ============================================================================
 # MEMORY CLIENT SINGLETON
@@ -92,6 +111,62 @@ def _get_memory_client():
     return _memory_client
 
 
+# ============================================================================
+# OBSERVE RESULT CACHE (module-level, shared by all manager instances)
+# ============================================================================
+# Keyed by (namespace, query, top_k). Namespaces already embed the actorId,
+# so sharing across instances never leaks one actor's facts to another.
+
+_observe_cache: "OrderedDict[Tuple[str, str, int], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+_observe_cache_lock = threading.Lock()
+
+
+def _observe_cache_get(key: Tuple[str, str, int]) -> Optional[List[Dict[str, Any]]]:
+    """Return cached records for (namespace, query, top_k) if still fresh."""
+    with _observe_cache_lock:
+        entry = _observe_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, records = entry
+        if expires_at <= time.monotonic():
+            del _observe_cache[key]
+            return None
+        _observe_cache.move_to_end(key)
+        return list(records)
+
+
+def _observe_cache_put(key: Tuple[str, str, int], records: List[Dict[str, Any]]) -> None:
+    """Store records for (namespace, query, top_k), evicting the oldest entry."""
+    if OBSERVE_CACHE_TTL_SECONDS <= 0:
+        return
+    with _observe_cache_lock:
+        _observe_cache[key] = (time.monotonic() + OBSERVE_CACHE_TTL_SECONDS, list(records))
+        _observe_cache.move_to_end(key)
+        while len(_observe_cache) > OBSERVE_CACHE_MAX_ENTRIES:
+            _observe_cache.popitem(last=False)
+
+
+def invalidate_observe_cache(namespace: Optional[str] = None) -> int:
+    """
+    Drop cached observe() results.
+
+    Args:
+        namespace: Only drop entries for this namespace (None = everything)
+
+    Returns:
+        Number of entries removed
+    """
+    with _observe_cache_lock:
+        if namespace is None:
+            removed = len(_observe_cache)
+            _observe_cache.clear()
+            return removed
+        stale = [key for key in _observe_cache if key[0] == namespace]
+        for key in stale:
+            del _observe_cache[key]
+        return len(stale)
+
+
 # ============================================================================
 # AGENT MEMORY MANAGER
 # ============================================================================
@@ -167,11 +242,15 @@ class AgentMemoryManager:
         include_facts: bool = True,
         include_episodes: bool = True,
         include_global: bool = True,
+        use_cache: bool = True,
     ) -> List[Dict[str, Any]]:
         """
         OBSERVE: Buscar memorias relevantes no LTM.
 
         AWS automatically extracts to LTM via Strategies, so we just query!
+        Namespaces are queried concurrently (asyncio.gather), each bounded by
+        OBSERVE_NAMESPACE_TIMEOUT_SECONDS. Successful per-namespace results
+        are cached for OBSERVE_CACHE_TTL_SECONDS.
 
         Args:
             query: Busca semantica (natural language)
@@ -179,6 +258,7 @@ class AgentMemoryManager:
             include_facts: Buscar no namespace /facts
             include_episodes: Buscar no namespace /episodes
             include_global: Buscar no namespace global
+            use_cache: Usar cache de resultados (default True)
 
         Returns:
             Lista de memory records com content e metadata
@@ -187,7 +267,6 @@ class AgentMemoryManager:
             logger.warning("[observe] Memory client not available")
             return []
 
-        results = []
         namespaces_to_search = []
 
         if include_facts:
@@ -203,29 +282,72 @@ class AgentMemoryManager:
                 ("global", NS_GLOBAL)
             )
 
-        for memory_type, namespace in namespaces_to_search:
-            try:
-                records = await self.client.retrieve_memory_records(
-                    query=query,
-                    namespace=namespace,
-                    top_k=limit,
-                )
-                for record in records:
-                    results.append({
-                        "type": memory_type,
-                        "namespace": namespace,
-                        **record,
-                    })
-            except Exception as e:
-                logger.warning(
-                    f"[observe] Error querying namespace {namespace}: {e}"
-                )
+        per_namespace = await asyncio.gather(*[
+            self._observe_namespace(memory_type, namespace, query, limit, use_cache)
+            for memory_type, namespace in namespaces_to_search
+        ])
+
+        # Preserve facts -> episodes -> global ordering
+        results = [record for records in per_namespace for record in records]
 
         logger.info(
             f"[observe] Found {len(results)} memories for query: {query[:50]}..."
         )
         return results
 
+    async def _observe_namespace(
+        self,
+        memory_type: str,
+        namespace: str,
+        query: str,
+        limit: int,
+        use_cache: bool,
+    ) -> List[Dict[str, Any]]:
+        """
+        Query a single namespace (cache first, timeout-bounded).
+
+        Errors and timeouts return [] and are never cached.
+        """
+        cache_key = (namespace, query, limit)
+        if use_cache:
+            cached = _observe_cache_get(cache_key)
+            if cached is not None:
+                logger.debug(f"[observe] Cache hit: namespace={namespace}")
+                return cached
+
+        try:
+            records = await asyncio.wait_for(
+                self.client.retrieve_memory_records(
+                    query=query,
+                    namespace=namespace,
+                    top_k=limit,
+                ),
+                timeout=OBSERVE_NAMESPACE_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"[observe] Timeout after {OBSERVE_NAMESPACE_TIMEOUT_SECONDS}s "
+                f"querying namespace {namespace}"
+            )
+            return []
+        except Exception as e:
+            logger.warning(
+                f"[observe] Error querying namespace {namespace}: {e}"
+            )
+            return []
+
+        results = [
+            {
+                "type": memory_type,
+                "namespace": namespace,
+                **record,
+            }
+            for record in records
+        ]
+        if use_cache:
+            _observe_cache_put(cache_key, results)
+        return results
+
     @trace_memory_operation("observe_facts")
     async def observe_facts(
         self,
@@ -364,6 +486,8 @@ class AgentMemoryManager:
                 namespace=namespace,
                 role="ASSISTANT",
             )
+            # Read-your-writes within the session: drop cached lookups
+            invalidate_observe_cache(namespace)
             logger.info(
                 f"[learn] Created event: type={origin_type.value}, "
                 f"category={category}, weight={emotional_weight}, namespace={namespace}"
@@ -580,6 +704,7 @@ __all__ = [
     # Convenience functions
     "observe_patterns",
     "learn_pattern",
+    "invalidate_observe_cache",
 
     # Re-exports from genesis_kernel for convenience
     "MemoryOriginType",
@@ -9,6 +9,9 @@ Reference: docs/permissions/PRD-permissions-system.md
 
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any
 
@@ -21,6 +24,15 @@ logger = logging.getLogger(__name__)
 # Environment variable for table name
 USERS_TABLE_NAME = os.environ.get("USERS_TABLE_NAME", "faiston-one-sga-sessions-prod")
 
+# Resolved-permissions cache (per container)
+# Short user TTL bounds how long a profile reassignment takes to apply.
+# The profile TTL is capped at the user TTL so a Profile.version change is
+# picked up (and dependent user entries dropped) before those entries expire.
+PERMISSIONS_CACHE_TTL_SECONDS = float(os.environ.get("PERMISSIONS_CACHE_TTL_SECONDS", "60"))
+PROFILE_CACHE_TTL_SECONDS = float(os.environ.get("PROFILE_CACHE_TTL_SECONDS", "30"))
+PERMISSIONS_CACHE_MAX_USERS = int(os.environ.get("PERMISSIONS_CACHE_MAX_USERS", "1000"))
+PERMISSIONS_CACHE_WARM_ON_START = os.environ.get("PERMISSIONS_CACHE_WARM_ON_START", "false").lower() == "true"
+
 
 @dataclass
 class Module:
@@ -73,6 +85,15 @@ class UserPermissions:
     version: int
 
 
+@dataclass
+class _CachedUserPermissions:
+    """Resolved permissions plus the profile versions they were built from."""
+    permissions: UserPermissions | None
+    expires_at: float
+    profile_versions: dict[str, int]
+    groups: tuple[str, ...]
+
+
 class PermissionsClient:
     """
     Client for accessing permission data from DynamoDB.
@@ -82,19 +103,49 @@ class PermissionsClient:
     - MODULE#{module} / FUNC#{code}: Functionality (nested in module)
     - PROFILE#{id} / PROFILE#{id}: Profile definition
     - USER#{id} / USER#{id}: User with profileId attribute
+
+    Resolved permissions are cached per user_id (short TTL, LRU-bounded).
+    Only fully resolved results are cached; a DynamoDB error during
+    resolution denies that request and the next call reads again.
+    Profiles and the module list are cached separately with a TTL no longer
+    than the user TTL; whenever a profile is re-read at a newer
+    Profile.version, every user entry resolved from it is dropped. Call
+    warm_cache() to preload every profile so the next permission checks
+    only read the user's profile assignment.
     """
 
-    def __init__(self, table_name: str | None = None):
+    def __init__(
+        self,
+        table_name: str | None = None,
+        cache_ttl_seconds: float = PERMISSIONS_CACHE_TTL_SECONDS,
+        profile_cache_ttl_seconds: float = PROFILE_CACHE_TTL_SECONDS,
+        max_cached_users: int = PERMISSIONS_CACHE_MAX_USERS,
+    ):
         """
         Initialize the permissions client.
 
         Args:
             table_name: DynamoDB table name (defaults to USERS_TABLE_NAME env var)
+            cache_ttl_seconds: TTL for resolved user permissions (0 disables)
+            profile_cache_ttl_seconds: TTL for profiles and the module list
+                (capped at cache_ttl_seconds when the user cache is enabled)
+            max_cached_users: LRU bound for resolved user permissions
         """
         self.table_name = table_name or USERS_TABLE_NAME
         self._dynamodb = None
         self._table = None
 
+        self._cache_ttl = cache_ttl_seconds
+        self._profile_cache_ttl = (
+            min(profile_cache_ttl_seconds, cache_ttl_seconds)
+            if cache_ttl_seconds > 0 else profile_cache_ttl_seconds
+        )
+        self._max_cached_users = max_cached_users
+        self._user_cache: OrderedDict[str, _CachedUserPermissions] = OrderedDict()
+        self._profile_cache: dict[str, tuple[Profile, float]] = {}
+        self._modules_cache: tuple[list[Module], float] | None = None
+        self._cache_lock = threading.RLock()
+
     @property
     def dynamodb(self):
         """Lazy initialization of DynamoDB resource."""
@@ -146,13 +197,21 @@ class PermissionsClient:
             logger.error(f"Error getting module {code}: {e}")
             return None
 
-    def list_modules(self) -> list[Module]:
+    def list_modules(self, use_cache: bool = True) -> list[Module]:
         """
         List all active modules.
 
+        Args:
+            use_cache: Serve from the module cache when fresh
+
         Returns:
             List of modules sorted by order
         """
+        if use_cache:
+            with self._cache_lock:
+                if self._modules_cache and self._modules_cache[1] > time.monotonic():
+                    return list(self._modules_cache[0])
+
         try:
             response = self.table.query(
                 IndexName="GSI1",
@@ -169,7 +228,10 @@ class PermissionsClient:
                     order=item.get("order", 0),
                     is_active=item.get("isActive", True)
                 ))
-            return sorted(modules, key=lambda m: m.order)
+            modules = sorted(modules, key=lambda m: m.order)
+            with self._cache_lock:
+                self._modules_cache = (modules, time.monotonic() + self._profile_cache_ttl)
+            return list(modules)
         except ClientError as e:
             logger.error(f"Error listing modules: {e}")
             return []
@@ -256,42 +318,63 @@ class PermissionsClient:
     # Profile Operations
     # =========================================================================
 
-    def get_profile(self, profile_id: str) -> Profile | None:
+    def get_profile(self, profile_id: str, use_cache: bool = True) -> Profile | None:
         """
         Get a profile by ID.
 
         Args:
             profile_id: Profile ID
+            use_cache: Serve from the profile cache when fresh
 
         Returns:
-            Profile or None if not found
+            Profile or None if not found (or on a DynamoDB error)
         """
         try:
-            response = self.table.get_item(
-                Key={
-                    "PK": f"PROFILE#{profile_id}",
-                    "SK": f"PROFILE#{profile_id}"
-                }
-            )
-            item = response.get("Item")
-            if item:
-                return Profile(
-                    id=item.get("id", profile_id),
-                    name=item.get("name", ""),
-                    description=item.get("description"),
-                    profile_type=item.get("type", "BASE"),
-                    base_profile=item.get("baseProfile"),
-                    cognito_group=item.get("cognitoGroup"),
-                    permissions=item.get("permissions", []),
-                    denied_permissions=item.get("deniedPermissions", []),
-                    version=item.get("version", 1),
-                    is_active=item.get("isActive", True)
-                )
-            return None
+            return self._read_profile(profile_id, use_cache)
         except ClientError as e:
             logger.error(f"Error getting profile {profile_id}: {e}")
             return None
 
+    def _read_profile(self, profile_id: str, use_cache: bool = True) -> Profile | None:
+        """
+        get_profile() that lets ClientError propagate.
+
+        Returns:
+            Profile, or None only if the item does not exist
+
+        Raises:
+            ClientError: On DynamoDB errors (throttling, timeouts, ...)
+        """
+        if use_cache:
+            with self._cache_lock:
+                cached = self._profile_cache.get(profile_id)
+                if cached and cached[1] > time.monotonic():
+                    return cached[0]
+
+        response = self.table.get_item(
+            Key={
+                "PK": f"PROFILE#{profile_id}",
+                "SK": f"PROFILE#{profile_id}"
+            }
+        )
+        item = response.get("Item")
+        if not item:
+            return None
+        profile = Profile(
+            id=item.get("id", profile_id),
+            name=item.get("name", ""),
+            description=item.get("description"),
+            profile_type=item.get("type", "BASE"),
+            base_profile=item.get("baseProfile"),
+            cognito_group=item.get("cognitoGroup"),
+            permissions=item.get("permissions", []),
+            denied_permissions=item.get("deniedPermissions", []),
+            version=item.get("version", 1),
+            is_active=item.get("isActive", True)
+        )
+        self._cache_profile(profile)
+        return profile
+
     def list_profiles(self, base_profile: str | None = None) -> list[Profile]:
         """
         List profiles, optionally filtered by base profile.
@@ -330,6 +413,8 @@ class PermissionsClient:
                     version=item.get("version", 1),
                     is_active=item.get("isActive", True)
                 ))
+            for profile in profiles:
+                self._cache_profile(profile)
             return profiles
         except ClientError as e:
             logger.error(f"Error listing profiles: {e}")
@@ -347,41 +432,108 @@ class PermissionsClient:
             user_id: User ID (Cognito sub)
 
         Returns:
-            Profile ID or None if not assigned
+            Profile ID or None if not assigned (or on a DynamoDB error)
         """
         try:
-            response = self.table.get_item(
-                Key={
-                    "PK": f"USER#{user_id}",
-                    "SK": f"USER#{user_id}"
-                },
-                ProjectionExpression="profileId"
-            )
-            item = response.get("Item")
-            return item.get("profileId") if item else None
+            return self._read_user_profile_id(user_id)
         except ClientError as e:
             logger.error(f"Error getting user profile ID: {e}")
             return None
 
-    def get_user_permissions(self, user_id: str, groups: list[str] | None = None) -> UserPermissions | None:
+    def _read_user_profile_id(self, user_id: str) -> str | None:
+        """
+        get_user_profile_id() that lets ClientError propagate.
+
+        Raises:
+            ClientError: On DynamoDB errors (throttling, timeouts, ...)
+        """
+        response = self.table.get_item(
+            Key={
+                "PK": f"USER#{user_id}",
+                "SK": f"USER#{user_id}"
+            },
+            ProjectionExpression="profileId"
+        )
+        item = response.get("Item")
+        return item.get("profileId") if item else None
+
+    def get_user_permissions(
+        self,
+        user_id: str,
+        groups: list[str] | None = None,
+        use_cache: bool = True,
+    ) -> UserPermissions | None:
         """
         Get resolved permissions for a user.
 
         This method:
-        1. Looks up the user's assigned profile
-        2. Falls back to base profile from Cognito groups
-        3. Resolves profile inheritance for custom profiles
-        4. Returns the final set of permissions
+        1. Returns cached resolved permissions when fresh
+        2. Looks up the user's assigned profile
+        3. Falls back to base profile from Cognito groups
+        4. Resolves profile inheritance for custom profiles
+        5. Returns the final set of permissions
 
         Args:
             user_id: User ID (Cognito sub)
             groups: Optional Cognito groups (for fallback)
+            use_cache: Serve from / populate the resolved-permissions cache
 
         Returns:
-            UserPermissions or None if unable to resolve
+            UserPermissions or None if unable to resolve. A DynamoDB error
+            while resolving returns None (deny) and nothing is cached, so the
+            next call reads DynamoDB again; it never falls back to the
+            Cognito group's base profile.
         """
+        group_key = tuple(sorted(groups or []))
+
+        if use_cache and self._cache_ttl > 0:
+            with self._cache_lock:
+                entry = self._user_cache.get(user_id)
+                if entry and self._is_user_entry_valid(entry, group_key):
+                    self._user_cache.move_to_end(user_id)
+                    return entry.permissions
+                self._user_cache.pop(user_id, None)
+
+        try:
+            resolved, profile_versions, complete = self._resolve_user_permissions(user_id, groups)
+        except ClientError as e:
+            logger.error(f"Error resolving permissions for user {user_id}: {e}")
+            return None
+
+        if use_cache and self._cache_ttl > 0 and resolved is not None and complete:
+            with self._cache_lock:
+                self._user_cache[user_id] = _CachedUserPermissions(
+                    permissions=resolved,
+                    expires_at=time.monotonic() + self._cache_ttl,
+                    profile_versions=profile_versions,
+                    groups=group_key,
+                )
+                self._user_cache.move_to_end(user_id)
+                while len(self._user_cache) > self._max_cached_users:
+                    self._user_cache.popitem(last=False)
+
+        return resolved
+
+    def _resolve_user_permissions(
+        self,
+        user_id: str,
+        groups: list[str] | None,
+    ) -> tuple[UserPermissions | None, dict[str, int], bool]:
+        """
+        Resolve permissions from DynamoDB (profiles may come from cache).
+
+        Returns:
+            Tuple of (UserPermissions or None, {profile_id: version} used,
+            True if every referenced profile was found - safe to cache)
+
+        Raises:
+            ClientError: On DynamoDB errors, so a throttled lookup is never
+                mistaken for "no profile assigned"
+        """
+        profile_versions: dict[str, int] = {}
+
         # Get user's assigned profile
-        profile_id = self.get_user_profile_id(user_id)
+        profile_id = self._read_user_profile_id(user_id)
 
         # Fallback to base profile from groups
         if not profile_id and groups:
@@ -389,23 +541,29 @@ class PermissionsClient:
 
         if not profile_id:
             logger.warning(f"No profile found for user {user_id}")
-            return None
+            return None, profile_versions, False
 
         # Get the profile
-        profile = self.get_profile(profile_id)
+        profile = self._read_profile(profile_id)
         if not profile:
             logger.warning(f"Profile {profile_id} not found")
-            return None
+            return None, profile_versions, False
+        profile_versions[profile.id] = profile.version
 
         # Resolve permissions
         permissions = set(profile.permissions or [])
         base_profile = profile_id
+        complete = True
 
         # Handle custom profile inheritance
         if profile.profile_type == "CUSTOM" and profile.base_profile:
             base_profile = profile.base_profile
-            base = self.get_profile(profile.base_profile)
-            if base:
+            base = self._read_profile(profile.base_profile)
+            if not base:
+                logger.warning(f"Base profile {profile.base_profile} not found")
+                complete = False
+            else:
+                profile_versions[base.id] = base.version
                 # Start with base permissions
                 permissions = set(base.permissions or [])
                 # Remove denied permissions
@@ -419,7 +577,100 @@ class PermissionsClient:
             base_profile=base_profile,
             permissions=permissions,
             version=profile.version
-        )
+        ), profile_versions, complete
+
+    # =========================================================================
+    # Cache Management
+    # =========================================================================
+
+    def _cache_profile(self, profile: Profile) -> None:
+        """
+        Store a profile and drop user entries built from an older version.
+
+        Args:
+            profile: Freshly read profile
+        """
+        with self._cache_lock:
+            previous = self._profile_cache.get(profile.id)
+            self._profile_cache[profile.id] = (
+                profile,
+                time.monotonic() + self._profile_cache_ttl,
+            )
+            if previous and previous[0].version != profile.version:
+                logger.info(
+                    f"Profile {profile.id} changed "
+                    f"(v{previous[0].version} -> v{profile.version}), "
+                    f"invalidating cached user permissions"
+                )
+                self.invalidate_profile(profile.id, keep_profile=True)
+
+    def _is_user_entry_valid(
+        self,
+        entry: _CachedUserPermissions,
+        group_key: tuple[str, ...],
+    ) -> bool:
+        """
+        Check a cached user entry (caller holds the cache lock).
+
+        The entry is stale when its TTL elapsed, when the groups differ
+        (groups only matter for the fallback profile), or when any profile
+        it was resolved from is now cached at a different version.
+        """
+        if entry.expires_at <= time.monotonic():
+            return False
+        if entry.groups != group_key:
+            return False
+        for profile_id, version in entry.profile_versions.items():
+            cached = self._profile_cache.get(profile_id)
+            if cached and cached[0].version != version:
+                return False
+        return True
+
+    def warm_cache(self) -> int:
+        """
+        Preload every profile (one query) and the module list.
+
+        Until the profile TTL lapses, permission checks only hit DynamoDB
+        for the user's profile assignment, once per user per TTL.
+
+        Returns:
+            Number of profiles cached
+        """
+        profiles = self.list_profiles()
+        self.list_modules(use_cache=False)
+        logger.info(f"Permissions cache warmed: {len(profiles)} profiles")
+        return len(profiles)
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop cached resolved permissions for a user (e.g., profile reassigned)."""
+        with self._cache_lock:
+            self._user_cache.pop(user_id, None)
+
+    def invalidate_profile(self, profile_id: str, keep_profile: bool = False) -> None:
+        """
+        Drop a profile and every user entry resolved from it.
+
+        Args:
+            profile_id: Profile ID that changed
+            keep_profile: Keep the profile itself (already refreshed)
+        """
+        with self._cache_lock:
+            if not keep_profile:
+                self._profile_cache.pop(profile_id, None)
+            stale = [
+                user_id
+                for user_id, entry in self._user_cache.items()
+                if profile_id in entry.profile_versions
+            ]
+            for user_id in stale:
+                del self._user_cache[user_id]
+
+    def clear_cache(self) -> None:
+        """Clear all cached permissions, profiles and modules."""
+        with self._cache_lock:
+            self._user_cache.clear()
+            self._profile_cache.clear()
+            self._modules_cache = None
 
     def _get_base_profile_from_groups(self, groups: list[str]) -> str | None:
         """
@@ -542,10 +793,15 @@ def get_permissions_client() -> PermissionsClient:
     """
     Get the singleton permissions client instance.
 
+    When PERMISSIONS_CACHE_WARM_ON_START=true, all profiles are preloaded
+    on first use (see PermissionsClient.warm_cache).
+
     Returns:
         PermissionsClient instance
     """
     global _client
     if _client is None:
         _client = PermissionsClient()
+        if PERMISSIONS_CACHE_WARM_ON_START:
+            _client.warm_cache()
     return _client
@@ -0,0 +1,229 @@
+# =============================================================================
+# Prewarm Manager - Warm Lazy Imports and Clients After Server Start
+# =============================================================================
+# Agents defer heavy work (_ensure_lazy_imports, LazyGeminiModel, SSM secret
+# lookup, boto3 clients) so the A2A listener starts inside AgentCore's
+# 30-second init window. Without prewarm, the FIRST USER REQUEST pays for all
+# of it.
+#
+# PrewarmManager runs an ordered list of steps on a daemon thread that is
+# started from the FastAPI startup event (i.e. as the server begins
+# listening). /ping reports readiness, so AgentCore routes traffic only to a
+# warm container:
+#
+#   warming  → HTTP 503 {"status": "warming", ...}
+#   ready    → HTTP 200 {"status": "healthy", "prewarm": {...}}
+#   degraded → HTTP 200 (a step failed; the lazy path still covers it)
+#
+# SAFETY:
+# - Steps are best-effort: a failing step is recorded, never raised
+# - The readiness gate is bounded by PREWARM_PING_GATE_SECONDS; after that
+#   /ping reports healthy even if warming is still running (never blocks
+#   the container past AgentCore's init limit)
+#
+# Usage:
+#   prewarm = PrewarmManager("schema_mapper", steps=[
+#       ("imports", _ensure_lazy_imports),
+#       ("secrets", load_google_api_key),
+#   ])
+#   attach_prewarm(app, prewarm)
+#   ...
+#   status_code, body = prewarm.ping_response({"agent_id": AGENT_ID})
+#
+# Environment:
+#   PREWARM_ENABLED            - "false" disables prewarm (default: true)
+#   PREWARM_PING_GATE_SECONDS  - max seconds /ping reports warming (default: 20)
+#   PREWARM_MODEL_PROBE        - "true" runs a token count against the model
+#                                (validates key + connection; default: false)
+#
+# VERSION: 2026-01-22T00:00:00Z
+# =============================================================================
+
+import importlib
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+PREWARM_ENABLED = os.environ.get("PREWARM_ENABLED", "true").lower() == "true"
+PREWARM_PING_GATE_SECONDS = float(os.environ.get("PREWARM_PING_GATE_SECONDS", "20"))
+PREWARM_MODEL_PROBE = os.environ.get("PREWARM_MODEL_PROBE", "false").lower() == "true"
+
+PrewarmStep = Tuple[str, Callable[[], Any]]
+
+
+def import_modules(*module_names: str) -> Callable[[], List[str]]:
+    """
+    Build a step that imports the given modules (missing ones are skipped).
+
+    Returns:
+        Callable returning the list of modules actually imported
+    """
+    def _import() -> List[str]:
+        loaded = []
+        for name in module_names:
+            try:
+                importlib.import_module(name)
+                loaded.append(name)
+            except ImportError as e:
+                logger.debug(f"[Prewarm] Optional module {name} not available: {e}")
+        return loaded
+    return _import
+
+
+def warm_model(model: Any) -> None:
+    """Initialize a (Lazy)GeminiModel, optionally probing it with a token count."""
+    warm = getattr(model, "warm", None)
+    if callable(warm):
+        warm(probe=PREWARM_MODEL_PROBE)
+
+
+# =============================================================================
+# Prewarm Manager
+# =============================================================================
+
+
+class PrewarmManager:
+    """
+    Runs prewarm steps once, on a background thread, and tracks readiness.
+
+    Args:
+        agent_id: Agent identifier for logging
+        steps: Ordered (name, callable) pairs
+        gate_seconds: Max seconds readiness is withheld from /ping
+        enabled: Run steps at all (disabled → always ready)
+    """
+
+    def __init__(
+        self,
+        agent_id: str,
+        steps: Sequence[PrewarmStep] = (),
+        gate_seconds: float = PREWARM_PING_GATE_SECONDS,
+        enabled: bool = PREWARM_ENABLED,
+    ):
+        self.agent_id = agent_id
+        self.steps: List[PrewarmStep] = list(steps)
+        self.gate_seconds = gate_seconds
+        self.enabled = enabled
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._results: Dict[str, Dict[str, Any]] = {}
+
+    def start(self) -> bool:
+        """
+        Start prewarming on a daemon thread (idempotent).
+
+        Returns:
+            True if a thread was started by this call
+        """
+        if not self.enabled:
+            return False
+        with self._lock:
+            if self._thread is not None:
+                return False
+            self._started_at = time.monotonic()
+            self._thread = threading.Thread(
+                target=self.run,
+                name=f"prewarm-{self.agent_id}",
+                daemon=True,
+            )
+            self._thread.start()
+        logger.info(f"[Prewarm:{self.agent_id}] Started ({len(self.steps)} steps)")
+        return True
+
+    def run(self) -> None:
+        """Run all steps in order (blocking). Failures are recorded, not raised."""
+        if self._started_at is None:
+            self._started_at = time.monotonic()
+        for name, step in self.steps:
+            step_start = time.monotonic()
+            try:
+                step()
+                result = {"ok": True}
+            except Exception as e:
+                logger.warning(f"[Prewarm:{self.agent_id}] Step '{name}' failed: {e}")
+                result = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            result["duration_ms"] = int((time.monotonic() - step_start) * 1000)
+            with self._lock:
+                self._results[name] = result
+        with self._lock:
+            self._finished_at = time.monotonic()
+        logger.info(f"[Prewarm:{self.agent_id}] Finished: {self.status}")
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait for the background thread (tests, scripts)."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    @property
+    def status(self) -> str:
+        """pending | warming | ready | degraded | disabled."""
+        if not self.enabled:
+            return "disabled"
+        with self._lock:
+            if self._started_at is None:
+                return "pending"
+            if self._finished_at is None:
+                return "warming"
+            failed = any(not r["ok"] for r in self._results.values())
+        return "degraded" if failed else "ready"
+
+    def is_ready(self) -> bool:
+        """True once warming finished, or the readiness gate has elapsed."""
+        status = self.status
+        if status in ("ready", "degraded", "disabled"):
+            return True
+        if status == "warming" and self._started_at is not None:
+            return time.monotonic() - self._started_at >= self.gate_seconds
+        return False
+
+    def report(self) -> Dict[str, Any]:
+        """Prewarm status and per-step timings (for /ping)."""
+        with self._lock:
+            elapsed = None
+            if self._started_at is not None:
+                end = self._finished_at or time.monotonic()
+                elapsed = int((end - self._started_at) * 1000)
+            steps = {name: dict(result) for name, result in self._results.items()}
+        return {"status": self.status, "elapsed_ms": elapsed, "steps": steps}
+
+    def ping_response(self, body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        """
+        Build the /ping response for the current readiness.
+
+        Args:
+            body: Agent-specific fields (agent_id, protocol, port, ...)
+
+        Returns:
+            Tuple of (HTTP status code, response body)
+        """
+        ready = self.is_ready()
+        return (200 if ready else 503), {
+            "status": "healthy" if ready else "warming",
+            **body,
+            "prewarm": self.report(),
+        }
+
+
+def attach_prewarm(app: Any, manager: PrewarmManager) -> None:
+    """Start prewarming when the FastAPI app starts serving."""
+    app.add_event_handler("startup", manager.start)
+
+
+__all__ = [
+    "PREWARM_ENABLED",
+    "PrewarmManager",
+    "attach_prewarm",
+    "import_modules",
+    "warm_model",
+]
@@ -0,0 +1,222 @@
+# =============================================================================
+# Startup Profiler - Cold Start Measurement for Agent Entry Points
+# =============================================================================
+# Measures where an agent's cold start goes, so regressions are caught before
+# they hit the 30-second AgentCore Firecracker init limit.
+#
+# Enabled with STARTUP_PROFILE=true. Records, relative to PROCESS START:
+# - modules_loaded_ms : agent main.py fully imported (create_app about to run)
+# - create_app_ms     : create_app() returned
+# - first_ping_ms     : first /ping response produced
+#
+# Per-module import cost comes from CPython's own import profiler
+# (PYTHONPROFILEIMPORTTIME=1 or -X importtime, written to stderr);
+# parse_importtime() turns that output into a sorted list.
+#
+# The report is written as JSON to STARTUP_PROFILE_PATH (default:
+# /tmp/startup_profile_{agent_id}.json) and logged once, on first /ping.
+#
+# scripts/profile_startup.py runs every agent main.py in a child process
+# with both switches on, merges the reports and checks startup budgets.
+#
+# Usage (agent main.py):
+#     app = profile_create_app(AGENT_ID, create_app)
+#     uvicorn.run(app, ...)
+#
+# CRITICAL: stdlib only - this module must not add to the cost it measures.
+#
+# VERSION: 2026-01-22T00:00:00Z
+# =============================================================================
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+STARTUP_PROFILE_ENABLED = os.environ.get("STARTUP_PROFILE", "false").lower() == "true"
+STARTUP_PROFILE_PATH = os.environ.get("STARTUP_PROFILE_PATH", "")
+
+# Fallback reference when /proc is unavailable (non-Linux)
+_MODULE_LOADED_AT = time.monotonic()
+
+
+def process_uptime_ms() -> float:
+    """
+    Milliseconds since this process started.
+
+    Uses /proc/self/stat (Linux, 10ms resolution); falls back to the time
+    since this module was imported.
+    """
+    try:
+        with open("/proc/self/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        start_ticks = int(fields[19])  # field 22: starttime (clock ticks since boot)
+        with open("/proc/uptime") as f:
+            uptime_s = float(f.read().split()[0])
+        return (uptime_s - start_ticks / os.sysconf("SC_CLK_TCK")) * 1000
+    except (OSError, ValueError, IndexError):
+        return (time.monotonic() - _MODULE_LOADED_AT) * 1000
+
+
+# =============================================================================
+# -X importtime Parsing
+# =============================================================================
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def parse_importtime(stderr: str, top: int = 25) -> Dict[str, Any]:
+    """
+    Summarize CPython -X importtime output.
+
+    Args:
+        stderr: Raw stderr of a process run with -X importtime
+        top: Number of modules to keep per ranking
+
+    Returns:
+        Dict with total_ms, module_count, top_cumulative and top_self
+        (each entry: module, self_ms, cumulative_ms)
+    """
+    modules: List[Dict[str, Any]] = []
+    total_us = 0
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        modules.append({
+            "module": name,
+            "self_ms": round(int(self_us) / 1000, 2),
+            "cumulative_ms": round(int(cumulative_us) / 1000, 2),
+        })
+        if len(indent) <= 1:  # top-level import (no nesting indent)
+            total_us += int(cumulative_us)
+
+    return {
+        "total_ms": round(total_us / 1000, 2),
+        "module_count": len(modules),
+        "top_cumulative": sorted(modules, key=lambda m: m["cumulative_ms"], reverse=True)[:top],
+        "top_self": sorted(modules, key=lambda m: m["self_ms"], reverse=True)[:top],
+    }
+
+
+# =============================================================================
+# Startup Profiler
+# =============================================================================
+
+
+class StartupProfiler:
+    """
+    Records startup milestones for one agent and writes the report.
+
+    Args:
+        agent_id: Agent identifier
+        path: Report path (default: STARTUP_PROFILE_PATH or /tmp)
+    """
+
+    def __init__(self, agent_id: str, path: Optional[str] = None):
+        self.agent_id = agent_id
+        self.path = path or STARTUP_PROFILE_PATH or f"/tmp/startup_profile_{agent_id}.json"
+        self.marks: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._written = False
+
+    def mark(self, name: str) -> float:
+        """Record a milestone (ms since process start); first value wins."""
+        with self._lock:
+            if name not in self.marks:
+                self.marks[name] = round(process_uptime_ms(), 1)
+            return self.marks[name]
+
+    def report(self) -> Dict[str, Any]:
+        """Milestones as a machine-readable dict."""
+        with self._lock:
+            marks = dict(self.marks)
+        return {
+            "agent_id": self.agent_id,
+            "pid": os.getpid(),
+            "modules_loaded_ms": marks.get("modules_loaded"),
+            "create_app_ms": marks.get("create_app"),
+            "first_ping_ms": marks.get("first_ping"),
+            "marks": marks,
+        }
+
+    def write_report(self) -> Optional[str]:
+        """Write the JSON report once. Returns the path, or None on failure."""
+        with self._lock:
+            if self._written:
+                return self.path
+            self._written = True
+        report = self.report()
+        logger.info(f"[StartupProfiler] {json.dumps(report)}")
+        try:
+            with open(self.path, "w") as f:
+                json.dump(report, f, indent=2)
+            return self.path
+        except OSError as e:
+            logger.warning(f"[StartupProfiler] Could not write {self.path}: {e}")
+            return None
+
+    def instrument_app(self, app: Any) -> None:
+        """Mark first_ping and write the report when /ping is first served."""
+        profiler = self
+
+        @app.middleware("http")
+        async def _first_ping(request, call_next):
+            response = await call_next(request)
+            if request.url.path == "/ping" and "first_ping" not in profiler.marks:
+                profiler.mark("first_ping")
+                profiler.write_report()
+            return response
+
+
+def profile_create_app(
+    agent_id: str,
+    create_app: Callable[[], Any],
+    enabled: Optional[bool] = None,
+    path: Optional[str] = None,
+) -> Any:
+    """
+    Call create_app(), recording startup milestones when profiling is on.
+
+    Args:
+        agent_id: Agent identifier
+        create_app: The agent's FastAPI app factory
+        enabled: Override STARTUP_PROFILE
+        path: Override report path
+
+    Returns:
+        The FastAPI app (instrumented for first /ping when profiling)
+    """
+    if not (STARTUP_PROFILE_ENABLED if enabled is None else enabled):
+        return create_app()
+
+    profiler = StartupProfiler(agent_id, path=path)
+    profiler.mark("modules_loaded")
+    app = create_app()
+    profiler.mark("create_app")
+    profiler.instrument_app(app)
+    logger.info(
+        f"[StartupProfiler] {agent_id}: modules_loaded={profiler.marks['modules_loaded']}ms "
+        f"create_app={profiler.marks['create_app']}ms"
+    )
+    return app
+
+
+__all__ = [
+    "STARTUP_PROFILE_ENABLED",
+    "StartupProfiler",
+    "parse_importtime",
+    "process_uptime_ms",
+    "profile_create_app",
+]
@@ -32,6 +32,7 @@ import os
 import json
 import uuid
 import logging
+import threading
 import urllib.parse
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
@@ -46,6 +47,8 @@ from botocore.session import Session as BotocoreSession
 from a2a.client import A2ACardResolver, ClientConfig, ClientFactory
 from a2a.types import AgentCapabilities, AgentCard, AgentSkill, Message, Part, Role, TextPart
 
+from shared.timing_ledger import record_call
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -172,6 +175,37 @@ class A2AResponse:
     raw_response: Optional[Dict] = None
 
 
+# =============================================================================
+# Shared boto3 Client (one per region, reused across invocations)
+# =============================================================================
+
+_agentcore_clients: Dict[str, Any] = {}
+_agentcore_clients_lock = threading.Lock()
+
+
+def get_agentcore_client(region: str) -> Any:
+    """
+    Get the shared bedrock-agentcore client for a region.
+
+    boto3 clients are thread-safe; building one per invocation re-resolves
+    credentials and endpoints on every A2A call.
+
+    Args:
+        region: AWS region
+
+    Returns:
+        boto3 bedrock-agentcore client
+    """
+    client = _agentcore_clients.get(region)
+    if client is None:
+        with _agentcore_clients_lock:
+            client = _agentcore_clients.get(region)
+            if client is None:
+                client = boto3.client("bedrock-agentcore", region_name=region)
+                _agentcore_clients[region] = client
+    return client
+
+
 # =============================================================================
 # Strands Framework A2A Client
 # =============================================================================
@@ -275,10 +309,7 @@ class StrandsA2AClient:
 
         try:
             # Use boto3 to call GetAgentCard API
-            client = boto3.client(
-                "bedrock-agentcore",
-                region_name=self.region,
-            )
+            client = get_agentcore_client(self.region)
 
             # Don't pass qualifier - let AWS use default behavior
             # Explicitly passing qualifier="DEFAULT" causes issues with cold endpoints
@@ -407,7 +438,7 @@ class StrandsA2AClient:
                 f"(message_id: {message_id[:8]}...)"
             )
 
-            client = boto3.client("bedrock-agentcore", region_name=self.region)
+            client = get_agentcore_client(self.region)
             response = client.invoke_agent_runtime(
                 agentRuntimeArn=runtime_arn,
                 payload=json.dumps(rpc_message),  # FIXED: was 'body', must be 'payload'
@@ -651,6 +682,7 @@ class StrandsA2AClient:
                 message_id=message_id,
                 session_id=session_id,
             )
+            record_call("a2a", bytes_read=len(result.response or ""))
 
             # Emit success/error audit events
             if audit:
@@ -0,0 +1,482 @@
+"""
+Import-Scoped Timing Ledger for Smart Import
+
+Records where the latency budget of one import goes: per phase and per
+sub-step, wall time, CPU time, bytes read, rows processed and external calls
+(S3, MCP Gateway, A2A, Gemini tokens). Aggregate phase_end durations alone do
+not show whether a slow import was spent in S3, in the Gateway or in Gemini.
+
+Ledgers are keyed by the import session_id, which already travels with every
+A2A hop. Each agent runtime records its own spans under that session_id; the
+DataTransformer stores its full ledger with the job record. Its get_job_status
+tool answers through that agent's LLM, so it returns only the span-free
+rollup (ledger_summary: phases + totals), which check_import_job_status
+merges into the orchestrator's ledger. Spans never leave their runtime.
+
+PII SAFETY: Only names, counters and durations are recorded - same count-only
+pattern as shared/flow_logger.py.
+
+Usage:
+    from shared.timing_ledger import record_call, span
+
+    # Sub-step span (nests under the current phase span)
+    with span(session_id, "etl_stream.transform", phase=4):
+        body = s3.get_object(...)["Body"].read()
+        record_call("s3", bytes_read=len(body))
+        record_usage(rows=row_count)
+
+    # Phase spans are opened/closed by flow_log.phase_start()/phase_end()
+
+Environment:
+    TIMING_LEDGER_ENABLED       - "false" turns every call into a no-op (default: true)
+    TIMING_LEDGER_MAX_SESSIONS  - Ledgers kept per runtime, LRU (default: 256)
+    TIMING_LEDGER_MAX_SPANS     - Spans kept per ledger (default: 500)
+"""
+
+import contextvars
+import functools
+import inspect
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TIMING_LEDGER_ENABLED = os.environ.get("TIMING_LEDGER_ENABLED", "true").lower() == "true"
+TIMING_LEDGER_MAX_SESSIONS = int(os.environ.get("TIMING_LEDGER_MAX_SESSIONS", "256"))
+TIMING_LEDGER_MAX_SPANS = int(os.environ.get("TIMING_LEDGER_MAX_SPANS", "500"))
+
+# Identifies this runtime in ledger summaries (skip merging our own rollup)
+RUNTIME_ID = uuid.uuid4().hex[:12]
+
+# Span currently receiving record_call()/record_usage() counters
+_current_span: contextvars.ContextVar[Optional["TimingSpan"]] = contextvars.ContextVar(
+    "timing_ledger_current_span", default=None
+)
+
+
+# =============================================================================
+# Spans and Ledgers
+# =============================================================================
+
+
+@dataclass
+class TimingSpan:
+    """
+    One timed phase or sub-step of an import.
+
+    CPU time uses time.thread_time(), so it covers the recording thread only
+    (work offloaded to other threads or runtimes shows up as wall time).
+    """
+
+    session_id: str
+    name: str
+    phase: Optional[int] = None
+    kind: str = "step"  # "phase" | "step"
+    parent_id: Optional[str] = None
+    agent: str = field(default_factory=lambda: os.environ.get("AGENT_ID", "unknown"))
+    span_id: str = field(default_factory=lambda: uuid.uuid4().hex[:16])
+    started_at: float = field(default_factory=time.time)
+    wall_ms: Optional[float] = None
+    cpu_ms: Optional[float] = None
+    status: str = "RUNNING"
+    counters: Dict[str, int] = field(default_factory=dict)
+    _wall_start: float = field(default_factory=time.perf_counter, repr=False)
+    _cpu_start: float = field(default_factory=time.thread_time, repr=False)
+
+    @property
+    def is_open(self) -> bool:
+        return self.wall_ms is None
+
+    def add(self, **counters: int) -> None:
+        for key, value in counters.items():
+            if value:
+                self.counters[key] = self.counters.get(key, 0) + int(value)
+
+    def close(self, status: str = "SUCCESS") -> None:
+        if not self.is_open:
+            return
+        self.wall_ms = round((time.perf_counter() - self._wall_start) * 1000, 1)
+        self.cpu_ms = round((time.thread_time() - self._cpu_start) * 1000, 1)
+        self.status = status
+
+    def to_dict(self) -> Dict[str, Any]:
+        wall_ms = self.wall_ms
+        if wall_ms is None:
+            wall_ms = round((time.perf_counter() - self._wall_start) * 1000, 1)
+        return {
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "phase": self.phase,
+            "kind": self.kind,
+            "agent": self.agent,
+            "started_at": self.started_at,
+            "wall_ms": wall_ms,
+            "cpu_ms": self.cpu_ms,
+            "status": self.status,
+            "counters": dict(self.counters),
+        }
+
+
+class TimingLedger:
+    """
+    All spans recorded for one import session, local and merged from peers.
+
+    Attributes:
+        session_id: Import session identifier.
+    """
+
+    def __init__(self, session_id: str, max_spans: int = TIMING_LEDGER_MAX_SPANS) -> None:
+        self.session_id = session_id
+        self.max_spans = max_spans
+        self._spans: List[TimingSpan] = []
+        self._remote: Dict[str, Dict[str, Any]] = {}
+        self._remote_rollups: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def open_span(
+        self,
+        name: str,
+        phase: Optional[int] = None,
+        kind: str = "step",
+        parent: Optional[TimingSpan] = None,
+    ) -> TimingSpan:
+        """Start a span (sub-steps inherit the parent's phase)."""
+        if phase is None and parent is not None:
+            phase = parent.phase
+        span_ = TimingSpan(
+            session_id=self.session_id,
+            name=name,
+            phase=phase,
+            kind=kind,
+            parent_id=parent.span_id if parent is not None else None,
+        )
+        with self._lock:
+            if len(self._spans) >= self.max_spans:
+                self._spans.pop(0)
+            self._spans.append(span_)
+        return span_
+
+    def find_open(self, name: str, phase: Optional[int], kind: str) -> Optional[TimingSpan]:
+        """Most recent still-open span with this name/phase/kind."""
+        with self._lock:
+            for span_ in reversed(self._spans):
+                if span_.is_open and span_.name == name and span_.phase == phase and span_.kind == kind:
+                    return span_
+        return None
+
+    def get_span(self, span_id: Optional[str]) -> Optional[TimingSpan]:
+        with self._lock:
+            return next((s for s in self._spans if s.span_id == span_id), None)
+
+    def merge(self, data: Optional[Dict[str, Any]]) -> None:
+        """
+        Merge a ledger dict produced by another runtime.
+
+        Full ledgers are deduplicated by span_id. Span-free summaries
+        (ledger_summary) replace the previous rollup from the same runtime
+        and are ignored when they come from this runtime.
+
+        Args:
+            data: TimingLedger.to_dict() or ledger_summary() output.
+        """
+        if not data:
+            return
+        with self._lock:
+            if "spans" not in data:
+                runtime_id = data.get("runtime_id") or "remote"
+                if runtime_id != RUNTIME_ID:
+                    self._remote_rollups[runtime_id] = {
+                        "phases": dict(data.get("phases") or {}),
+                        "totals": dict(data.get("totals") or {}),
+                    }
+                return
+            local_ids = {s.span_id for s in self._spans}
+            for remote in data.get("spans") or []:
+                span_id = remote.get("span_id")
+                if span_id and span_id not in local_ids:
+                    self._remote[span_id] = dict(remote)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Ledger as JSON-safe dict: spans, per-phase rollup and totals.
+
+        Phase wall time is the sum of phase spans (falling back to top-level
+        steps when a phase was only recorded by a remote runtime); counters roll
+        up from every span in the phase.
+        """
+        with self._lock:
+            spans = [s.to_dict() for s in self._spans] + list(self._remote.values())
+            rollups = list(self._remote_rollups.values())
+        spans.sort(key=lambda s: s.get("started_at") or 0)
+
+        phases: Dict[str, Dict[str, Any]] = {}
+        totals: Dict[str, int] = {}
+        for span_ in spans:
+            for key, value in (span_.get("counters") or {}).items():
+                totals[key] = totals.get(key, 0) + value
+            if span_.get("phase") is None:
+                continue
+            rollup = phases.setdefault(str(span_["phase"]), {
+                "wall_ms": 0.0, "step_wall_ms": 0.0, "cpu_ms": 0.0, "counters": {},
+            })
+            for key, value in (span_.get("counters") or {}).items():
+                rollup["counters"][key] = rollup["counters"].get(key, 0) + value
+            rollup["cpu_ms"] = round(rollup["cpu_ms"] + (span_.get("cpu_ms") or 0), 1)
+            if span_.get("kind") == "phase":
+                rollup["wall_ms"] = round(rollup["wall_ms"] + (span_.get("wall_ms") or 0), 1)
+            elif span_.get("parent_id") is None:
+                rollup["step_wall_ms"] = round(rollup["step_wall_ms"] + (span_.get("wall_ms") or 0), 1)
+
+        for rollup in phases.values():
+            if not rollup["wall_ms"]:
+                rollup["wall_ms"] = rollup["step_wall_ms"]
+            del rollup["step_wall_ms"]
+
+        for remote in rollups:
+            for key, value in remote["totals"].items():
+                totals[key] = totals.get(key, 0) + value
+            for number, remote_phase in remote["phases"].items():
+                rollup = phases.setdefault(number, {"wall_ms": 0.0, "cpu_ms": 0.0, "counters": {}})
+                rollup["wall_ms"] = round(rollup["wall_ms"] + (remote_phase.get("wall_ms") or 0), 1)
+                rollup["cpu_ms"] = round(rollup["cpu_ms"] + (remote_phase.get("cpu_ms") or 0), 1)
+                for key, value in (remote_phase.get("counters") or {}).items():
+                    rollup["counters"][key] = rollup["counters"].get(key, 0) + value
+
+        return {
+            "runtime_id": RUNTIME_ID,
+            "session_id": self.session_id,
+            "spans": spans,
+            "phases": phases,
+            "totals": totals,
+        }
+
+
+# =============================================================================
+# Registry (one ledger per import session, LRU-bounded per runtime)
+# =============================================================================
+
+_ledgers: "OrderedDict[str, TimingLedger]" = OrderedDict()
+_ledgers_lock = threading.Lock()
+
+
+def get_ledger(session_id: Optional[str], create: bool = True) -> Optional[TimingLedger]:
+    """
+    Get the ledger for an import session.
+
+    Args:
+        session_id: Import session identifier.
+        create: Create the ledger when missing.
+
+    Returns:
+        TimingLedger, or None when disabled, session_id is empty or missing.
+    """
+    if not TIMING_LEDGER_ENABLED or not session_id:
+        return None
+    with _ledgers_lock:
+        ledger = _ledgers.get(session_id)
+        if ledger is None:
+            if not create:
+                return None
+            ledger = _ledgers[session_id] = TimingLedger(session_id)
+            while len(_ledgers) > TIMING_LEDGER_MAX_SESSIONS:
+                _ledgers.popitem(last=False)
+        else:
+            _ledgers.move_to_end(session_id)
+        return ledger
+
+
+def ledger_snapshot(session_id: Optional[str]) -> Optional[Dict[str, Any]]:
+    """to_dict() of the session ledger, or None when nothing was recorded."""
+    ledger = get_ledger(session_id, create=False)
+    return ledger.to_dict() if ledger is not None else None
+
+
+def ledger_summary(data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Span-free view of a ledger dict (phases + totals).
+
+    Use this for anything that is returned through an LLM tool call; the
+    span list (up to TIMING_LEDGER_MAX_SPANS entries) stays local.
+    """
+    if not data:
+        return None
+    return {
+        "runtime_id": data.get("runtime_id") or RUNTIME_ID,
+        "session_id": data.get("session_id"),
+        "phases": data.get("phases") or {},
+        "totals": data.get("totals") or {},
+    }
+
+
+def merge_ledger(session_id: Optional[str], data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Merge a remote ledger into the local one and return the combined view.
+
+    Returns:
+        Combined ledger dict, or the remote dict unchanged when disabled.
+    """
+    ledger = get_ledger(session_id)
+    if ledger is None:
+        return data
+    ledger.merge(data)
+    return ledger.to_dict()
+
+
+def clear_ledgers() -> None:
+    """Drop every ledger in this runtime (tests)."""
+    with _ledgers_lock:
+        _ledgers.clear()
+
+
+# =============================================================================
+# Recording API
+# =============================================================================
+
+
+def begin_phase(session_id: Optional[str], phase: int, name: str) -> Optional[TimingSpan]:
+    """
+    Open a phase span and make it current (called by flow_log.phase_start).
+
+    Returns:
+        The span, or None when the ledger is disabled.
+    """
+    ledger = get_ledger(session_id)
+    if ledger is None:
+        return None
+    span_ = ledger.open_span(name, phase=phase, kind="phase", parent=_current_span.get())
+    _current_span.set(span_)
+    return span_
+
+
+def end_phase(session_id: Optional[str], phase: int, name: str, status: str = "SUCCESS") -> Optional[TimingSpan]:
+    """
+    Close the matching open phase span (called by flow_log.phase_end).
+
+    Returns:
+        The closed span, or None when no matching span is open.
+    """
+    ledger = get_ledger(session_id, create=False)
+    if ledger is None:
+        return None
+    span_ = ledger.find_open(name, phase, "phase")
+    if span_ is None:
+        return None
+    span_.close(status)
+    if _current_span.get() is span_:
+        _current_span.set(ledger.get_span(span_.parent_id))
+    return span_
+
+
+@contextmanager
+def span(session_id: Optional[str], name: str, phase: Optional[int] = None) -> Iterator[Optional[TimingSpan]]:
+    """
+    Time a sub-step under the current span (or at top level when none).
+
+    Args:
+        session_id: Import session identifier (None = use the current span's).
+        name: Step name (e.g. "etl_stream.transform").
+        phase: Phase number (default: inherited from the parent span).
+
+    Yields:
+        The span, or None when the ledger is disabled.
+    """
+    parent = _current_span.get()
+    ledger = get_ledger(session_id or (parent.session_id if parent else None))
+    if ledger is None:
+        yield None
+        return
+
+    if parent is not None and parent.session_id != ledger.session_id:
+        parent = None
+    span_ = ledger.open_span(name, phase=phase, parent=parent)
+    token = _current_span.set(span_)
+    try:
+        yield span_
+        span_.close("SUCCESS")
+    except BaseException:
+        span_.close("FAILED")
+        raise
+    finally:
+        _current_span.reset(token)
+
+
+def timed(name: str, phase: Optional[int] = None, session_arg: str = "session_id") -> Callable:
+    """
+    Decorator form of span() that reads session_id from the call arguments.
+
+    Example:
+        @tool
+        @timed("etl_stream.transform", phase=4)
+        def stream_and_transform(s3_key: str, mappings_json: str, session_id: str, ...):
+            ...
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                session_id = signature.bind_partial(*args, **kwargs).arguments.get(session_arg)
+            except TypeError:
+                session_id = None
+            with span(session_id, name, phase=phase):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def record_call(service: str, bytes_read: int = 0, **counters: int) -> None:
+    """
+    Attribute one external call to the current span (no-op outside a span).
+
+    Args:
+        service: "s3" | "mcp" | "a2a" | "gemini" (counted as "<service>_calls").
+        bytes_read: Response bytes (rolled into the shared "bytes_read" counter).
+        **counters: Service-specific counters, prefixed with the service name
+            (e.g. record_call("gemini", input_tokens=10) -> gemini_input_tokens).
+    """
+    span_ = _current_span.get()
+    if span_ is None:
+        return
+    span_.add(**{f"{service}_calls": 1, "bytes_read": bytes_read})
+    span_.add(**{f"{service}_{key}": value for key, value in counters.items()})
+
+
+def record_usage(**counters: int) -> None:
+    """Add unprefixed counters (e.g. rows=1000) to the current span."""
+    span_ = _current_span.get()
+    if span_ is not None:
+        span_.add(**counters)
+
+
+def current_span() -> Optional[TimingSpan]:
+    """Span currently receiving counters, if any."""
+    return _current_span.get()
+
+
+__all__ = [
+    "TimingSpan",
+    "TimingLedger",
+    "get_ledger",
+    "ledger_snapshot",
+    "ledger_summary",
+    "merge_ledger",
+    "clear_ledgers",
+    "begin_phase",
+    "end_phase",
+    "span",
+    "timed",
+    "record_call",
+    "record_usage",
+    "current_span",
+]
@@ -0,0 +1,121 @@
+# =============================================================================
+# Write Sharding - Spread hot date/type partition keys across N shards
+# =============================================================================
+# Date-bucketed keys (DATE#YYYY-MM, LOG#YYYY-MM-DD, TYPE#AGENT_ACTIVITY) put
+# every write of a period into one DynamoDB partition, which throttles under
+# import bursts. With N > 1 shards, writers append a stable suffix derived
+# from the item id (DATE#2026-01#3) and readers scatter-gather all N shards
+# in parallel, merging the sorted results by sort key.
+#
+# Usage:
+#   from shared.write_sharding import get_shard_count, sharded_key, scatter_gather
+#   shards = get_shard_count("MOVEMENT_DATE_SHARDS")
+#   item["GSI5PK"] = sharded_key(f"DATE#{month}", movement_id, shards)
+#   items = scatter_gather(f"DATE#{month}", shards, query_fn, "GSI5SK", limit=100)
+#
+# N = 1 (default) keeps the original unsuffixed keys. When N > 1, readers
+# also query the unsuffixed key so items written before sharding stay visible.
+# =============================================================================
+
+import heapq
+import itertools
+import logging
+import os
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+WRITE_SHARD_READ_WORKERS = int(os.environ.get("WRITE_SHARD_READ_WORKERS", "8"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the process-wide executor used for shard queries."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=WRITE_SHARD_READ_WORKERS, thread_name_prefix="shard-read"
+            )
+        return _executor
+
+
+def get_shard_count(env_var: str, default: int = 1) -> int:
+    """
+    Read a shard count from the environment (minimum 1).
+
+    Args:
+        env_var: Environment variable name (e.g., "AUDIT_LOG_SHARDS")
+        default: Value when the variable is unset or invalid
+    """
+    try:
+        return max(1, int(os.environ.get(env_var, default)))
+    except ValueError:
+        logger.warning(f"[Sharding] Invalid {env_var}={os.environ.get(env_var)!r}, using {default}")
+        return default
+
+
+def sharded_key(base_key: str, item_key: str, shard_count: int) -> str:
+    """
+    Write key for an item: base_key#<crc32(item_key) % shard_count>.
+
+    The shard is derived from the item id so retries of the same item land
+    on the same partition. Returns base_key unchanged when shard_count <= 1.
+    """
+    if shard_count <= 1:
+        return base_key
+    return f"{base_key}#{zlib.crc32(item_key.encode('utf-8')) % shard_count}"
+
+
+def shard_keys(base_key: str, shard_count: int) -> List[str]:
+    """All keys a reader must query for base_key (including the legacy key)."""
+    if shard_count <= 1:
+        return [base_key]
+    return [base_key] + [f"{base_key}#{n}" for n in range(shard_count)]
+
+
+def scatter_gather(
+    base_key: str,
+    shard_count: int,
+    query: Callable[[str], List[Dict[str, Any]]],
+    sort_key: str,
+    limit: int = 100,
+    descending: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Query every shard of base_key in parallel and merge by sort key.
+
+    Args:
+        base_key: Unsharded partition key (e.g., "DATE#2026-01")
+        shard_count: Number of write shards
+        query: Function(partition_key) -> items sorted by sort_key in the
+            requested direction, at most `limit` items
+        sort_key: Attribute used to merge shard results
+        limit: Maximum merged items
+        descending: True when shard results are newest first
+
+    Returns:
+        Up to `limit` items, globally ordered by sort_key
+    """
+    keys = shard_keys(base_key, shard_count)
+    if len(keys) == 1:
+        return query(keys[0])[:limit]
+
+    results = list(_get_executor().map(query, keys))
+    merged = heapq.merge(
+        *results, key=lambda item: item.get(sort_key, ""), reverse=descending
+    )
+    return list(itertools.islice(merged, limit))
+
+
+__all__ = [
+    "get_shard_count",
+    "sharded_key",
+    "shard_keys",
+    "scatter_gather",
+]
@@ -220,13 +220,18 @@ def trace_subsegment(name: str, annotations: Optional[dict] = None):
         name: Subsegment name
         annotations: Optional dict of annotations to add
 
+    Inside a Smart Import phase the subsegment is also recorded as a sub-step
+    span in the import's timing ledger (shared/timing_ledger.py).
+
     Example:
         with trace_subsegment("fetch_from_memory", {"query": "column mappings"}):
             records = await memory_client.retrieve_memory_records(query)
     """
+    from shared.timing_ledger import span
+
     recorder = _get_xray_recorder()
 
-    with recorder.in_subsegment(name) as subsegment:
+    with recorder.in_subsegment(name) as subsegment, span(None, name):
         if annotations:
             for key, value in annotations.items():
                 subsegment.put_annotation(key, value)
@@ -142,6 +142,9 @@ _mock_boto3.client = MagicMock(return_value=MagicMock())
 _mock_boto3.resource = MagicMock(return_value=MagicMock())
 _mock_boto3.Session = MagicMock(return_value=MagicMock())
 sys.modules['boto3'] = _mock_boto3
+# shared/permissions_client.py: from boto3.dynamodb.conditions import Key
+sys.modules['boto3.dynamodb'] = _mock_boto3.dynamodb
+sys.modules['boto3.dynamodb.conditions'] = _mock_boto3.dynamodb.conditions
 
 
 # botocore.exceptions.ClientError must be a real exception class for except clauses
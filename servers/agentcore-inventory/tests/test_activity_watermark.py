@@ -0,0 +1,211 @@
+# =============================================================================
+# Tests for ObservationAgent Incremental Scanning
+# =============================================================================
+# Unit tests for watermark-based scan_recent_activity.
+#
+# These tests verify:
+# - Watermark ordering (newer timestamps, same-timestamp tie breaks)
+# - Watermarks persist to / load from DynamoDB
+# - Incremental scans fold only new records and keep cumulative summaries
+# - Records older than the window are dropped; summaries never exceed it
+# - analyze_patterns reuses the saved aggregates
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_activity_watermark.py -v
+# =============================================================================
+
+import importlib
+import json
+from unittest.mock import patch
+
+import pytest
+
+from agents.specialists.observation.tools import activity_watermark
+from agents.specialists.observation.tools.activity_watermark import (
+    ActivityWatermark,
+    load_watermark,
+    reset_watermarks,
+    save_watermark,
+)
+
+scan_module = importlib.import_module(
+    "agents.specialists.observation.tools.scan_recent_activity"
+)
+analyze_module = importlib.import_module(
+    "agents.specialists.observation.tools.analyze_patterns"
+)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class _FakeTable:
+    """In-memory stand-in for a DynamoDB Table resource."""
+
+    def __init__(self):
+        self.items = {}
+
+    def put_item(self, Item):
+        self.items[(Item["PK"], Item["SK"])] = Item
+
+    def get_item(self, Key):
+        item = self.items.get((Key["PK"], Key["SK"]))
+        return {"Item": item} if item else {}
+
+
+class _FakeMemory:
+    """Stand-in for AgentMemoryManager returning a mutable record list."""
+
+    episodes = []
+    queries = []
+
+    def __init__(self, agent_id, actor_id):
+        pass
+
+    async def observe_facts(self, query, limit=10):
+        return []
+
+    async def observe_episodes(self, query, limit=10):
+        _FakeMemory.queries.append(query)
+        return list(_FakeMemory.episodes)
+
+
+def _record(record_id, hour, content="Missing column x", outcome="error", session_id="s1"):
+    return {
+        "memoryRecordId": record_id,
+        "content": content,
+        "outcome": outcome,
+        "session_id": session_id,
+        "category": "import",
+        "timestamp": f"2099-01-01T{hour:02d}:00:00Z",
+    }
+
+
+@pytest.fixture
+def table():
+    fake = _FakeTable()
+    reset_watermarks()
+    with patch.object(activity_watermark, "_get_table", return_value=fake):
+        yield fake
+    reset_watermarks()
+
+
+@pytest.fixture
+def memory():
+    _FakeMemory.episodes = []
+    _FakeMemory.queries = []
+    with patch.object(scan_module, "AgentMemoryManager", _FakeMemory):
+        yield _FakeMemory
+
+
+def _scan(**kwargs):
+    return json.loads(scan_module.scan_recent_activity.__wrapped__("user-1", **kwargs))
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestActivityWatermark:
+    """Tests for watermark ordering and persistence."""
+
+    def test_newer_and_tied_records(self):
+        watermark = ActivityWatermark.start("user-1", 24)
+        watermark.advance([("a", "2099-01-01T10:00:00Z")])
+
+        assert watermark.is_new("b", "2099-01-01T11:00:00Z")
+        assert watermark.is_new("b", "2099-01-01T10:00:00Z")
+        assert not watermark.is_new("a", "2099-01-01T10:00:00Z")
+        assert not watermark.is_new("c", "2099-01-01T09:00:00Z")
+
+    def test_round_trip_through_dynamodb(self, table):
+        watermark = ActivityWatermark.start("user-1", 24)
+        watermark.advance([("a", "2099-01-01T10:00:00Z")])
+        assert save_watermark(watermark) is True
+
+        reset_watermarks()
+        loaded = load_watermark("user-1", 24)
+        assert loaded.last_timestamp == "2099-01-01T10:00:00Z"
+        assert ("USER#user-1", "OBSERVATION#WATERMARK#24") in table.items
+
+    def test_expired_watermark_is_dropped(self, table):
+        watermark = ActivityWatermark.start("user-1", 24)
+        watermark.window_started_at = "2000-01-01T00:00:00Z"
+        save_watermark(watermark)
+        assert load_watermark("user-1", 24) is None
+
+
+class TestIncrementalScan:
+    """Tests for scan_recent_activity(incremental=True)."""
+
+    def test_second_scan_only_folds_new_records(self, table, memory):
+        memory.episodes = [_record("r1", 10), _record("r2", 11, session_id="s2")]
+        first = _scan(incremental=True)
+        assert first["new_records"] == 2
+
+        memory.episodes = [
+            _record("r2", 11, session_id="s2"),
+            _record("r3", 12, session_id="s3"),
+        ]
+        second = _scan(incremental=True)
+
+        assert second["new_records"] == 1
+        assert [e["record_id"] for e in second["episodes"]] == ["r3"]
+        assert second["activity_summary"]["total_episodes"] == 3
+        assert second["activity_summary"]["unique_sessions"] == 3
+        assert second["watermark"] == "2099-01-01T12:00:00Z"
+
+    def test_full_scan_ignores_watermark(self, table, memory):
+        memory.episodes = [_record("r1", 10)]
+        _scan(incremental=True)
+        result = _scan()
+
+        assert result["incremental"] is False
+        assert result["activity_summary"]["total_episodes"] == 1
+
+    def test_analyze_patterns_uses_saved_aggregates(self, table, memory):
+        memory.episodes = [
+            _record("r1", 10, session_id="s1"),
+            _record("r2", 11, session_id="s2"),
+            _record("r3", 12, session_id="s3"),
+        ]
+        _scan(incremental=True)
+        memory.episodes = [_record("r4", 13, session_id="s4")]
+        activity = scan_module.scan_recent_activity.__wrapped__("user-1", incremental=True)
+
+        result = json.loads(analyze_module.analyze_patterns.__wrapped__(activity, pattern_type="error"))
+
+        assert result["patterns"][0]["subtype"] == "SchemaMismatch"
+        assert result["patterns"][0]["frequency"] == 4
+
+
+class TestScanWindow:
+    """Tests for the time-window cutoff on retrieved records."""
+
+    def test_records_older_than_window_are_dropped(self, table, memory):
+        stale = _record("old", 10)
+        stale["timestamp"] = "2000-01-01T10:00:00Z"
+        memory.episodes = [stale, _record("r1", 11)]
+
+        full = _scan()
+        delta = _scan(incremental=True)
+
+        assert [e["record_id"] for e in full["episodes"]] == ["r1"]
+        assert full["activity_summary"]["total_episodes"] == 1
+        assert delta["new_records"] == 1
+
+    def test_summary_buckets_outside_window_are_pruned(self, table, memory):
+        memory.episodes = [_record("r1", 10)]
+        _scan(incremental=True)
+        watermark = load_watermark("user-1", 24)
+        watermark.summary["2000-01-01T00:00:00Z"] = scan_module._merge_summary(
+            {}, [], [_record("old", 0)] * 5
+        )
+
+        memory.episodes = [_record("r2", 11)]
+        result = _scan(incremental=True)
+
+        assert result["activity_summary"]["total_episodes"] == 2
+        assert "2000-01-01T00:00:00Z" not in load_watermark("user-1", 24).summary
@@ -0,0 +1,134 @@
+# =============================================================================
+# Tests for Agent Instance Pool
+# =============================================================================
+# Unit tests for shared/agent_pool.py.
+#
+# These tests verify:
+# - Shells are reused instead of rebuilt
+# - Per-request context is injected and cleared (no cross-session leaks)
+# - Hooks with a sync reset() are reset between requests
+# - Failed requests discard their shell
+# - Idle shells are bounded by max_size
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_agent_pool.py -v
+# =============================================================================
+
+import pytest
+
+from shared.agent_pool import AgentPool, AgentShell
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class _FakeState:
+    """Mimics strands AgentState (JSON dict with get/set/delete)."""
+
+    def __init__(self):
+        self._data = {}
+
+    def get(self, key=None):
+        return dict(self._data) if key is None else self._data.get(key)
+
+    def set(self, key, value):
+        self._data[key] = value
+
+    def delete(self, key):
+        self._data.pop(key, None)
+
+
+class _FakeHook:
+    def __init__(self):
+        self.resets = 0
+
+    def reset(self):
+        self.resets += 1
+
+
+class _FakeAgent:
+    def __init__(self):
+        self.messages = []
+        self.state = _FakeState()
+        self.system_prompt = "base"
+
+    def __call__(self, prompt):
+        self.messages.append({"role": "user", "content": prompt})
+        return self.state.get("session_id")
+
+
+@pytest.fixture
+def built():
+    return []
+
+
+@pytest.fixture
+def pool(built):
+    def factory():
+        shell = AgentShell(agent=_FakeAgent(), hooks=[_FakeHook()])
+        built.append(shell)
+        return shell
+
+    def inject(agent, session_id=None, **_):
+        agent.system_prompt = f"session={session_id}"
+
+    return AgentPool("test", factory=factory, inject=inject, max_size=2)
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestAgentPool:
+    """Tests for AgentPool checkout/return."""
+
+    def test_shell_is_reused(self, pool, built):
+        with pool.checkout(session_id="s1") as agent:
+            agent("hi")
+        with pool.checkout(session_id="s2") as agent:
+            agent("hi")
+
+        assert len(built) == 1
+        assert pool.stats()["reused"] == 1
+
+    def test_context_is_injected_and_cleared(self, pool):
+        with pool.checkout(session_id="s1") as agent:
+            assert agent("hello") == "s1"
+            assert agent.system_prompt == "session=s1"
+
+        with pool.checkout(session_id="s2") as agent:
+            assert agent.messages == []
+            assert agent.state.get("session_id") == "s2"
+            assert agent.system_prompt == "session=s2"
+
+    def test_hooks_are_reset(self, pool, built):
+        with pool.checkout(session_id="s1"):
+            pass
+        # reset on checkout and on return
+        assert built[0].hooks[0].resets == 2
+
+    def test_failed_request_discards_shell(self, pool, built):
+        with pytest.raises(RuntimeError):
+            with pool.checkout(session_id="s1"):
+                raise RuntimeError("boom")
+
+        with pool.checkout(session_id="s2"):
+            pass
+
+        assert len(built) == 2
+        assert pool.stats()["discarded"] == 1
+
+    def test_concurrent_checkouts_get_distinct_shells(self, pool):
+        with pool.checkout(session_id="a") as first, pool.checkout(session_id="b") as second:
+            assert first is not second
+
+    def test_idle_shells_are_bounded(self, pool):
+        with pool.checkout(session_id="a"), pool.checkout(session_id="b"), \
+                pool.checkout(session_id="c"):
+            pass
+
+        stats = pool.stats()
+        assert stats["idle"] == 2
+        assert stats["overflow"] == 1
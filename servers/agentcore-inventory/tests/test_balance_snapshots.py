@@ -0,0 +1,186 @@
+# =============================================================================
+# Tests for Balance Snapshots and Materialized View Refresh
+# =============================================================================
+# Unit tests for the snapshot-backed reads and refresh_materialized_views()
+# in core_tools/postgres_client.py (no database required - queries are fakes).
+#
+# These tests verify:
+# - get_balance reads balance_snapshots without joins (flag restores joins)
+# - Snapshot reads fall back to joins when 008 is not applied
+# - reconcile_with_sap compares against per-location rollups
+# - Views refresh CONCURRENTLY only when change volume or staleness is due
+# - Accounted change-log entries are cleared; busy views are skipped
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_balance_snapshots.py -v
+# =============================================================================
+
+import pytest
+
+from core_tools import postgres_client
+from core_tools.postgres_client import SGAPostgresClient
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class _FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None, prepare=None):
+        self.conn.executed.append((" ".join(query.split()), params))
+
+    def fetchone(self):
+        return {"locked": self.conn.lock_available}
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.executed = []
+        self.commits = 0
+        self.lock_available = True
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+class _UndefinedTable(Exception):
+    sqlstate = "42P01"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("RDS_SECRET_ARN", "arn:aws:secretsmanager:us-east-2:1:secret:sga")
+    monkeypatch.setattr(postgres_client, "RDS_BALANCE_SNAPSHOTS", True)
+    monkeypatch.setattr(postgres_client, "_balance_snapshots_missing", False)
+    pg = SGAPostgresClient()
+    pg.conn = _FakeConnection()
+    pg.queries = []
+    pg.rows = []
+    pg.missing_snapshots = False
+
+    def _execute_query(query, params=None, fetch_all=True, prepare=None):
+        query = " ".join(query.split())
+        pg.queries.append((query, params))
+        if pg.missing_snapshots and ("balance_snapshots" in query or "balance_location_rollups" in query):
+            raise _UndefinedTable('relation "sga.balance_snapshots" does not exist')
+        return pg.rows
+
+    pg._execute_query = _execute_query
+    monkeypatch.setattr(SGAPostgresClient, "_get_connection", lambda self: self.conn)
+    return pg
+
+
+def _state(view_name, pending, age=0.0, max_log_id=None):
+    return {
+        "view_name": view_name,
+        "pending_changes": pending,
+        "max_log_id": max_log_id,
+        "oldest_change_age_seconds": age if pending else None,
+    }
+
+
+def _refreshes(conn):
+    return [q for q, _ in conn.executed if q.startswith("REFRESH")]
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestSnapshotReads:
+    """Tests for snapshot/rollup-backed reads."""
+
+    def test_get_balance_reads_snapshots(self, client):
+        client.rows = [
+            {"description": "Switch", "quantity_total": 5, "quantity_reserved": 1, "quantity_available": 4},
+            {"description": "Switch", "quantity_total": 3, "quantity_reserved": 0, "quantity_available": 3},
+        ]
+        result = client.get_balance("PN-1", location_id="LOC-A")
+
+        query, params = client.queries[0]
+        assert "FROM sga.balance_snapshots" in query and "JOIN" not in query
+        assert query.endswith("AND location_code = %s") and params == ("PN-1", "LOC-A")
+        assert result["summary"] == {"total_quantity": 8, "total_reserved": 1, "total_available": 7}
+
+    def test_flag_restores_join_query(self, client, monkeypatch):
+        monkeypatch.setattr(postgres_client, "RDS_BALANCE_SNAPSHOTS", False)
+        client.get_balance("PN-1", project_id="PRJ-1")
+
+        query, _ = client.queries[0]
+        assert "FROM sga.balances b" in query and query.endswith("AND p.project_code = %s")
+
+    def test_missing_tables_fall_back_to_joins(self, client):
+        client.missing_snapshots = True
+
+        client.get_balance("PN-1")
+        client.reconcile_with_sap([])
+        client.get_balance("PN-2")
+
+        queries = [q for q, _ in client.queries]
+        assert "FROM sga.balance_snapshots" in queries[0]
+        assert "FROM sga.balances b" in queries[1]
+        assert "FROM sga.balances b" in queries[2] and "GROUP BY" in queries[2]
+        assert "FROM sga.balances b" in queries[3] and len(queries) == 4
+
+    def test_reconcile_uses_location_rollups(self, client):
+        client.rows = [
+            {"part_number": "PN-1", "location_code": "LOC-A", "sga_quantity": 10},
+            {"part_number": "PN-2", "location_code": "LOC-A", "sga_quantity": 4},
+        ]
+        result = client.reconcile_with_sap([
+            {"part_number": "PN-1", "location_code": "LOC-A", "quantity": 10},
+        ])
+
+        assert "FROM sga.balance_location_rollups" in client.queries[0][0]
+        assert result["summary"]["matches_count"] == 1
+        assert result["sga_only"][0]["part_number"] == "PN-2"
+
+
+class TestMaterializedViewRefresh:
+    """Tests for change-driven refresh scheduling."""
+
+    def test_refreshes_only_views_over_threshold(self, client):
+        client.rows = [
+            _state("mv_inventory_summary", 800, max_log_id=42),
+            _state("mv_location_utilization", 3, age=10.0),
+        ]
+        result = client.refresh_materialized_views()
+
+        assert _refreshes(client.conn) == [
+            "REFRESH MATERIALIZED VIEW CONCURRENTLY sga.mv_inventory_summary"
+        ]
+        assert ("DELETE FROM sga.mv_change_log WHERE view_name = %s AND log_id <= %s",
+                ("mv_inventory_summary", 42)) in client.conn.executed
+        assert [r["view_name"] for r in result["refreshed"]] == ["mv_inventory_summary"]
+        assert result["skipped"][0]["reason"] == "below threshold"
+
+    def test_stale_changes_trigger_refresh(self, client, monkeypatch):
+        monkeypatch.setattr(postgres_client, "RDS_MV_REFRESH_MAX_STALENESS_SECONDS", 60)
+        client.rows = [_state("mv_location_utilization", 3, age=120.0, max_log_id=7)]
+
+        assert len(client.refresh_materialized_views()["refreshed"]) == 1
+
+    def test_busy_view_is_skipped(self, client):
+        client.conn.lock_available = False
+        client.rows = [_state("mv_inventory_summary", 0)]
+
+        result = client.refresh_materialized_views(force=True)
+
+        assert _refreshes(client.conn) == []
+        assert result["skipped"][0]["reason"] == "refresh in progress"
@@ -0,0 +1,292 @@
+# =============================================================================
+# Tests for Enrichment Cache
+# =============================================================================
+# Unit tests for the read-through EnrichmentCache used by enrichment_tools.
+#
+# These tests verify:
+# - Key normalization (case/whitespace, "Unknown" manufacturer)
+# - LRU hits, eviction and TTL expiry
+# - Negative (NOT_FOUND) caching served from the S3 index entry
+# - Flush writes one index entry per key (no shared read-modify-write)
+# - Entries written or refreshed by other containers are picked up
+# - enrich_batch only indexes results whose S3 write succeeded
+# - enrich_batch skips Tavily for cached SKUs
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_enrichment_cache.py -v
+# =============================================================================
+
+import io
+import json
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from core_tools.enrichment_cache import (
+    ENTRY_PREFIX,
+    EnrichmentCache,
+    normalize_cache_key,
+)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class _FakeBoto3S3:
+    """Minimal in-memory stand-in for the boto3 S3 client."""
+
+    def __init__(self):
+        self.objects = {}
+        self.get_calls = 0
+
+    def get_object(self, Bucket, Key):
+        self.get_calls += 1
+        if Key not in self.objects:
+            raise Exception("An error occurred (NoSuchKey) when calling GetObject")
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+    def put_object(self, Bucket, Key, Body, ContentType=None):
+        self.objects[Key] = Body
+
+
+class _FakeDocsClient:
+    """Stand-in for EquipmentDocsS3Client."""
+
+    bucket = "test-equipment-docs"
+
+    def __init__(self):
+        self.client = _FakeBoto3S3()
+
+    def get_doc_path(self, part_number, doc_type, filename):
+        return f"equipment-docs/{part_number}/{doc_type}/{filename}"
+
+
+def _result(part_number="C9200-24P", status="success", age_hours=0, manufacturer="Cisco"):
+    timestamp = (datetime.utcnow() - timedelta(hours=age_hours)).isoformat() + "Z"
+    return {
+        "part_number": part_number,
+        "serial_number": None,
+        "status": status,
+        "manufacturer": manufacturer,
+        "description": f"{manufacturer} {part_number}",
+        "specifications": {"ports": "24 port"},
+        "documents": [],
+        "sources": ["https://cisco.com/c9200"],
+        "confidence_score": 0.9,
+        "error_message": None,
+        "enrichment_timestamp": timestamp,
+    }
+
+
+@pytest.fixture
+def docs_client():
+    return _FakeDocsClient()
+
+
+@pytest.fixture
+def cache(docs_client):
+    return EnrichmentCache(
+        s3_client=docs_client,
+        ttl_hours=24,
+        negative_ttl_hours=1,
+        max_entries=3,
+    )
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestNormalizeCacheKey:
+    """Tests for cache key normalization."""
+
+    def test_case_and_whitespace_are_ignored(self):
+        assert normalize_cache_key(" c9200-24p ", "CISCO") == ("C9200-24P", "cisco")
+
+    def test_hyphens_are_significant(self):
+        assert normalize_cache_key("C920024P")[0] != normalize_cache_key("C9200-24P")[0]
+
+    def test_unknown_manufacturer_is_empty(self):
+        assert normalize_cache_key("X", "Unknown") == normalize_cache_key("X", None)
+
+
+class TestEnrichmentCache:
+    """Tests for EnrichmentCache lookups and persistence."""
+
+    def test_miss_on_empty_cache(self, cache):
+        assert cache.get("C9200-24P", "Cisco") is None
+        assert cache.stats()["misses"] == 1
+
+    def test_put_then_get_hits_lru(self, cache, docs_client):
+        cache.put(_result(), manufacturer_hint="Cisco")
+        calls_before = docs_client.client.get_calls
+
+        cached = cache.get("c9200-24p", "cisco")
+
+        assert cached["status"] == "success"
+        assert docs_client.client.get_calls == calls_before
+
+    def test_detected_manufacturer_key_is_recorded(self, cache):
+        cache.put(_result(manufacturer="Cisco"), manufacturer_hint=None)
+        assert cache.get("C9200-24P", "Cisco") is not None
+        assert cache.get("C9200-24P") is not None
+
+    def test_expired_positive_result_is_a_miss(self, cache):
+        cache.put(_result(age_hours=48), manufacturer_hint="Cisco")
+        assert cache.get("C9200-24P", "Cisco") is None
+
+    def test_error_results_are_not_cached(self, cache):
+        cache.put(_result(status="error"), manufacturer_hint="Cisco")
+        assert cache.get("C9200-24P", "Cisco") is None
+
+    def test_lru_is_bounded(self, cache):
+        for i in range(5):
+            cache.put(_result(part_number=f"PN-{i}", manufacturer=""), manufacturer_hint=None)
+        assert cache.stats()["lru_size"] == 3
+
+    def test_negative_result_served_from_index(self, docs_client):
+        writer = EnrichmentCache(s3_client=docs_client, negative_ttl_hours=1)
+        writer.put(_result(status="not_found", manufacturer="HP"), manufacturer_hint="HP")
+        assert writer.flush() is True
+
+        reader = EnrichmentCache(s3_client=docs_client, negative_ttl_hours=1)
+        cached = reader.get("C9200-24P", "HP")
+
+        assert cached["status"] == "not_found"
+        assert cached["documents"] == []
+
+    def test_positive_result_read_back_from_s3(self, docs_client):
+        result = _result()
+        docs_client.client.objects[
+            "equipment-docs/C9200-24P/enrichment_metadata/enrichment_result.json"
+        ] = json.dumps(result).encode("utf-8")
+
+        writer = EnrichmentCache(s3_client=docs_client)
+        writer.put(result, manufacturer_hint="Cisco")
+        writer.flush()
+
+        reader = EnrichmentCache(s3_client=docs_client)
+        assert reader.get("C9200-24P", "Cisco")["description"] == "Cisco C9200-24P"
+
+    def test_flush_writes_one_entry_per_key_without_reads(self, docs_client):
+        first = EnrichmentCache(s3_client=docs_client)
+        second = EnrichmentCache(s3_client=docs_client)
+
+        first.put(_result(part_number="A-1", status="not_found", manufacturer="Dell"), manufacturer_hint="Dell")
+        second.put(_result(part_number="B-2", status="not_found", manufacturer="Dell"), manufacturer_hint="Dell")
+        first.flush()
+        second.flush()
+
+        assert docs_client.client.get_calls == 0
+        entries = sorted(k for k in docs_client.client.objects if k.startswith(ENTRY_PREFIX))
+        assert entries == [f"{ENTRY_PREFIX}A-1%7Cdell.json", f"{ENTRY_PREFIX}B-2%7Cdell.json"]
+
+        reader = EnrichmentCache(s3_client=docs_client)
+        assert reader.get("A-1", "Dell")["status"] == "not_found"
+        assert reader.get("B-2", "Dell")["status"] == "not_found"
+
+    def test_miss_then_entry_written_elsewhere_is_seen(self, docs_client):
+        reader = EnrichmentCache(s3_client=docs_client)
+        assert reader.get("A-1", "Dell") is None
+
+        writer = EnrichmentCache(s3_client=docs_client)
+        writer.put(_result(part_number="A-1", status="not_found", manufacturer="Dell"), manufacturer_hint="Dell")
+        writer.flush()
+
+        assert reader.get("A-1", "Dell")["status"] == "not_found"
+
+    def test_expired_entry_is_reread_from_s3(self, docs_client):
+        reader = EnrichmentCache(s3_client=docs_client, negative_ttl_hours=1)
+        stale = EnrichmentCache(s3_client=docs_client, negative_ttl_hours=1)
+        stale.put(_result(part_number="A-1", status="not_found", age_hours=2, manufacturer="Dell"), manufacturer_hint="Dell")
+        stale.flush()
+        assert reader.get("A-1", "Dell") is None
+
+        fresh = EnrichmentCache(s3_client=docs_client, negative_ttl_hours=1)
+        fresh.put(_result(part_number="A-1", status="not_found", manufacturer="Dell"), manufacturer_hint="Dell")
+        fresh.flush()
+
+        assert reader.get("A-1", "Dell")["status"] == "not_found"
+
+    def test_flush_with_nothing_pending_writes_nothing(self, cache, docs_client):
+        cache.get("C9200-24P", "Cisco")
+        assert cache.flush() is True
+        assert docs_client.client.objects == {}
+
+    def test_invalidate_drops_entry(self, cache):
+        cache.put(_result(), manufacturer_hint="Cisco")
+        cache.invalidate("C9200-24P", "Cisco")
+        assert cache.get("C9200-24P", "Cisco") is None
+
+
+class TestEnrichBatchUsesCache:
+    """Tests for enrich_batch cache integration."""
+
+    def test_cached_and_duplicate_skus_skip_tavily(self, cache):
+        from core_tools import enrichment_tools
+
+        cache.put(_result(part_number="CACHED-1", manufacturer="Cisco"), manufacturer_hint="Cisco")
+        live = enrichment_tools.EnrichmentResult(
+            part_number="NEW-1",
+            serial_number="SN-1",
+            status=enrichment_tools.EnrichmentStatus.NOT_FOUND,
+        )
+
+        with patch("core_tools.enrichment_cache.get_enrichment_cache", return_value=cache), \
+                patch.object(enrichment_tools, "enrich_equipment", return_value=live) as mock_enrich:
+            batch = enrichment_tools.enrich_batch(
+                items=[
+                    {"part_number": "CACHED-1", "manufacturer": "Cisco", "serial_number": "A"},
+                    {"part_number": "NEW-1", "serial_number": "SN-1"},
+                    {"part_number": "new-1", "serial_number": "SN-2"},
+                ],
+                import_id="import-1",
+                tenant_id="faiston",
+                trigger_kb_sync=False,
+            )
+
+        assert mock_enrich.call_count == 1
+        assert batch.cache_hits == 2
+        assert batch.successful == 1
+        assert batch.not_found == 2
+        assert [r.serial_number for r in batch.results] == ["A", "SN-1", "SN-2"]
+
+    def test_failed_s3_store_is_not_indexed(self, cache):
+        from core_tools import enrichment_tools
+
+        live = enrichment_tools.EnrichmentResult(
+            part_number="NEW-1",
+            serial_number="SN-1",
+            status=enrichment_tools.EnrichmentStatus.SUCCESS,
+            confidence_score=0.9,
+        )
+
+        with patch("core_tools.enrichment_cache.get_enrichment_cache", return_value=cache), \
+                patch("core_tools.s3_client.EquipmentDocsS3Client", create=True), \
+                patch.object(enrichment_tools, "enrich_equipment", return_value=live), \
+                patch.object(enrichment_tools, "_store_enrichment_result", return_value=False) as store:
+            batch = enrichment_tools.enrich_batch(
+                items=[{"part_number": "NEW-1", "serial_number": "SN-1"}],
+                import_id="import-1",
+                tenant_id="faiston",
+                trigger_kb_sync=False,
+            )
+
+        assert store.call_count == 1
+        assert batch.successful == 1
+        assert cache.get("NEW-1") is None
+
+    def test_validate_part_number_returns_cached_confidence(self, cache):
+        from core_tools import enrichment_tools
+
+        cache.put(_result(part_number="C9200-24P", status="partial", manufacturer="Cisco"), manufacturer_hint="Cisco")
+        cache._lru[normalize_cache_key("C9200-24P", "Cisco")]["confidence_score"] = 0.6
+
+        with patch("core_tools.enrichment_cache.get_enrichment_cache", return_value=cache):
+            validation = enrichment_tools.validate_part_number("C9200-24P", "Cisco")
+
+        assert validation["cached"] is True
+        assert validation["confidence"] == 0.6
@@ -0,0 +1,145 @@
+# =============================================================================
+# Tests for FileStructure Cache
+# =============================================================================
+# Unit tests for core_tools/library/file_structure_cache.py and its use in
+# FileInspector.inspect_s3_file().
+#
+# These tests verify:
+# - Re-inspecting an unchanged object costs a single HEAD
+# - A new ETag or INSPECTOR_VERSION misses
+# - The S3 sidecar shares results across containers
+# - Failed inspections are never cached
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_file_structure_cache.py -v
+# =============================================================================
+
+import io
+
+import pytest
+
+from core_tools.library.file_processing import FileInspector
+from core_tools.library.file_structure_cache import FileStructureCache
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+CSV_BYTES = (
+    "codigo;descricao;quantidade\n"
+    "ABC123;Item 1;10\n"
+    "DEF456;Item 2;20\n"
+    "GHI789;Item 3;30\n"
+).encode("utf-8")
+
+
+class _FakeS3:
+    """In-memory S3 that records every call."""
+
+    def __init__(self):
+        self.objects = {}
+        self.etags = {}
+        self.calls = []
+
+    def upload(self, bucket, key, body, etag):
+        self.objects[(bucket, key)] = body
+        self.etags[(bucket, key)] = etag
+
+    def head_object(self, Bucket, Key):
+        self.calls.append(("head", Key))
+        body = self.objects[(Bucket, Key)]
+        return {
+            "ContentLength": len(body),
+            "ContentType": "text/csv" if Key.endswith(".csv") else "application/octet-stream",
+            "ETag": f'"{self.etags[(Bucket, Key)]}"',
+        }
+
+    def get_object(self, Bucket, Key, Range=None):
+        self.calls.append(("get", Key))
+        if (Bucket, Key) not in self.objects:
+            raise Exception("NoSuchKey")
+        body = self.objects[(Bucket, Key)]
+        if Range:
+            start, end = Range.split("=")[1].split("-")
+            body = body[int(start):int(end) + 1]
+        return {"Body": io.BytesIO(body)}
+
+    def put_object(self, Bucket, Key, Body, ContentType=None):
+        self.calls.append(("put", Key))
+        self.objects[(Bucket, Key)] = Body
+        self.etags[(Bucket, Key)] = "sidecar"
+
+
+@pytest.fixture
+def s3():
+    fake = _FakeS3()
+    fake.upload("docs", "uploads/inventory.csv", CSV_BYTES, "etag-1")
+    return fake
+
+
+def _inspector(s3, cache):
+    inspector = FileInspector(bucket="docs", cache=cache)
+    inspector._s3_client = s3
+    return inspector
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestFileStructureCache:
+    """Tests for ETag-keyed caching in FileInspector."""
+
+    def test_unchanged_object_costs_single_head(self, s3):
+        inspector = _inspector(s3, FileStructureCache(sidecar_enabled=False))
+
+        first = inspector.inspect_s3_file("docs", "uploads/inventory.csv")
+        s3.calls.clear()
+        second = inspector.inspect_s3_file("docs", "uploads/inventory.csv")
+
+        assert first.success
+        assert second.to_dict() == first.to_dict()
+        assert s3.calls == [("head", "uploads/inventory.csv")]
+
+    def test_new_etag_misses(self, s3):
+        cache = FileStructureCache(sidecar_enabled=False)
+        inspector = _inspector(s3, cache)
+        inspector.inspect_s3_file("docs", "uploads/inventory.csv")
+
+        s3.upload("docs", "uploads/inventory.csv", CSV_BYTES + b"JKL000;Item 4;40\n", "etag-2")
+        inspector.inspect_s3_file("docs", "uploads/inventory.csv")
+
+        assert cache.stats()["misses"] == 2
+        assert cache.stats()["lru_size"] == 2
+
+    def test_inspector_version_is_part_of_key(self):
+        cache = FileStructureCache(sidecar_enabled=False)
+        old = cache.make_key("docs", "a.csv", '"etag"', "1")
+        cache.put(old, {"success": True, "columns": ["a"]})
+
+        assert cache.get(cache.make_key("docs", "a.csv", "etag", "1")) is not None
+        assert cache.get(cache.make_key("docs", "a.csv", "etag", "2")) is None
+        assert cache.make_key("docs", "a.csv", None, "1") is None
+
+    def test_sidecar_shared_across_containers(self, s3):
+        _inspector(s3, FileStructureCache()).inspect_s3_file("docs", "uploads/inventory.csv")
+        assert any(call[0] == "put" for call in s3.calls)
+
+        s3.calls.clear()
+        other_container = FileStructureCache()
+        result = _inspector(s3, other_container).inspect_s3_file("docs", "uploads/inventory.csv")
+
+        assert result.success
+        assert result.columns == ["codigo", "descricao", "quantidade"]
+        assert other_container.stats()["sidecar_hits"] == 1
+        assert [call[0] for call in s3.calls] == ["head", "get"]
+
+    def test_failures_are_not_cached(self, s3):
+        s3.upload("docs", "uploads/blob.bin", b"\x00\x01\x02" * 100, "etag-bin")
+        cache = FileStructureCache(sidecar_enabled=False)
+
+        result = _inspector(s3, cache).inspect_s3_file("docs", "uploads/blob.bin")
+
+        assert result.success is False
+        assert cache.stats()["stores"] == 0
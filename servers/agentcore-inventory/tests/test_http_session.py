@@ -0,0 +1,136 @@
+# =============================================================================
+# Tests for Pooled HTTP Sessions in MCP Clients
+# =============================================================================
+# Unit tests for shared/http_session.py and its use by MCPGatewayClient and
+# CognitoMCPClient (the HTTP session is a fake; no network access).
+#
+# These tests verify:
+# - Sessions mount a sized keep-alive pool with retries on 429/503 only
+# - MCPGatewayClient signs and sends the same pre-serialized body
+# - Both clients reuse one session across calls (tokens included)
+# - The 401 token refresh resends the original body
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_http_session.py -v
+# =============================================================================
+
+import json
+
+import pytest
+import requests
+
+from core_tools.cognito_mcp_client import CognitoMCPClient
+from core_tools.mcp_gateway_client import MCPGatewayClient
+from shared.http_session import create_http_session
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class _Response:
+    def __init__(self, payload, status_code=200):
+        self._payload = payload
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode("utf-8")
+        self.text = self.content.decode("utf-8")
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(response=self)
+
+    def json(self):
+        return self._payload
+
+
+class _FakeSession:
+    def __init__(self, responses=None):
+        self.posts = []
+        self.responses = list(responses or [])
+
+    def post(self, url, headers=None, data=None, timeout=None):
+        self.posts.append({"url": url, "headers": headers, "data": data})
+        if self.responses:
+            return self.responses.pop(0)
+        if url.endswith("/oauth2/token"):
+            return _Response({"access_token": f"tok-{len(self.posts)}", "expires_in": 3600})
+        return _Response(_tool_result({"ok": True}))
+
+
+def _tool_result(value):
+    return {"jsonrpc": "2.0", "id": "1", "result": {"content": [{"type": "text", "text": json.dumps(value)}]}}
+
+
+@pytest.fixture
+def cognito():
+    client = CognitoMCPClient(
+        gateway_url="https://gw.example/mcp",
+        token_url="https://auth.example/oauth2/token",
+        client_id="client",
+        client_secret="secret",
+    )
+    client._http = _FakeSession()
+    return client
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestCreateHttpSession:
+    """Tests for pool sizing and retry policy."""
+
+    def test_adapter_pool_and_retries(self):
+        session = create_http_session(pool_maxsize=25, max_retries=4)
+        adapter = session.get_adapter("https://gw.example/mcp")
+        retry = adapter.max_retries
+
+        assert adapter._pool_maxsize == 25
+        assert retry.total == 4 and retry.read == 0
+        assert retry.is_retry("POST", 429) and retry.is_retry("POST", 503)
+        assert not retry.is_retry("POST", 500) and not retry.is_retry("POST", 504)
+
+
+class TestGatewayClientTransport:
+    """Tests for MCPGatewayClient signing and session reuse."""
+
+    def test_signed_body_is_the_body_sent(self):
+        client = MCPGatewayClient(gateway_url="https://gw.example/mcp")
+        client._http = _FakeSession()
+        signed = []
+        client._sign_request = lambda method, url, body: signed.append(body) or {"X-Sig": "s"}
+
+        assert client.call_tool("T___sga_get_balance", {"part_number": "PN-1"}) == {"ok": True}
+        client.call_tool("T___sga_get_balance", {"part_number": "PN-2"})
+
+        assert [p["data"] for p in client._http.posts] == signed
+        assert json.loads(signed[0])["params"]["arguments"] == {"part_number": "PN-1"}
+
+
+class TestCognitoClientTransport:
+    """Tests for CognitoMCPClient session reuse."""
+
+    def test_token_and_calls_share_session(self, cognito):
+        cognito.call_tool("tavily___Search", {"query": "C9200"})
+        cognito.call_tool("tavily___Search", {"query": "C9300"})
+
+        urls = [p["url"] for p in cognito._http.posts]
+        assert urls == [
+            "https://auth.example/oauth2/token",
+            "https://gw.example/mcp",
+            "https://gw.example/mcp",
+        ]
+        assert json.loads(cognito._http.posts[1]["data"])["params"]["arguments"] == {"query": "C9200"}
+
+    def test_unauthorized_resends_same_body(self, cognito):
+        cognito._http.responses = [
+            _Response({"access_token": "stale", "expires_in": 3600}),
+            _Response({}, status_code=401),
+        ]
+
+        assert cognito.call_tool("tavily___Search", {"query": "C9200"}) == {"ok": True}
+
+        gateway_posts = [p for p in cognito._http.posts if p["url"].endswith("/mcp")]
+        assert len(gateway_posts) == 2 and gateway_posts[0]["data"] == gateway_posts[1]["data"]
+        assert gateway_posts[1]["headers"]["Authorization"] != "Bearer stale"
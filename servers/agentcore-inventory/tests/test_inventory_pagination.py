@@ -0,0 +1,123 @@
+# =============================================================================
+# Tests for Inventory Keyset Pagination
+# =============================================================================
+# Unit tests for SGAPostgresClient.list_inventory() paging and count modes,
+# and their exposure through GatewayPostgresAdapter.
+#
+# These tests verify:
+# - Keyset pages seek on (part_number, location_code) instead of OFFSET
+# - Continuation tokens round-trip and are bound to the filters
+# - Estimated counts use pg_class.reltuples / EXPLAIN, exact only on request
+# - The adapter forwards cursor/pagination/count to sga_list_inventory
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_inventory_pagination.py -v
+# =============================================================================
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from core_tools.database_adapter import InventoryFilters
+from core_tools.gateway_adapter import GatewayPostgresAdapter
+from core_tools.postgres_client import SGAPostgresClient
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+ROWS = [
+    {"part_number": f"PN-{i // 2:03d}", "location_code": f"LOC-{i % 2}"}
+    for i in range(7)
+]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("RDS_SECRET_ARN", "arn:aws:secretsmanager:us-east-2:1:secret:sga")
+    pg = SGAPostgresClient()
+    pg.queries = []
+
+    def _execute_query(query, params=None, fetch_all=True, prepare=None):
+        pg.queries.append((" ".join(query.split()), params))
+        if "pg_class" in query:
+            return [{"estimate": 12345}]
+        if query.startswith("EXPLAIN"):
+            return [{"QUERY PLAN": [{"Plan": {"Plan Rows": 42}}]}]
+        if "COUNT(*)" in query:
+            return [{"total": len(ROWS)}]
+        if "OFFSET" in query:
+            limit, offset = params[-2:]
+            return ROWS[offset:offset + limit]
+        rows = ROWS
+        if params and "(part_number, location_code) >" in query:
+            after = (params[-3], params[-2])
+            rows = [r for r in rows if (r["part_number"], r["location_code"]) > after]
+        return rows[: params[-1]]
+
+    pg._execute_query = _execute_query
+    return pg
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestKeysetPagination:
+    """Tests for cursor-based paging."""
+
+    def test_pages_cover_all_rows_without_offset(self, client):
+        seen, cursor = [], None
+        while True:
+            page = client.list_inventory(limit=3, pagination="keyset", cursor=cursor, count="none")
+            seen.extend(page["items"])
+            cursor = page["next_cursor"]
+            if not page["has_more"]:
+                break
+
+        assert seen == ROWS
+        assert cursor is None
+        assert not any("OFFSET" in q for q, _ in client.queries)
+
+    def test_cursor_is_bound_to_filters(self, client):
+        page = client.list_inventory(filters={"status": "IN_STOCK"}, limit=2, pagination="keyset")
+        with pytest.raises(ValueError, match="different filters"):
+            client.list_inventory(filters={"status": "LOW_STOCK"}, cursor=page["next_cursor"])
+
+    def test_invalid_cursor_rejected(self, client):
+        with pytest.raises(ValueError, match="Invalid inventory cursor"):
+            client.list_inventory(cursor="not-a-cursor")
+
+
+class TestCounts:
+    """Tests for optional/estimated counts."""
+
+    def test_keyset_defaults_to_reltuples_estimate(self, client):
+        page = client.list_inventory(limit=3, pagination="keyset")
+        assert page["total"] == 12345 and page["total_is_estimate"] is True
+        assert not any("COUNT(*)" in q for q, _ in client.queries)
+
+    def test_filtered_estimate_uses_explain(self, client):
+        page = client.list_inventory(filters={"location_id": "LOC-1"}, pagination="keyset")
+        assert page["total"] == 42
+
+    def test_exact_count_on_request(self, client):
+        page = client.list_inventory(limit=3, pagination="keyset", count="exact")
+        assert page["total"] == 7 and page["total_is_estimate"] is False
+
+    def test_offset_mode_keeps_exact_total(self, client):
+        page = client.list_inventory(limit=3, offset=3)
+        assert page["total"] == 7 and page["has_more"] is True
+        assert "total_is_estimate" not in page
+
+
+class TestGatewayAdapter:
+    """Tests for GatewayPostgresAdapter.list_inventory forwarding."""
+
+    def test_forwards_cursor_and_count(self):
+        mcp = MagicMock()
+        GatewayPostgresAdapter(mcp).list_inventory(InventoryFilters(cursor="abc", count="exact"))
+
+        arguments = mcp.call_tool.call_args.kwargs["arguments"]
+        assert arguments == {"limit": 100, "cursor": "abc", "count": "exact"}
@@ -556,3 +556,194 @@ class TestAuditLogging:
 
         # Assert - should have called error()
         mock_audit.error.assert_called()
+
+
+# =============================================================================
+# Async Invocation Tests
+# =============================================================================
+
+
+class _FakeS3:
+    """In-memory S3 for async results and payload offload."""
+
+    def __init__(self):
+        self.objects = {}
+
+    def put_object(self, Bucket, Key, Body, ContentType=None):
+        self.objects[(Bucket, Key)] = Body
+
+    def get_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise Exception("NoSuchKey")
+        return {"Body": MagicMock(read=MagicMock(return_value=self.objects[(Bucket, Key)]))}
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop((Bucket, Key), None)
+
+
+@pytest.fixture
+def fake_s3():
+    s3 = _FakeS3()
+    with patch("shared.lambda_invoker._get_s3_client", return_value=s3), \
+            patch("shared.lambda_invoker.LAMBDA_EXCHANGE_BUCKET", "exchange-bucket"), \
+            patch("shared.lambda_invoker.LAMBDA_S3_EXCHANGE_ENABLED", True), \
+            patch("shared.lambda_invoker._emit_in_background"):
+        yield s3
+
+
+def _complete(fake_s3, invocation, response):
+    """Simulate the Lambda writing its response for a correlation id."""
+    fake_s3.put_object(invocation.bucket, invocation.key, json.dumps(response).encode("utf-8"))
+
+
+class TestAsyncInvocation:
+    """Tests for InvocationType=Event mode and payload offload."""
+
+    def test_invokes_with_event_type_and_result_location(
+        self, mock_lambda_client, mock_xray, invoker, fake_s3
+    ):
+        """Async mode should not block and should tell the Lambda where to write."""
+        invocation = invoker.invoke_file_analyzer_async(
+            action="analyze_file_structure",
+            payload={"s3_key": "uploads/test.csv"},
+            session_id="session-456",
+        )
+
+        call_args = mock_lambda_client.invoke.call_args[1]
+        event = json.loads(call_args["Payload"])
+        assert call_args["InvocationType"] == "Event"
+        assert event["async_result"] == {
+            "correlation_id": invocation.correlation_id,
+            "bucket": "exchange-bucket",
+            "key": invocation.key,
+        }
+        assert invocation.poll() is None
+        assert not invocation.done()
+
+    def test_result_returns_envelope_when_written(
+        self, mock_lambda_client, mock_xray, invoker, fake_s3
+    ):
+        """The future should resolve to the same envelope as the sync call."""
+        invocation = invoker.invoke_file_analyzer_async(
+            action="analyze_file_structure", payload={"s3_key": "uploads/test.csv"},
+        )
+        _complete(fake_s3, invocation, {
+            "content": [{"type": "text", "text": json.dumps({"columns": ["a", "b"]})}],
+        })
+
+        result = invocation.result(timeout=1, poll_interval=0)
+
+        assert result == {
+            "success": True,
+            "specialist_agent": "file_analyzer",
+            "response": {"columns": ["a", "b"]},
+        }
+        assert invocation.done()
+
+    @pytest.mark.asyncio
+    async def test_wait_keeps_several_in_flight(
+        self, mock_lambda_client, mock_xray, invoker, fake_s3
+    ):
+        """Several invocations can be awaited together."""
+        import asyncio
+
+        invocations = [
+            invoker.invoke_file_analyzer_async("analyze_file_structure", {"s3_key": f"k{i}"})
+            for i in range(3)
+        ]
+        for i, invocation in enumerate(invocations):
+            _complete(fake_s3, invocation, {"success": True, "data": {"index": i}})
+
+        results = await asyncio.gather(*(i.wait(timeout=1, poll_interval=0) for i in invocations))
+
+        assert [r["response"]["index"] for r in results] == [0, 1, 2]
+        assert mock_lambda_client.invoke.call_count == 3
+
+    def test_application_error_raises_cognitive_error(
+        self, mock_lambda_client, mock_xray, invoker, fake_s3, error_response
+    ):
+        """Errors in the stored result should raise like the sync path."""
+        invocation = invoker.invoke_async("fn", {"action": "x"}, "intake.x")
+        _complete(fake_s3, invocation, error_response)
+
+        with pytest.raises(CognitiveError) as exc_info:
+            invocation.result(timeout=1, poll_interval=0)
+        assert exc_info.value.error_type == "VALIDATION_ERROR"
+
+    def test_timeout_raises_cognitive_error(
+        self, mock_lambda_client, mock_xray, invoker, fake_s3
+    ):
+        """A missing result should time out with a recoverable error."""
+        invocation = invoker.invoke_async("fn", {"action": "x"}, "intake.x")
+
+        with pytest.raises(CognitiveError) as exc_info:
+            invocation.result(timeout=0, poll_interval=0)
+        assert exc_info.value.error_type == "LAMBDA_ASYNC_TIMEOUT"
+        assert exc_info.value.recoverable is True
+
+    def test_large_event_is_offloaded_to_s3(
+        self, mock_lambda_client, mock_xray, invoker, fake_s3
+    ):
+        """Events near the 256 KB async limit should travel by reference."""
+        big_payload = {"rows": ["x" * 1000] * 300}
+        invocation = invoker.invoke_async(
+            "fn", {"action": "bulk", "session_id": "s", **big_payload}, "intake.bulk"
+        )
+
+        sent = json.loads(mock_lambda_client.invoke.call_args[1]["Payload"])
+        ref = sent["payload_ref"]
+        stored = json.loads(fake_s3.objects[(ref["bucket"], ref["key"])])
+        assert "rows" not in sent
+        assert sent["action"] == "bulk"
+        assert sent["async_result"]["correlation_id"] == invocation.correlation_id
+        assert stored["rows"] == big_payload["rows"]
+
+        _complete(fake_s3, invocation, {"success": True, "data": {}})
+        invocation.result(timeout=1, poll_interval=0)
+        assert fake_s3.objects == {}
+
+    def test_result_object_deleted_after_read(
+        self, mock_lambda_client, mock_xray, invoker, fake_s3
+    ):
+        """Consumed results should not accumulate in the exchange bucket."""
+        invocation = invoker.invoke_async("fn", {"action": "x"}, "intake.x")
+        _complete(fake_s3, invocation, {"success": True, "data": {}})
+
+        invocation.result(timeout=1, poll_interval=0)
+
+        assert (invocation.bucket, invocation.key) not in fake_s3.objects
+
+    def test_offload_and_async_require_opt_in(
+        self, mock_lambda_client, mock_xray, invoker, fake_s3, success_response
+    ):
+        """Without the opt-in, large sync events stay inline and async is refused."""
+        mock_lambda_client.invoke.return_value = {
+            "Payload": MagicMock(read=MagicMock(return_value=json.dumps(success_response).encode())),
+            "StatusCode": 200,
+        }
+        with patch("shared.lambda_invoker.LAMBDA_S3_EXCHANGE_ENABLED", False):
+            invoker.invoke_intake("verify_file", {"rows": ["x" * 1000] * 6000}, "user-123", "s")
+
+            sent = json.loads(mock_lambda_client.invoke.call_args[1]["Payload"])
+            assert "payload_ref" not in sent and len(sent["payload"]["rows"]) == 6000
+            assert fake_s3.objects == {}
+
+            with pytest.raises(CognitiveError) as exc_info:
+                invoker.invoke_async("fn", {"action": "x"}, "intake.x")
+            assert exc_info.value.error_type == "CONFIG_ERROR"
+
+    def test_sync_result_ref_is_resolved(
+        self, mock_lambda_client, mock_xray, invoker, fake_s3, success_response
+    ):
+        """Sync responses returned by reference should be fetched from S3."""
+        fake_s3.put_object("exchange-bucket", "big.json", json.dumps(success_response).encode())
+        ref = {"result_ref": {"bucket": "exchange-bucket", "key": "big.json"}}
+        mock_lambda_client.invoke.return_value = {
+            "Payload": MagicMock(read=MagicMock(return_value=json.dumps(ref).encode())),
+            "StatusCode": 200,
+        }
+
+        result = invoker.invoke_intake("get_nf_upload_url", {}, "user-123", "session-456")
+
+        assert result["response"]["s3_key"] == success_response["data"]["s3_key"]
+        assert ("exchange-bucket", "big.json") not in fake_s3.objects
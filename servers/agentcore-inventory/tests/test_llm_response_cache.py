@@ -0,0 +1,179 @@
+# =============================================================================
+# Tests for LLM Response Cache
+# =============================================================================
+# Unit tests for shared/llm_response_cache.py.
+#
+# These tests verify:
+# - Identical turns are replayed without calling the model
+# - Volatile ids (session ids, UUIDs) are normalized out of the key and
+#   restored in the replayed response
+# - AGENT_VERSION, system prompt and namespace changes miss
+# - Tool-requesting turns (SchemaMapper's save_mapping_proposal) are cached;
+#   unclean stops are not
+# - Entries are shared through S3
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_llm_response_cache.py -v
+# =============================================================================
+
+import io
+import json
+
+import pytest
+
+from shared import llm_response_cache
+from shared.llm_response_cache import LLMResponseCache, build_cache_key
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class _FakeModel:
+    """Model whose stream() echoes a fixed response and counts calls."""
+
+    def __init__(self, text="ok", tool=None, stop_reason="end_turn"):
+        self.calls = 0
+        self.text = text
+        self.tool = tool
+        self.stop_reason = stop_reason
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        self.calls += 1
+        yield {"messageStart": {"role": "assistant"}}
+        if self.tool:
+            yield {"contentBlockStart": {"start": {"toolUse": {"name": self.tool, "toolUseId": self.tool}}}}
+        session = json.loads(messages[0]["content"][0]["text"])["session_id"]
+        yield {"contentBlockDelta": {"delta": {"text": f"{self.text} for {session}"}}}
+        yield {"messageStop": {"stopReason": self.stop_reason}}
+
+
+class _FakeS3:
+    def __init__(self):
+        self.objects = {}
+
+    def get_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise Exception("NoSuchKey")
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+    def put_object(self, Bucket, Key, Body, ContentType=None):
+        self.objects[Key] = Body
+
+
+def _messages(session_id="sess-1"):
+    payload = {"session_id": session_id, "source_columns": ["PN", "QTD", "SERIAL"]}
+    return [{"role": "user", "content": [{"text": json.dumps(payload)}]}]
+
+
+def _mapping_turn_history(session_id="sess-1"):
+    """SchemaMapper history after the save_mapping_proposal tool ran."""
+    return _messages(session_id) + [
+        {"role": "assistant", "content": [{"toolUse": {
+            "toolUseId": "t1", "name": "save_mapping_proposal", "input": {"mappings": {"PN": "part_number"}},
+        }}]},
+        {"role": "user", "content": [{"toolResult": {
+            "toolUseId": "t1", "status": "success", "content": [{"text": '{"saved": true}'}],
+        }}]},
+    ]
+
+
+async def _run(cache, model, messages, system_prompt="prompt-v1"):
+    events = []
+    async for event in cache.stream(lambda: model, "gemini-2.5-pro", messages, [], system_prompt):
+        events.append(event)
+    return events
+
+
+def _text(events):
+    return "".join(e["contentBlockDelta"]["delta"]["text"] for e in events if "contentBlockDelta" in e)
+
+
+@pytest.fixture
+def cache():
+    return LLMResponseCache(agent_version="v1")
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestCacheKey:
+    """Tests for key building and normalization."""
+
+    def test_volatile_ids_do_not_change_key(self):
+        key_a, _ = build_cache_key("m", "p", [], _messages("sess-1"), "v1")
+        key_b, _ = build_cache_key("m", "p", [], _messages("sess-2"), "v1")
+        assert key_a == key_b
+
+    def test_version_and_prompt_change_key(self):
+        base, _ = build_cache_key("m", "p", [], _messages(), "v1")
+        assert build_cache_key("m", "p", [], _messages(), "v2")[0] != base
+        assert build_cache_key("m", "p2", [], _messages(), "v1")[0] != base
+
+
+class TestLLMResponseCache:
+    """Tests for cache-through streaming."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_turn_is_replayed_with_current_ids(self, cache):
+        model = _FakeModel()
+        await _run(cache, model, _messages("sess-1"))
+        events = await _run(cache, model, _messages("sess-2"))
+
+        assert model.calls == 1
+        assert _text(events) == "ok for sess-2"
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_prompt_change_misses(self, cache):
+        model = _FakeModel()
+        await _run(cache, model, _messages(), system_prompt="v1")
+        await _run(cache, model, _messages(), system_prompt="v2")
+        assert model.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_namespaces_are_isolated(self, cache, monkeypatch):
+        model = _FakeModel()
+        monkeypatch.setattr(llm_response_cache, "CACHE_NAMESPACE", "a")
+        await _run(cache, model, _messages())
+        monkeypatch.setattr(llm_response_cache, "CACHE_NAMESPACE", "b")
+        await _run(cache, model, _messages())
+        assert model.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_schema_mapper_tool_turn_is_cached(self, cache):
+        model = _FakeModel(tool="save_mapping_proposal", stop_reason="tool_use")
+        await _run(cache, model, _messages("sess-1"))
+        events = await _run(cache, model, _messages("sess-2"))
+
+        assert model.calls == 1
+        starts = [e["contentBlockStart"]["start"]["toolUse"]["name"] for e in events if "contentBlockStart" in e]
+        assert starts == ["save_mapping_proposal"]
+
+    @pytest.mark.asyncio
+    async def test_turn_after_tool_result_is_cached(self, cache):
+        model = _FakeModel()
+        await _run(cache, model, _mapping_turn_history("sess-1"))
+        await _run(cache, model, _mapping_turn_history("sess-2"))
+        assert model.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_truncated_response_is_not_cached(self, cache):
+        model = _FakeModel(stop_reason="max_tokens")
+        await _run(cache, model, _messages())
+        await _run(cache, model, _messages())
+        assert model.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_entries_shared_through_s3_per_version(self):
+        s3 = _FakeS3()
+        model = _FakeModel()
+        await _run(LLMResponseCache("v1", bucket="b", s3_client=s3), model, _messages())
+
+        await _run(LLMResponseCache("v1", bucket="b", s3_client=s3), model, _messages())
+        assert model.calls == 1
+
+        await _run(LLMResponseCache("v2", bucket="b", s3_client=s3), model, _messages())
+        assert model.calls == 2
@@ -0,0 +1,118 @@
+# =============================================================================
+# Tests for Logging Hook
+# =============================================================================
+# Unit tests for LoggingHook (queue-based structured lifecycle logging).
+#
+# These tests verify:
+# - Records are formatted on the listener thread, not in the hook callback
+# - Large payloads are truncated per event-type policy
+# - Per-tool rate limits suppress hot loops and report suppressed counts
+# - Errors bypass sampling and rate limits
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_logging_hook.py -v
+# =============================================================================
+
+import json
+import logging
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from shared.hooks import logging_hook
+from shared.hooks.logging_hook import LogEventPolicy, LoggingHook
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def records(caplog):
+    caplog.set_level(logging.DEBUG)
+    yield lambda: [
+        json.loads(r.getMessage()) for r in caplog.records if r.name == logging_hook.__name__
+    ]
+    logging_hook.shutdown_logging_pipeline()
+
+
+def _tool_start(name="insert_pending_items_batch", tool_input=None):
+    return SimpleNamespace(tool_name=name, tool_input=tool_input or {})
+
+
+def _tool_end(name="insert_pending_items_batch", error=None):
+    return SimpleNamespace(tool_name=name, error=error)
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestQueuePipeline:
+    """Tests for the QueueHandler/QueueListener pipeline."""
+
+    def test_serialization_happens_on_listener(self, records, monkeypatch):
+        hook = LoggingHook(log_level=logging.DEBUG, include_payloads=True)
+        threads = []
+        original = logging_hook._LazyJSON.__str__
+        monkeypatch.setattr(
+            logging_hook._LazyJSON, "__str__",
+            lambda self: threads.append(threading.current_thread()) or original(self),
+        )
+
+        hook._on_tool_start(_tool_start(tool_input={"batches_json": "[]"}))
+        logging_hook.shutdown_logging_pipeline()
+
+        assert records()[0]["tool_input"] == {"batches_json": "[]"}
+        assert threads[0] is not threading.main_thread()
+
+    def test_sync_mode_logs_inline(self, records):
+        LoggingHook(use_queue=False)._on_model_start(SimpleNamespace(messages=[1, 2]))
+        assert records()[0]["message_count"] == 2
+
+
+class TestPolicies:
+    """Tests for truncation, sampling and rate limits."""
+
+    def test_large_payload_is_truncated(self, records):
+        hook = LoggingHook(
+            log_level=logging.DEBUG,
+            include_payloads=True,
+            event_policies={"TOOL_CALL_START": LogEventPolicy(max_payload_chars=50)},
+        )
+        hook._on_tool_start(_tool_start(tool_input={"batches_json": "x" * 10_000}))
+        logging_hook.shutdown_logging_pipeline()
+
+        tool_input = records()[0]["tool_input"]
+        assert tool_input.startswith('{"batches_json": "xxx')
+        assert "truncated" in tool_input and len(tool_input) < 100
+
+    def test_sampled_out_event_is_dropped(self, records):
+        hook = LoggingHook(event_policies={"MODEL_CALL_START": LogEventPolicy(sample_rate=0.0)})
+        hook._on_model_start(SimpleNamespace(messages=[]))
+        logging_hook.shutdown_logging_pipeline()
+        assert records() == []
+
+    def test_tool_rate_limit_reports_suppressed(self, records):
+        hook = LoggingHook(tool_rate_limits={"insert_pending_items_batch": 2})
+        for _ in range(5):
+            hook._on_tool_start(_tool_start())
+
+        # One second later the bucket has refilled
+        hook._rate_limiter._buckets["insert_pending_items_batch"][1] -= 1.0
+        hook._on_tool_start(_tool_start())
+        logging_hook.shutdown_logging_pipeline()
+
+        logged = records()
+        assert len(logged) == 3
+        assert logged[-1]["suppressed_events"] == 3
+
+    def test_errors_bypass_rate_limit(self, records):
+        hook = LoggingHook(tool_rate_limits={"insert_pending_items_batch": 1})
+        hook._on_tool_end(_tool_end())
+        hook._on_tool_end(_tool_end(error=RuntimeError("db down")))
+        logging_hook.shutdown_logging_pipeline()
+
+        assert [r["success"] for r in records()] == [True, False]
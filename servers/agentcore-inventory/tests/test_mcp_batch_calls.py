@@ -0,0 +1,144 @@
+# =============================================================================
+# Tests for Batched MCP Tool Calls
+# =============================================================================
+# Unit tests for MCPGatewayClient.call_tools_batch() (the HTTP session is a
+# fake Gateway; no network access).
+#
+# These tests verify:
+# - Calls go out as one JSON-RPC batch array, results mapped back by id
+# - Per-call errors are returned in place without failing the batch
+# - A Gateway that rejects batches gets concurrent single calls instead,
+#   and is not sent batch arrays again
+# - Auth/throttling errors raise without marking batches unsupported
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_mcp_batch_calls.py -v
+# =============================================================================
+
+import json
+import threading
+
+import pytest
+import requests
+
+from core_tools.mcp_gateway_client import MCPGatewayClient
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class _Response:
+    def __init__(self, payload, status_code=200):
+        self._payload = payload
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.content = json.dumps(payload).encode("utf-8")
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(response=self)
+
+    def json(self):
+        return self._payload
+
+
+def _answer(request):
+    part_number = request["params"]["arguments"]["part_number"]
+    if part_number == "PN-BAD":
+        return {"jsonrpc": "2.0", "id": request["id"], "error": {"code": -32602, "message": "unknown part"}}
+    text = json.dumps({"part_number": part_number, "quantity": 1})
+    return {"jsonrpc": "2.0", "id": request["id"], "result": {"content": [{"type": "text", "text": text}]}}
+
+
+class _FakeGateway:
+    def __init__(self, accepts_batches=True, batch_reply=None):
+        self.accepts_batches = accepts_batches
+        self.batch_reply = batch_reply
+        self.bodies = []
+        self._lock = threading.Lock()
+
+    def post(self, url, headers=None, data=None, timeout=None):
+        request = json.loads(data)
+        with self._lock:
+            self.bodies.append(request)
+        if isinstance(request, list):
+            if self.batch_reply is not None:
+                return self.batch_reply
+            if not self.accepts_batches:
+                return _Response({"jsonrpc": "2.0", "id": None,
+                                  "error": {"code": -32600, "message": "Invalid Request"}}, 400)
+            # Servers may answer batch members in any order
+            return _Response([_answer(r) for r in reversed(request)])
+        return _Response(_answer(request))
+
+
+@pytest.fixture
+def client():
+    client = MCPGatewayClient(gateway_url="https://gw.example/mcp")
+    client._sign_request = lambda method, url, body: {}
+    return client
+
+
+CALLS = [("SGAPostgresTools___sga_get_balance", {"part_number": pn}) for pn in ("PN-1", "PN-BAD", "PN-3")]
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestCallToolsBatch:
+    """Tests for JSON-RPC batching and fallback."""
+
+    def test_single_batch_request_mapped_by_id(self, client):
+        client._http = _FakeGateway()
+
+        results = client.call_tools_batch(CALLS)
+
+        assert len(client._http.bodies) == 1 and len(client._http.bodies[0]) == 3
+        assert results[0] == {"part_number": "PN-1", "quantity": 1}
+        assert results[1] == {"error": "MCP error: unknown part"}
+        assert results[2]["part_number"] == "PN-3"
+
+    def test_rejected_batch_falls_back_to_concurrent_calls(self, client):
+        client._http = _FakeGateway(accepts_batches=False)
+
+        first = client.call_tools_batch(CALLS)
+        second = client.call_tools_batch(CALLS[:1])
+
+        assert [r.get("part_number") for r in first] == ["PN-1", None, "PN-3"]
+        assert first[1] == {"error": "MCP error: unknown part"}
+        assert second == [first[0]]
+        batches = [b for b in client._http.bodies if isinstance(b, list)]
+        assert len(batches) == 1 and len(client._http.bodies) == 1 + 3 + 1
+
+    def test_empty_batch_sends_nothing(self, client):
+        client._http = _FakeGateway()
+
+        assert client.call_tools_batch([]) == []
+        assert client._http.bodies == []
+
+    def test_batch_unsupported_400_falls_back(self, client):
+        client._http = _FakeGateway(
+            batch_reply=_Response({"message": "Batch requests are not supported"}, 400)
+        )
+
+        assert client.call_tools_batch(CALLS[:1]) == [{"part_number": "PN-1", "quantity": 1}]
+        assert client._batch_supported is False
+
+    @pytest.mark.parametrize("status", [401, 403, 429])
+    def test_error_status_raises_and_keeps_flag(self, client, status):
+        client._http = _FakeGateway(batch_reply=_Response({"message": "denied"}, status))
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.call_tools_batch(CALLS)
+        assert client._batch_supported is None
+
+    def test_payload_too_large_falls_back_once(self, client):
+        client._http = _FakeGateway(batch_reply=_Response({"message": "too large"}, 413))
+
+        results = client.call_tools_batch(CALLS)
+
+        assert results[0]["part_number"] == "PN-1"
+        assert client._batch_supported is None
@@ -0,0 +1,161 @@
+# =============================================================================
+# Tests for Multi-Part MCP Tool Results
+# =============================================================================
+# Unit tests for result spilling in core_tools/postgres_tools_lambda.py and
+# page resolution in core_tools/mcp_gateway_client.py. Gateway calls are
+# routed straight into the Lambda handler; S3 is an in-memory fake.
+#
+# These tests verify:
+# - Small results stay inline; no bucket means no spilling
+# - Oversized results have their largest list written as S3 pages
+# - call_tool() rebuilds the original result from the pages
+# - iter_tool_items() reads pages lazily and follows next_cursor
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_mcp_result_paging.py -v
+# =============================================================================
+
+import json
+
+import pytest
+
+from core_tools import postgres_tools_lambda
+from core_tools.mcp_gateway_client import MCPGatewayClient
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+ITEMS = [{"part_number": f"PN-{i:04d}", "quantity": i} for i in range(250)]
+
+
+class _FakeS3:
+    def __init__(self):
+        self.objects = {}
+        self.gets = []
+
+    def put_object(self, Bucket, Key, Body, ContentType):
+        self.objects[(Bucket, Key)] = Body
+
+    def get_object(self, Bucket, Key):
+        self.gets.append(Key)
+        body = self.objects[(Bucket, Key)]
+        return {"Body": type("Body", (), {"read": lambda self: body})()}
+
+
+class _FakeClient:
+    def __init__(self):
+        self.calls = []
+
+    def list_inventory(self, **kwargs):
+        self.calls.append(kwargs)
+        if kwargs.get("pagination") == "keyset":
+            if kwargs.get("cursor"):
+                return {"items": ITEMS[200:], "has_more": False, "next_cursor": None}
+            return {"items": ITEMS[:200], "has_more": True, "next_cursor": "c1"}
+        return {"items": ITEMS, "total": len(ITEMS), "has_more": False}
+
+    def release(self):
+        pass
+
+
+class _Response:
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode("utf-8")
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    fake = _FakeS3()
+    monkeypatch.setattr(postgres_tools_lambda, "_s3_client", fake)
+    monkeypatch.setattr(postgres_tools_lambda, "_pg_client", _FakeClient())
+    monkeypatch.setattr(postgres_tools_lambda, "MCP_RESULT_BUCKET", "sga-results")
+    monkeypatch.setattr(postgres_tools_lambda, "MCP_RESULT_MAX_INLINE_BYTES", 2000)
+    monkeypatch.setattr(postgres_tools_lambda, "MCP_RESULT_PAGE_ITEMS", 100)
+    return fake
+
+
+@pytest.fixture
+def gateway(s3, monkeypatch):
+    def _post(url, headers, data, timeout):
+        request = json.loads(data)
+        params = request["params"]
+        response = postgres_tools_lambda.handler(
+            {"name": params["name"], "arguments": params["arguments"]}, None
+        )
+        return _Response({"jsonrpc": "2.0", "id": request["id"], "result": response})
+
+    client = MCPGatewayClient(gateway_url="https://gw.example/mcp")
+    monkeypatch.setattr(client._http, "post", _post)
+    client._sign_request = lambda method, url, body: {}
+    client._s3 = s3
+    return client
+
+
+def _invoke(tool, arguments):
+    response = postgres_tools_lambda.handler({"name": tool, "arguments": arguments}, None)
+    return json.loads(response["content"][0]["text"])
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestResultSpilling:
+    """Tests for the Lambda side of multi-part results."""
+
+    def test_small_result_stays_inline(self, s3, monkeypatch):
+        monkeypatch.setattr(postgres_tools_lambda, "MCP_RESULT_MAX_INLINE_BYTES", 1_000_000)
+
+        assert _invoke("sga_list_inventory", {})["items"] == ITEMS
+        assert s3.objects == {}
+
+    def test_no_bucket_keeps_large_result_inline(self, s3, monkeypatch):
+        monkeypatch.setattr(postgres_tools_lambda, "MCP_RESULT_BUCKET", "")
+
+        assert len(_invoke("sga_list_inventory", {})["items"]) == 250
+        assert s3.objects == {}
+
+    def test_largest_list_written_as_pages(self, s3):
+        result = _invoke("sga_list_inventory", {})
+
+        manifest = result["result_pages"]
+        assert "items" not in result and result["total"] == 250
+        assert manifest["field"] == "items" and manifest["item_count"] == 250
+        assert len(manifest["keys"]) == 3 and len(s3.objects) == 3
+        last_page = json.loads(s3.objects[("sga-results", manifest["keys"][-1])])
+        assert last_page == ITEMS[200:]
+
+
+class TestResultPageClient:
+    """Tests for MCPGatewayClient page resolution."""
+
+    def test_call_tool_rebuilds_result(self, gateway):
+        result = gateway.call_tool("SGAPostgresTools___sga_list_inventory", {})
+
+        assert result == {"items": ITEMS, "total": 250, "has_more": False}
+
+    def test_iter_tool_items_reads_pages_lazily(self, gateway, s3):
+        items = gateway.iter_tool_items("SGAPostgresTools___sga_list_inventory", {})
+
+        first = [next(items) for _ in range(100)]
+        assert first == ITEMS[:100] and len(s3.gets) == 1
+        assert first + list(items) == ITEMS and len(s3.gets) == 3
+
+    def test_iter_tool_items_follows_cursor(self, gateway, s3, monkeypatch):
+        monkeypatch.setattr(postgres_tools_lambda, "MCP_RESULT_MAX_INLINE_BYTES", 1_000_000)
+
+        items = list(gateway.iter_tool_items(
+            "SGAPostgresTools___sga_list_inventory", {"pagination": "keyset"}
+        ))
+
+        assert items == ITEMS
+        assert [c["cursor"] for c in postgres_tools_lambda._pg_client.calls] == [None, "c1"]
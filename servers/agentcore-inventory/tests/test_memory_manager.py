@@ -20,6 +20,15 @@ from unittest.mock import MagicMock, AsyncMock, patch
 # Fixtures
 # =============================================================================
 
+@pytest.fixture(autouse=True)
+def clear_observe_cache():
+    """Isolate tests from the module-level observe() result cache."""
+    from shared.memory_manager import invalidate_observe_cache
+    invalidate_observe_cache()
+    yield
+    invalidate_observe_cache()
+
+
 @pytest.fixture
 def mock_memory_client():
     """Mock AWS AgentCore Memory client."""
@@ -0,0 +1,127 @@
+# =============================================================================
+# Tests for Memory observe() Concurrency and Caching
+# =============================================================================
+# Unit tests for AgentMemoryManager.observe() namespace fan-out and the
+# module-level result cache in shared/memory_manager.py (client mocked).
+#
+# These tests verify:
+# - Repeated lookups are served from the observe cache
+# - Namespaces are queried concurrently but results keep their order
+# - A slow namespace times out to no records instead of stalling observe()
+# - learn*() invalidates only the namespace it wrote to
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_memory_observe_cache.py -v
+# =============================================================================
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from shared.memory_manager import AgentMemoryManager, invalidate_observe_cache
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def clear_observe_cache():
+    """Isolate tests from the module-level observe() result cache."""
+    invalidate_observe_cache()
+    yield
+    invalidate_observe_cache()
+
+
+@pytest.fixture
+def mock_memory_client():
+    """Mock AWS AgentCore Memory client."""
+    client = MagicMock()
+    client.retrieve_memory_records = AsyncMock(return_value=[])
+    client.create_event = AsyncMock(return_value="evt_mock_123")
+    return client
+
+
+@pytest.fixture
+def mock_memory_manager(mock_memory_client):
+    """AgentMemoryManager wired to the mocked client."""
+    with patch("shared.memory_manager._get_memory_client", return_value=mock_memory_client):
+        manager = AgentMemoryManager(
+            agent_id="test_agent",
+            actor_id="test_user",
+            use_global_namespace=True,
+        )
+        manager._client = mock_memory_client
+        return manager
+
+
+@pytest.fixture
+def sample_memory_records():
+    return [
+        {"content": "Column 'SERIAL' -> field 'serial_number'", "namespace": "/facts/test_user"},
+        {"content": "Import successful: 150 rows", "namespace": "/episodes/test_user"},
+    ]
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestObserveCache:
+    """Tests for concurrent, cached observe()."""
+
+    @pytest.mark.asyncio
+    async def test_observe_repeated_query_served_from_cache(
+        self, mock_memory_manager, mock_memory_client, sample_memory_records
+    ):
+        """Test identical lookups are answered locally."""
+        mock_memory_client.retrieve_memory_records.return_value = sample_memory_records
+
+        first = await mock_memory_manager.observe("column mapping")
+        second = await mock_memory_manager.observe("column mapping")
+
+        assert first == second
+        assert mock_memory_client.retrieve_memory_records.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_observe_preserves_namespace_order(self, mock_memory_manager, mock_memory_client):
+        """Test concurrent queries still return facts, episodes, global in order."""
+        async def _retrieve(query, namespace, top_k):
+            return [{"content": namespace}]
+
+        mock_memory_client.retrieve_memory_records.side_effect = _retrieve
+
+        results = await mock_memory_manager.observe("anything")
+
+        assert [r["type"] for r in results] == ["fact", "episode", "global"]
+
+    @pytest.mark.asyncio
+    async def test_observe_namespace_timeout_degrades(self, mock_memory_manager, mock_memory_client):
+        """Test a slow namespace returns no records instead of stalling observe()."""
+        async def _retrieve(query, namespace, top_k):
+            if namespace.startswith("/episodes"):
+                await asyncio.sleep(1)
+            return [{"content": namespace}]
+
+        mock_memory_client.retrieve_memory_records.side_effect = _retrieve
+
+        with patch("shared.memory_manager.OBSERVE_NAMESPACE_TIMEOUT_SECONDS", 0.05):
+            results = await mock_memory_manager.observe("anything")
+
+        assert [r["type"] for r in results] == ["fact", "global"]
+
+    @pytest.mark.asyncio
+    async def test_learn_invalidates_written_namespace(
+        self, mock_memory_manager, mock_memory_client, sample_memory_records
+    ):
+        """Test learn_fact (global namespace) invalidates cached global lookups only."""
+        mock_memory_client.retrieve_memory_records.return_value = sample_memory_records
+        await mock_memory_manager.observe("column mapping")
+
+        await mock_memory_manager.learn_fact(fact="SN -> serial_number", category="column_mapping")
+        await mock_memory_manager.observe("column mapping")
+
+        # 3 namespaces initially + only the global namespace re-queried
+        assert mock_memory_client.retrieve_memory_records.call_count == 4
@@ -0,0 +1,193 @@
+# =============================================================================
+# Tests for Movement Dimension Cache and Bulk Movements
+# =============================================================================
+# Unit tests for SGAPostgresClient.create_movement() code lookups and
+# create_movements_bulk() (no database required - cursor is a fake).
+#
+# These tests verify:
+# - Part number / location / project codes resolve in one query, then hit cache
+# - Unknown codes are negatively cached and expire after the negative TTL
+# - Bulk movements resolve codes once and insert movements + items in one commit
+# - Any invalid line rejects the whole batch without touching the database
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_movement_bulk.py -v
+# =============================================================================
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from core_tools import postgres_client
+from core_tools.database_adapter import MovementData, MovementType
+from core_tools.gateway_adapter import GatewayPostgresAdapter
+from core_tools.postgres_client import SGAPostgresClient
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+DIMENSIONS = {
+    ("part_number", "PN-1"): "pn-uuid-1",
+    ("part_number", "PN-2"): "pn-uuid-2",
+    ("location", "LOC-A"): "loc-uuid-a",
+    ("location", "LOC-B"): "loc-uuid-b",
+    ("project", "PRJ-1"): "prj-uuid-1",
+}
+ASSETS = {"SN-1": "asset-1", "SN-2": "asset-2"}
+
+
+class _FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None, prepare=None):
+        query = " ".join(query.split())
+        self.conn.executed.append((query, params))
+        if "UNION ALL" in query or "FROM sga.part_numbers" in query:
+            self._rows = self._dimension_rows(query, params)
+        elif "FROM sga.assets" in query:
+            self._rows = [
+                {"serial_number": s, "asset_id": ASSETS[s]} for s in params[0] if s in ASSETS
+            ]
+        elif query.startswith("INSERT INTO sga.movements"):
+            now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+            self._rows = [
+                {"movement_id": params[i], "movement_date": now}
+                for i in range(0, len(params), 11)
+            ]
+        else:
+            self._rows = []
+
+    @staticmethod
+    def _dimension_rows(query, params):
+        kinds = [branch.split("'")[1] for branch in query.split(" UNION ALL ")]
+        return [
+            {"kind": kind, "code": code, "id": DIMENSIONS[(kind, code)]}
+            for kind, codes in zip(kinds, params)
+            for code in codes
+            if (kind, code) in DIMENSIONS
+        ]
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return self._rows
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.executed = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.fixture
+def conn(monkeypatch):
+    monkeypatch.setenv("RDS_SECRET_ARN", "arn:aws:secretsmanager:us-east-2:1:secret:sga")
+    postgres_client._dimension_cache.invalidate()
+    fake = _FakeConnection()
+    monkeypatch.setattr(SGAPostgresClient, "_get_connection", lambda self: fake)
+    yield fake
+    postgres_client._dimension_cache.invalidate()
+
+
+def _lookups(conn):
+    return [q for q, _ in conn.executed if q.startswith("SELECT")]
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestDimensionCache:
+    """Tests for cached code -> id resolution in create_movement."""
+
+    def test_codes_resolved_in_one_query_then_cached(self, conn):
+        client = SGAPostgresClient()
+        for _ in range(3):
+            result = client.create_movement(
+                "TRANSFERENCIA", "PN-1", 1,
+                source_location_id="LOC-A", destination_location_id="LOC-B", project_id="PRJ-1",
+            )
+            assert result["success"] is True
+
+        assert len(_lookups(conn)) == 1
+        insert_params = [p for q, p in conn.executed if q.startswith("INSERT")][0]
+        assert insert_params[1:6] == ("pn-uuid-1", 1, "loc-uuid-a", "loc-uuid-b", "prj-uuid-1")
+
+    def test_unknown_part_number_is_negatively_cached(self, conn, monkeypatch):
+        client = SGAPostgresClient()
+        assert "Part number not found" in client.create_movement("ENTRADA", "PN-X", 1)["error"]
+        client.create_movement("ENTRADA", "PN-X", 1)
+        assert len(_lookups(conn)) == 1
+
+        monkeypatch.setattr(postgres_client, "RDS_DIMENSION_NEGATIVE_TTL_SECONDS", 0)
+        client.create_movement("ENTRADA", "PN-X", 1)
+        assert len(_lookups(conn)) == 2
+
+
+class TestBulkMovements:
+    """Tests for create_movements_bulk()."""
+
+    def test_inserts_movements_and_items_in_one_transaction(self, conn):
+        result = SGAPostgresClient().create_movements_bulk([
+            {"movement_type": "ENTRADA", "part_number": "PN-1", "quantity": 2,
+             "destination_location_id": "LOC-A", "serial_numbers": ["SN-1", "SN-2"]},
+            {"movement_type": "ENTRADA", "part_number": "PN-2", "quantity": 5,
+             "destination_location_id": "LOC-B"},
+        ])
+
+        assert result["success"] is True
+        assert result["created_count"] == 2 and result["item_count"] == 2
+        assert all(m["movement_date"] for m in result["movements"])
+        assert len(_lookups(conn)) == 2  # dimensions + serials
+        inserts = [q for q, _ in conn.executed if q.startswith("INSERT")]
+        assert [q.split(" (")[0] for q in inserts] == [
+            "INSERT INTO sga.movements", "INSERT INTO sga.movement_items",
+        ]
+        assert conn.commits == 1
+
+    def test_invalid_line_rejects_whole_batch(self, conn):
+        result = SGAPostgresClient().create_movements_bulk([
+            {"movement_type": "ENTRADA", "part_number": "PN-1", "quantity": 1},
+            {"movement_type": "ENTRADA", "part_number": "PN-X", "quantity": 1},
+            {"movement_type": "ENTRADA", "part_number": "PN-2", "quantity": 1,
+             "serial_numbers": ["SN-404"]},
+        ])
+
+        assert result["success"] is False and result["created_count"] == 0
+        assert [e["index"] for e in result["errors"]] == [1, 2]
+        assert not any(q.startswith("INSERT") for q, _ in conn.executed)
+        assert conn.commits == 0
+
+    def test_adapter_calls_bulk_tool(self):
+        mcp = MagicMock()
+        GatewayPostgresAdapter(mcp).create_movements_bulk([
+            MovementData(MovementType.ENTRADA, "PN-1", 3, destination_location_id="LOC-A"),
+        ])
+
+        assert mcp.call_tool.call_args.kwargs["tool_name"].endswith("sga_create_movements_bulk")
+        assert mcp.call_tool.call_args.kwargs["arguments"] == {"movements": [{
+            "movement_type": "ENTRADA", "part_number": "PN-1", "quantity": 3,
+            "destination_location_id": "LOC-A",
+        }]}
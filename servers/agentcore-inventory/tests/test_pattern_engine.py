@@ -0,0 +1,158 @@
+# =============================================================================
+# Tests for ObservationAgent Pattern Engine
+# =============================================================================
+# Unit tests for the compiled pattern engine used by analyze_patterns.
+#
+# These tests verify:
+# - Single-pass error classification keeps ERROR_PATTERNS priority
+# - Semantic similarity scores
+# - Incremental folding (dedup across folds, one-shot counting)
+# - Aggregates survive a to_dict/from_dict round trip
+# - analyze_patterns folds into saved aggregates
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_pattern_engine.py -v
+# =============================================================================
+
+import importlib
+import json
+
+import pytest
+
+from agents.specialists.observation.tools.pattern_engine import (
+    PatternAggregates,
+    best_target_for,
+    calculate_semantic_similarity,
+    classify_error,
+    record_fingerprint,
+)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+def _episode(content, outcome="error", session_id="s1", hour=10):
+    return {
+        "content": content,
+        "outcome": outcome,
+        "session_id": session_id,
+        "timestamp": f"2026-01-15T{hour:02d}:00:00Z",
+    }
+
+
+@pytest.fixture
+def episodes():
+    return [
+        _episode("Missing column part_number", session_id="s1"),
+        _episode("Unknown column: 'qtd'", session_id="s2"),
+        _episode("type conversion failed", session_id="s3"),
+        _episode("Import ok", outcome="success", session_id="s4"),
+    ]
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestClassifyError:
+    """Tests for the single-pass error classifier."""
+
+    def test_schema_mismatch(self):
+        assert classify_error("Missing column part_number") == "SchemaMismatch"
+
+    def test_priority_follows_pattern_order(self):
+        # Matches both SchemaMismatch and DataIntegrity keywords
+        assert classify_error("type conversion: unknown column qtd") == "SchemaMismatch"
+
+    def test_case_insensitive(self):
+        assert classify_error("DUPLICATE KEY") == "BusinessLogic"
+
+    def test_unknown(self):
+        assert classify_error("something odd happened") == "Unknown"
+
+
+class TestSemanticSimilarity:
+    """Tests for column-name similarity."""
+
+    def test_exact_match_ignores_separators(self):
+        assert calculate_semantic_similarity("Part-Number", "part_number") == 1.0
+
+    def test_prefix_match(self):
+        assert calculate_semantic_similarity("serial", "serial_number") == 0.7
+
+    def test_no_match(self):
+        assert calculate_semantic_similarity("abc", "xyz") == 0.0
+
+    def test_best_target(self):
+        assert best_target_for("quantity") == ("quantity", 1.0)
+
+
+class TestPatternAggregates:
+    """Tests for incremental folding and persistence."""
+
+    def test_fold_counts_errors_and_unmapped_columns(self, episodes):
+        aggregates = PatternAggregates()
+        aggregates.fold(episodes=episodes)
+
+        assert aggregates.error_counts == {"SchemaMismatch": 2, "DataIntegrity": 1}
+        assert aggregates.unmapped_columns == {"qtd": 1}
+        assert aggregates.episodes_folded == 4
+
+    def test_refolding_same_records_is_idempotent(self, episodes):
+        aggregates = PatternAggregates()
+        aggregates.fold(episodes=episodes)
+        assert aggregates.fold(episodes=episodes) == 0
+        assert aggregates.error_counts["SchemaMismatch"] == 2
+
+    def test_one_shot_mode_counts_repeats(self):
+        repeated = [_episode("Missing column x")] * 3
+        aggregates = PatternAggregates()
+        aggregates.fold(episodes=repeated, dedupe=False)
+        assert aggregates.error_counts["SchemaMismatch"] == 3
+
+    def test_round_trip_then_incremental_fold(self, episodes):
+        first = PatternAggregates()
+        first.fold(episodes=episodes[:2])
+
+        restored = PatternAggregates.from_dict(json.loads(json.dumps(first.to_dict())))
+        restored.fold(episodes=episodes)
+
+        full = PatternAggregates()
+        full.fold(episodes=episodes)
+        assert restored.error_patterns() == full.error_patterns()
+        assert restored.behavior_patterns() == full.behavior_patterns()
+
+    def test_fingerprint_prefers_record_id(self):
+        assert record_fingerprint({"memory_record_id": "mr-1", "content": "x"}) == "mr-1"
+
+    def test_error_samples_are_bounded(self):
+        aggregates = PatternAggregates()
+        aggregates.fold(
+            episodes=[_episode(f"Missing column c{i}", session_id=f"s{i}") for i in range(10)]
+        )
+        assert len(aggregates.error_samples["SchemaMismatch"]) == 3
+
+
+class TestAnalyzePatternsTool:
+    """Tests for analyze_patterns using saved aggregates."""
+
+    def test_folds_into_saved_aggregates(self, episodes):
+        module = importlib.import_module(
+            "agents.specialists.observation.tools.analyze_patterns"
+        )
+        saved = PatternAggregates()
+        saved.fold(episodes=[_episode("Missing column serial", session_id="s0")])
+
+        # Call the undecorated function (cognitive_error_handler wraps it)
+        result = json.loads(module.analyze_patterns.__wrapped__(json.dumps({
+            "success": True,
+            "facts": [],
+            "episodes": episodes,
+            "activity_summary": {"unique_sessions": 5},
+            "pattern_aggregates": saved.to_dict(),
+        }), pattern_type="error"))
+
+        schema = [p for p in result["patterns"] if p["subtype"] == "SchemaMismatch"]
+        assert schema[0]["frequency"] == 3
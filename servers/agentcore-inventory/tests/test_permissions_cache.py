@@ -0,0 +1,198 @@
+# =============================================================================
+# Tests for PermissionsClient resolved-permissions cache
+# =============================================================================
+# These tests verify:
+# - Repeated checks for the same user make no extra DynamoDB calls
+# - Profile.version changes invalidate cached user permissions
+# - DynamoDB errors deny the request and are never cached
+# - warm_cache() preloads profiles so only the user lookup hits DynamoDB
+# - The LRU bound and TTL are honoured
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_permissions_cache.py -v
+# =============================================================================
+
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from shared import permissions_client
+from shared.permissions_client import PermissionsClient
+
+_THROTTLED = ClientError(
+    {"Error": {"Code": "ProvisionedThroughputExceededException", "Message": "throttled"}},
+    "GetItem",
+)
+
+
+def _profile_item(profile_id, permissions, version=1, profile_type="BASE", base=None):
+    return {
+        "id": profile_id,
+        "name": profile_id.title(),
+        "type": profile_type,
+        "baseProfile": base,
+        "permissions": permissions,
+        "deniedPermissions": [],
+        "version": version,
+    }
+
+
+class _FakeTable:
+    """DynamoDB Table stand-in that counts get_item calls."""
+
+    def __init__(self):
+        self.users = {"u1": "logistica", "u2": "logistica"}
+        self.profiles = {"logistica": _profile_item("logistica", ["EST_R01"])}
+        self.failing = set()  # PKs whose next get_item raises
+        self.get_item = MagicMock(side_effect=self._get_item)
+        self.query = MagicMock(side_effect=self._query)
+
+    def _get_item(self, Key, ProjectionExpression=None):
+        pk = Key["PK"]
+        if pk in self.failing:
+            self.failing.discard(pk)
+            raise _THROTTLED
+        if pk.startswith("USER#"):
+            profile_id = self.users.get(pk[len("USER#"):])
+            return {"Item": {"profileId": profile_id}} if profile_id else {}
+        if pk.startswith("PROFILE#"):
+            item = self.profiles.get(pk[len("PROFILE#"):])
+            return {"Item": item} if item else {}
+        return {}
+
+    def _query(self, **kwargs):
+        return {"Items": list(self.profiles.values())}
+
+
+@pytest.fixture
+def table():
+    return _FakeTable()
+
+
+@pytest.fixture
+def client(table):
+    c = PermissionsClient(table_name="test", cache_ttl_seconds=60, max_cached_users=2)
+    c._table = table
+    return c
+
+
+class TestPermissionsCache:
+    """Tests for the resolved-permissions cache."""
+
+    def test_repeat_lookup_is_served_from_cache(self, client, table):
+        first = client.get_user_permissions("u1")
+        calls = table.get_item.call_count
+
+        second = client.get_user_permissions("u1")
+
+        assert second is first
+        assert "EST_R01" in second.permissions
+        assert table.get_item.call_count == calls
+
+    def test_use_cache_false_always_reads(self, client, table):
+        client.get_user_permissions("u1")
+        calls = table.get_item.call_count
+        client.get_user_permissions("u1", use_cache=False)
+        assert table.get_item.call_count > calls
+
+    def test_profile_version_change_invalidates_users(self, client, table):
+        client.get_user_permissions("u1")
+        table.profiles["logistica"] = _profile_item("logistica", ["EST_R01", "EST_C01"], version=2)
+
+        client.warm_cache()  # sees v2 via list_profiles
+        refreshed = client.get_user_permissions("u1")
+
+        assert refreshed.version == 2
+        assert "EST_C01" in refreshed.permissions
+
+    def test_warm_cache_leaves_only_user_lookup(self, client, table):
+        client.warm_cache()
+        client.get_user_permissions("u1")
+
+        pks = [c.kwargs["Key"]["PK"] for c in table.get_item.call_args_list]
+        assert pks == ["USER#u1"]
+
+    def test_lru_bound(self, client, table):
+        table.users["u3"] = "logistica"
+        for user_id in ("u1", "u2", "u3"):
+            client.get_user_permissions(user_id)
+        assert list(client._user_cache) == ["u2", "u3"]
+
+    def test_ttl_zero_disables_user_cache(self, table):
+        c = PermissionsClient(table_name="test", cache_ttl_seconds=0)
+        c._table = table
+        c.get_user_permissions("u1")
+        c.get_user_permissions("u1")
+        user_calls = [
+            call for call in table.get_item.call_args_list
+            if call.kwargs["Key"]["PK"] == "USER#u1"
+        ]
+        assert len(user_calls) == 2
+
+    def test_invalidate_user(self, client, table):
+        client.get_user_permissions("u1")
+        client.invalidate_user("u1")
+        calls = table.get_item.call_count
+        client.get_user_permissions("u1")
+        assert table.get_item.call_count == calls + 1  # profile still cached
+
+
+class TestPermissionsCacheErrors:
+    """Tests that failed or partial resolutions are not cached."""
+
+    def test_user_lookup_error_denies_without_caching(self, client, table):
+        table.failing.add("USER#u1")
+
+        assert client.get_user_permissions("u1", groups=["Admins"]) is None
+        assert "u1" not in client._user_cache
+
+        calls = table.get_item.call_count
+        resolved = client.get_user_permissions("u1", groups=["Admins"])
+        assert resolved.profile_id == "logistica"
+        assert table.get_item.call_args_list[calls].kwargs["Key"]["PK"] == "USER#u1"
+
+    def test_profile_lookup_error_is_not_cached(self, client, table):
+        table.failing.add("PROFILE#logistica")
+
+        assert client.get_user_permissions("u1") is None
+        assert "EST_R01" in client.get_user_permissions("u1").permissions
+
+    def test_base_profile_error_is_not_cached(self, client, table):
+        table.users["u3"] = "custom"
+        table.profiles["custom"] = {
+            **_profile_item("custom", ["EST_R01"], profile_type="CUSTOM", base="logistica"),
+            "deniedPermissions": ["EST_R01"],
+        }
+        table.failing.add("PROFILE#logistica")
+
+        assert client.get_user_permissions("u3") is None
+        resolved = client.get_user_permissions("u3")
+        assert resolved.permissions == set()
+        assert "u3" in client._user_cache
+
+    def test_missing_profile_is_not_cached(self, client, table):
+        table.users["u3"] = "ghost"
+        assert client.get_user_permissions("u3") is None
+        assert "u3" not in client._user_cache
+
+
+class TestProfileVersionRefresh:
+    """Tests that profile changes reach cached users before their TTL."""
+
+    def test_profile_ttl_capped_at_user_ttl(self, table):
+        c = PermissionsClient(table_name="test", cache_ttl_seconds=10, profile_cache_ttl_seconds=300)
+        assert c._profile_cache_ttl == 10
+
+    def test_version_change_seen_by_other_user_drops_entry(self, table, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(permissions_client.time, "monotonic", lambda: now[0])
+        c = PermissionsClient(table_name="test", cache_ttl_seconds=60, profile_cache_ttl_seconds=30)
+        c._table = table
+
+        c.get_user_permissions("u1")
+        table.profiles["logistica"] = _profile_item("logistica", ["EST_R01", "EST_C01"], version=2)
+        now[0] += 31  # profile expired, u1's entry still within its TTL
+        c.get_user_permissions("u2")  # re-reads the profile at v2
+
+        assert "u1" not in c._user_cache
+        assert "EST_C01" in c.get_user_permissions("u1").permissions
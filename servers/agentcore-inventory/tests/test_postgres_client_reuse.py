@@ -0,0 +1,168 @@
+# =============================================================================
+# Tests for PostgreSQL Client Warm-Container Reuse
+# =============================================================================
+# Unit tests for secret caching, connection validation and prepared reads in
+# core_tools/postgres_client.py (no database required - connections are fakes).
+#
+# These tests verify:
+# - The secret is fetched once per container and refreshed after the TTL
+# - A failed login with a cached secret refetches it (rotation) and retries
+# - Idle connections are probed before reuse and replaced when broken
+# - release() ends open read transactions but keeps the connection
+# - Fixed read queries request server-side prepared statements
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_postgres_client_reuse.py -v
+# =============================================================================
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from core_tools import postgres_client
+from core_tools.postgres_client import SGAPostgresClient
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class _FakeSecrets:
+    def __init__(self):
+        self.password = "v1"
+        self.calls = 0
+
+    def get_secret_value(self, SecretId):
+        self.calls += 1
+        return {"SecretString": json.dumps({"host": "db", "username": "sga", "password": self.password})}
+
+
+class _FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None, prepare=None):
+        if self.conn.broken:
+            raise OSError("server closed the connection unexpectedly")
+        self.conn.executed.append((query.strip().split()[0], prepare))
+        self.conn.info.transaction_status = postgres_client._TX_INTRANS
+
+    def fetchall(self):
+        return []
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.broken = False
+        self.executed = []
+        self.rollbacks = 0
+        self.info = SimpleNamespace(transaction_status=0)
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.info.transaction_status = 0
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def secrets(monkeypatch):
+    fake = _FakeSecrets()
+    monkeypatch.setenv("RDS_SECRET_ARN", "arn:aws:secretsmanager:us-east-2:1:secret:sga")
+    monkeypatch.setattr(postgres_client, "_get_boto3_client", lambda service, region: fake)
+    postgres_client._secret_cache.clear()
+    yield fake
+    postgres_client._secret_cache.clear()
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    opened = []
+
+    def _connect(self, creds):
+        if creds["password"] != "v2" and getattr(self, "_require_v2", False):
+            raise Exception('FATAL: password authentication failed for user "sga"')
+        opened.append(_FakeConnection())
+        return opened[-1]
+
+    monkeypatch.setattr(SGAPostgresClient, "_connect", _connect)
+    return opened
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestSecretCache:
+    """Tests for the module-level secret cache."""
+
+    def test_secret_fetched_once_per_container(self, secrets):
+        SGAPostgresClient()._get_credentials()
+        SGAPostgresClient()._get_credentials()
+        assert secrets.calls == 1
+
+    def test_secret_refreshed_after_ttl(self, secrets, monkeypatch):
+        SGAPostgresClient()._get_credentials()
+        monkeypatch.setattr(postgres_client, "RDS_SECRET_TTL_SECONDS", 0)
+        SGAPostgresClient()._get_credentials()
+        assert secrets.calls == 2
+
+    def test_rotated_secret_is_refetched_on_login_failure(self, secrets, connections):
+        SGAPostgresClient()._get_credentials()  # cache "v1"
+        secrets.password = "v2"                 # rotation
+
+        client = SGAPostgresClient()
+        client._require_v2 = True
+        client._get_connection()
+
+        assert secrets.calls == 2
+        assert len(connections) == 1
+
+
+class TestConnectionReuse:
+    """Tests for validation, release and prepared reads."""
+
+    def test_connection_reused_across_calls(self, secrets, connections):
+        client = SGAPostgresClient()
+        assert client._get_connection() is client._get_connection()
+        assert len(connections) == 1
+
+    def test_broken_idle_connection_is_replaced(self, secrets, connections, monkeypatch):
+        client = SGAPostgresClient()
+        first = client._get_connection()
+        first.broken = True
+        monkeypatch.setattr(postgres_client, "RDS_CONNECTION_VALIDATE_AFTER_SECONDS", -1)
+
+        second = client._get_connection()
+
+        assert second is not first and first.closed
+        assert len(connections) == 2
+
+    def test_release_ends_read_transaction(self, secrets, connections):
+        client = SGAPostgresClient()
+        client.get_movements({"movement_type": "ENTRADA"})
+        client.release()
+
+        conn = connections[0]
+        assert conn.rollbacks == 1 and not conn.closed
+        assert conn.info.transaction_status == 0
+
+    def test_fixed_reads_are_prepared(self, secrets, connections):
+        client = SGAPostgresClient()
+        client.get_balance("PN-1")
+        client.search_assets("abc", search_type="serial")
+
+        assert connections[0].executed == [("SELECT", True), ("SELECT", True)]
@@ -0,0 +1,84 @@
+# =============================================================================
+# Tests for Postgres Tools Lambda Request Logging
+# =============================================================================
+# Unit tests for payload-aware logging in core_tools/postgres_tools_lambda.py
+# (the database client is a fake; no connection is opened).
+#
+# These tests verify:
+# - Bulky arguments are logged as count/bytes/hash, never row by row
+# - Small tools still log their arguments verbatim
+# - Full payloads are logged only for the sampled fraction of calls
+# - Long result lists are logged as counts
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_postgres_lambda_logging.py -v
+# =============================================================================
+
+import logging
+
+import pytest
+
+from core_tools import postgres_tools_lambda
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+ROWS = [{"line_number": i, "part_number": f"PN-{i}", "description": "x" * 50} for i in range(500)]
+
+
+class _FakeClient:
+    def insert_pending_items_batch(self, rows, entry_id):
+        return {"success": True, "inserted_count": len(rows), "errors": []}
+
+    def list_inventory(self, **kwargs):
+        return {"items": [{"part_number": f"PN-{i}"} for i in range(100)], "total": 100}
+
+    def release(self):
+        pass
+
+
+@pytest.fixture
+def logs(caplog, monkeypatch):
+    monkeypatch.setattr(postgres_tools_lambda, "_pg_client", _FakeClient())
+    caplog.set_level(logging.INFO, logger=postgres_tools_lambda.logger.name)
+    return lambda: [r.getMessage() for r in caplog.records if r.name == postgres_tools_lambda.logger.name]
+
+
+def _invoke(tool, arguments):
+    return postgres_tools_lambda.handler({"name": tool, "arguments": arguments}, None)
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestPayloadLogging:
+    """Tests for bulky-field summaries and sampling."""
+
+    def test_bulky_rows_are_summarized(self, logs):
+        result = _invoke("sga_insert_pending_items_batch", {"rows": ROWS, "session_id": "entry-1"})
+
+        assert result["isError"] is False
+        (line,) = [m for m in logs() if m.startswith("Executing tool")]
+        assert '"rows": {"bytes":' in line and '"count": 500' in line and '"sha256":' in line
+        assert "PN-499" not in "".join(logs())
+
+    def test_summary_hash_is_stable(self):
+        a = postgres_tools_lambda._summarize_payload(ROWS)
+        b = postgres_tools_lambda._summarize_payload(list(ROWS))
+        assert a == b and a["count"] == 500
+
+    def test_full_payload_is_sampled(self, logs, monkeypatch):
+        monkeypatch.setattr(postgres_tools_lambda, "LOG_PAYLOAD_SAMPLE_RATE", 1.0)
+        _invoke("sga_insert_pending_items_batch", {"rows": ROWS[:3], "session_id": "entry-1"})
+
+        assert any(m.startswith("Full payload (sampled") and "PN-2" in m for m in logs())
+
+    def test_small_tools_log_arguments_verbatim(self, logs):
+        _invoke("sga_list_inventory", {"location_id": "LOC-A", "limit": 100})
+
+        assert any('"location_id": "LOC-A"' in m for m in logs())
+        (result_line,) = [m for m in logs() if m.startswith("Tool result")]
+        assert "'items': {'count': 100}" in result_line
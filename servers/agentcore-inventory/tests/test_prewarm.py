@@ -0,0 +1,146 @@
+# =============================================================================
+# Tests for Background Prewarm
+# =============================================================================
+# Unit tests for shared/prewarm.py.
+#
+# These tests verify:
+# - Steps run once, in order, on a background thread
+# - Failing steps degrade (never raise) and are reported
+# - /ping reports 503 "warming" until ready, bounded by the gate
+# - The FastAPI startup event starts prewarming
+# - AgentPool.prewarm runs the warm callback on new shells
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_prewarm.py -v
+# =============================================================================
+
+import threading
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from shared.agent_pool import AgentPool, AgentShell
+from shared.prewarm import PrewarmManager, attach_prewarm, import_modules
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+def _step(calls, name):
+    return name, lambda: calls.append(name)
+
+
+def _failing():
+    raise RuntimeError("ssm unavailable")
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestPrewarmManager:
+    """Tests for PrewarmManager lifecycle and readiness."""
+
+    def test_steps_run_in_order_once(self, calls):
+        manager = PrewarmManager("test", steps=[_step(calls, "a"), _step(calls, "b")], enabled=True)
+
+        assert manager.start() is True
+        assert manager.start() is False
+        manager.join(5)
+
+        assert calls == ["a", "b"]
+        assert manager.status == "ready"
+        assert set(manager.report()["steps"]) == {"a", "b"}
+
+    def test_failing_step_degrades(self, calls):
+        manager = PrewarmManager(
+            "test", steps=[("secrets", _failing), _step(calls, "model")], enabled=True
+        )
+        manager.start()
+        manager.join(5)
+
+        report = manager.report()
+        assert manager.status == "degraded"
+        assert report["steps"]["secrets"]["ok"] is False
+        assert "ssm unavailable" in report["steps"]["secrets"]["error"]
+        assert calls == ["model"]
+        assert manager.is_ready()
+
+    def test_ping_is_503_while_warming(self):
+        release = threading.Event()
+        manager = PrewarmManager(
+            "test", steps=[("slow", release.wait)], gate_seconds=60, enabled=True
+        )
+        manager.start()
+
+        status_code, body = manager.ping_response({"agent_id": "test"})
+        assert status_code == 503
+        assert body["status"] == "warming"
+        assert body["agent_id"] == "test"
+
+        release.set()
+        manager.join(5)
+        status_code, body = manager.ping_response({"agent_id": "test"})
+        assert status_code == 200
+        assert body["status"] == "healthy"
+
+    def test_gate_bounds_warming(self):
+        release = threading.Event()
+        manager = PrewarmManager(
+            "test", steps=[("slow", release.wait)], gate_seconds=0, enabled=True
+        )
+        manager.start()
+        try:
+            assert manager.status == "warming"
+            assert manager.is_ready()
+        finally:
+            release.set()
+            manager.join(5)
+
+    def test_disabled_is_always_ready(self, calls):
+        manager = PrewarmManager("test", steps=[_step(calls, "a")], enabled=False)
+        assert manager.start() is False
+        assert manager.is_ready()
+        assert calls == []
+
+    def test_import_modules_skips_missing(self):
+        loaded = import_modules("json", "module_that_does_not_exist")()
+        assert loaded == ["json"]
+
+
+class TestPrewarmIntegration:
+    """Tests for FastAPI and AgentPool wiring."""
+
+    def test_startup_event_starts_prewarm(self, calls):
+        manager = PrewarmManager("test", steps=[_step(calls, "a")], enabled=True)
+        app = FastAPI()
+        attach_prewarm(app, manager)
+
+        @app.get("/ping")
+        def ping(response: Response):
+            status_code, body = manager.ping_response({})
+            response.status_code = status_code
+            return body
+
+        with TestClient(app) as client:
+            manager.join(5)
+            result = client.get("/ping")
+
+        assert calls == ["a"]
+        assert result.status_code == 200
+        assert result.json()["prewarm"]["status"] == "ready"
+
+    def test_pool_prewarm_runs_warm_callback(self):
+        warmed = []
+        pool = AgentPool("test", factory=lambda: AgentShell(agent=object()), max_size=2)
+
+        assert pool.prewarm(2, warm=warmed.append) == 2
+        assert len(warmed) == 2
@@ -0,0 +1,163 @@
+# =============================================================================
+# Tests for Transactional Movement Recording
+# =============================================================================
+# Unit tests for SGADynamoDBClient.record_movements() (TransactWriteItems
+# calls go to a fake table meta client).
+#
+# These tests verify:
+# - Balance deltas are coalesced per balance item (one Update per item,
+#   receipts and reservations combined)
+# - Chunks never exceed 100 actions and carry their own balance updates
+# - Each chunk has a deterministic ClientRequestToken and identical payload
+# - Conflicts are retried with the same token; replays report already applied;
+#   other failures stop the batch
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_record_movements.py -v
+# =============================================================================
+
+from types import SimpleNamespace
+
+import pytest
+
+from core_tools import dynamodb_client
+from core_tools.dynamodb_client import SGADynamoDBClient
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class _TransactionCanceled(Exception):
+    def __init__(self, *reasons):
+        super().__init__(f"Transaction cancelled [{', '.join(reasons)}]")
+        self.response = {
+            "Error": {"Code": "TransactionCanceledException"},
+            "CancellationReasons": [{"Code": reason} for reason in reasons],
+        }
+
+
+class _FakeDynamoClient:
+    def __init__(self):
+        self.calls = []
+        self.failures = []
+
+    def transact_write_items(self, TransactItems, ClientRequestToken):
+        self.calls.append((TransactItems, ClientRequestToken))
+        if self.failures:
+            raise self.failures.pop(0)
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    monkeypatch.setattr(dynamodb_client.time, "sleep", lambda s: None)
+    return _FakeDynamoClient()
+
+
+@pytest.fixture
+def client(fake):
+    client = SGADynamoDBClient(table_name="sga-inventory-test")
+    client._table = SimpleNamespace(meta=SimpleNamespace(client=fake))
+    return client
+
+
+def _movement(n, location="LOC-A", pn="PN-1", delta=1, **extra):
+    return {
+        "movement_id": f"mov-{n}", "movement_type": "ENTRY",
+        "location_id": location, "pn_id": pn, "quantity": abs(delta),
+        "balance_delta": delta, **extra,
+    }
+
+
+def _updates(actions):
+    return [a["Update"] for a in actions if "Update" in a]
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestRecordMovements:
+    """Tests for grouping, coalescing and idempotency."""
+
+    def test_deltas_coalesced_per_balance_key(self, client, fake):
+        result = client.record_movements([
+            _movement(1, delta=5), _movement(2, delta=-2), _movement(3, pn="PN-2", delta=4),
+        ])
+
+        assert result == {
+            "success": True, "movements_written": 3, "already_applied": 0,
+            "balance_updates": 2, "transactions": 1,
+        }
+        (actions, _), = fake.calls
+        updates = _updates(actions)
+        assert [u["ExpressionAttributeValues"][":total_delta"] for u in updates] == [3, 4]
+        assert all(a["Put"]["ConditionExpression"] == "attribute_not_exists(PK)" for a in actions[:3])
+
+    def test_chunks_respect_transaction_limit(self, client, fake):
+        movements = [_movement(i, location=f"LOC-{i}") for i in range(120)]
+        result = client.record_movements(movements)
+
+        assert result["transactions"] == 3 and result["movements_written"] == 120
+        assert all(len(actions) <= 100 for actions, _ in fake.calls)
+        for actions, _ in fake.calls:
+            puts = {a["Put"]["Item"]["location_id"] for a in actions if "Put" in a}
+            keys = {u["Key"]["PK"].split("#")[1] for u in _updates(actions)}
+            assert puts == keys
+
+    def test_receipt_and_reservation_share_one_update(self, client, fake):
+        client.record_movements([
+            _movement(1, delta=10), _movement(2, delta=4, is_reservation=True),
+            _movement(3, pn="PN-2", delta=2, is_reservation=True),
+        ])
+
+        (actions, _), = fake.calls
+        updates = _updates(actions)
+        keys = [(u["Key"]["PK"], u["Key"]["SK"]) for u in updates]
+        assert len(keys) == len(set(keys)) == 2
+        values = updates[0]["ExpressionAttributeValues"]
+        assert (values[":total_delta"], values[":reserved_delta"], values[":available_delta"]) == (10, 4, 6)
+        assert ":total_delta" not in updates[1]["ExpressionAttributeValues"]
+
+    def test_update_keys_unique_in_every_transaction(self, client, fake):
+        movements = [
+            _movement(i, location=f"LOC-{i % 7}", delta=1, is_reservation=i % 2 == 0)
+            for i in range(150)
+        ]
+        client.record_movements(movements)
+
+        for actions, _ in fake.calls:
+            keys = [(u["Key"]["PK"], u["Key"]["SK"]) for u in _updates(actions)]
+            assert len(keys) == len(set(keys))
+
+    def test_retry_sends_identical_request(self, client, fake):
+        kwargs = {"request_token": "import-123", "created_at": "2026-01-15T10:00:00Z"}
+        client.record_movements([_movement(1)], **kwargs)
+        client.record_movements([_movement(1)], **kwargs)
+
+        (first, token_a), (second, token_b) = fake.calls
+        assert token_a == token_b and len(token_a) <= 36
+        assert first == second
+
+    def test_replayed_chunk_reported_as_already_applied(self, client, fake):
+        fake.failures = [_TransactionCanceled("ConditionalCheckFailed", "ConditionalCheckFailed", "None")]
+        result = client.record_movements([_movement(1), _movement(2)], request_token="import-123")
+
+        assert result["success"] is True
+        assert result["already_applied"] == 2 and result["movements_written"] == 0
+
+    def test_conflict_retried_with_same_token(self, client, fake):
+        fake.failures = [_TransactionCanceled("TransactionConflict")]
+        result = client.record_movements([_movement(1)])
+
+        assert result["success"] is True
+        assert len(fake.calls) == 2 and fake.calls[0][1] == fake.calls[1][1]
+
+    def test_duplicate_movement_stops_batch(self, client, fake):
+        fake.failures = [_TransactionCanceled("ConditionalCheckFailed", "None", "None")]
+        result = client.record_movements([_movement(1), _movement(2)])
+
+        assert result["success"] is False and result["movements_written"] == 0
+        assert result["failed_movement_ids"] == ["mov-1", "mov-2"]
+        assert len(fake.calls) == 1
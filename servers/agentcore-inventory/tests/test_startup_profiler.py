@@ -0,0 +1,106 @@
+# =============================================================================
+# Tests for Startup Profiler
+# =============================================================================
+# Unit tests for shared/startup_profiler.py.
+#
+# These tests verify:
+# - -X importtime output is parsed and ranked
+# - Milestones are recorded relative to process start
+# - The first /ping writes the JSON report exactly once
+# - Profiling is a pass-through when disabled
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_startup_profiler.py -v
+# =============================================================================
+
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from shared.startup_profiler import (
+    StartupProfiler,
+    parse_importtime,
+    process_uptime_ms,
+    profile_create_app,
+)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        420 | io
+import time:      1500 |       1500 |     google.genai.types
+import time:      2000 |       3500 |   google.genai
+import time:       500 |       4000 | strands.models.gemini
+Traceback (most recent call last):
+"""
+
+
+def _create_app():
+    app = FastAPI()
+
+    @app.get("/ping")
+    def ping():
+        return {"status": "healthy"}
+
+    return app
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestParseImporttime:
+    """Tests for parse_importtime()."""
+
+    def test_totals_and_rankings(self):
+        summary = parse_importtime(IMPORTTIME_OUTPUT, top=2)
+
+        assert summary["module_count"] == 5
+        assert summary["total_ms"] == 4.42  # io + strands.models.gemini (top level)
+        assert [m["module"] for m in summary["top_cumulative"]] == [
+            "strands.models.gemini", "google.genai",
+        ]
+        assert summary["top_self"][0] == {
+            "module": "google.genai", "self_ms": 2.0, "cumulative_ms": 3.5,
+        }
+
+    def test_ignores_non_importtime_lines(self):
+        assert parse_importtime("boom\nValueError: x")["module_count"] == 0
+
+
+class TestStartupProfiler:
+    """Tests for milestones and report writing."""
+
+    def test_process_uptime_is_positive(self):
+        assert process_uptime_ms() > 0
+
+    def test_first_mark_wins(self, tmp_path):
+        profiler = StartupProfiler("test", path=str(tmp_path / "r.json"))
+        first = profiler.mark("create_app")
+        assert profiler.mark("create_app") == first
+
+    def test_first_ping_writes_report(self, tmp_path):
+        path = tmp_path / "startup.json"
+        app = profile_create_app("schema_mapper", _create_app, enabled=True, path=str(path))
+
+        client = TestClient(app)
+        client.get("/ping")
+        first = json.loads(path.read_text())
+        client.get("/ping")
+
+        assert first["agent_id"] == "schema_mapper"
+        assert first["modules_loaded_ms"] <= first["create_app_ms"] <= first["first_ping_ms"]
+        assert json.loads(path.read_text()) == first
+
+    def test_disabled_is_pass_through(self, tmp_path):
+        path = tmp_path / "startup.json"
+        app = profile_create_app("schema_mapper", _create_app, enabled=False, path=str(path))
+
+        TestClient(app).get("/ping")
+        assert not path.exists()
@@ -0,0 +1,176 @@
+# =============================================================================
+# Tests for Timing Ledger
+# =============================================================================
+# Unit tests for shared/timing_ledger.py and its flow_log integration.
+#
+# These tests verify:
+# - flow_log phase_start/phase_end open and close phase spans
+# - Sub-steps nest under the current phase and inherit its number
+# - External calls and rows are attributed to the innermost span
+# - Ledgers from another runtime merge without duplicating spans
+# - Job status tools return the span-free rollup only
+# - Recording outside a span is a no-op
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_timing_ledger.py -v
+# =============================================================================
+
+import json
+
+import pytest
+
+from shared import timing_ledger
+from shared.flow_logger import flow_log
+from shared.timing_ledger import (
+    TimingLedger,
+    ledger_snapshot,
+    ledger_summary,
+    merge_ledger,
+    record_call,
+    record_usage,
+    span,
+    timed,
+)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def clean_ledgers():
+    timing_ledger.clear_ledgers()
+    yield
+    timing_ledger.clear_ledgers()
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestPhaseSpans:
+    """Tests for phase spans driven by flow_log."""
+
+    def test_phase_start_end_records_span(self):
+        flow_log.phase_start(2, "InventoryAnalyst", "sess-1")
+        record_call("s3", bytes_read=1024)
+        flow_log.phase_end(2, "InventoryAnalyst", "sess-1", "SUCCESS", 0)
+
+        ledger = ledger_snapshot("sess-1")
+        (phase_span,) = ledger["spans"]
+        assert phase_span["kind"] == "phase"
+        assert phase_span["status"] == "SUCCESS"
+        assert phase_span["wall_ms"] >= 0
+        assert ledger["phases"]["2"]["counters"] == {"s3_calls": 1, "bytes_read": 1024}
+
+    def test_phase_context_marks_failure(self):
+        with pytest.raises(ValueError):
+            with flow_log.phase_context(3, "SchemaMapper", "sess-2"):
+                raise ValueError("boom")
+
+        assert ledger_snapshot("sess-2")["spans"][0]["status"] == "FAILED"
+        assert timing_ledger.current_span() is None
+
+    def test_sub_steps_nest_under_phase(self):
+        flow_log.phase_start(4, "DataTransformer", "sess-3")
+        with span("sess-3", "etl_stream.transform") as step:
+            record_call("mcp", bytes_read=10)
+            record_usage(rows=500)
+        record_call("a2a")
+        flow_log.phase_end(4, "DataTransformer", "sess-3", "HANDOFF_SUCCESS", 0)
+
+        phase_span, step_span = ledger_snapshot("sess-3")["spans"]
+        assert step_span["parent_id"] == phase_span["span_id"]
+        assert step.phase == 4
+        assert step_span["counters"] == {"mcp_calls": 1, "bytes_read": 10, "rows": 500}
+        assert phase_span["counters"] == {"a2a_calls": 1}
+        assert ledger_snapshot("sess-3")["totals"]["rows"] == 500
+
+
+class TestRecording:
+    """Tests for counters, decorators and merging."""
+
+    def test_record_outside_span_is_noop(self):
+        record_call("s3", bytes_read=100)
+        assert ledger_snapshot("never-started") is None
+
+    def test_gemini_counters_are_prefixed(self):
+        with span("sess-4", "mapping", phase=3):
+            record_call("gemini", input_tokens=120, output_tokens=30)
+
+        assert ledger_snapshot("sess-4")["totals"] == {
+            "gemini_calls": 1, "gemini_input_tokens": 120, "gemini_output_tokens": 30,
+        }
+
+    def test_timed_reads_session_from_arguments(self):
+        @timed("batch_loader.insert_all_batches", phase=4)
+        def insert(batches_json: str, session_id: str) -> str:
+            record_usage(rows_inserted=3)
+            return "ok"
+
+        assert insert("[]", session_id="sess-5") == "ok"
+        step = ledger_snapshot("sess-5")["spans"][0]
+        assert step["name"] == "batch_loader.insert_all_batches"
+        assert ledger_snapshot("sess-5")["phases"]["4"]["counters"] == {"rows_inserted": 3}
+
+    def test_merge_remote_ledger_dedupes(self):
+        remote = TimingLedger("sess-6")
+        step = remote.open_span("etl_stream.transform", phase=4)
+        step.add(rows=1000)
+        step.close()
+        remote_dict = remote.to_dict()
+
+        flow_log.phase_start(4, "DataTransformer", "sess-6")
+        flow_log.phase_end(4, "DataTransformer", "sess-6", "HANDOFF_SUCCESS", 0)
+        merge_ledger("sess-6", remote_dict)
+        combined = merge_ledger("sess-6", remote_dict)
+
+        assert len(combined["spans"]) == 2
+        assert combined["phases"]["4"]["counters"] == {"rows": 1000}
+
+    def test_summary_rollup_merges_without_spans(self):
+        remote = TimingLedger("sess-7")
+        step = remote.open_span("etl_stream.transform", phase=4)
+        step.add(rows=1000)
+        step.close()
+        summary = ledger_summary({**remote.to_dict(), "runtime_id": "data-transformer"})
+
+        flow_log.phase_start(2, "InventoryAnalyst", "sess-7")
+        flow_log.phase_end(2, "InventoryAnalyst", "sess-7", "SUCCESS", 0)
+        merge_ledger("sess-7", summary)
+        combined = merge_ledger("sess-7", summary)
+
+        assert "spans" not in summary
+        assert len(combined["spans"]) == 1
+        assert combined["phases"]["4"]["counters"] == {"rows": 1000}
+        assert combined["totals"] == {"rows": 1000}
+
+    def test_own_runtime_summary_is_not_double_counted(self):
+        with span("sess-8", "etl_stream.transform", phase=4):
+            record_usage(rows=5)
+
+        combined = merge_ledger("sess-8", ledger_summary(ledger_snapshot("sess-8")))
+
+        assert combined["totals"] == {"rows": 5}
+
+
+class TestJobStatusTiming:
+    """Tests for the ledger returned by the DataTransformer job tool."""
+
+    def test_get_job_status_returns_rollup_only(self):
+        from agents.specialists.data_transformer.tools import job_manager
+
+        with span("sess-9", "etl_stream.transform", phase=4):
+            record_usage(rows=7)
+        job_manager._JOBS["job-t1"] = {
+            "job_id": "job-t1", "session_id": "sess-9", "status": "completed",
+            "rows_total": 7, "rows_processed": 7, "timing": ledger_snapshot("sess-9"),
+        }
+        try:
+            result = json.loads(job_manager.get_job_status("job-t1"))
+        finally:
+            job_manager._JOBS.pop("job-t1")
+
+        assert set(result["timing"]) == {"runtime_id", "session_id", "phases", "totals"}
+        assert result["timing"]["totals"] == {"rows": 7}
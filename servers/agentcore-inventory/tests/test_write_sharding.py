@@ -0,0 +1,107 @@
+# =============================================================================
+# Tests for Write Sharding
+# =============================================================================
+# Unit tests for shared/write_sharding.py and the sharded date/type keys in
+# SGADynamoDBClient and AgentAuditEmitter (DynamoDB calls are fakes).
+#
+# These tests verify:
+# - One shard keeps the original unsuffixed keys
+# - Shard suffixes are stable per item id and spread across N partitions
+# - Readers query every shard (plus the legacy key) and merge by sort key
+# - Movements and agent activity events are written to sharded keys
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/test_write_sharding.py -v
+# =============================================================================
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from core_tools import dynamodb_client
+from core_tools.dynamodb_client import SGADynamoDBClient
+from shared import audit_emitter
+from shared.audit_emitter import AgentAuditEmitter, AgentStatus, AuditEvent
+from shared.write_sharding import scatter_gather, shard_keys, sharded_key
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def movements_client(monkeypatch):
+    monkeypatch.setattr(dynamodb_client, "MOVEMENT_DATE_SHARDS", 4)
+    client = SGADynamoDBClient(table_name="sga-inventory-test")
+    client._table = MagicMock()
+    return client
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestShardKeys:
+    """Tests for key generation."""
+
+    def test_single_shard_keeps_original_key(self):
+        assert sharded_key("DATE#2026-01", "mov-1", 1) == "DATE#2026-01"
+        assert shard_keys("DATE#2026-01", 1) == ["DATE#2026-01"]
+
+    def test_suffix_is_stable_and_spreads(self):
+        keys = {sharded_key("DATE#2026-01", f"mov-{i}", 8) for i in range(200)}
+        assert keys == {f"DATE#2026-01#{n}" for n in range(8)}
+        assert sharded_key("DATE#2026-01", "mov-7", 8) == sharded_key("DATE#2026-01", "mov-7", 8)
+
+    def test_readers_include_legacy_key(self):
+        assert shard_keys("LOG#2026-01-11", 2) == ["LOG#2026-01-11", "LOG#2026-01-11#0", "LOG#2026-01-11#1"]
+
+
+class TestScatterGather:
+    """Tests for the parallel merge reader."""
+
+    def test_merges_shards_by_sort_key(self):
+        shards = {
+            "DATE#2026-01": [{"SK": "2026-01-01"}],
+            "DATE#2026-01#0": [{"SK": "2026-01-09"}, {"SK": "2026-01-03"}],
+            "DATE#2026-01#1": [{"SK": "2026-01-05"}, {"SK": "2026-01-02"}],
+        }
+        items = scatter_gather("DATE#2026-01", 2, lambda pk: shards[pk], sort_key="SK", limit=4)
+        assert [i["SK"] for i in items] == ["2026-01-09", "2026-01-05", "2026-01-03", "2026-01-02"]
+
+
+class TestShardedWriters:
+    """Tests for movements and audit events."""
+
+    def test_movement_written_to_sharded_date_key(self, movements_client):
+        movements_client.create_movement("mov-42", "ENTRY", "LOC-A", "PN-1", 3)
+
+        item = movements_client._table.put_item.call_args.kwargs["Item"]
+        assert item["GSI5PK"] == sharded_key(item["GSI5PK"].rsplit("#", 1)[0], "mov-42", 4)
+        assert item["GSI5PK"].count("#") == 2
+
+    def test_get_movements_by_date_queries_every_shard(self, movements_client, monkeypatch):
+        queried = []
+        monkeypatch.setattr(
+            movements_client, "query_partition",
+            lambda pk, **kw: queried.append((pk, kw["gsi_name"])) or [{"GSI5SK": pk}],
+        )
+
+        items = movements_client.get_movements_by_date("2026-01", limit=10)
+
+        assert sorted(pk for pk, _ in queried) == shard_keys("DATE#2026-01", 4)
+        assert {gsi for _, gsi in queried} == {"GSI5-DateQuery"}
+        assert len(items) == 5
+
+    def test_agent_activity_uses_sharded_keys(self, monkeypatch):
+        monkeypatch.setenv("AUDIT_LOG_TABLE", "sga-audit-test")
+        monkeypatch.setattr(audit_emitter, "AUDIT_LOG_SHARDS", 3)
+        emitter = AgentAuditEmitter(agent_id="learning")
+        emitter._dynamodb = MagicMock()
+
+        assert emitter.emit(AuditEvent("learning", AgentStatus.WORKING, "Analisando..."))
+
+        item = emitter._dynamodb.put_item.call_args.kwargs["Item"]
+        assert item["PK"].rsplit("#", 1)[1] in {"0", "1", "2"}
+        assert item["GSI3PK"] in {f"TYPE#AGENT_ACTIVITY#{n}" for n in range(3)}
@@ -0,0 +1,152 @@
+# =============================================================================
+# Unit Tests for Phase 3 Deterministic Mapping (Mode 2.5 fast path)
+# =============================================================================
+# Tests that unambiguous layouts are mapped by SchemaColumnMatcher without an
+# A2A call to SchemaMapper, and that partial/ambiguous layouts are escalated.
+#
+# Run: cd server/agentcore-inventory && python -m pytest tests/unit/test_schema_mapping_fast_path.py -v
+# =============================================================================
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agents.orchestrators.inventory_hub.services import mapping_service
+from agents.orchestrators.inventory_hub.services.mapping_service import (
+    _parse_learned_aliases,
+    invoke_schema_mapper_phase3,
+    try_deterministic_mapping,
+)
+from core_tools.schema_provider import ColumnInfo, TableSchema
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class _FakeSchemaProvider:
+    """SchemaProvider stand-in exposing pending_entry_items only."""
+
+    def __init__(self):
+        names = [
+            "entry_item_id", "entry_id", "line_number", "part_number",
+            "description", "quantity", "unit_value", "total_value", "serial_numbers",
+        ]
+        self.schema = TableSchema(
+            table_name="pending_entry_items",
+            columns=[ColumnInfo(name=n, data_type="text") for n in names],
+            required_columns=["entry_id", "line_number", "quantity"],
+        )
+
+    def get_table_schema(self, table_name):
+        return self.schema if table_name == "pending_entry_items" else None
+
+
+@pytest.fixture
+def provider():
+    return _FakeSchemaProvider()
+
+
+SAMPLE = [
+    {"codigo": "ab-1", "descricao": "Item 1", "qtd": "10", "valor_unitario": "1.234,56"},
+    {"codigo": "ab-2", "descricao": "Item 2", "qtd": "5", "valor_unitario": "15,50"},
+]
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestTryDeterministicMapping:
+    """Tests for try_deterministic_mapping()."""
+
+    def test_unambiguous_layout_is_mapped(self, provider):
+        columns = ["codigo", "descricao", "qtd", "valor_unitario", "observacao"]
+        result, reason = try_deterministic_mapping(
+            columns, SAMPLE, "nexo_1", schema_provider=provider
+        )
+
+        assert reason == "all_required_matched"
+        assert result["status"] == "success"
+        assert result["requires_confirmation"] is True
+        assert result["mapping_mode"] == "deterministic"
+        assert result["unmapped_source_columns"] == ["observacao"]
+
+        by_source = {m["source_column"]: m for m in result["mappings"]}
+        assert by_source["codigo"]["target_column"] == "part_number"
+        assert by_source["codigo"]["transform"] == "TRIM|UPPERCASE"
+        assert by_source["qtd"]["target_column"] == "quantity"
+        assert by_source["valor_unitario"]["transform"] == "NUMBER_PARSE_PTBR"
+
+    def test_missing_required_column_escalates(self, provider):
+        result, reason = try_deterministic_mapping(
+            ["codigo", "descricao"], SAMPLE, "nexo_1", schema_provider=provider
+        )
+        assert result is None
+        assert reason == "missing_required=1"
+
+    def test_two_sources_for_one_target_escalates(self, provider):
+        result, reason = try_deterministic_mapping(
+            ["codigo", "sku", "qtd"], [], "nexo_1", schema_provider=provider
+        )
+        assert result is None
+        assert reason.startswith("target_collisions")
+
+    def test_fuzzy_match_escalates(self, provider):
+        result, reason = try_deterministic_mapping(
+            ["codigo", "qtd", "quantidadee"], [], "nexo_1", schema_provider=provider
+        )
+        assert result is None
+        assert reason.startswith("ambiguous_columns")
+
+    def test_learned_alias_completes_layout(self, provider):
+        result, _ = try_deterministic_mapping(
+            ["codigo", "qtde_recebida"], [], "nexo_1",
+            learned_aliases={"QTDE_RECEBIDA": "quantity"},
+            schema_provider=provider,
+        )
+        assert result is not None
+        assert result["patterns_used"] == ["qtde_recebida -> quantity"]
+
+    def test_parse_learned_aliases(self):
+        records = [
+            {"content": {"text": "Column 'QTDE_RECEBIDA' maps to 'quantity'"}},
+            {"content": "x", "metadata": {"source_column": "PN_FORN", "target_column": "part_number"}},
+        ]
+        assert _parse_learned_aliases(records) == {
+            "QTDE_RECEBIDA": "quantity",
+            "PN_FORN": "part_number",
+        }
+
+
+class TestInvokeSchemaMapperPhase3:
+    """Tests for routing between fast path and A2A."""
+
+    def test_fast_path_skips_a2a(self, provider):
+        with patch("core_tools.schema_provider.get_schema_provider", return_value=provider), \
+                patch.object(mapping_service, "A2AClient") as a2a:
+            result = invoke_schema_mapper_phase3(["codigo", "qtd"], SAMPLE, "k", "nexo_1")
+
+        assert result["status"] == "success"
+        a2a.assert_not_called()
+
+    def test_ambiguous_layout_uses_a2a(self, provider):
+        a2a_result = MagicMock(success=True, response='{"status": "needs_input", "questions": []}')
+        client = MagicMock()
+
+        async def _invoke_agent(**kwargs):
+            return a2a_result
+
+        client.invoke_agent = _invoke_agent
+
+        async def _no_aliases(session_id):
+            return {}
+
+        with patch("core_tools.schema_provider.get_schema_provider", return_value=provider), \
+                patch.object(mapping_service, "_observe_learned_aliases", _no_aliases), \
+                patch.object(mapping_service, "A2AClient", return_value=client):
+            result = invoke_schema_mapper_phase3(["descricao"], SAMPLE, "k", "nexo_1")
+
+        assert result["status"] == "needs_input"